@@ -0,0 +1,79 @@
+"""Benchmark reading a large Lens Data Editor.
+
+This script creates a synthetic sequential system with many surfaces and compares the time needed to read it surface by
+surface with the time needed by `zospy.functions.lde.snapshot`. OpticStudio is required to run this benchmark.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from timeit import repeat
+
+import zospy as zp
+
+COLUMNS = ("Radius", "Thickness", "SemiDiameter", "Conic", "Par1", "Par2")
+
+
+def create_system(oss: zp.zpcore.OpticStudioSystem, n_surfaces: int) -> None:
+    """Create a synthetic system with alternating standard and even asphere surfaces."""
+    oss.new()
+    oss.make_sequential()
+
+    for i in range(n_surfaces):
+        surface = oss.LDE.InsertNewSurfaceAt(1)
+
+        if i % 2:
+            zp.functions.lde.surface_change_type(surface, zp.constants.Editors.LDE.SurfaceType.EvenAsphere)
+            surface.GetSurfaceCell(zp.constants.Editors.LDE.SurfaceColumn.Par2).DoubleValue = 1e-4 * i
+
+        surface.Radius = 50 + i
+        surface.Thickness = 1 + 0.01 * i
+        surface.SemiDiameter = 5
+        surface.Comment = f"surface {i}"
+
+
+def read_per_surface(oss: zp.zpcore.OpticStudioSystem) -> list[dict]:
+    """Read the Lens Data Editor surface by surface, retrieving the surface row for every value."""
+    rows = []
+
+    for i in range(oss.LDE.NumberOfSurfaces):
+        row = {
+            "Type": str(oss.LDE.GetSurfaceAt(i).Type),
+            "Comment": oss.LDE.GetSurfaceAt(i).Comment,
+            "Material": oss.LDE.GetSurfaceAt(i).Material,
+        }
+
+        for column in COLUMNS:
+            cell = oss.LDE.GetSurfaceAt(i).GetSurfaceCell(getattr(zp.constants.Editors.LDE.SurfaceColumn, column))
+            row[column] = cell.DoubleValue if str(cell.DataType) == "Double" else None
+
+        rows.append(row)
+
+    return rows
+
+
+def main(args: argparse.Namespace) -> int:
+    zos = zp.ZOS()
+    oss = zos.connect("standalone")
+
+    create_system(oss, args.surfaces)
+
+    per_surface = min(repeat(lambda: read_per_surface(oss), number=1, repeat=args.repeat))
+    snapshot = min(repeat(lambda: zp.functions.lde.snapshot(oss, columns=COLUMNS), number=1, repeat=args.repeat))
+
+    print(f"Surfaces:    {oss.LDE.NumberOfSurfaces}")
+    print(f"Per surface: {per_surface:.3f} s")
+    print(f"Snapshot:    {snapshot:.3f} s ({per_surface / snapshot:.1f}x faster)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark reading a large Lens Data Editor.")
+    parser.add_argument("--surfaces", type=int, default=200, help="Number of surfaces in the synthetic system.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repetitions; the fastest run is reported.")
+
+    args = parser.parse_args()
+
+    sys.exit(main(args))
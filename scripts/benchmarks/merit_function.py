@@ -0,0 +1,52 @@
+"""Benchmark merit function evaluation throughput.
+
+This script loads an optical system and evaluates its merit function for random perturbations of the variables using
+`zospy.functions.mfe.MeritFunctionEvaluator`, reporting the number of evaluations per second. OpticStudio is required to
+run this benchmark.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+import numpy as np
+
+import zospy as zp
+
+
+def main(args: argparse.Namespace) -> int:
+    zos = zp.ZOS()
+    oss = zos.connect("standalone")
+    oss.load(args.file)
+
+    evaluator = zp.functions.mfe.MeritFunctionEvaluator(oss)
+
+    if not evaluator.variables:
+        print("The system has no variables.")
+        return 1
+
+    rng = np.random.default_rng(args.seed)
+    x0 = evaluator.x0
+    xs = x0 * (1 + args.perturbation * rng.standard_normal((args.evaluations, len(x0))))
+
+    evaluator.evaluate_many(xs)
+
+    print(f"Variables:   {len(evaluator.variables)}")
+    print(f"Operands:    {len(evaluator.targets)}")
+    print(f"Evaluations: {evaluator.n_evaluations}")
+    print(f"Throughput:  {evaluator.evaluations_per_second:.1f} evaluations/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark merit function evaluation throughput.")
+    parser.add_argument("file", help="Optical system with a merit function and variables.")
+    parser.add_argument("--evaluations", type=int, default=200, help="Number of merit function evaluations.")
+    parser.add_argument("--perturbation", type=float, default=0.01, help="Relative perturbation of the variables.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random number generator.")
+
+    args = parser.parse_args()
+
+    sys.exit(main(args))
@@ -0,0 +1,172 @@
+"""Benchmark the parsers of analysis text outputs.
+
+This script generates synthetic text outputs for every grammar in `zospy/analyses/parsers/grammars` at several sizes
+and for both decimal point locales, writes them to UTF-16 encoded files like OpticStudio does, and measures the time to
+read, parse and transform them, as well as the peak memory use. OpticStudio is not required to run this benchmark.
+
+The results can be compared to a stored baseline to detect performance regressions:
+
+    python scripts/benchmarks/parsers                  # Compare to baseline.json
+    python scripts/benchmarks/parsers --save-baseline  # Overwrite baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import corpus
+from lark.visitors import merge_transformers
+
+import zospy.api.config as _config
+from zospy.analyses.parsers import ZospyTransformer, load_grammar
+from zospy.analyses.parsers.tables import extract_numeric_blocks, restore_numeric_blocks
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+LOCALES = {"point": (".", ","), "comma": (",", ".")}
+"""Decimal point and thousands separator of the benchmarked locales."""
+
+ENCODING = "UTF-16-le"
+"""Encoding of text outputs if OpticStudio is configured to write Unicode text files."""
+
+
+def run_case(case: corpus.Case, text_file: Path) -> dict[str, float]:
+    """Read, parse and transform a text output, and return the duration of every step in seconds."""
+    start = time.perf_counter()
+
+    with open(text_file, encoding=ENCODING) as f:
+        text = f.read()
+
+    read = time.perf_counter()
+
+    parser = load_grammar(case.grammar)
+    text, blocks = extract_numeric_blocks(text, parser)
+    tree = restore_numeric_blocks(parser.parse(text), blocks)
+
+    parsed = time.perf_counter()
+
+    result = merge_transformers(case.transformer(), zospy=ZospyTransformer()).transform(tree)
+
+    if case.result_type is not None:
+        case.result_type(**result)
+
+    transformed = time.perf_counter()
+
+    return {"read": read - start, "parse": parsed - read, "transform": transformed - parsed}
+
+
+def benchmark(case: corpus.Case, locale: str, repeat: int) -> dict[str, float]:
+    """Benchmark a case in a locale. Durations are the minimum of `repeat` runs."""
+    _config.DECIMAL_POINT, _config.THOUSANDS_SEPARATOR = LOCALES[locale]
+    text = case.generate(_config.DECIMAL_POINT, **case.parameters)
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_file = Path(directory) / f"{case.grammar}.txt"
+        text_file.write_text(text, encoding=ENCODING)
+
+        # Load the grammar before measuring
+        load_grammar(case.grammar)
+
+        runs = [run_case(case, text_file) for _ in range(repeat)]
+
+        tracemalloc.start()
+        run_case(case, text_file)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    result = {step: min(run[step] for run in runs) for step in runs[0]}
+    result["total"] = min(sum(run.values()) for run in runs)
+    result["peak_memory"] = peak_memory
+    result["size"] = text_file_size = len(text.encode(ENCODING))
+    result["throughput"] = text_file_size / result["total"]
+
+    return result
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Compare results to a baseline, and return a description of every regression."""
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        for metric in ("total", "peak_memory"):
+            ratio = result[metric] / baseline[name][metric]
+
+            if ratio > tolerance:
+                regressions.append(f"{name}: {metric} is {ratio:.2f}x the baseline")
+
+    return regressions
+
+
+def main(args: argparse.Namespace) -> int:
+    cases = [
+        case
+        for case in corpus.CASES
+        if case.size in args.sizes and (not args.grammars or case.grammar in args.grammars)
+    ]
+    results = {}
+
+    print(f"{'Case':<50} {'Read':>9} {'Parse':>9} {'Transform':>9} {'Peak memory':>12} {'Throughput':>12}")
+
+    for case in cases:
+        for locale in args.locales:
+            name = f"{case.grammar}/{case.size}/{locale}"
+            result = results[name] = benchmark(case, locale, args.repeat)
+
+            print(
+                f"{name:<50} {result['read'] * 1e3:>7.1f}ms {result['parse'] * 1e3:>7.1f}ms "
+                f"{result['transform'] * 1e3:>7.1f}ms {result['peak_memory'] / 2**20:>9.1f}MiB "
+                f"{result['throughput'] / 2**20:>7.2f}MiB/s"
+            )
+
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=4, sort_keys=True) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+
+        return 0
+
+    if not args.baseline.exists():
+        print(f"Baseline {args.baseline} not found, skipping comparison.")
+
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+
+    for regression in regressions:
+        print(f"Regression: {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the parsers of analysis text outputs.")
+    parser.add_argument("--grammars", nargs="+", help="Grammars to benchmark. Defaults to all grammars.")
+    parser.add_argument(
+        "--sizes", nargs="+", choices=["small", "large"], default=["small", "large"], help="Sizes to benchmark."
+    )
+    parser.add_argument(
+        "--locales", nargs="+", choices=list(LOCALES), default=list(LOCALES), help="Decimal point locales to benchmark."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per case. The fastest run is reported.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Baseline to compare to.")
+    parser.add_argument("--save-baseline", action="store_true", help="Save the results as baseline.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=2.0,
+        help="Maximum ratio of the duration or peak memory to the baseline before it is reported as a regression.",
+    )
+
+    args = parser.parse_args()
+
+    sys.exit(main(args))
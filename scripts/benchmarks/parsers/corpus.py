@@ -0,0 +1,513 @@
+"""Generators of synthetic OpticStudio text outputs for the parser benchmarks.
+
+Every generator returns the text output of one analysis, formatted like OpticStudio formats it. Numbers are drawn from a
+seeded random number generator and formatted with the given decimal point, so that the outputs are reproducible and
+cover both decimal point locales.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from zospy.analyses.polarization.pupil_map import PolarizationPupilMapResult, PolarizationPupilMapTransformer
+from zospy.analyses.polarization.transmission import (
+    PolarizationTransmissionResult,
+    PolarizationTransmissionTransformer,
+)
+from zospy.analyses.raysandspots.single_ray_trace import SingleRayTraceResult, SingleRayTraceTransformer
+from zospy.analyses.reports.cardinal_points import CardinalPointsResult, CardinalPointsTransformer
+from zospy.analyses.reports.surface_data import SurfaceDataResult, SurfaceDataTransformer
+from zospy.analyses.reports.system_data import SystemDataResult, SystemDataTransformer
+from zospy.analyses.wavefront.zernike_coefficients_vs_field import ZernikeCoefficientsVsFieldTransformer
+from zospy.analyses.wavefront.zernike_standard_coefficients import (
+    ZernikeStandardCoefficientsResult,
+    ZernikeStandardCoefficientsTransformer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from lark import Transformer
+
+HEADER_LINES = [
+    "File : C:\\Users\\zospy\\Documents\\Zemax\\Samples\\lens.zmx",
+    "Title: Benchmark lens",
+    "Date : 10-03-2025",
+]
+
+
+class _Numbers:
+    """Format random numbers with a decimal point."""
+
+    def __init__(self, decimal_point: str, seed: int = 0):
+        self.decimal_point = decimal_point
+        self.rng = np.random.default_rng(seed)
+
+    def format(self, value: float, spec: str) -> str:
+        if np.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+
+        return format(value, spec).replace(".", self.decimal_point)
+
+    def normal(self, spec: str = ".10E", scale: float = 1.0) -> str:
+        return self.format(self.rng.normal(scale=scale), spec)
+
+    def uniform(self, spec: str = ".6f", low: float = 0.0, high: float = 1.0) -> str:
+        return self.format(self.rng.uniform(low, high), spec)
+
+
+def _join(lines: list[str]) -> str:
+    return "\ufeff" + "\n".join(lines) + "\n"
+
+
+def single_ray_trace(decimal_point: str, n_surfaces: int) -> str:
+    """Single Ray Trace through `n_surfaces` surfaces, with real and paraxial ray trace data."""
+    numbers = _Numbers(decimal_point)
+    header = (
+        "Surf\tX-coordinate\tY-coordinate\tZ-coordinate\tX-cosine\tY-cosine\tZ-cosine\tX-normal\tY-normal\tZ-normal\t"
+        "Angle in\tPath length\tComment"
+    )
+    lines = [
+        "Ray Trace Data",
+        "",
+        *HEADER_LINES,
+        "Lens Title: Benchmark lens",
+        "Units           :   Millimeters",
+        "Coordinates     :   Global coordinates relative to surface 1",
+        "",
+        f"Wavelength      :   {numbers.format(0.543, '.6f')} µm",
+        f"Normalized X Field Coord (Hx) :\t{numbers.format(0, '.10f')}",
+        f"Normalized Y Field Coord (Hy) :\t{numbers.format(1, '.10f')}",
+        f"Normalized X Pupil Coord (Px) :\t{numbers.format(0, '.10f')}",
+        f"Normalized Y Pupil Coord (Py) :\t{numbers.format(1, '.10f')}",
+        "",
+    ]
+
+    for title, paraxial in (("Real Ray Trace Data:", False), ("Paraxial Ray Trace Data:", True)):
+        lines += [title, "", header]
+        lines.append("\t".join(["OBJ", *["Infinity"] * 3, *[numbers.format(v, ".10E") for v in (0, 0, 1)]]))
+
+        for surface in range(1, n_surfaces):
+            label = "STO" if surface == 1 else f"{surface:3d}"
+            values = [numbers.normal() for _ in range(11)]
+
+            if paraxial:
+                values[6:] = ["-"] * 5
+
+            comment = ["lens front"] if surface % 4 == 1 else []
+            lines.append("\t".join([label, *values, *comment]))
+
+        lines.append("")
+
+    return _join(lines)
+
+
+def polarization_pupil_map(decimal_point: str, sampling: int) -> str:
+    """Polarization Pupil Map with a `sampling` x `sampling` pupil grid."""
+    numbers = _Numbers(decimal_point)
+    lines = [
+        "Polarization Pupil Map",
+        "",
+        *HEADER_LINES,
+        "",
+        f"Wavelength     : {numbers.format(0.543, '.4f')}",
+        f"Field Pos      : {numbers.format(0, '.4f')} (deg)",
+        f"X-Field        : {numbers.format(1, '.4f')}",
+        f"Y-Field        : {numbers.format(0, '.4f')}",
+        f"X-Phase        : {numbers.format(0, '.4f')}",
+        f"Y-Phase        : {numbers.format(0, '.4f')}",
+        "Configs        : 1",
+        "Surface        : 4",
+        f"Transmission   : {numbers.format(95.1234, '.4f')} %",
+        "",
+        "   Px       Py        Ex        Ey    Intensity  Phase (Deg) Orientation",
+    ]
+
+    for px in np.linspace(-1, 1, sampling):
+        for py in np.linspace(-1, 1, sampling):
+            values = [numbers.format(v, "10.6f") for v in (px, py, *numbers.rng.normal(size=5))]
+            lines.append("  ".join(values))
+
+    return _join(lines)
+
+
+def polarization_transmission(decimal_point: str, n_fields: int, n_wavelengths: int, n_surfaces: int) -> str:
+    """Polarization Transmission for `n_fields` fields and `n_wavelengths` wavelengths through `n_surfaces` surfaces."""
+    numbers = _Numbers(decimal_point)
+    lines = [
+        "Polarization Transmission",
+        "",
+        *HEADER_LINES,
+        "",
+        f"X-Field        : {numbers.format(1, '.4f')}",
+        f"Y-Field        : {numbers.format(0, '.4f')}",
+        f"X-Phase        : {numbers.format(0, '.4f')}",
+        f"Y-Phase        : {numbers.format(0, '.4f')}",
+        "Grid Size      : 32 x 32",
+        "",
+    ]
+    wavelengths = [numbers.format(w, ".6f") for w in np.linspace(0.45, 0.65, n_wavelengths)]
+    fields = [numbers.format(f, ".4f") for f in np.linspace(0, 10, n_fields)]
+
+    for field in fields:
+        lines.append(f"Field Pos      : {field} (deg)")
+        lines += [f"Transmission at {wavelength}: {numbers.uniform('.6f', 90, 99)}" for wavelength in wavelengths]
+        lines += [f"Total Transmission: {numbers.uniform('.6f', 90, 99)}", ""]
+
+    lines += ["Chief ray transmission:", ""]
+
+    for field in fields:
+        for i, wavelength in enumerate(wavelengths, start=1):
+            lines += [
+                f"Field Pos      : {field} (deg)",
+                f"Wavelength {i}: {wavelength} µm",
+                "Surf   Tot. Tran   Rel. Tran",
+            ]
+            lines += [
+                f"{surface:4d}  {numbers.uniform('.6f', 0.9, 1)}  {numbers.uniform('.6f', 0.99, 1)}"
+                for surface in range(1, n_surfaces + 1)
+            ]
+            lines.append("")
+
+    return _join(lines)
+
+
+def cardinal_points(decimal_point: str) -> str:
+    """Cardinal Points of a singlet."""
+    numbers = _Numbers(decimal_point)
+    points = [
+        "Focal Length",
+        "Focal Planes",
+        "Principal Planes",
+        "Anti-Principal Planes",
+        "Nodal Planes",
+        "Anti-Nodal Planes",
+    ]
+    lines = [
+        "Cardinal Points",
+        "",
+        *HEADER_LINES,
+        "",
+        "Starting surface     : 2",
+        "Ending surface       : 3",
+        f"Wavelength           : {numbers.format(0.543, '.6f')}",
+        "Orientation          : Y-Z",
+        "Lens units           : Millimeters",
+        "",
+        "Distances are measured from the starting and ending surface.",
+        "",
+        "                                 Object Space        Image Space",
+    ]
+    lines += [f"{point:<25}: {numbers.normal('.6f', 20)}   {numbers.normal('.6f', 20)}" for point in points]
+
+    return _join(lines)
+
+
+def surface_data(decimal_point: str, n_wavelengths: int) -> str:
+    """Surface Data of a glass surface with refractive indices at `n_wavelengths` wavelengths."""
+    numbers = _Numbers(decimal_point)
+    lines = [
+        "Surface 2 Data Summary",
+        "",
+        *HEADER_LINES,
+        "Lens units    : Millimeters",
+        "",
+        f"Thickness     : {numbers.format(5, '.6f')}",
+        f"Diameter      : {numbers.format(25.4, '.6f')}",
+        "",
+        "Edge Thickness:",
+        f"Y Edge Thick  : {numbers.format(3.2, '.6f')}",
+        f"X Edge Thick  : {numbers.format(3.2, '.6f')}",
+        "",
+        "Index of Refraction:",
+        "Glass         : N-BK7",
+        "Best Fit Glass: N-BK7",
+        "#   Wavelength         Index",
+    ]
+    lines += [
+        f"{i:3d}\t{numbers.format(w, '.6f')}\t{numbers.format(1.52 - 0.02 * w, '.6f')}"
+        for i, w in enumerate(np.linspace(0.4, 0.8, n_wavelengths), start=1)
+    ]
+    lines += ["", "Surface Powers (as situated):"]
+
+    for _ in range(2):
+        lines += [
+            f"Surf  2        : {numbers.normal('.6E', 0.01)}",
+            f"Surf  3        : {numbers.normal('.6E', 0.01)}",
+            f"Power {numbers.format(0, '.4f')} {numbers.format(1, '.4f')} : {numbers.normal('.6E', 0.01)}",
+            f"EFL {numbers.format(0, '.4f')} {numbers.format(1, '.4f')} : {numbers.normal('.6f', 100)}",
+            f"F/# {numbers.format(0, '.4f')} {numbers.format(1, '.4f')} : {numbers.uniform('.6f', 2, 8)}",
+            "",
+            "Surface Powers (in air):",
+        ]
+
+    lines[-1] = f"Shape Factor  : {numbers.normal('.6f')}"
+
+    return _join(lines)
+
+
+def system_data(decimal_point: str, n_fields: int, n_wavelengths: int) -> str:
+    """System Data of a system with `n_fields` fields and `n_wavelengths` wavelengths."""
+    numbers = _Numbers(decimal_point)
+
+    def value(spec: str = ".6f", scale: float = 10) -> str:
+        return numbers.normal(spec, scale)
+
+    lines = [
+        "System/Prescription Data",
+        "",
+        *HEADER_LINES,
+        "",
+        "GENERAL LENS DATA:",
+        "",
+        "Surfaces                : 4",
+        "Stop                    : 1",
+        f"System Aperture         : Entrance Pupil Diameter = {numbers.format(10, '.6f')}",
+        "Fast Semi-Diameters     : On",
+        "Field Unpolarized       : On",
+        "Convert thin film phase to ray equivalent  :  On",
+        "J/E Conversion Method   : X Axis Reference",
+        "Glass Catalogs          : SCHOTT MISC",
+        "Ray Aiming              : Off",
+        f"Apodization             : Uniform, factor = {numbers.format(0, '.6E')}",
+        "Reference OPD           : Exit Pupil",
+        "Paraxial Rays Setting   : Ignore Coordinate Breaks",
+        "Method to Compute F/#   : Tracing Rays",
+        "Method to Compute Huygens Integral     : Force Planar",
+        "Print Coordinate Breaks : On",
+        "Multi-Threading         : On",
+        "OPD Modulo 2 Pi         : Off",
+        f"Temperature (C)         : {numbers.format(20, '.6E')}",
+        f"Pressure (ATM)          : {numbers.format(1, '.6E')}",
+        "Adjust Index Data To Environment       : Off",
+        f"Effective Focal Length  : {value()} (in air at system temperature and pressure)",
+        f"Effective Focal Length  : {value()} (in image space)",
+        f"Back Focal Length       : {value()}",
+        f"Total Track             : {value()}",
+        f"Image Space F/#         : {value()}",
+        f"Paraxial Working F/#    : {value()}",
+        f"Working F/#             : {value()}",
+        f"Image Space NA          : {value(scale=0.1)}",
+        f"Object Space NA         : {value('.6E', 1e-9)}",
+        f"Stop Radius             : {value()}",
+        f"Paraxial Image Height   : {value()}",
+        f"Paraxial Magnification  : {value()}",
+        f"Entrance Pupil Diameter : {value()}",
+        f"Entrance Pupil Position : {value()}",
+        f"Exit Pupil Diameter     : {value()}",
+        f"Exit Pupil Position     : {value()}",
+        "Field Type              : Angle in degrees",
+        f"Maximum Radial Field    : {value()}",
+        f"Primary Wavelength [µm] : {numbers.format(0.543, '.6f')}",
+        f"Angular Magnification   : {value()}",
+        "Lens Units              : Millimeters",
+        "Source Units            : Watts",
+        "Analysis Units          : Watts/cm^2",
+        "Afocal Mode Units       : milliradians",
+        "MTF Units               : cycles/millimeter",
+        "Include Calculated Data in Session File : On",
+        "",
+        f"Fields          : {n_fields}",
+        "Field Type      : Angle in degrees",
+        "#        X-Value        Y-Value         Weight",
+    ]
+    lines += [
+        f"{i:<3d} {numbers.format(0, '14.6f')} {numbers.format(f, '14.6f')} {numbers.format(1, '14.6f')}"
+        for i, f in enumerate(np.linspace(0, 10, n_fields), start=1)
+    ]
+    lines += ["", "Vignetting Factors", "#       VDX       VDY       VCX       VCY       VAN"]
+    lines += [f"{i:<3d} " + " ".join(numbers.format(0, "9.6f") for _ in range(5)) for i in range(1, n_fields + 1)]
+    lines += ["", f"Wavelengths     : {n_wavelengths}", "Units           : µm", "#          Value         Weight"]
+    lines += [
+        f"{i:<3d} {numbers.format(w, '14.6f')} {numbers.format(1, '14.6f')}"
+        for i, w in enumerate(np.linspace(0.45, 0.65, n_wavelengths), start=1)
+    ]
+    lines += ["", "Predicted coordinate ABCD matrix:"]
+    lines += [f"{entry} = {value()}" for entry in "ABCD"]
+
+    return _join(lines)
+
+
+_ZERNIKE_FORMULAS = [
+    "1",
+    "4^(1/2) (p) * COS (A)",
+    "4^(1/2) (p) * SIN (A)",
+    "3^(1/2) (2p^2 - 1)",
+    "6^(1/2) (p^2) * SIN (2A)",
+]
+
+
+def zernike_standard_coefficients(decimal_point: str, n_terms: int) -> str:
+    """Zernike Standard Coefficients with `n_terms` terms."""
+    numbers = _Numbers(decimal_point)
+    lines = [
+        "Listing of Zernike Standard Coefficient Data",
+        "",
+        *HEADER_LINES,
+        "",
+        "Note: RMS (to chief) is the RMS wavefront error relative to the chief ray.",
+        "",
+        "Surface                              :  Image",
+        f"Field                                :  {numbers.format(0, '.4f')}, {numbers.format(0, '.4f')} (deg)",
+        f"Wavelength                           :  {numbers.format(0.543, '.4f')} µm",
+        f"Peak to Valley (to chief)            :  {numbers.uniform('.8f')} waves",
+        f"Peak to Valley (to centroid)         :  {numbers.uniform('.8f')} waves",
+        "",
+    ]
+
+    for name in ("rays", "fitted coefficients"):
+        lines += [
+            f"From integration of the {name}:",
+            f"RMS (to chief)                       :  {numbers.uniform('.8f')} waves",
+            f"RMS (to centroid)                    :  {numbers.uniform('.8f')} waves",
+            f"Variance                             :  {numbers.uniform('.8f')} waves squared",
+            f"Strehl Ratio (Est)                   :  {numbers.uniform('.8f')}",
+            "",
+        ]
+
+    lines += [
+        f"RMS fit error                        :  {numbers.uniform('.8f', 0, 1e-6)} waves",
+        f"Maximum fit error                    :  {numbers.uniform('.8f', 0, 1e-6)} waves",
+        "",
+    ]
+    lines += [
+        f"Z {i:3d}  {numbers.normal('16.8f')} :   {_ZERNIKE_FORMULAS[i % len(_ZERNIKE_FORMULAS)]}"
+        for i in range(1, n_terms + 1)
+    ]
+
+    return _join(lines)
+
+
+def zernike_coefficients_vs_field(decimal_point: str, n_fields: int, n_terms: int) -> str:
+    """Zernike Coefficients vs. Field with `n_terms` terms at `n_fields` field points."""
+    numbers = _Numbers(decimal_point)
+    lines = [
+        "Zernike Coefficients vs. Field",
+        "",
+        *HEADER_LINES,
+        "",
+        "Field: " + "   ".join(str(i) for i in range(1, n_terms + 1)),
+    ]
+    lines += [
+        "   ".join([numbers.format(field, ".8f"), *(numbers.normal(".8f") for _ in range(n_terms))])
+        for field in np.linspace(0, 1, n_fields)
+    ]
+
+    return _join(lines)
+
+
+@dataclass(frozen=True)
+class Case:
+    """Text output of an analysis at a certain size."""
+
+    grammar: str
+    size: str
+    generate: Callable[..., str]
+    parameters: dict[str, Any]
+    transformer: type[Transformer]
+    result_type: type | None = None
+
+
+CASES = [
+    Case(
+        "single_ray_trace",
+        "small",
+        single_ray_trace,
+        {"n_surfaces": 5},
+        SingleRayTraceTransformer,
+        SingleRayTraceResult,
+    ),
+    Case(
+        "single_ray_trace",
+        "large",
+        single_ray_trace,
+        {"n_surfaces": 500},
+        SingleRayTraceTransformer,
+        SingleRayTraceResult,
+    ),
+    Case(
+        "polarization_pupil_map",
+        "small",
+        polarization_pupil_map,
+        {"sampling": 11},
+        PolarizationPupilMapTransformer,
+        PolarizationPupilMapResult,
+    ),
+    Case(
+        "polarization_pupil_map",
+        "large",
+        polarization_pupil_map,
+        {"sampling": 65},
+        PolarizationPupilMapTransformer,
+        PolarizationPupilMapResult,
+    ),
+    Case(
+        "polarization_transmission",
+        "small",
+        polarization_transmission,
+        {"n_fields": 1, "n_wavelengths": 1, "n_surfaces": 4},
+        PolarizationTransmissionTransformer,
+        PolarizationTransmissionResult,
+    ),
+    Case(
+        "polarization_transmission",
+        "large",
+        polarization_transmission,
+        {"n_fields": 4, "n_wavelengths": 6, "n_surfaces": 20},
+        PolarizationTransmissionTransformer,
+        PolarizationTransmissionResult,
+    ),
+    Case("cardinal_points", "small", cardinal_points, {}, CardinalPointsTransformer, CardinalPointsResult),
+    Case("surface_data", "small", surface_data, {"n_wavelengths": 3}, SurfaceDataTransformer, SurfaceDataResult),
+    Case("surface_data", "large", surface_data, {"n_wavelengths": 24}, SurfaceDataTransformer, SurfaceDataResult),
+    Case(
+        "system_data",
+        "small",
+        system_data,
+        {"n_fields": 3, "n_wavelengths": 3},
+        SystemDataTransformer,
+        SystemDataResult,
+    ),
+    Case(
+        "system_data",
+        "large",
+        system_data,
+        {"n_fields": 12, "n_wavelengths": 24},
+        SystemDataTransformer,
+        SystemDataResult,
+    ),
+    Case(
+        "zernike_standard_coefficients",
+        "small",
+        zernike_standard_coefficients,
+        {"n_terms": 37},
+        ZernikeStandardCoefficientsTransformer,
+        ZernikeStandardCoefficientsResult,
+    ),
+    Case(
+        "zernike_standard_coefficients",
+        "large",
+        zernike_standard_coefficients,
+        {"n_terms": 231},
+        ZernikeStandardCoefficientsTransformer,
+        ZernikeStandardCoefficientsResult,
+    ),
+    Case(
+        "zernike_coefficients_vs_field",
+        "small",
+        zernike_coefficients_vs_field,
+        {"n_fields": 11, "n_terms": 37},
+        ZernikeCoefficientsVsFieldTransformer,
+    ),
+    Case(
+        "zernike_coefficients_vs_field",
+        "large",
+        zernike_coefficients_vs_field,
+        {"n_fields": 101, "n_terms": 231},
+        ZernikeCoefficientsVsFieldTransformer,
+    ),
+]
+"""Benchmark cases. Every grammar in `zospy/analyses/parsers/grammars` has at least one case."""
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
+from lark import Lark, Transformer
 
 from zospy.analyses.parsers import base
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 available_grammars = [
     g.stem for g in Path(base.__file__).parent.joinpath("grammars").glob("*.lark") if g.stem != "zospy"
 ]
@@ -20,3 +25,78 @@ def test_load_grammar(grammar: str):
 def test_load_nonexistent_grammar():
     with pytest.raises(FileNotFoundError, match=r"Grammar file nonexistent.lark not found"):
         base.load_grammar("nonexistent")
+
+
+class ListTransformer(Transformer):
+    def start(self, args):
+        return {"words": [str(arg) for arg in args]}
+
+
+@pytest.fixture
+def word_parser() -> Lark:
+    return Lark("start: WORD+\n%import common (WORD, WS)\n%ignore WS", parser="earley")
+
+
+@pytest.fixture
+def parse_cache(mocker: MockerFixture):
+    mocker.patch("zospy.api.config.PARSE_CACHE_SIZE", 2)
+    base.clear_parse_cache()
+
+    yield
+
+    base.clear_parse_cache()
+
+
+class TestParseCache:
+    def test_disabled_by_default(self, word_parser, mocker):
+        spy = mocker.spy(word_parser, "parse")
+
+        base.parse("a b", word_parser, ListTransformer)
+        base.parse("a b", word_parser, ListTransformer)
+
+        assert spy.call_count == 2
+        assert base.parse_cache_info().currsize == 0
+
+    @pytest.mark.usefixtures("parse_cache")
+    def test_cached(self, word_parser, mocker):
+        spy = mocker.spy(word_parser, "parse")
+
+        first = base.parse("a b", word_parser, ListTransformer)
+        second = base.parse("a b", word_parser, ListTransformer)
+
+        assert spy.call_count == 1
+        assert first == second == {"words": ["a", "b"]}
+        assert base.parse_cache_info() == base.ParseCacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    @pytest.mark.usefixtures("parse_cache")
+    def test_returns_copies(self, word_parser):
+        base.parse("a b", word_parser, ListTransformer)["words"].append("c")
+
+        assert base.parse("a b", word_parser, ListTransformer) == {"words": ["a", "b"]}
+
+    @pytest.mark.usefixtures("parse_cache")
+    def test_keyed_by_decimal_point(self, word_parser, mocker):
+        spy = mocker.spy(word_parser, "parse")
+
+        base.parse("a b", word_parser, ListTransformer)
+        mocker.patch("zospy.api.config.DECIMAL_POINT", ",")
+        base.parse("a b", word_parser, ListTransformer)
+
+        assert spy.call_count == 2
+
+    @pytest.mark.usefixtures("parse_cache")
+    def test_least_recently_used_is_evicted(self, word_parser, mocker):
+        spy = mocker.spy(word_parser, "parse")
+
+        for text in ["a", "b", "a", "c", "a", "b"]:
+            base.parse(text, word_parser, ListTransformer)
+
+        assert base.parse_cache_info().currsize == 2
+        assert [c.args[0] for c in spy.call_args_list] == ["a", "b", "c", "b"]
+
+
+def test_parse_falls_back_to_original_text(word_parser, mocker):
+    # A block that was extracted from outside a table leaves a placeholder that the grammar does not accept
+    mocker.patch("zospy.analyses.parsers.base.extract_numeric_blocks", return_value=("0", ["a b"]))
+
+    assert base.parse("a b", word_parser, ListTransformer) == {"words": ["a", "b"]}
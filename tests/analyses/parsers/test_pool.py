@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+from zospy.analyses.parsers import base, pool
+from zospy.analyses.polarization.pupil_map import PolarizationPupilMapResult, PolarizationPupilMapTransformer
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+PUPIL_MAP_TEXT = """\ufeffPolarization Pupil Map
+
+File : C:\\lens.zmx
+Title:
+
+Wavelength     : 0,5430
+Field Pos      : 0,0000 (deg)
+X-Field        : 1,0000
+Y-Field        : 0,0000
+X-Phase        : 0,0000
+Y-Phase        : 0,0000
+Configs        : 1
+Surface        : 4
+Transmission   : 95,1234 %
+
+   Px       Py        Ex        Ey    Intensity  Phase (Deg) Orientation
+ -1,000000   -1,000000    0,125730   -0,132105    0,640423    0,104900   -0,535669
+  1,000000   -1,000000   -0,623274    0,041326   -2,325031   -0,218792   -1,245911
+"""
+
+
+@pytest.fixture
+def parse_pool(mocker: MockerFixture):
+    mocker.patch("zospy.api.config.DECIMAL_POINT", ",")
+    mocker.patch("zospy.api.config.THOUSANDS_SEPARATOR", ".")
+
+    yield
+
+    pool.shutdown_parse_pool()
+
+
+@pytest.mark.usefixtures("parse_pool")
+def test_submit_parse():
+    future = pool.submit_parse(PUPIL_MAP_TEXT, "polarization_pupil_map", PolarizationPupilMapTransformer, max_workers=1)
+    expected = base.parse(PUPIL_MAP_TEXT, base.load_grammar("polarization_pupil_map"), PolarizationPupilMapTransformer)
+    result = future.result(timeout=60)
+
+    assert result["Wavelength"] == pytest.approx(0.543)
+    pd.testing.assert_frame_equal(result["Pupil Map"], expected["Pupil Map"])
+
+
+@pytest.mark.usefixtures("parse_pool")
+def test_submit_parse_raises_parse_errors():
+    future = pool.submit_parse("Not a pupil map", "polarization_pupil_map", PolarizationPupilMapTransformer)
+
+    with pytest.raises(ValueError, match="Failed to parse text output with grammar polarization_pupil_map"):
+        future.result(timeout=60)
+
+
+@pytest.mark.usefixtures("parse_pool")
+def test_submit_parse_with_result_type():
+    future = pool.submit_parse(
+        PUPIL_MAP_TEXT, "polarization_pupil_map", PolarizationPupilMapTransformer, PolarizationPupilMapResult
+    )
+    result = future.result(timeout=60)
+
+    assert isinstance(result, PolarizationPupilMapResult)
+    assert result.surface == 4
+    assert result.pupil_map.shape == (2, 7)
+
+
+@pytest.mark.usefixtures("parse_pool")
+def test_submit_parse_raises_validation_errors():
+    text = PUPIL_MAP_TEXT.replace("Configs        : 1\n", "")
+    future = pool.submit_parse(
+        text, "polarization_pupil_map", PolarizationPupilMapTransformer, PolarizationPupilMapResult
+    )
+
+    with pytest.raises(ValueError, match="Failed to create PolarizationPupilMapResult"):
+        future.result(timeout=60)
+
+
+@pytest.mark.usefixtures("parse_pool")
+def test_shutdown_parse_pool():
+    first = pool.submit_parse(PUPIL_MAP_TEXT, "polarization_pupil_map", PolarizationPupilMapTransformer)
+    pool.shutdown_parse_pool()
+
+    assert first.done()
+
+    second = pool.submit_parse(PUPIL_MAP_TEXT, "polarization_pupil_map", PolarizationPupilMapTransformer)
+
+    assert second.result(timeout=60).keys() == first.result().keys()
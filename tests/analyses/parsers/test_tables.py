@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from zospy.analyses.parsers import base
+from zospy.analyses.parsers.tables import extract_numeric_blocks, read_array, read_table, restore_numeric_blocks
+
+NUMERIC_TABLE = """
+  1.0   2.0   3.0
+ -4.5  -    Infinity
+
+  7     8.0e-2  9.0
+"""
+
+PUPIL_MAP_TEXT = """\ufeffPolarization Pupil Map
+
+File : C:\\lens.zmx
+Title:
+
+Wavelength     : 0.5430
+Transmission   : 95.1234 %
+
+   Px       Py        Ex        Ey    Intensity  Phase (Deg) Orientation
+ -1.000000   -1.000000    0.125730   -0.132105    0.640423    0.104900   -0.535669
+ -1.000000    1.000000    0.361595    1.304000    0.947081   -0.703735   -1.265421
+  1.000000   -1.000000   -0.623274    0.041326   -2.325031   -0.218792   -1.245911
+"""
+
+RAY_TRACE_TEXT = """\ufeffRay Trace Data
+
+Lens Title: lens
+Units           :   Millimeters
+
+Wavelength      :   0.543000 µm
+Normalized Y Field Coord (Hy) :\t1.0000000000
+
+Real Ray Trace Data:
+
+Surf\tY marginal\tU marginal\tY chief\tU chief\tComment
+OBJ\tInfinity\t0.0000000000E+00\t-\t-
+STO\t1.2500000000E+00\t-2.5000000000E-02\t0.0000000000E+00\t1.0000000000E-01
+  2\t1.0000000000E+00\t-2.5000000000E-02\t5.0000000000E-01\t1.0000000000E-01\tlens front
+"""
+
+
+class TestReadArray:
+    def test_read_array(self):
+        result = read_array(NUMERIC_TABLE, decimal_point=".", thousands_separator=None)
+
+        np.testing.assert_array_equal(result, [[1, 2, 3], [-4.5, np.nan, np.inf], [7, 0.08, 9]])
+
+    def test_decimal_comma(self):
+        result = read_array("1,5 2.000,25\n-3 4", decimal_point=",", thousands_separator=".")
+
+        np.testing.assert_array_equal(result, [[1.5, 2000.25], [-3, 4]])
+
+    def test_pad(self):
+        result = read_array("1 2 3\n4", 3, decimal_point=".", thousands_separator=None)
+
+        np.testing.assert_array_equal(result, [[1, 2, 3], [4, np.nan, np.nan]])
+
+    def test_empty(self):
+        assert read_array("\n", 2).shape == (0, 2)
+
+    def test_different_row_lengths_raises_value_error(self):
+        with pytest.raises(ValueError, match="same number of values"):
+            read_array("1 2 3\n4", decimal_point=".", thousands_separator=None)
+
+    def test_too_many_values_raises_value_error(self):
+        with pytest.raises(ValueError, match="at most 2 values"):
+            read_array("1 2 3", 2, decimal_point=".", thousands_separator=None)
+
+
+class TestReadTable:
+    def test_read_table(self):
+        result = read_table("1 2\n3 4", ["A", "B"], decimal_point=".", thousands_separator=None)
+
+        pd.testing.assert_frame_equal(result, pd.DataFrame({"A": [1.0, 3.0], "B": [2.0, 4.0]}))
+
+    def test_label_and_text_column(self):
+        body = "OBJ\tInfinity\t0.0\n  1\t1.5\t-\tfront   lens\n  2\t2.5\t3.5"
+
+        result = read_table(
+            body,
+            ["Surf", "X", "Y", "Comment"],
+            label_column=True,
+            text_column=True,
+            decimal_point=".",
+            thousands_separator=None,
+        )
+
+        assert result["Surf"].tolist() == ["OBJ", 1, 2]
+        np.testing.assert_array_equal(result["X"], [np.inf, 1.5, 2.5])
+        np.testing.assert_array_equal(result["Y"], [0, np.nan, 3.5])
+        assert result["Comment"].iloc[1] == "front lens"
+        assert result["Comment"].isna().tolist() == [True, False, True]
+
+    def test_numeric_text_after_numeric_columns(self):
+        body = "  1\t1.5\t2.5\t2\n  2\t3.5\t4.5\t1.5 mm"
+
+        result = read_table(
+            body,
+            ["Surf", "X", "Y", "Comment"],
+            label_column=True,
+            text_column=True,
+            decimal_point=".",
+            thousands_separator=None,
+        )
+
+        np.testing.assert_array_equal(result["Y"], [2.5, 4.5])
+        assert result["Comment"].tolist() == ["2", "1.5 mm"]
+
+    def test_missing_columns_warns(self):
+        with pytest.warns(UserWarning, match="Header and row length mismatch"):
+            result = read_table("1 2\n3", ["A", "B"], decimal_point=".", thousands_separator=None)
+
+        np.testing.assert_array_equal(result["B"], [2, np.nan])
+
+    def test_too_many_values_raises_value_error(self):
+        with pytest.raises(ValueError, match="at most 1 numeric values"):
+            read_table("1 2", ["A"], decimal_point=".", thousands_separator=None)
+
+
+class TestNumericBlocks:
+    def test_extract_numeric_blocks(self):
+        parser = base.load_grammar("polarization_pupil_map")
+
+        text, blocks = extract_numeric_blocks(PUPIL_MAP_TEXT, parser)
+
+        assert len(blocks) == 1
+        assert blocks[0].startswith("-1.000000")
+        assert blocks[0].endswith("-1.245911")
+        assert text.startswith(PUPIL_MAP_TEXT[: PUPIL_MAP_TEXT.index(" -1.000000")])
+        assert "0.125730" not in text
+
+    def test_extract_ray_trace_data_rows(self):
+        parser = base.load_grammar("single_ray_trace")
+
+        text, blocks = extract_numeric_blocks(RAY_TRACE_TEXT, parser)
+
+        assert len(blocks) == 1
+        assert blocks[0].startswith("OBJ")
+        assert blocks[0].endswith("lens front")
+        assert "1.2500000000E+00" not in text
+        assert restore_numeric_blocks(parser.parse(text), blocks) == parser.parse(RAY_TRACE_TEXT)
+
+    def test_extract_numeric_blocks_without_terminal(self):
+        parser = base.load_grammar("single_ray_trace")
+
+        assert extract_numeric_blocks(PUPIL_MAP_TEXT, parser) == (PUPIL_MAP_TEXT, [])
+
+    def test_restore_numeric_blocks(self):
+        parser = base.load_grammar("polarization_pupil_map")
+
+        text, blocks = extract_numeric_blocks(PUPIL_MAP_TEXT, parser)
+        restored = restore_numeric_blocks(parser.parse(text), blocks)
+
+        assert restored == parser.parse(PUPIL_MAP_TEXT)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import json
+from concurrent.futures import Future
 from contextlib import nullcontext as does_not_raise
 from dataclasses import fields
 from datetime import datetime
@@ -361,6 +362,43 @@ class TestAnalysisWrapper:
         assert getattr(analysis, temp_file_type).exists()
         assert getattr(analysis, temp_file_type).is_file()
 
+    def test_close_sustained_analysis(self, mocker: MockerFixture):
+        analysis = MockAnalysis()
+        analysis.run(oss=mocker.Mock(), oncomplete="Sustain")
+
+        assert analysis.analysis is not None
+
+        analysis.close()
+
+        assert analysis.analysis is None
+
+        analysis.close()  # Closing a closed analysis does nothing
+
+    def test_run_in_background_returns_future(self, mocker: MockerFixture):
+        result = MockAnalysis().run(oss=mocker.Mock(), background=True)
+
+        assert isinstance(result.data, Future)
+        assert result.data.result() == MockAnalysisData()
+
+    def test_run_in_background_parses_output_in_background(self, mocker: MockerFixture):
+        submit_parse = mocker.patch("zospy.analyses.base.submit_parse", return_value=Future())
+        analysis = MockAnalysis()
+        mocker.patch.object(analysis, "get_text_output", return_value="text")
+        mocker.patch.object(
+            analysis, "run_analysis", side_effect=lambda: analysis.parse_output("grammar", mocker.Mock())
+        )
+
+        result = analysis.run(oss=mocker.Mock(), background=True)
+
+        assert result.data is submit_parse.return_value
+        submit_parse.assert_called_once()
+        assert analysis.parse_output("grammar", mocker.Mock(), background=True) is submit_parse.return_value
+
+        # Outside a background run, the output is parsed directly
+        mocker.patch("zospy.analyses.base.load_grammar")
+        parse = mocker.patch("zospy.analyses.base.parse", return_value=MockAnalysisData())
+        assert analysis.parse_output("grammar", mocker.Mock()) is parse.return_value
+
     @pytest.mark.parametrize(
         "temp_file_type,filename",
         [
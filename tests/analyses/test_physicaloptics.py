@@ -7,7 +7,9 @@ from zospy.analyses.physicaloptics import (
     PhysicalOpticsPropagation,
     create_beam_parameter_dict,
     create_fiber_parameter_dict,
+    parameter_schema,
 )
+from zospy.analyses.physicaloptics.parameter_schema import POPParameterSchema
 
 
 class TestPhysicalOpticsPropagation:
@@ -272,3 +274,83 @@ class TestPhysicalOpticsPropagation:
                 fiber_type="GaussianWaist",
                 fiber_parameters={"WrongName": 1},
             ).run(simple_system)
+
+
+class TestParameterSchema:
+    @pytest.fixture
+    def schema(self):
+        return POPParameterSchema(
+            version="25.1.1",
+            beam={"TopHat": {"Waist X": 2.0, "Waist Y": 2.0, "Decenter X": 0.0, "Decenter Y": 0.0}},
+            fiber={"TopHat": {"Waist X": 1.0, "Waist Y": 1.0, "Decenter X": 0.0, "Decenter Y": 0.0}},
+        )
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, mocker):
+        mocker.patch("zospy.api.config.CACHE_DIR", tmp_path)
+        parameter_schema.clear_parameter_schema_cache()
+
+        yield tmp_path
+
+        parameter_schema.clear_parameter_schema_cache()
+
+    def test_indices(self, schema):
+        assert schema.indices("beam", "TopHat") == {"Waist X": 0, "Waist Y": 1, "Decenter X": 2, "Decenter Y": 3}
+        assert schema.indices("fiber", "File") is None
+
+    def test_invalid_kind_raises_value_error(self, schema):
+        with pytest.raises(ValueError, match="Invalid parameter type"):
+            schema.parameters("lens", "TopHat")
+
+    def test_json_roundtrip_preserves_order(self, schema):
+        result = POPParameterSchema.from_json(schema.to_json())
+
+        assert result == schema
+        assert list(result.beam["TopHat"]) == list(schema.beam["TopHat"])
+
+    def test_discover_matches_parameter_dicts(self, simple_system):
+        schema = parameter_schema.discover_parameter_schema(simple_system)
+
+        assert set(schema.beam) >= {"GaussianWaist", "GaussianSizeAngle", "TopHat", "AstigmaticGaussian"}
+        assert not set(schema.beam) & parameter_schema.DYNAMIC_BEAM_TYPES
+        assert set(schema.fiber["TopHat"]) == {"Waist X", "Waist Y", "Decenter X", "Decenter Y"}
+
+    def test_schema_is_cached_in_memory_and_on_disk(self, simple_system, cache_dir):
+        schema = parameter_schema.get_parameter_schema(simple_system)
+
+        assert parameter_schema.get_parameter_schema(simple_system) is schema
+        assert (cache_dir / f"pop_parameters_{schema.version}.json").exists()
+
+        parameter_schema.clear_parameter_schema_cache()
+
+        assert parameter_schema.get_parameter_schema(simple_system) == schema
+
+    def test_schema_is_read_from_disk(self, simple_system, cache_dir, schema, mocker):
+        version = str(simple_system.ZOS.version)
+        (cache_dir / f"pop_parameters_{version}.json").write_text(schema.to_json())
+        discover = mocker.patch("zospy.analyses.physicaloptics.parameter_schema.discover_parameter_schema")
+
+        assert create_beam_parameter_dict(simple_system, beam_type="TopHat") == schema.beam["TopHat"]
+        discover.assert_not_called()
+
+    def test_clear_persistent_cache(self, simple_system, cache_dir):
+        parameter_schema.get_parameter_schema(simple_system)
+
+        parameter_schema.clear_parameter_schema_cache(persistent=True)
+
+        assert not list(cache_dir.glob("pop_parameters_*.json"))
+
+    def test_schema_is_not_stored_without_cache_dir(self, schema, tmp_path, mocker, monkeypatch):
+        mocker.patch("zospy.api.config.CACHE_DIR", None)
+        mocker.patch("zospy.analyses.physicaloptics.parameter_schema.discover_parameter_schema", return_value=schema)
+        monkeypatch.chdir(tmp_path)
+        oss = mocker.Mock()
+        oss.ZOS.version = schema.version
+        parameter_schema.clear_parameter_schema_cache()
+
+        try:
+            assert parameter_schema.get_parameter_schema(oss) is schema
+        finally:
+            parameter_schema.clear_parameter_schema_cache()
+
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import zospy as zp
+from zospy.analyses.tolerancing import QuickYield
+
+
+class TestQuickYield:
+    @staticmethod
+    def _add_tolerance(oss):
+        radius_tolerance = oss.TDE.GetOperandAt(1)
+        radius_tolerance.ChangeType(zp.constants.Editors.TDE.ToleranceOperandType.TRAD)
+        radius_tolerance.GetOperandCell(zp.constants.Editors.TDE.ToleranceColumn.Param1).IntegerValue = 2
+        radius_tolerance.Min = -0.1
+        radius_tolerance.Max = 0.1
+
+    def test_can_run(self, simple_system):
+        self._add_tolerance(simple_system)
+
+        result = QuickYield(number_of_monte_carlo=100).run(simple_system)
+        assert result.data is not None
+
+    def test_to_json(self, simple_system):
+        self._add_tolerance(simple_system)
+
+        result = QuickYield(number_of_monte_carlo=100).run(simple_system)
+        assert result.from_json(result.to_json()).to_json() == result.to_json()
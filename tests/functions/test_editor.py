@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from zospy.functions._editor import CellChange, CommentIndex, EditorColumns, _is_missing, apply_changes
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def comment_index() -> CommentIndex:
+    return CommentIndex(["", "Lens 1", "lens 2", "Lens 1", "Detector"], first_row=1)
+
+
+class TestCommentIndex:
+    def test_len(self, comment_index):
+        assert len(comment_index) == 5
+
+    @pytest.mark.parametrize(
+        "comment,case_sensitive,expected",
+        [
+            ("Lens 1", True, [2, 4]),
+            ("LENS 1", True, []),
+            ("LENS 1", False, [2, 4]),
+            ("", True, [1]),
+            ("Lens 3", False, []),
+        ],
+    )
+    def test_find(self, comment_index, comment, case_sensitive, expected):
+        assert comment_index.find(comment, case_sensitive=case_sensitive) == expected
+
+    @pytest.mark.parametrize(
+        "prefix,case_sensitive,expected",
+        [("Lens", True, [2, 4]), ("lens", False, [2, 3, 4]), ("", True, [1, 2, 3, 4, 5])],
+    )
+    def test_startswith(self, comment_index, prefix, case_sensitive, expected):
+        assert comment_index.startswith(prefix, case_sensitive=case_sensitive) == expected
+
+    @pytest.mark.parametrize(
+        "pattern,case_sensitive,expected",
+        [
+            (r"\d$", True, [2, 3, 4]),
+            ("^det", True, []),
+            ("^det", False, [5]),
+            (re.compile(r"2"), True, [3]),
+            (re.compile(r"^LENS"), False, [2, 3, 4]),
+        ],
+    )
+    def test_match(self, comment_index, pattern, case_sensitive, expected):
+        assert comment_index.match(pattern, case_sensitive=case_sensitive) == expected
+
+    def test_find_returns_copy(self, comment_index):
+        comment_index.find("Lens 1").append(10)
+
+        assert comment_index.find("Lens 1") == [2, 4]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, True), (np.nan, True), (pd.NA, True), (pd.NaT, True), (0.0, False), ("", False), ("None", False)],
+)
+def test_is_missing(value, expected):
+    assert _is_missing(value) is expected
+
+
+class TestApplyChanges:
+    @pytest.fixture
+    def columns(self) -> EditorColumns:
+        return EditorColumns(("Comment", "Thickness"), "GetSurfaceCell", "Editors.LDE.SurfaceColumn")
+
+    def test_rollback_skips_cells_without_value(self, columns, mocker: MockerFixture):
+        row = mocker.Mock(Comment="old", Thickness=1.0)
+        write = mocker.patch.object(
+            EditorColumns, "write", side_effect=[None, None, RuntimeError("Cannot write"), None]
+        )
+        changes = [
+            CellChange(1, "Comment", "old", "new"),
+            CellChange(1, "Par1", None, 2.0),
+            CellChange(1, "Thickness", 1.0, 2.0),
+        ]
+
+        with pytest.raises(RuntimeError, match="Cannot write"):
+            apply_changes(mocker.MagicMock(), changes, lambda _: row, columns)
+
+        assert write.call_args_list[-1] == mocker.call(row, "Comment", "old")
+        assert write.call_count == 4
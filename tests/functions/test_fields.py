@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import zospy as zp
+from zospy.functions.fields import field_map, read_fields, write_fields
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+def test_read_fields(simple_system: OpticStudioSystem):
+    result = read_fields(simple_system)
+
+    assert result.index.tolist() == [1]
+    assert result.loc[1, "Y"] == 0
+    assert result.loc[1, "Weight"] == 1
+
+
+class TestWriteFields:
+    def test_add_fields(self, simple_system: OpticStudioSystem):
+        write_fields(simple_system, pd.DataFrame({"X": [0, 1, 2], "Y": [0, 3, 4]}))
+
+        result = read_fields(simple_system)
+
+        np.testing.assert_allclose(result["X"], [0, 1, 2])
+        np.testing.assert_allclose(result["Y"], [0, 3, 4])
+        np.testing.assert_allclose(result["Weight"], 1)
+
+    def test_remove_fields(self, simple_system: OpticStudioSystem):
+        write_fields(simple_system, pd.DataFrame({"X": [0, 1, 2], "Y": [0, 3, 4]}))
+        write_fields(simple_system, pd.DataFrame({"X": [5], "Y": [0], "Weight": [2]}))
+
+        result = read_fields(simple_system)
+
+        assert result.index.tolist() == [1]
+        assert result.loc[1, "X"] == 5
+        assert result.loc[1, "Weight"] == 2
+
+    def test_empty_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match="At least one field"):
+            write_fields(simple_system, pd.DataFrame({"X": [], "Y": []}))
+
+    def test_unknown_column_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match="Unknown field columns: Z"):
+            write_fields(simple_system, pd.DataFrame({"X": [0], "Y": [0], "Z": [0]}))
+
+
+class TestFieldMap:
+    def test_wavefront_map_zernike_cube(self, simple_system: OpticStudioSystem):
+        result = field_map(
+            simple_system, zp.analyses.wavefront.WavefrontMap(sampling="32x32"), [0, 1], [0, 1, 2], max_term=15
+        )
+
+        assert result.values.shape == (2, 3, 15)
+        assert result.executions == 6
+        np.testing.assert_allclose(result.values[0, 0, 4:6], 0, atol=1e-6)
+        assert np.abs(result.values[1, 2, 4:6]).max() > 1e-6
+
+    def test_zernike_standard_coefficients(self, simple_system: OpticStudioSystem):
+        result = field_map(
+            simple_system,
+            zp.analyses.wavefront.ZernikeStandardCoefficients(sampling="32x32", maximum_term=15),
+            [0],
+            [0, 2],
+        )
+
+        assert result.values.shape == (1, 2, 15)
+
+    def test_chunks(self, simple_system: OpticStudioSystem):
+        result = field_map(
+            simple_system, zp.analyses.wavefront.WavefrontMap(sampling="32x32"), [0, 1], [0, 1], chunk_size=3
+        )
+
+        reference = field_map(simple_system, zp.analyses.wavefront.WavefrontMap(sampling="32x32"), [0, 1], [0, 1])
+
+        np.testing.assert_allclose(result.values, reference.values)
+
+    def test_restores_fields(self, simple_system: OpticStudioSystem):
+        write_fields(simple_system, pd.DataFrame({"X": [0, 0], "Y": [0, 5], "VDY": [0, 0.1]}))
+        original_fields = read_fields(simple_system)
+        analysis = zp.analyses.wavefront.WavefrontMap(sampling="32x32")
+
+        field_map(simple_system, analysis, [0, 1, 2], [0, 1, 2], chunk_size=4)
+
+        pd.testing.assert_frame_equal(read_fields(simple_system), original_fields)
+        assert analysis.analysis is None
+
+    def test_restores_fields_on_error(self, simple_system: OpticStudioSystem):
+        original_fields = read_fields(simple_system)
+
+        def extract(_):
+            return np.zeros(1)
+
+        with pytest.raises(ValueError, match="one row per field point"):
+            field_map(simple_system, zp.analyses.wavefront.WavefrontMap(sampling="32x32"), [0, 1], [0], extract=extract)
+
+        pd.testing.assert_frame_equal(read_fields(simple_system), original_fields)
+
+    def test_invalid_chunk_size_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match="chunk_size should be at least 1"):
+            field_map(simple_system, zp.analyses.wavefront.WavefrontMap(), [0], [0], chunk_size=0)
+
+    def test_extracts_values_per_chunk(self, mocker):
+        mocker.patch("zospy.functions.fields.read_fields", return_value=pd.DataFrame({"X": [0.0], "Y": [0.0]}))
+        mocker.patch("zospy.functions.fields.write_fields")
+        analysis = mocker.Mock()
+        analysis.run.side_effect = lambda *_, **__: object()
+        chunk_sizes = []
+
+        def extract(results):
+            chunk_sizes.append(len(results))
+            return np.zeros((len(results), 2))
+
+        result = field_map(mocker.Mock(), analysis, [0, 1, 2], [0, 1], chunk_size=4, extract=extract)
+
+        assert chunk_sizes == [4, 2]
+        assert result.values.shape == (3, 2, 2)
+        assert result.executions == 6
@@ -3,8 +3,11 @@ from __future__ import annotations
 from inspect import signature
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from zospy.functions._editor import EditorColumns
 from zospy.functions.lde import (
     _APERTURE_FILE,
     _APERTURE_X_DECENTER,
@@ -17,11 +20,16 @@ from zospy.functions.lde import (
     _WIDTH_OF_ARMS,
     _X_HALF_WIDTH,
     _Y_HALF_WIDTH,
+    apply,
+    comment_index,
     find_surface_by_comment,
+    snapshot,
     surface_change_aperturetype,
 )
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from zospy.zpcore import OpticStudioSystem
 
 
@@ -50,6 +58,157 @@ def test_can_find_surface_by_comment(simple_system, comment, case_sensitive, exp
     assert indices == expected_indices
 
 
+def test_can_find_surface_by_comment_with_optic_studio_system(simple_system):
+    simple_system.LDE.GetSurfaceAt(1).Comment = "Abcd"
+    simple_system.LDE.GetSurfaceAt(4).Comment = "abcd"
+
+    result = find_surface_by_comment(simple_system, comment="ABCD", case_sensitive=False)
+
+    assert [surface.SurfaceNumber for surface in result] == [1, 4]
+
+
+class TestCommentIndex:
+    def test_queries(self, simple_system):
+        index = comment_index(simple_system)
+
+        assert index.find("lens front") == [2]
+        assert index.startswith("LENS", case_sensitive=False) == [2, 3]
+        assert index.match("back$") == [3]
+
+    def test_is_cached(self, simple_system):
+        assert comment_index(simple_system) is comment_index(simple_system)
+
+    def test_rebuilt_after_inserting_surface(self, simple_system):
+        comment_index(simple_system)
+
+        simple_system.LDE.InsertNewSurfaceAt(1).Comment = "new surface"
+
+        assert comment_index(simple_system).find("new surface") == [1]
+        assert comment_index(simple_system).find("lens front") == [3]
+
+    def test_rebuilt_after_invalidating(self, simple_system):
+        comment_index(simple_system)
+
+        simple_system.LDE.InsertNewSurfaceAt(3).Comment = "new surface"
+        simple_system.LDE.RemoveSurfaceAt(2)
+        simple_system.invalidate_comment_indexes("LDE")
+
+        assert comment_index(simple_system).find("lens front") == []
+        assert comment_index(simple_system).find("new surface") == [2]
+
+    def test_rebuilt_after_apply(self, simple_system):
+        comment_index(simple_system)
+
+        apply(simple_system, pd.DataFrame({"Comment": ["stop"]}, index=[1]))
+
+        assert comment_index(simple_system).find("stop") == [1]
+
+    def test_rebuilt_after_new(self, simple_system):
+        comment_index(simple_system)
+
+        simple_system.new()
+
+        assert comment_index(simple_system).find("lens front") == []
+
+
+class TestSnapshot:
+    def test_reads_lens_data(self, simple_system: OpticStudioSystem):
+        result = snapshot(simple_system)
+
+        assert len(result) == 5
+        assert result.surface_type.tolist() == ["Standard"] * 5
+        assert result.comment.tolist() == ["", "", "lens front", "lens back", ""]
+        np.testing.assert_array_equal(result["Radius"], [np.inf, np.inf, 20, -20, np.inf])
+        np.testing.assert_array_equal(result["Thickness"], [np.inf, 0, 1, 19.792, 0])
+        assert list(result.columns) == ["Radius", "Thickness", "SemiDiameter", "Conic"]
+
+    def test_reads_parameter_columns(self, coordinate_break_system: OpticStudioSystem):
+        result = snapshot(coordinate_break_system, columns=["Thickness", "Par1", "Par2"])
+
+        assert result.surface_type[4] == "CoordinateBreak"
+        assert result["Par1"][4] == 2
+        assert result["Par2"][4] == 0
+
+    def test_to_dataframe(self, simple_system: OpticStudioSystem):
+        df = snapshot(simple_system, columns=["Radius"]).to_dataframe()
+
+        assert df.index.name == "Surface"
+        assert df.columns.tolist() == ["Type", "Comment", "Material", "Radius"]
+        assert df.loc[2, "Comment"] == "lens front"
+        assert df.loc[3, "Radius"] == -20
+
+    def test_matches_surface_reads_on_large_lde(self, simple_system: OpticStudioSystem):
+        for i in range(200):
+            surface = simple_system.LDE.InsertNewSurfaceAt(4)
+            surface.Radius = 100 + i
+            surface.Thickness = 0.01 * i
+            surface.Comment = f"surface {i}"
+
+        result = snapshot(simple_system, columns=["Radius", "Thickness"])
+
+        surfaces = [simple_system.LDE.GetSurfaceAt(i) for i in range(simple_system.LDE.NumberOfSurfaces)]
+        assert result.comment.tolist() == [s.Comment for s in surfaces]
+        np.testing.assert_array_equal(result["Radius"], [s.Radius for s in surfaces])
+        np.testing.assert_array_equal(result["Thickness"], [s.Thickness for s in surfaces])
+
+
+class TestApply:
+    def test_writes_changed_cells(self, simple_system: OpticStudioSystem):
+        lens_data = snapshot(simple_system, columns=["Radius", "Thickness"]).to_dataframe()
+        lens_data.loc[2, "Thickness"] = 2
+        lens_data.loc[3, "Radius"] = -25
+        lens_data.loc[3, "Comment"] = "new comment"
+
+        n_changed = apply(simple_system, lens_data)
+
+        assert n_changed == 3
+        assert simple_system.LDE.GetSurfaceAt(2).Thickness == 2
+        assert simple_system.LDE.GetSurfaceAt(3).Radius == -25
+        assert simple_system.LDE.GetSurfaceAt(3).Comment == "new comment"
+
+    def test_unchanged_data_writes_nothing(self, simple_system: OpticStudioSystem):
+        lens_data = snapshot(simple_system).to_dataframe()
+
+        assert apply(simple_system, lens_data) == 0
+
+    def test_skips_missing_values(self, simple_system: OpticStudioSystem):
+        lens_data = pd.DataFrame({"Thickness": [np.nan, 3.0]}, index=[2, 3])
+
+        assert apply(simple_system, lens_data) == 1
+        assert simple_system.LDE.GetSurfaceAt(2).Thickness == 1
+        assert simple_system.LDE.GetSurfaceAt(3).Thickness == 3
+
+    def test_writes_parameter_columns(self, coordinate_break_system: OpticStudioSystem):
+        apply(coordinate_break_system, pd.DataFrame({"Par2": [1.5]}, index=[4]))
+
+        assert coordinate_break_system.LDE.GetSurfaceAt(4).SurfaceData.Decenter_Y == pytest.approx(1.5)
+
+    def test_rolls_back_on_failure(self, simple_system: OpticStudioSystem, mocker: MockerFixture):
+        write = EditorColumns.write
+
+        def write_or_fail(self, row, column, value):
+            if column == "Radius":
+                raise RuntimeError("Cannot write radius")
+
+            write(self, row, column, value)
+
+        mocker.patch.object(EditorColumns, "write", write_or_fail)
+
+        with pytest.raises(RuntimeError, match="Cannot write radius"):
+            apply(simple_system, pd.DataFrame({"Thickness": [5.0, 5.0], "Radius": [np.nan, 30.0]}, index=[2, 3]))
+
+        assert simple_system.LDE.GetSurfaceAt(2).Thickness == 1
+        assert simple_system.LDE.GetSurfaceAt(3).Thickness == pytest.approx(19.792)
+
+    def test_changed_surface_type_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match="Cannot change column Type of row 2"):
+            apply(simple_system, pd.DataFrame({"Type": ["EvenAsphere"]}, index=[2]))
+
+    def test_nonexistent_surface_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match="Row 10 does not exist"):
+            apply(simple_system, pd.DataFrame({"Thickness": [1.0]}, index=[10]))
+
+
 class TestSurfaceChangeApertureType:
     APERTURE_TYPE_PARAMETERS: ClassVar[dict[str, tuple[str, Any]]] = {
         _APERTURE_FILE: ("aperture_file", "square.uda"),
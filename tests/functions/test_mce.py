@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import zospy as zp
+from zospy.functions.mce import ConfigurationSweepResult, read_configurations, sweep
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def multi_configuration_system(simple_system: OpticStudioSystem) -> OpticStudioSystem:
+    mce = simple_system.MCE
+    mce.AddConfiguration(False)
+    mce.AddConfiguration(False)
+
+    thickness = mce.GetOperandAt(1)
+    thickness.ChangeType(zp.constants.Editors.MCE.MultiConfigOperandType.THIC)
+    thickness.Param1 = 3
+
+    for config, value in zip((1, 2, 3), (19.792, 15, 19.792), strict=True):
+        thickness.GetOperandCell(config).DoubleValue = value
+
+    mce.SetCurrentConfiguration(1)
+
+    return simple_system
+
+
+def test_read_configurations(multi_configuration_system: OpticStudioSystem):
+    result = read_configurations(multi_configuration_system)
+
+    assert result.index.tolist() == [1, 2, 3]
+    assert result.columns.tolist() == [1]
+    np.testing.assert_allclose(result[1], [19.792, 15, 19.792])
+
+
+class TestSweep:
+    def test_runs_analyses_per_configuration(self, multi_configuration_system: OpticStudioSystem):
+        (mtf,) = sweep(multi_configuration_system, [zp.analyses.mtf.FFTMTF(sampling="32x32")])
+
+        assert mtf.configurations == [1, 2, 3]
+        assert mtf.duplicate_of == {3: 1}
+        assert mtf.results[3] is mtf.results[1]
+        assert not mtf.results[2].data.equals(mtf.results[1].data)
+
+    def test_stack(self, multi_configuration_system: OpticStudioSystem):
+        (mtf,) = sweep(multi_configuration_system, [zp.analyses.mtf.FFTMTF(sampling="32x32")], [1, 2])
+
+        stacked = mtf.stack()
+
+        assert isinstance(stacked, pd.DataFrame)
+        assert stacked.index.names[0] == "config"
+        pd.testing.assert_frame_equal(stacked.loc[2], mtf.results[2].data)
+
+    def test_without_deduplication(self, multi_configuration_system: OpticStudioSystem):
+        (mtf,) = sweep(multi_configuration_system, [zp.analyses.mtf.FFTMTF(sampling="32x32")], deduplicate=False)
+
+        assert mtf.duplicate_of == {}
+        assert mtf.results[3] is not mtf.results[1]
+        pd.testing.assert_frame_equal(mtf.results[3].data, mtf.results[1].data)
+
+    def test_restores_current_configuration(self, multi_configuration_system: OpticStudioSystem):
+        multi_configuration_system.MCE.SetCurrentConfiguration(2)
+        analysis = zp.analyses.mtf.FFTMTF(sampling="32x32")
+
+        sweep(multi_configuration_system, [analysis])
+
+        assert multi_configuration_system.MCE.CurrentConfiguration == 2
+        assert analysis.analysis is None
+
+
+@dataclass
+class MockSweepData:
+    table: pd.DataFrame
+    values: np.ndarray
+    total: float
+
+
+def test_stack_dataclass_fields():
+    data = {
+        config: MockSweepData(pd.DataFrame({"a": [config]}), np.full(2, config), config * 10.0) for config in (1, 2)
+    }
+    result = ConfigurationSweepResult({config: SimpleNamespace(data=d) for config, d in data.items()})
+
+    stacked = result.stack()
+
+    assert list(stacked) == ["table", "values", "total"]
+    pd.testing.assert_frame_equal(stacked["table"].loc[2], data[2].table)
+    np.testing.assert_array_equal(stacked["values"], [[1, 1], [2, 2]])
+    assert stacked["total"].to_dict() == {1: 10.0, 2: 20.0}
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import zospy as zp
+from zospy.functions.mfe import MeritFunctionEvaluator, MeritFunctionResult, evaluate, find_variables
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def merit_function_system(simple_system: OpticStudioSystem) -> OpticStudioSystem:
+    effective_focal_length = simple_system.MFE.GetOperandAt(1)
+    effective_focal_length.ChangeType(zp.constants.Editors.MFE.MeritOperandType.EFFL)
+    effective_focal_length.Target = 20
+    effective_focal_length.Weight = 1
+
+    total_track = simple_system.MFE.AddOperand()
+    total_track.ChangeType(zp.constants.Editors.MFE.MeritOperandType.TTHI)
+    total_track.GetOperandCell(zp.constants.Editors.MFE.MeritColumn.Param1).IntegerValue = 1
+    total_track.GetOperandCell(zp.constants.Editors.MFE.MeritColumn.Param2).IntegerValue = 3
+    total_track.Target = 20
+    total_track.Weight = 1
+
+    zp.solvers.variable(simple_system.LDE.GetSurfaceAt(3).ThicknessCell)
+
+    return simple_system
+
+
+def test_evaluate(merit_function_system: OpticStudioSystem):
+    result = evaluate(merit_function_system)
+
+    assert isinstance(result, MeritFunctionResult)
+    assert result.total == pytest.approx(merit_function_system.MFE.CalculateMeritFunction())
+    assert result.values == pytest.approx(
+        [merit_function_system.MFE.GetOperandAt(i).Value for i in (1, 2)],
+    )
+    np.testing.assert_array_equal(result.targets, [20, 20])
+    np.testing.assert_array_equal(result.weights, [1, 1])
+    assert result.contributions.sum() == pytest.approx(100)
+
+
+def test_find_variables(merit_function_system: OpticStudioSystem):
+    variables = find_variables(merit_function_system)
+
+    assert len(variables) == 1
+    assert variables[0].DoubleValue == pytest.approx(19.792)
+
+
+class TestMeritFunctionEvaluator:
+    def test_call_sets_variables(self, merit_function_system: OpticStudioSystem):
+        evaluator = MeritFunctionEvaluator(merit_function_system)
+
+        total = evaluator([10.0])
+
+        assert merit_function_system.LDE.GetSurfaceAt(3).Thickness == pytest.approx(10)
+        assert total == pytest.approx(evaluate(merit_function_system).total)
+        assert evaluator.n_evaluations == 1
+
+    def test_evaluate(self, merit_function_system: OpticStudioSystem):
+        evaluator = MeritFunctionEvaluator(merit_function_system)
+
+        result = evaluator.evaluate([19.0])
+
+        assert result.values[1] == pytest.approx(20)
+        np.testing.assert_array_equal(result.targets, [20, 20])
+
+    def test_call_invalidates_cached_results(self, merit_function_system: OpticStudioSystem):
+        evaluator = MeritFunctionEvaluator(merit_function_system)
+        results = iter([1, 2])
+
+        merit_function_system.cached_result("key", lambda: next(results))
+        evaluator([10.0])
+
+        assert merit_function_system.cached_result("key", lambda: next(results)) == 2
+
+    def test_evaluate_many_restores_variables(self, merit_function_system: OpticStudioSystem):
+        evaluator = MeritFunctionEvaluator(merit_function_system)
+
+        totals, values = evaluator.evaluate_many([[18.0], [19.0], [20.0]])
+
+        assert totals.shape == (3,)
+        assert values.shape == (3, 2)
+        np.testing.assert_allclose(values[:, 1], [19, 20, 21])
+        assert evaluator.x0 == pytest.approx([19.792])
+        assert evaluator.evaluations_per_second > 0
+
+    def test_invalid_number_of_variables_raises_value_error(self, merit_function_system: OpticStudioSystem):
+        evaluator = MeritFunctionEvaluator(merit_function_system)
+
+        with pytest.raises(ValueError, match="Expected 1 variable values"):
+            evaluator([1.0, 2.0])
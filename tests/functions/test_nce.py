@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import pandas as pd
 import pytest
 
-from zospy.functions.nce import find_object_by_comment
+from zospy.functions.nce import apply, comment_index, find_object_by_comment
 
 
 @pytest.mark.parametrize(
@@ -27,3 +28,38 @@ def test_can_find_object_by_comment(nsc_simple_system, comment, case_sensitive,
     indices = [obj.ObjectNumber for obj in result]
 
     assert indices == expected_indices
+
+
+def test_can_find_object_by_comment_with_optic_studio_system(nsc_simple_system):
+    nsc_simple_system.NCE.GetObjectAt(2).Comment = "lens"
+    nsc_simple_system.NCE.GetObjectAt(3).Comment = "Lens"
+
+    result = find_object_by_comment(nsc_simple_system, comment="lens")
+
+    assert [obj.ObjectNumber for obj in result] == [2]
+
+
+def test_comment_index_rebuilt_after_removing_object(nsc_simple_system):
+    nsc_simple_system.NCE.GetObjectAt(3).Comment = "detector"
+    nsc_simple_system.invalidate_comment_indexes()
+
+    assert comment_index(nsc_simple_system).match("^det") == [3]
+
+    nsc_simple_system.NCE.RemoveObjectAt(2)
+
+    assert comment_index(nsc_simple_system).match("^det") == [2]
+
+
+class TestApply:
+    def test_writes_changed_cells(self, nsc_simple_system):
+        object_data = pd.DataFrame({"ZPosition": [10.0, 12.0], "Par1": [25.0, None]}, index=[2, 3])
+
+        n_changed = apply(nsc_simple_system, object_data)
+
+        assert n_changed == 2
+        assert nsc_simple_system.NCE.GetObjectAt(2).GetCellAt(11).DoubleValue == 25
+        assert nsc_simple_system.NCE.GetObjectAt(3).ZPosition == 12
+
+    def test_nonexistent_object_raises_value_error(self, nsc_simple_system):
+        with pytest.raises(ValueError, match="Row 0 does not exist"):
+            apply(nsc_simple_system, pd.DataFrame({"ZPosition": [1.0]}, index=[0]))
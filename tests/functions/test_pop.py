@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from zospy.analyses.physicaloptics import PhysicalOpticsPropagation
+from zospy.functions.pop import POPChainResult, POPStage, propagate_chain
+from zospy.io import zbf
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+def write_gaussian(path, waist: float = 0.5) -> None:
+    coordinates = (np.arange(64) - 32) * 0.05
+    x, y = np.meshgrid(coordinates, coordinates)
+
+    zbf.write(path, np.exp(-(x**2 + y**2) / waist**2), dx=0.05, dy=0.05, wavelength=5.43e-4, waist_x=waist)
+
+
+class TestPOPStage:
+    def test_parameters(self, tmp_path):
+        write_gaussian(tmp_path / "stage.zbf")
+
+        stage = POPStage(1, 3, tmp_path / "stage.zbf")
+
+        assert stage.parameters["waist_x"] == pytest.approx(0.5)
+        assert stage.parameters["power"] == pytest.approx(np.pi * 0.5**2 / 2)
+        assert isinstance(stage.beam.field, np.memmap)
+        assert stage.irradiance.shape == (64, 64)
+
+    def test_chain_parameters_and_cleanup(self, tmp_path):
+        write_gaussian(tmp_path / "stage0.zbf", 0.5)
+        write_gaussian(tmp_path / "stage1.zbf", 0.4)
+        result = POPChainResult(
+            [POPStage(1, 3, tmp_path / "stage0.zbf"), POPStage(3, "Image", tmp_path / "stage1.zbf")], tmp_path
+        )
+
+        assert result.parameters["waist_x"].tolist() == pytest.approx([0.5, 0.4])
+
+        result.cleanup()
+
+        assert not list(tmp_path.iterdir())
+
+
+class TestPropagateChain:
+    def test_matches_single_run(self, simple_system: OpticStudioSystem, tmp_path):
+        analysis = PhysicalOpticsPropagation(
+            x_sampling=64, y_sampling=64, use_total_power=True, use_peak_irradiance=False
+        )
+
+        result = propagate_chain(simple_system, analysis, [(1, 3), (3, "Image")], scratch_dir=tmp_path)
+        single = propagate_chain(simple_system, analysis, [(1, "Image")], scratch_dir=tmp_path)
+
+        assert len(result.stages) == 2
+        assert result.stages[1].beam.header.nx == 64
+        expected = single.stages[0].irradiance
+        np.testing.assert_allclose(result.stages[1].irradiance, expected, atol=1e-3 * expected.max())
+
+    def test_transform(self, simple_system: OpticStudioSystem, tmp_path):
+        calls = []
+
+        def transform(stage: int, beam: zbf.Beam) -> zbf.Beam:
+            calls.append(stage)
+            return beam
+
+        result = propagate_chain(
+            simple_system,
+            PhysicalOpticsPropagation(use_total_power=True, use_peak_irradiance=False),
+            [(1, 2), (2, 3), (3, "Image")],
+            scratch_dir=tmp_path,
+            transform=transform,
+        )
+
+        assert calls == [0, 1]
+        assert len(result.stages) == 3
+
+    def test_restores_settings(self, simple_system: OpticStudioSystem, tmp_path):
+        analysis = PhysicalOpticsPropagation()
+
+        propagate_chain(simple_system, analysis, [(1, 3), (3, "Image")], scratch_dir=tmp_path)
+
+        assert analysis.settings == PhysicalOpticsPropagation().settings
+        assert analysis.analysis is None
+
+    def test_empty_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match="At least one stage"):
+            propagate_chain(simple_system, PhysicalOpticsPropagation(), [])
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from zospy.io import zbf
+from zospy.io.zbf import ZBF_HEADER_DTYPE, ZBFHeader
+
+
+def gaussian(nx: int = 32, ny: int = 16, dx: float = 0.01, dy: float = 0.02, waist: float = 0.05) -> np.ndarray:
+    x = (np.arange(nx) - nx // 2) * dx
+    y = (np.arange(ny) - ny // 2) * dy
+    xx, yy = np.meshgrid(x, y)
+
+    return np.exp(-(xx**2 + yy**2) / waist**2) * np.exp(1j * xx)
+
+
+def test_header_size():
+    assert ZBF_HEADER_DTYPE.itemsize == 196
+
+
+class TestHeader:
+    def test_roundtrip(self):
+        header = ZBFHeader(nx=8, ny=4, dx=0.1, dy=0.2, wavelength=5.43e-4, is_polarized=True, units="m", waist_x=0.3)
+
+        assert ZBFHeader.from_bytes(header.to_bytes()) == header
+
+    def test_shape_and_file_size(self):
+        header = ZBFHeader(nx=8, ny=4, dx=0.1, dy=0.1, wavelength=5.43e-4, is_polarized=True)
+
+        assert header.shape == (2, 4, 8)
+        assert header.file_size == 196 + 2 * 4 * 8 * 16
+
+    def test_unsupported_version_raises_value_error(self):
+        data = np.frombuffer(ZBFHeader(nx=1, ny=1, dx=1, dy=1, wavelength=1).to_bytes(), dtype=ZBF_HEADER_DTYPE).copy()
+        data["version"] = 2
+
+        with pytest.raises(ValueError, match="Unsupported ZBF format version 2"):
+            ZBFHeader.from_bytes(data.tobytes())
+
+    def test_short_data_raises_value_error(self):
+        with pytest.raises(ValueError, match="should be 196 bytes"):
+            ZBFHeader.from_bytes(b"\x01\x00\x00\x00")
+
+    def test_unknown_units_raises_value_error(self):
+        with pytest.raises(ValueError, match="Unknown units"):
+            ZBFHeader(nx=1, ny=1, dx=1, dy=1, wavelength=1, units="ft")
+
+
+class TestReadWrite:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "beam.zbf"
+        ex = gaussian()
+
+        header = zbf.write(path, ex, dx=0.01, dy=0.02, wavelength=5.43e-4, waist_x=0.05, waist_y=0.05)
+        beam = zbf.read(path)
+
+        assert beam.header == header
+        assert isinstance(beam.field, np.memmap)
+        assert beam.ey is None
+        np.testing.assert_array_equal(beam.ex, ex)
+        assert path.stat().st_size == header.file_size
+
+    def test_read_into_memory(self, tmp_path):
+        path = tmp_path / "beam.zbf"
+        ex = gaussian()
+        zbf.write(path, ex, dx=0.01, dy=0.02, wavelength=5.43e-4)
+
+        beam = zbf.read(path, mmap_mode=None)
+
+        assert not isinstance(beam.field, np.memmap)
+        np.testing.assert_array_equal(beam.ex, ex)
+
+    def test_polarized(self, tmp_path):
+        path = tmp_path / "beam.zbf"
+        ex = gaussian()
+        ey = 1j * gaussian()
+
+        zbf.write(path, ex, ey, dx=0.01, dy=0.02, wavelength=5.43e-4)
+        beam = zbf.read(path)
+
+        assert beam.header.is_polarized
+        np.testing.assert_array_equal(beam.ex, ex)
+        np.testing.assert_array_equal(beam.ey, ey)
+        np.testing.assert_allclose(beam.irradiance, np.abs(ex) ** 2 + np.abs(ey) ** 2)
+
+    def test_coordinates_and_power(self, tmp_path):
+        path = tmp_path / "beam.zbf"
+        zbf.write(path, gaussian(nx=256, ny=256, dx=0.002, dy=0.002), dx=0.002, dy=0.002, wavelength=5.43e-4)
+
+        beam = zbf.read(path)
+
+        assert beam.x[128] == 0
+        assert beam.y[0] == pytest.approx(-0.256)
+        # The power of a Gaussian beam with amplitude 1 is pi * waist^2 / 2
+        assert beam.power == pytest.approx(np.pi * 0.05**2 / 2)
+
+    def test_truncated_file_raises_value_error(self, tmp_path):
+        path = tmp_path / "beam.zbf"
+        zbf.write(path, gaussian(), dx=0.01, dy=0.02, wavelength=5.43e-4)
+        path.write_bytes(path.read_bytes()[:-16])
+
+        with pytest.raises(ValueError, match="should be at least"):
+            zbf.read(path)
+
+    def test_mismatched_components_raise_value_error(self, tmp_path):
+        with pytest.raises(ValueError, match="same shape"):
+            zbf.write(tmp_path / "beam.zbf", gaussian(), gaussian(nx=16), dx=0.01, dy=0.02, wavelength=5.43e-4)
+
+    def test_create(self, tmp_path):
+        path = tmp_path / "beam.zbf"
+        header = ZBFHeader(nx=32, ny=16, dx=0.01, dy=0.02, wavelength=5.43e-4)
+
+        beam = zbf.create(path, header)
+        beam.field[0] = gaussian()
+        beam.flush()
+
+        assert zbf.read_header(path) == header
+        np.testing.assert_array_equal(zbf.read(path).ex, gaussian())
+
+    def test_save(self, tmp_path):
+        zbf.write(tmp_path / "beam.zbf", gaussian(), 1j * gaussian(), dx=0.01, dy=0.02, wavelength=5.43e-4)
+        beam = zbf.read(tmp_path / "beam.zbf")
+
+        beam.save(tmp_path / "copy.zbf")
+
+        assert (tmp_path / "copy.zbf").read_bytes() == (tmp_path / "beam.zbf").read_bytes()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from tests.config import REFERENCE_DATA_FOLDER, REFERENCE_VERSION
+from zospy.analyses.base import AnalysisResult
+from zospy.local import Prescription
+
+
+@pytest.fixture
+def simple_prescription() -> Prescription:
+    """Prescription of the `simple_system` fixture."""
+    return Prescription(
+        surface_type=["Standard"] * 5,
+        radius=[np.inf, np.inf, 20, -20, np.inf],
+        thickness=[np.inf, 0, 1, 19.792, 0],
+        index=[[1.0], [1.0], [1.5], [1.0], [1.0]],
+        wavelengths=[0.543],
+        semi_diameter=[0, 1, 1, 1, 0],
+        stop=1,
+        aperture_type="FloatByStopSize",
+        aperture_value=0,
+    )
+
+
+@pytest.fixture
+def reference_result(request):
+    """Load reference analysis results from the reference data folder."""
+
+    def load(test_file: str, test_name: str) -> AnalysisResult:
+        data_file = (
+            request.config.rootpath / REFERENCE_DATA_FOLDER / f"{REFERENCE_VERSION}-{test_file}-{test_name}.json"
+        )
+
+        if not data_file.exists():
+            pytest.skip(f"Data file {data_file} does not exist")
+
+        return AnalysisResult.from_json(data_file.read_text(encoding="utf-8"))
+
+    return load
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from zospy.local import diffraction
+
+WAVELENGTH = 0.543e-3
+"""Wavelength of the simple system in millimeters."""
+
+
+def circular_wavefront(n: int = 64, opd: float = 0.0) -> pd.DataFrame:
+    """Wavefront map of a circular pupil with a constant OPD, sampled like a `WavefrontMap` result."""
+    coordinates = (np.arange(n) - n // 2) * 2 / (n - 2)
+    x, y = np.meshgrid(coordinates, coordinates)
+    data = np.where(x**2 + y**2 <= 1, opd, np.nan)
+
+    return pd.DataFrame(data, index=pd.Index(coordinates, name="y"), columns=pd.Index(coordinates, name="x"))
+
+
+def diffraction_limited_mtf(frequency: np.ndarray) -> np.ndarray:
+    """Analytic MTF of an unaberrated circular pupil, for frequencies in units of the cutoff frequency."""
+    v = np.clip(frequency, 0, 1)
+
+    return 2 / np.pi * (np.arccos(v) - v * np.sqrt(1 - v**2))
+
+
+@pytest.fixture
+def wavefront_map_reference(reference_result):
+    return reference_result("test_wavefront.py", "test_wavefront_map_returns_correct_result[64x64-False]").data
+
+
+@pytest.fixture
+def working_f_number(reference_result):
+    return reference_result(
+        "test_reports.py", "test_system_data_returns_correct_result"
+    ).data.general_lens_data.working_f_number
+
+
+class TestPupilFunction:
+    def test_shape(self):
+        pupil = diffraction.pupil_function(circular_wavefront(32), padding=4)
+
+        assert pupil.field.shape == (128, 128)
+        assert pupil.step == pytest.approx(2 / 30)
+
+    def test_grid_size(self):
+        pupil = diffraction.pupil_function(circular_wavefront(32), grid_size=100)
+
+        assert pupil.grid_size == 100
+
+    def test_batched_defocus(self):
+        pupil = diffraction.pupil_function(circular_wavefront(32), defocus=np.zeros((3, 2)))
+
+        assert pupil.field.shape == (3, 2, 64, 64)
+
+    def test_pupil_is_centered(self):
+        pupil = diffraction.pupil_function(circular_wavefront(32), padding=2)
+
+        np.testing.assert_array_equal(pupil.field[32, 32 - 15 : 32 + 16], 1)
+        assert pupil.field[32, 32 - 16] == 0
+
+    def test_grid_smaller_than_wavefront_raises_value_error(self):
+        with pytest.raises(ValueError, match="grid size should be at least"):
+            diffraction.pupil_function(circular_wavefront(32), grid_size=16)
+
+    def test_non_square_wavefront_raises_value_error(self):
+        with pytest.raises(ValueError, match="should be square"):
+            diffraction.pupil_function(circular_wavefront(32).iloc[:-1])
+
+
+class TestPSF:
+    def test_unaberrated_strehl_ratio_is_one(self):
+        result = diffraction.psf(diffraction.pupil_function(circular_wavefront()))
+
+        assert result.strehl_ratio == pytest.approx(1)
+        assert result.intensity.max() == pytest.approx(1)
+
+    def test_constant_opd_does_not_change_psf(self):
+        reference = diffraction.psf(diffraction.pupil_function(circular_wavefront()))
+        result = diffraction.psf(diffraction.pupil_function(circular_wavefront(opd=0.3)))
+
+        np.testing.assert_allclose(result.intensity, reference.intensity, atol=1e-12)
+
+    def test_airy_disk_first_zero(self):
+        result = diffraction.psf(diffraction.pupil_function(circular_wavefront(128), padding=8))
+        profile = result.intensity[512, 512:]
+        first_minimum = np.argmax(np.diff(profile) > 0)
+
+        assert result.coordinates[512 + first_minimum] == pytest.approx(1.22, abs=result.spacing)
+
+    def test_defocus_reduces_strehl_ratio(self):
+        result = diffraction.psf(diffraction.pupil_function(circular_wavefront(), defocus=[0, 0.1, 0.25]))
+
+        assert result.strehl_ratio[0] > result.strehl_ratio[1] > result.strehl_ratio[2]
+
+    def test_normalize(self):
+        result = diffraction.psf(diffraction.pupil_function(circular_wavefront(), defocus=[0, 0.5]), normalize=True)
+
+        np.testing.assert_allclose(result.intensity.max(axis=(-2, -1)), 1)
+
+    def test_strehl_ratio_matches_reference_data(self, wavefront_map_reference, reference_result):
+        reference = reference_result(
+            "test_psf.py", "test_fft_psf_returns_correct_result[32x32-32x32-0-Linear-False-0.0-False-Image]"
+        ).data
+
+        result = diffraction.psf(diffraction.pupil_function(wavefront_map_reference))
+
+        assert result.strehl_ratio == pytest.approx(reference.to_numpy().max(), abs=1e-3)
+
+    def test_image_spacing(self):
+        pupil = diffraction.pupil_function(circular_wavefront(128), padding=4)
+
+        assert diffraction.image_spacing(pupil, 0.543, 10) == pytest.approx(0.543 * 10 * 126 / 512)
+
+
+class TestMTF:
+    def test_unaberrated_mtf_matches_analytic_mtf(self):
+        result = diffraction.mtf(diffraction.pupil_function(circular_wavefront(128)))
+
+        np.testing.assert_allclose(result.tangential, diffraction_limited_mtf(result.frequency), atol=5e-3)
+        np.testing.assert_allclose(result.sagittal, diffraction_limited_mtf(result.frequency), atol=5e-3)
+
+    def test_mtf_is_zero_beyond_cutoff(self):
+        result = diffraction.mtf(diffraction.pupil_function(circular_wavefront()))
+        frequency = np.hypot(*np.meshgrid(result.coordinates, result.coordinates))
+
+        np.testing.assert_allclose(result.modulation[frequency > 1 + 2 * result.spacing], 0, atol=1e-12)
+
+    def test_mtf_matches_reference_data(self, wavefront_map_reference, reference_result, working_f_number):
+        reference = reference_result(
+            "test_mtf.py", "test_fft_mtf_returns_correct_result[64x64-Image-1-Modulation-0.0-True-True-True]"
+        ).data
+        field = reference["Field: 0,0000 (deg)"]
+
+        pupil = diffraction.pupil_function(wavefront_map_reference)
+        result = diffraction.mtf(pupil)
+        frequency = (
+            result.frequency / result.spacing * diffraction.frequency_spacing(pupil, WAVELENGTH, working_f_number)
+        )
+
+        np.testing.assert_allclose(
+            np.interp(field.index, frequency, result.tangential), field["Tangential"], atol=0.015
+        )
+        np.testing.assert_allclose(np.interp(field.index, frequency, result.sagittal), field["Sagittal"], atol=0.015)
+
+
+class TestThroughFocusMTF:
+    def test_focal_shift_to_defocus(self):
+        assert diffraction.focal_shift_to_defocus(0.1, 0.5e-3, 5) == pytest.approx(1)
+
+    def test_symmetric_for_unaberrated_pupil(self):
+        tangential, sagittal = diffraction.through_focus_mtf(circular_wavefront(), [-0.2, 0, 0.2], 0.3)
+
+        assert tangential[0] == pytest.approx(tangential[2])
+        assert tangential[1] > tangential[0]
+        np.testing.assert_allclose(sagittal, tangential)
+
+    def test_matches_reference_data(self, wavefront_map_reference, reference_result, working_f_number):
+        reference = (
+            reference_result(
+                "test_mtf.py", "test_fft_through_focus_mtf_returns_correct_result[64x64-0.1-0-5-Modulation]"
+            )
+            .data.root[0]
+            .data
+        )
+        defocus = diffraction.focal_shift_to_defocus(reference.index, WAVELENGTH, working_f_number)
+
+        tangential, sagittal = diffraction.through_focus_mtf(
+            wavefront_map_reference, defocus, 10 * WAVELENGTH * working_f_number
+        )
+
+        np.testing.assert_allclose(tangential, reference["Tangential"], atol=1e-3)
+        np.testing.assert_allclose(sagittal, reference["Sagittal"], atol=1e-3)
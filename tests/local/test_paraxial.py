@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from zospy.local import Prescription, paraxial, read_prescription
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def cardinal_points_reference(reference_result):
+    return reference_result("test_reports.py", "test_cardinal_points_returns_correct_result").data.cardinal_points
+
+
+@pytest.fixture
+def system_data_reference(reference_result):
+    return reference_result("test_reports.py", "test_system_data_returns_correct_result").data.general_lens_data
+
+
+class TestCardinalPoints:
+    @pytest.mark.parametrize(
+        "attribute,reference_attribute",
+        [
+            ("focal_length", "focal_length"),
+            ("focal_plane", "focal_planes"),
+            ("principal_plane", "principal_planes"),
+            ("anti_principal_plane", "anti_principal_planes"),
+            ("nodal_plane", "nodal_planes"),
+            ("anti_nodal_plane", "anti_nodal_planes"),
+        ],
+    )
+    def test_matches_reference_data(
+        self, simple_prescription: Prescription, cardinal_points_reference, attribute, reference_attribute
+    ):
+        result = paraxial.cardinal_points(simple_prescription, 2, 3)
+        expected = getattr(cardinal_points_reference, reference_attribute)
+
+        assert getattr(result, f"{attribute}_object")[0] == pytest.approx(expected.object, abs=1e-5)
+        assert getattr(result, f"{attribute}_image")[0] == pytest.approx(expected.image, abs=1e-5)
+
+    def test_read_prescription_matches_reference_data(
+        self, simple_system: OpticStudioSystem, cardinal_points_reference
+    ):
+        result = paraxial.cardinal_points(read_prescription(simple_system), 2, 3)
+
+        assert result.focal_length_image[0] == pytest.approx(cardinal_points_reference.focal_length.image, abs=1e-5)
+
+
+class TestFirstOrderData:
+    @pytest.mark.parametrize(
+        "attribute",
+        [
+            "effective_focal_length_air",
+            "effective_focal_length_image",
+            "back_focal_length",
+            "total_track",
+            "image_space_f_number",
+            "paraxial_working_f_number",
+            "image_space_na",
+            "stop_radius",
+            "paraxial_image_height",
+            "paraxial_magnification",
+            "entrance_pupil_diameter",
+            "entrance_pupil_position",
+            "exit_pupil_diameter",
+            "exit_pupil_position",
+            "angular_magnification",
+        ],
+    )
+    def test_matches_reference_data(self, simple_prescription: Prescription, system_data_reference, attribute):
+        result = paraxial.first_order_data(simple_prescription)
+
+        assert np.ravel(getattr(result, attribute))[0] == pytest.approx(
+            getattr(system_data_reference, attribute), rel=1e-5, abs=1e-6
+        )
+
+    def test_read_prescription_matches_reference_data(self, simple_system: OpticStudioSystem, system_data_reference):
+        result = paraxial.first_order_data(read_prescription(simple_system))
+
+        assert result.effective_focal_length_air[0] == pytest.approx(
+            system_data_reference.effective_focal_length_air, rel=1e-5
+        )
+        assert result.exit_pupil_position[0] == pytest.approx(system_data_reference.exit_pupil_position, rel=1e-5)
+
+    def test_vectorized_over_configurations_and_wavelengths(self, simple_prescription: Prescription):
+        prescription = Prescription(
+            surface_type=simple_prescription.surface_type,
+            radius=[simple_prescription.radius, simple_prescription.radius * 2],
+            thickness=simple_prescription.thickness,
+            index=[[1.0, 1.0], [1.0, 1.0], [1.5, 1.52], [1.0, 1.0], [1.0, 1.0]],
+            wavelengths=[0.543, 0.6],
+            semi_diameter=simple_prescription.semi_diameter,
+            aperture_type="FloatByStopSize",
+        )
+
+        result = paraxial.first_order_data(prescription)
+
+        assert result.effective_focal_length_air.shape == (2, 2)
+        assert result.effective_focal_length_air[0, 0] == pytest.approx(20.168067, abs=1e-6)
+        assert result.effective_focal_length_air[0, 1] < result.effective_focal_length_air[0, 0]
+        assert result.effective_focal_length_air[1, 0] > result.effective_focal_length_air[0, 0]
+
+
+def test_system_matrix_determinant_is_one(simple_prescription: Prescription):
+    matrix = paraxial.system_matrix(simple_prescription)
+
+    assert np.linalg.det(matrix) == pytest.approx(1.0)
+
+
+def test_trace_parallel_ray_focuses_at_back_focal_length(simple_prescription: Prescription):
+    y, nu = paraxial.trace(simple_prescription, 1.0, 0.0, last_surface=3)
+
+    assert -y[-1, 0] / nu[-1, 0] == pytest.approx(19.83193277)
+
+
+def test_paraxial_surface_power():
+    prescription = Prescription(
+        surface_type=["Standard", "Paraxial", "Standard"],
+        radius=np.full(3, np.inf),
+        thickness=[np.inf, 50, 0],
+        index=np.ones((3, 1)),
+        wavelengths=[0.55],
+        parameters=np.array([[0] * 8, [50] + [0] * 7, [0] * 8]),
+    )
+
+    assert paraxial.first_order_data(prescription).effective_focal_length_air[0] == pytest.approx(50)
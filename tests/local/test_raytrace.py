@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from zospy.local import Prescription, read_prescription
+from zospy.local.raytrace import model_glass_index, trace_direct, trace_normalized
+from zospy.tools.raytrace import DIRECT_UNPOL_RESULT_DTYPE, NORM_UNPOL_RESULT_DTYPE, BatchRayTrace
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def single_ray_trace_reference(reference_result):
+    return reference_result(
+        "test_raysandspots.py", "test_single_ray_trace_returns_correct_result[0-0-1-1-DirectionCosines-True]"
+    ).data.real_ray_trace_data
+
+
+@pytest.fixture
+def wavefront_map_reference(reference_result):
+    return reference_result("test_wavefront.py", "test_wavefront_map_returns_correct_result[64x64-False]").data
+
+
+def _insert_surfaces(
+    prescription: Prescription, position: int, surface_type: list[str], parameters: list
+) -> Prescription:
+    """Insert zero-thickness surfaces in front of `position`, in the medium of the preceding surface."""
+    n = len(surface_type)
+
+    def insert(values, new_values):
+        return np.insert(values, [position] * n, new_values, axis=0)
+
+    return replace(
+        prescription,
+        surface_type=[*prescription.surface_type[:position], *surface_type, *prescription.surface_type[position:]],
+        radius=insert(prescription.radius, [np.inf] * n),
+        thickness=insert(prescription.thickness, [0.0] * n),
+        index=insert(prescription.index, [prescription.index[position - 1]] * n),
+        conic=insert(prescription.conic, [0.0] * n),
+        semi_diameter=insert(prescription.semi_diameter, [0.0] * n),
+        parameters=insert(prescription.parameters, parameters),
+        mirror=insert(prescription.mirror, [False] * n),
+        comment=None,
+    )
+
+
+class TestTraceNormalized:
+    @pytest.mark.parametrize("surface", [2, 3, 4])
+    def test_matches_single_ray_trace_reference(
+        self, simple_prescription: Prescription, single_ray_trace_reference, surface
+    ):
+        result = trace_normalized(simple_prescription, [0, 0, 1, 1], last_surface=surface, global_coordinates=True)
+        expected = single_ray_trace_reference.iloc[surface]
+
+        assert result.dtype == NORM_UNPOL_RESULT_DTYPE
+        assert result.shape == (1,)
+        assert result["error_code"][0] == 0
+        assert [result[f][0] for f in ("X", "Y", "Z", "L", "M", "N", "l2", "m2", "n2")] == pytest.approx(
+            expected[
+                [
+                    "X-coordinate",
+                    "Y-coordinate",
+                    "Z-coordinate",
+                    "X-cosine",
+                    "Y-cosine",
+                    "Z-cosine",
+                    "X-normal",
+                    "Y-normal",
+                    "Z-normal",
+                ]
+            ].to_list(),
+            abs=1e-9,
+        )
+
+    def test_opd_matches_wavefront_map_reference(self, simple_prescription: Prescription, wavefront_map_reference):
+        px, py = np.meshgrid(wavefront_map_reference.columns.astype(float), wavefront_map_reference.index)
+        inside_pupil = px**2 + py**2 <= 1
+        rays = np.stack([np.zeros_like(px), np.zeros_like(px), px, py], axis=-1)
+
+        result = trace_normalized(simple_prescription, rays)
+
+        assert result.shape == (*px.shape, 1)
+        np.testing.assert_allclose(
+            result["opd"][..., 0][inside_pupil], wavefront_map_reference.to_numpy()[inside_pupil], atol=1e-6
+        )
+
+    def test_read_prescription_matches_batch_ray_trace(self, simple_system: OpticStudioSystem):
+        rays = np.array([[0, 0, 0, 0], [0, 0, 0, 1], [0, 0, 0.5, -0.5]])
+
+        expected = BatchRayTrace().run(simple_system, rays).data
+        result = trace_normalized(read_prescription(simple_system), rays)[:, 0]
+
+        for field in ("X", "Y", "Z", "L", "M", "N"):
+            np.testing.assert_allclose(result[field], expected[field], atol=1e-8)
+
+    def test_vectorized_over_configurations_and_wavelengths(self, simple_prescription: Prescription):
+        index = np.array(simple_prescription.index)
+        prescription = replace(
+            simple_prescription,
+            radius=[simple_prescription.radius] * 2,
+            thickness=[simple_prescription.thickness, simple_prescription.thickness + np.array([0, 0, 0, 1, 0])],
+            index=np.concatenate([index, np.where(index > 1, 1.6, 1.0)], axis=-1),
+            wavelengths=[0.543, 0.6],
+        )
+        rays = np.zeros((3, 2, 4))
+        rays[..., 3] = 0.5
+
+        result = trace_normalized(prescription, rays)
+
+        assert result.shape == (2, 3, 2, 2)
+        assert result["Y"][0, 0, 0, 0] == pytest.approx(trace_normalized(simple_prescription, rays)["Y"][0, 0, 0])
+        assert result["Y"][1, 0, 0, 1] != pytest.approx(result["Y"][0, 0, 0, 0])
+
+    def test_structured_input(self, simple_prescription: Prescription):
+        rays = np.zeros(3, dtype=[("Hx", float), ("Hy", float), ("Px", float), ("Py", float)])
+        rays["Py"] = [-1, 0, 1]
+
+        structured = trace_normalized(simple_prescription, rays)
+        plain = trace_normalized(simple_prescription, rays.view(np.float64).reshape(3, 4))
+
+        np.testing.assert_array_equal(structured, plain)
+
+    def test_even_asphere_without_coefficients_matches_standard(self, simple_prescription: Prescription):
+        prescription = replace(
+            simple_prescription, surface_type=["Standard", "Standard", "EvenAsphere", "EvenAsphere", "Standard"]
+        )
+
+        np.testing.assert_allclose(
+            trace_normalized(prescription, [0, 0, 0.3, 0.7])["Y"],
+            trace_normalized(simple_prescription, [0, 0, 0.3, 0.7])["Y"],
+        )
+
+    def test_even_asphere_intercept_lies_on_surface(self, simple_prescription: Prescription):
+        parameters = np.zeros((5, 8))
+        parameters[2, :2] = [1e-3, -2e-4]
+        prescription = replace(
+            simple_prescription,
+            surface_type=["Standard", "Standard", "EvenAsphere", "Standard", "Standard"],
+            conic=[0, 0, -0.5, 0, 0],
+            parameters=parameters,
+        )
+
+        result = trace_normalized(prescription, [0, 0, 0.6, 0.8], last_surface=2)
+        rho = result["X"] ** 2 + result["Y"] ** 2
+        sag = 0.05 * rho / (1 + np.sqrt(1 - 0.5 * 0.05**2 * rho)) + 1e-3 * rho - 2e-4 * rho**2
+
+        assert result["Z"] == pytest.approx(sag, abs=1e-12)
+
+    def test_coordinate_breaks_cancel(self, simple_prescription: Prescription):
+        prescription = _insert_surfaces(
+            simple_prescription,
+            3,
+            ["CoordinateBreak", "CoordinateBreak"],
+            [[0.1, -0.2, 3, -2, 10, 0, 0, 0], [-0.1, 0.2, -3, 2, -10, 1, 0, 0]],
+        )
+        rays = np.array([[0, 0, 0, 1], [0, 0, 0.5, -0.5]])
+
+        np.testing.assert_allclose(
+            trace_normalized(prescription, rays)["Y"], trace_normalized(simple_prescription, rays)["Y"], atol=1e-12
+        )
+
+    def test_coordinate_break_global_coordinates(self, simple_prescription: Prescription):
+        prescription = _insert_surfaces(simple_prescription, 4, ["CoordinateBreak"], [[0, 0.5, 0, 0, 0, 0, 0, 0]])
+
+        local = trace_normalized(prescription, [0, 0, 0, 0])
+        global_ = trace_normalized(prescription, [0, 0, 0, 0], global_coordinates=True)
+
+        assert local["Y"][0] == pytest.approx(-0.5)
+        assert global_["Y"][0] == pytest.approx(0.0)
+
+    def test_paraxial_surface_focuses_parallel_rays(self):
+        prescription = Prescription(
+            surface_type=["Standard", "Paraxial", "Standard"],
+            radius=[np.inf] * 3,
+            thickness=[np.inf, 10, 0],
+            index=1.0,
+            wavelengths=[0.55],
+            parameters=[[0] * 8, [10, 0, 0, 0, 0, 0, 0, 0], [0] * 8],
+            aperture_value=4,
+        )
+        px, py = np.meshgrid(np.linspace(-1, 1, 5), np.linspace(-1, 1, 5))
+        rays = np.stack([np.zeros_like(px), np.zeros_like(px), px, py], axis=-1)
+
+        result = trace_normalized(prescription, rays)
+
+        np.testing.assert_allclose(result["X"], 0, atol=1e-12)
+        np.testing.assert_allclose(result["Y"], 0, atol=1e-12)
+        np.testing.assert_allclose(result["opd"], 0, atol=1e-9)
+
+    def test_missed_surface_sets_error_code(self, simple_prescription: Prescription):
+        prescription = replace(simple_prescription, radius=[np.inf, np.inf, 0.5, -20, np.inf])
+
+        result = trace_normalized(prescription, [[0, 0, 0, 0], [0, 0, 0, 1]])
+
+        assert result["error_code"][:, 0].tolist() == [0, 2]
+        assert result["intensity"][:, 0].tolist() == [1, 0]
+
+    def test_unsupported_surface_type_raises_value_error(self, simple_prescription: Prescription):
+        prescription = replace(
+            simple_prescription, surface_type=["Standard", "Standard", "Toroidal", "Standard", "Standard"]
+        )
+
+        with pytest.raises(ValueError, match="unsupported surface type: Toroidal"):
+            trace_normalized(prescription, [0, 0, 0, 0])
+
+    def test_invalid_ray_shape_raises_value_error(self, simple_prescription: Prescription):
+        with pytest.raises(ValueError, match=r"rays should have shape \(\.\.\., 4\)"):
+            trace_normalized(simple_prescription, np.zeros((3, 2)))
+
+
+class TestTraceDirect:
+    def test_matches_normalized_ray_trace(self, simple_prescription: Prescription):
+        normalized = trace_normalized(simple_prescription, [0, 0, 0, 0.5])
+        direct = trace_direct(simple_prescription, [0, 0.5, 0, 0, 0, 1], start_surface=1)
+
+        assert direct.dtype == DIRECT_UNPOL_RESULT_DTYPE
+        assert direct["Y"][0] == pytest.approx(normalized["Y"][0], abs=1e-12)
+        assert direct["M"][0] == pytest.approx(normalized["M"][0], abs=1e-12)
+
+    def test_infinite_start_surface_raises_value_error(self, simple_prescription: Prescription):
+        with pytest.raises(ValueError, match="infinite thickness"):
+            trace_direct(simple_prescription, [0, 0, 0, 0, 0, 1])
+
+
+class TestModelGlassIndex:
+    def test_matches_index_and_abbe_number(self):
+        nd, nf, nc = model_glass_index(1.5168, 64.17, 0, [0.5875618, 0.4861327, 0.6562725])
+
+        assert nd == pytest.approx(1.5168)
+        assert (nd - 1) / (nf - nc) == pytest.approx(64.17)
+
+    def test_zero_abbe_number_is_non_dispersive(self):
+        np.testing.assert_allclose(model_glass_index([1.5, 1.7], 0, 0, [0.4, 0.55, 0.7]), [[1.5] * 3, [1.7] * 3])
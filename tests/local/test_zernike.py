@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from zospy.local import zernike
+
+
+def circular_wavefront(n: int = 64) -> pd.DataFrame:
+    """Empty wavefront map of a circular pupil, sampled like a `WavefrontMap` result."""
+    coordinates = (np.arange(n) - n // 2) * 2 / (n - 2)
+    x, y = np.meshgrid(coordinates, coordinates)
+    data = np.where(x**2 + y**2 <= 1, 0.0, np.nan)
+
+    return pd.DataFrame(data, index=pd.Index(coordinates, name="y"), columns=pd.Index(coordinates, name="x"))
+
+
+@pytest.fixture
+def wavefront_map_reference(reference_result):
+    return reference_result("test_wavefront.py", "test_wavefront_map_returns_correct_result[128x128-False]").data
+
+
+class TestIndices:
+    def test_standard_indices(self):
+        n, m = zernike.standard_indices(11)
+
+        np.testing.assert_array_equal(n, [0, 1, 1, 2, 2, 2, 3, 3, 3, 3, 4])
+        np.testing.assert_array_equal(m, [0, 1, -1, 0, -2, 2, -1, 1, -3, 3, 0])
+
+    def test_fringe_indices(self):
+        n, m = zernike.fringe_indices(16)
+
+        np.testing.assert_array_equal(n, [0, 1, 1, 2, 2, 2, 3, 3, 4, 3, 3, 4, 4, 5, 5, 6])
+        np.testing.assert_array_equal(m, [0, 1, -1, 0, 2, -2, 1, -1, 0, 3, -3, 2, -2, 1, -1, 0])
+
+    def test_unknown_convention_raises_value_error(self):
+        with pytest.raises(ValueError, match="Unknown Zernike convention"):
+            zernike.zernike(1, 0, 0, convention="Annular")
+
+
+class TestZernike:
+    @pytest.mark.parametrize(
+        "term,convention,expected",
+        [
+            (4, "Standard", np.sqrt(3) * (2 * 0.5**2 - 1)),
+            (8, "Standard", np.sqrt(8) * (3 * 0.5**3 - 2 * 0.5) * np.cos(0.3)),
+            (13, "Standard", np.sqrt(10) * (4 * 0.5**4 - 3 * 0.5**2) * np.sin(0.6)),
+            (4, "Fringe", 2 * 0.5**2 - 1),
+            (9, "Fringe", 6 * 0.5**4 - 6 * 0.5**2 + 1),
+            (11, "Fringe", 0.5**3 * np.sin(0.9)),
+        ],
+    )
+    def test_value(self, term, convention, expected):
+        assert zernike.zernike(term, 0.5, 0.3, convention=convention) == pytest.approx(expected)
+
+    def test_standard_terms_are_orthonormal(self):
+        wavefront = circular_wavefront(256)
+        matrix = zernike.basis(wavefront, 15)
+
+        np.testing.assert_allclose(matrix.T @ matrix / len(matrix), np.eye(15), atol=0.02)
+
+
+class TestFit:
+    @pytest.mark.parametrize("convention", ["Standard", "Fringe"])
+    def test_recovers_coefficients(self, convention):
+        wavefront = circular_wavefront()
+        coefficients = np.random.default_rng(0).normal(size=15)
+        data = zernike.reconstruct(coefficients, wavefront, convention=convention)
+
+        result = zernike.fit(
+            pd.DataFrame(data, index=wavefront.index, columns=wavefront.columns), 15, convention=convention
+        )
+
+        np.testing.assert_allclose(result, coefficients, atol=1e-10)
+
+    def test_fit_many(self):
+        wavefront = circular_wavefront()
+        coefficients = np.random.default_rng(0).normal(size=(3, 8))
+        maps = [
+            pd.DataFrame(data, index=wavefront.index, columns=wavefront.columns)
+            for data in zernike.reconstruct(coefficients, wavefront)
+        ]
+        small = circular_wavefront(32)
+        maps.append(pd.DataFrame(zernike.reconstruct(coefficients[0], small), index=small.index, columns=small.columns))
+
+        result = zernike.fit(maps, 8)
+
+        assert result.shape == (4, 8)
+        np.testing.assert_allclose(result[:3], coefficients, atol=1e-10)
+        np.testing.assert_allclose(result[3], coefficients[0], atol=1e-10)
+
+    def test_basis_is_cached(self):
+        zernike.clear_basis_cache()
+
+        assert zernike.basis(circular_wavefront(), 8) is zernike.basis(circular_wavefront(), 8)
+
+    def test_reconstruct_shape(self):
+        result = zernike.reconstruct(np.ones((2, 3, 8)), circular_wavefront(32))
+
+        assert result.shape == (2, 3, 32, 32)
+        assert np.isnan(result[..., 0, 0]).all()
+
+    def test_standard_coefficients_match_reference_data(self, wavefront_map_reference, reference_result):
+        reference = reference_result(
+            "test_wavefront.py", "test_zernike_standard_coefficients_returns_correct_result[128x128-64]"
+        ).data.coefficients
+
+        result = zernike.fit(wavefront_map_reference, 64)
+
+        np.testing.assert_allclose(result, [reference[term].value for term in range(1, 65)], atol=1e-7)
+
+    def test_fringe_coefficients_match_reference_data(self, wavefront_map_reference, reference_result):
+        reference = reference_result(
+            "test_wavefront.py",
+            "test_zernike_coefficients_vs_field_returns_correct_result[1-15-Fringe--x-15-128x128-0.5-1-5]",
+        ).data
+
+        result = zernike.fit(wavefront_map_reference, 15, convention="Fringe")
+
+        np.testing.assert_allclose(result, reference.iloc[0], atol=1e-6)
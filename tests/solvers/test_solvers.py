@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pandas as pd
 import pytest
 
 import zospy as zp
@@ -83,3 +84,72 @@ def test_variable(simple_system):
     solvers.variable(lens_back.RadiusCell)
 
     assert lens_back.RadiusCell.GetSolveData().Type == zp.constants.Editors.SolveType.Variable
+
+
+class TestApplyMany:
+    def test_applies_solvers(self, simple_system):
+        n_applied = solvers.apply_many(
+            simple_system,
+            [
+                (2, "Radius", "variable"),
+                (2, "Thickness", "variable"),
+                (3, "Radius", "surface_pickup", {"from_surface": 2, "scale": -1}),
+                (4, "Radius", "surface_pickup", {"from_surface": 2, "scale": -1}),
+            ],
+        )
+
+        lde = simple_system.LDE
+
+        assert n_applied == 4
+        assert lde.GetSurfaceAt(2).RadiusCell.GetSolveData().Type == zp.constants.Editors.SolveType.Variable
+        assert lde.GetSurfaceAt(2).ThicknessCell.GetSolveData().Type == zp.constants.Editors.SolveType.Variable
+        assert lde.GetSurfaceAt(3).RadiusCell.GetSolveData().Type == zp.constants.Editors.SolveType.SurfacePickup
+        assert lde.GetSurfaceAt(4).Radius == -20
+
+    def test_dataframe_spec(self, simple_system):
+        spec = pd.DataFrame({
+            "surface": [3, 3],
+            "column": ["Radius", "Thickness"],
+            "solve": ["fixed", "position"],
+            "parameters": [None, {"from_surface": 2, "length": 20}],
+        })
+
+        solvers.apply_many(simple_system, spec)
+
+        lens_back = simple_system.LDE.GetSurfaceAt(3)
+
+        assert lens_back.RadiusCell.GetSolveData().Type == zp.constants.Editors.SolveType.Fixed
+        assert lens_back.ThicknessCell.GetSolveData().Type == zp.constants.Editors.SolveType.Position
+        assert lens_back.Thickness == pytest.approx(19)
+
+    def test_unknown_solver_raises_value_error(self, simple_system):
+        with pytest.raises(ValueError, match="Unknown solver"):
+            solvers.apply_many(simple_system, [(2, "Radius", "variable"), (3, "Radius", "unknown")])
+
+        assert simple_system.LDE.GetSurfaceAt(2).RadiusCell.GetSolveData().Type == zp.constants.Editors.SolveType.Fixed
+
+    def test_restores_solves_on_failure(self, simple_system):
+        with pytest.raises(ValueError, match="Cannot apply solver variable to column Comment of surface 3"):
+            solvers.apply_many(simple_system, [(2, "Radius", "variable"), (3, "Comment", "variable")])
+
+        assert simple_system.LDE.GetSurfaceAt(2).RadiusCell.GetSolveData().Type == zp.constants.Editors.SolveType.Fixed
+
+    def test_solve_data_not_reused_across_columns(self, simple_system):
+        solvers.apply_many(
+            simple_system,
+            [
+                (3, "Radius", "surface_pickup", {"from_surface": 2}),
+                (3, "Thickness", "surface_pickup", {"from_surface": 2}),
+            ],
+        )
+
+        lens_front = simple_system.LDE.GetSurfaceAt(2)
+        lens_back = simple_system.LDE.GetSurfaceAt(3)
+
+        assert lens_back.Radius == lens_front.Radius
+        assert lens_back.Thickness == lens_front.Thickness
+
+    def test_dataframe_spec_missing_parameters(self):
+        spec = pd.DataFrame({"surface": [2], "column": ["Radius"], "solve": ["variable"], "parameters": [float("nan")]})
+
+        assert solvers._parse_solve_spec(spec) == [(2, "Radius", "variable", {})]  # ruff: ignore[private-member-access]
@@ -122,6 +122,95 @@ def test_oss_constructor_weakref_zos_raises_typeerror(zos):
         OpticStudioSystem(weakref.proxy(zos), None)
 
 
+class TestSuspendUpdates:
+    def test_suspends_updates(self, simple_system):
+        simple_system.LensUpdateMode = constants.LensUpdateMode.AllWindows
+
+        with simple_system.suspend_updates() as oss:
+            assert oss is simple_system
+            assert simple_system.LensUpdateMode == "None"
+            assert simple_system.SessionModes == "SessionOff"
+            assert not simple_system.TheApplication.ShowChangesInUI
+
+        assert simple_system.LensUpdateMode == "AllWindows"
+
+    def test_restores_modes_on_exception(self, simple_system):
+        session_mode = simple_system.SessionModes
+        show_changes_in_ui = simple_system.TheApplication.ShowChangesInUI
+
+        with pytest.raises(RuntimeError), simple_system.suspend_updates():
+            raise RuntimeError
+
+        assert simple_system.SessionModes == session_mode
+        assert simple_system.TheApplication.ShowChangesInUI == show_changes_in_ui
+
+
+class TestCachedResult:
+    def test_reuses_result(self, simple_system):
+        results = iter([1, 2])
+
+        assert simple_system.cached_result("key", lambda: next(results)) == 1
+        assert simple_system.cached_result("key", lambda: next(results)) == 1
+
+    def test_invalidated_by_suspend_updates(self, simple_system):
+        results = iter([1, 2])
+
+        simple_system.cached_result("key", lambda: next(results))
+
+        with simple_system.suspend_updates():
+            pass
+
+        assert simple_system.cached_result("key", lambda: next(results)) == 2
+
+    def test_cached_per_configuration(self, simple_system):
+        simple_system.MCE.AddConfiguration(False)
+        results = iter([1, 2])
+
+        simple_system.MCE.SetCurrentConfiguration(1)
+        simple_system.cached_result("key", lambda: next(results))
+        simple_system.MCE.SetCurrentConfiguration(2)
+
+        assert simple_system.cached_result("key", lambda: next(results)) == 2
+
+
+def test_invalidate_cached_results(mocker: MockerFixture):
+    systems = [OpticStudioSystem(mocker.Mock(), mocker.Mock()) for _ in range(2)]
+
+    for oss in systems:
+        oss._cached_results["key"] = 1
+
+    zp.zpcore.invalidate_cached_results(systems[0])
+
+    assert [bool(oss._cached_results) for oss in systems] == [False, True]
+
+    zp.zpcore.invalidate_cached_results()
+
+    assert not any(oss._cached_results for oss in systems)
+
+
+class TestInvalidateCommentIndexes:
+    @pytest.fixture
+    def mock_oss(self, mocker: MockerFixture):
+        oss = OpticStudioSystem(mocker.Mock(), mocker.Mock())
+        oss._comment_indexes = {"LDE": mocker.Mock(), "NCE": mocker.Mock()}
+
+        return oss
+
+    def test_editors_are_not_wrapped(self, mock_oss):
+        assert mock_oss.LDE is mock_oss._System.LDE
+        assert mock_oss.NCE is mock_oss._System.NCE
+
+    def test_invalidate_editor(self, mock_oss):
+        mock_oss.invalidate_comment_indexes("LDE")
+
+        assert set(mock_oss._comment_indexes) == {"NCE"}
+
+    def test_invalidate_all(self, mock_oss):
+        mock_oss.invalidate_comment_indexes()
+
+        assert not mock_oss._comment_indexes
+
+
 def test_version(optic_studio_version):
     assert optic_studio_version
 
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import inspect
 import json
-from dataclasses import dataclass, fields
-from types import SimpleNamespace
+from dataclasses import dataclass, fields, is_dataclass
+from types import NoneType, SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -124,7 +124,7 @@ class MockTool(BaseToolWrapper[MockToolOutputData, MockToolSettings]):
         return MockToolOutputData()
 
 
-_tool_wrapper_classes = [c for c in _all_subclasses(BaseToolWrapper) if c not in {MockTool}]
+_tool_wrapper_classes = [c for c in _all_subclasses(BaseToolWrapper) if c is not MockTool and not inspect.isabstract(c)]
 
 
 @pytest.fixture(scope="module", params=_tool_wrapper_classes)
@@ -151,6 +151,11 @@ class TestToolWrapper:
     def test_settings_type_is_specified(self):
         assert MockTool._settings_type is not ToolSettings  # ruff: ignore[private-member-access]
 
+    def test_settings_type_resolved_for_all_tools(self, tool_wrapper_class):
+        settings_type = tool_wrapper_class._settings_type  # ruff: ignore[private-member-access]
+
+        assert settings_type is NoneType or is_dataclass(settings_type)
+
     def test_tools_correct_tool_opener(self, oss: OpticStudioSystem, tool_wrapper_class):
         instance = tool_wrapper_class()
 
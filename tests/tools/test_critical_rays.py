@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import zospy as zp
+from zospy.tools.critical_rays import (
+    CRITICAL_RAY_DTYPE,
+    CriticalRays,
+    CriticalRaysetGenerator,
+    critical_ray_pattern,
+    get_critical_rays,
+)
+from zospy.tools.raytrace import NORM_UNPOL_RESULT_DTYPE
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def critical_rays_system(simple_system: OpticStudioSystem, tmp_path: Path) -> OpticStudioSystem:
+    simple_system.SystemData.Fields.AddField(0, 5, 1)
+    simple_system.save_as(tmp_path / "critical_rays_system.zmx")
+
+    return simple_system
+
+
+def test_critical_rayset_generator(critical_rays_system: OpticStudioSystem):
+    result = CriticalRaysetGenerator().run(critical_rays_system)
+
+    assert result.data.crs_file.endswith("critical_rays_system.CRS")
+    assert result.data.rays.dtype == CRITICAL_RAY_DTYPE
+    assert len(result.data.rays) == 2 * 5
+    np.testing.assert_array_equal(np.unique(result.data.rays["Hy"]), [0, 1])
+
+
+def test_critical_rayset_generator_unsaved_system(simple_system: OpticStudioSystem):
+    if simple_system.SystemFile:
+        pytest.skip("OpticStudio assigns a file name to new systems")
+
+    result = CriticalRaysetGenerator(crs_file="unsaved_system.CRS").run(simple_system)
+
+    assert Path(result.data.crs_file) == Path(tempfile.gettempdir(), "unsaved_system.CRS")
+
+
+def test_get_critical_rays(critical_rays_system: OpticStudioSystem):
+    critical_rays = get_critical_rays(critical_rays_system)
+
+    expected = zp.tools.raytrace.BatchRayTrace().run(critical_rays_system, critical_rays.rays).data
+
+    np.testing.assert_allclose(critical_rays.results["Y"], expected["Y"])
+    assert get_critical_rays(critical_rays_system) is critical_rays
+    assert not Path(critical_rays_system.SystemFile).with_suffix(".CRS").exists()
+
+
+def test_get_critical_rays_invalidated_by_edits(critical_rays_system: OpticStudioSystem):
+    critical_rays = get_critical_rays(critical_rays_system)
+
+    zp.solvers.apply_many(critical_rays_system, [(3, "Thickness", "variable")])
+
+    assert get_critical_rays(critical_rays_system) is not critical_rays
+
+
+def test_get_critical_rays_invalidated_by_solver(critical_rays_system: OpticStudioSystem):
+    critical_rays = get_critical_rays(critical_rays_system)
+
+    zp.solvers.variable(critical_rays_system.LDE.GetSurfaceAt(3).ThicknessCell)
+
+    assert get_critical_rays(critical_rays_system) is not critical_rays
+
+
+def test_get_critical_rays_depends_on_wavelengths(critical_rays_system: OpticStudioSystem):
+    critical_rays = get_critical_rays(critical_rays_system)
+
+    critical_rays_system.SystemData.Wavelengths.AddWavelength(0.486, 1)
+
+    assert get_critical_rays(critical_rays_system) is not critical_rays
+
+
+def test_get_critical_rays_depends_on_aperture(critical_rays_system: OpticStudioSystem):
+    critical_rays = get_critical_rays(critical_rays_system)
+
+    critical_rays_system.SystemData.Aperture.ApertureValue *= 2
+
+    assert get_critical_rays(critical_rays_system) is not critical_rays
+
+
+def test_get_critical_rays_invalidated_explicitly(critical_rays_system: OpticStudioSystem):
+    critical_rays = get_critical_rays(critical_rays_system)
+
+    critical_rays_system.LDE.GetSurfaceAt(3).Thickness += 1
+    critical_rays_system.invalidate_cached_results()
+
+    assert get_critical_rays(critical_rays_system) is not critical_rays
+
+
+class TestCriticalRayPattern:
+    def test_chief_and_marginals(self):
+        rays = critical_ray_pattern("ChiefAndMarginals", 1, np.array([[0, 0], [0, 1]]), 2)
+
+        assert rays.dtype == CRITICAL_RAY_DTYPE
+        assert len(rays) == 2 * 2 * 5
+        np.testing.assert_array_equal(rays["field"][:10], 1)
+        np.testing.assert_array_equal(rays["wavelength"][:10], np.repeat([1, 2], 5))
+        np.testing.assert_array_equal(rays["Hy"][10:], 1)
+        np.testing.assert_array_equal(rays["Py"][:5], [0, 1, -1, 0, 0])
+
+    @pytest.mark.parametrize(
+        "ray_pattern,number_of_rays,expected_length",
+        [("YFan", 5, 5), ("XFan", 1, 1), ("XyFan", 5, 10), ("ChiefAndRing", 8, 9), ("Grid", 3, 5)],
+    )
+    def test_number_of_rays(self, ray_pattern, number_of_rays, expected_length):
+        rays = critical_ray_pattern(ray_pattern, number_of_rays, np.zeros((1, 2)), 1)
+
+        assert len(rays) == expected_length
+        assert np.all(np.hypot(rays["Px"], rays["Py"]) <= 1 + 1e-12)
+
+    def test_list_raises_value_error(self):
+        with pytest.raises(ValueError, match="Cannot construct the rays of ray pattern 'List'"):
+            critical_ray_pattern("List", 5, np.zeros((1, 2)), 1)
+
+
+@pytest.fixture
+def critical_rays() -> CriticalRays:
+    rays = critical_ray_pattern("ChiefAndMarginals", 1, np.array([[0, 0], [0, 1]]), 1)
+    results = np.zeros(len(rays), dtype=NORM_UNPOL_RESULT_DTYPE)
+    results["X"] = rays["Px"]
+    results["Y"] = rays["Py"] + 10 * rays["Hy"]
+
+    return CriticalRays(rays=rays, results=results)
+
+
+class TestCriticalRays:
+    def test_select(self, critical_rays):
+        selected = critical_rays.select(field=2)
+
+        assert len(selected.rays) == 5
+        np.testing.assert_array_equal(selected.results["Y"], [10, 11, 9, 10, 10])
+
+    def test_chief_rays(self, critical_rays):
+        chief_rays = critical_rays.chief_rays()
+
+        np.testing.assert_array_equal(chief_rays.rays["field"], [1, 2])
+        np.testing.assert_array_equal(chief_rays.results["Y"], [0, 10])
+
+    def test_transverse_aberrations(self, critical_rays):
+        aberrations = critical_rays.transverse_aberrations()
+
+        np.testing.assert_array_equal(aberrations[:, 0], np.tile([0, 0, 0, 1, -1], 2))
+        np.testing.assert_array_equal(aberrations[:, 1], np.tile([0, 1, -1, 0, 0], 2))
+
+    def test_transverse_aberrations_without_chief_ray_raises_value_error(self):
+        rays = critical_ray_pattern("YFan", 2, np.zeros((1, 2)), 1)
+        critical_rays = CriticalRays(rays=rays, results=np.zeros(len(rays), dtype=NORM_UNPOL_RESULT_DTYPE))
+
+        with pytest.raises(ValueError, match="do not contain a chief ray"):
+            critical_rays.transverse_aberrations()
+
+    def test_to_dataframe(self, critical_rays):
+        df = critical_rays.to_dataframe()
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 10
+        assert {"field", "Px", "X", "error_code"} <= set(df.columns)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from zospy.tools.nsc_raytrace import ZRD_SEGMENT_DTYPE, NSCRayTrace, ZRDReader, aggregate_detector_hits
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def zrd_file(nsc_simple_system: OpticStudioSystem, tmp_path: Path) -> str:
+    nsc_simple_system.save_as(tmp_path / "nsc_simple_system.zos")
+
+    return NSCRayTrace(save_rays="nsc_simple_system.ZRD").run(nsc_simple_system).data.zrd_file
+
+
+class TestNSCRayTrace:
+    def test_run_without_saving_rays(self, nsc_simple_system: OpticStudioSystem):
+        result = NSCRayTrace().run(nsc_simple_system)
+
+        assert result.data.zrd_file is None
+        assert result.data.total_ray_energy > 0
+
+    def test_save_rays(self, zrd_file: str):
+        assert zrd_file.endswith("nsc_simple_system.ZRD")
+
+
+class TestZRDReader:
+    def test_returns_record_array(self, nsc_simple_system: OpticStudioSystem, zrd_file: str):
+        result = ZRDReader().run(nsc_simple_system, zrd_file)
+
+        assert result.data.dtype == ZRD_SEGMENT_DTYPE
+        assert len(np.unique(result.data["ray_number"])) == 100
+
+    def test_iter_run_yields_fixed_size_chunks(self, nsc_simple_system: OpticStudioSystem, zrd_file: str):
+        full = ZRDReader().run(nsc_simple_system, zrd_file).data
+        chunks = list(ZRDReader(chunk_size=32).iter_run(nsc_simple_system, zrd_file))
+
+        assert all(len(chunk) == 32 for chunk in chunks[:-1])
+        np.testing.assert_array_equal(np.concatenate(chunks), full)
+
+    def test_filter(self, nsc_simple_system: OpticStudioSystem, zrd_file: str):
+        result = ZRDReader(ray_filter="H3").run(nsc_simple_system, zrd_file)
+
+        assert np.any(result.data["hit_object"] == 3)
+
+
+def test_aggregate_detector_hits():
+    chunks = [np.zeros(3, dtype=ZRD_SEGMENT_DTYPE), np.zeros(2, dtype=ZRD_SEGMENT_DTYPE)]
+    chunks[0]["hit_object"] = [0, 2, 3]
+    chunks[0]["intensity"] = [1, 0.5, 0.25]
+    chunks[1]["hit_object"] = [3, 3]
+    chunks[1]["intensity"] = [0.25, 0.5]
+
+    result = aggregate_detector_hits(chunks)
+
+    assert list(result.index) == [2, 3]
+    assert list(result["Hits"]) == [1, 3]
+    assert list(result["Intensity"]) == pytest.approx([0.5, 1.0])
+
+
+def test_aggregate_detector_hits_selected_detectors():
+    chunk = np.zeros(2, dtype=ZRD_SEGMENT_DTYPE)
+    chunk["hit_object"] = [2, 3]
+
+    result = aggregate_detector_hits([chunk], detectors=[3, 5])
+
+    assert list(result["Hits"]) == [1, 0]
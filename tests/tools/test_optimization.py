@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import zospy as zp
+from zospy.tools.optimization import (
+    GlobalOptimization,
+    LocalOptimization,
+    OptimizationProgress,
+    OptimizationResult,
+)
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def optimization_system(simple_system: OpticStudioSystem) -> OpticStudioSystem:
+    effective_focal_length = simple_system.MFE.GetOperandAt(1)
+    effective_focal_length.ChangeType(zp.constants.Editors.MFE.MeritOperandType.EFFL)
+    effective_focal_length.Target = 25
+    effective_focal_length.Weight = 1
+
+    zp.solvers.variable(simple_system.LDE.GetSurfaceAt(2).RadiusCell)
+
+    return simple_system
+
+
+def test_local_optimization(optimization_system: OpticStudioSystem):
+    progress = []
+
+    result = LocalOptimization(poll_interval=0.1).run(optimization_system, callback=progress.append)
+
+    assert isinstance(result.data, OptimizationResult)
+    assert result.data.stop_reason == "Completed"
+    assert result.data.final_merit_function <= result.data.initial_merit_function
+    assert result.data.final_merit_function == pytest.approx(0, abs=1e-6)
+    assert progress == result.data.history
+
+
+def test_global_optimization_max_time(optimization_system: OpticStudioSystem):
+    result = GlobalOptimization(max_time=2, poll_interval=0.5).run(optimization_system)
+
+    assert result.data.stop_reason == "MaxTime"
+    assert result.data.elapsed >= 2
+    assert not optimization_system.Tools.IsRunning
+
+
+def test_iter_run_break_stops_optimization(optimization_system: OpticStudioSystem):
+    for progress in GlobalOptimization(max_time=None, poll_interval=0.1).iter_run(optimization_system):
+        assert isinstance(progress, OptimizationProgress)
+        assert progress.stop_reason is None
+        break
+
+    assert optimization_system.Tools.CurrentTool is None
+
+
+class FakeOptimizationTool:
+    """Stand-in for an OpticStudio optimization tool with a scripted merit function."""
+
+    def __init__(self, merit_functions: list[float]):
+        self.merit_functions = merit_functions
+        self.polls = 0
+        self.cancelled = False
+        self.MaxCores = 8
+        self.Progress = 0
+        self.InitialMeritFunction = merit_functions[0]
+
+    @property
+    def IsRunning(self) -> bool:  # ruff: ignore[invalid-function-name]
+        return not self.cancelled and self.polls < len(self.merit_functions) - 1
+
+    @property
+    def CurrentMeritFunction(self) -> float:  # ruff: ignore[invalid-function-name]
+        return self.merit_functions[min(self.polls, len(self.merit_functions) - 1)]
+
+    def Run(self) -> None:  # ruff: ignore[invalid-function-name]
+        pass
+
+    def WaitWithTimeout(self, timeout: float) -> bool:  # ruff: ignore[invalid-function-name, unused-method-argument]
+        self.polls += 1
+        return self.IsRunning
+
+    def Cancel(self) -> None:  # ruff: ignore[invalid-function-name]
+        self.cancelled = True
+
+    def WaitForCompletion(self) -> None:  # ruff: ignore[invalid-function-name]
+        pass
+
+
+@pytest.mark.usefixtures("zos")
+class TestOptimize:
+    def test_completed(self):
+        tool = FakeOptimizationTool([10, 5, 1])
+        optimization = zp.tools.optimization.HammerOptimization(max_time=None)
+
+        history = list(optimization._optimize(tool))  # ruff: ignore[private-member-access]
+
+        assert [p.merit_function for p in history] == [10, 5, 1]
+        assert history[-1].stop_reason == "Completed"
+        assert tool.NumberOfCores == tool.MaxCores
+        assert not tool.cancelled
+
+    def test_number_of_cores(self):
+        tool = FakeOptimizationTool([10, 5])
+
+        list(zp.tools.optimization.HammerOptimization(max_time=None, number_of_cores=2)._optimize(tool))  # ruff: ignore[private-member-access]
+
+        assert tool.NumberOfCores == 2
+
+    def test_plateau(self, monkeypatch: pytest.MonkeyPatch):
+        times = iter(range(100))
+        monkeypatch.setattr(zp.tools.optimization, "perf_counter", lambda: next(times))
+
+        tool = FakeOptimizationTool([10, 5, 4.9999, 4.9998, 4.9997, 1, 0])
+        optimization = zp.tools.optimization.HammerOptimization(max_time=None, plateau_time=2, plateau_tolerance=1e-3)
+
+        history = list(optimization._optimize(tool))  # ruff: ignore[private-member-access]
+
+        assert history[-1].stop_reason == "Plateau"
+        assert history[-1].merit_function == pytest.approx(4.9998)
+        assert tool.cancelled
+
+    def test_max_time(self, monkeypatch: pytest.MonkeyPatch):
+        times = iter(range(100))
+        monkeypatch.setattr(zp.tools.optimization, "perf_counter", lambda: next(times))
+
+        tool = FakeOptimizationTool([10, 9, 8, 7, 6, 5, 4])
+        history = list(zp.tools.optimization.HammerOptimization(max_time=3)._optimize(tool))  # ruff: ignore[private-member-access]
+
+        assert history[-1].stop_reason == "MaxTime"
+        assert history[-1].elapsed == 3
+        assert tool.cancelled
+
+    def test_close_cancels(self):
+        tool = FakeOptimizationTool([10, 9, 8, 7])
+        iterator = zp.tools.optimization.HammerOptimization(max_time=None)._optimize(tool)  # ruff: ignore[private-member-access]
+
+        next(iterator)
+        iterator.close()
+
+        assert tool.cancelled
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from zospy.analyses.raysandspots import SingleRayTrace
+from zospy.tools.raytrace import (
+    DIRECT_POL_RESULT_DTYPE,
+    DIRECT_RAY_DTYPE,
+    DIRECT_UNPOL_RESULT_DTYPE,
+    NORM_POL_RESULT_DTYPE,
+    NORM_RAY_DTYPE,
+    NORM_UNPOL_RESULT_DTYPE,
+    BatchRayTrace,
+    DirectPolBatchRayTrace,
+    DirectUnpolBatchRayTrace,
+    NormPolBatchRayTrace,
+)
+
+if TYPE_CHECKING:
+    from zospy.zpcore import OpticStudioSystem
+
+
+def _single_ray_trace_image_coordinates(oss: OpticStudioSystem, hx, hy, px, py) -> tuple[float, float, float]:
+    result = SingleRayTrace(hx=hx, hy=hy, px=px, py=py).run(oss)
+    image = result.data.real_ray_trace_data.iloc[-1]
+
+    return image["X-coordinate"], image["Y-coordinate"], image["Z-coordinate"]
+
+
+class TestBatchRayTrace:
+    def test_returns_structured_array(self, simple_system: OpticStudioSystem):
+        rays = np.array([[0, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+
+        result = BatchRayTrace().run(simple_system, rays)
+
+        assert result.data.dtype == NORM_UNPOL_RESULT_DTYPE
+        assert result.data.shape == (3,)
+        assert np.all(result.data["error_code"] == 0)
+        assert np.all(result.data["vignette_code"] == 0)
+
+    def test_keeps_input_shape(self, simple_system: OpticStudioSystem):
+        px, py = np.meshgrid(np.linspace(-0.5, 0.5, 3), np.linspace(-0.5, 0.5, 4))
+        rays = np.stack([np.zeros_like(px), np.zeros_like(px), px, py], axis=-1)
+
+        result = BatchRayTrace().run(simple_system, rays)
+
+        assert result.data.shape == (4, 3)
+
+    @pytest.mark.parametrize("hx,hy,px,py", [(0, 0, 0, 0), (0, 0, 0, 1), (0, 0, 0.5, -0.5)])
+    def test_matches_single_ray_trace(self, simple_system: OpticStudioSystem, hx, hy, px, py):
+        expected = _single_ray_trace_image_coordinates(simple_system, hx, hy, px, py)
+
+        result = BatchRayTrace().run(simple_system, [[hx, hy, px, py]])
+
+        assert (result.data["X"][0], result.data["Y"][0], result.data["Z"][0]) == pytest.approx(expected, abs=1e-6)
+
+    def test_chunked_trace_matches_single_chunk(self, simple_system: OpticStudioSystem):
+        py = np.linspace(-1, 1, 11)
+        rays = np.column_stack([np.zeros_like(py), np.zeros_like(py), np.zeros_like(py), py])
+
+        single_chunk = BatchRayTrace(max_rays=100).run(simple_system, rays)
+        multiple_chunks = BatchRayTrace(max_rays=3).run(simple_system, rays)
+
+        np.testing.assert_array_equal(single_chunk.data, multiple_chunks.data)
+
+    def test_trace_to_intermediate_surface(self, simple_system: OpticStudioSystem):
+        result = BatchRayTrace(to_surface=2).run(simple_system, [[0, 0, 0, 1]])
+
+        assert result.data["Y"][0] == pytest.approx(1.0)
+
+    def test_invalid_ray_shape_raises_value_error(self, simple_system: OpticStudioSystem):
+        with pytest.raises(ValueError, match=r"rays should have shape \(\.\.\., 4\)"):
+            BatchRayTrace().run(simple_system, np.zeros((3, 2)))
+
+    def test_structured_input(self, simple_system: OpticStudioSystem):
+        rays = np.zeros(5, dtype=NORM_RAY_DTYPE)
+        rays["Py"] = np.linspace(-1, 1, 5)
+
+        structured = BatchRayTrace().run(simple_system, rays)
+        plain = BatchRayTrace().run(simple_system, rays.view(np.float64).reshape(5, 4))
+
+        np.testing.assert_array_equal(structured.data, plain.data)
+
+    def test_out_array(self, simple_system: OpticStudioSystem):
+        rays = np.zeros((5, 4))
+        out = np.zeros(5, dtype=NORM_UNPOL_RESULT_DTYPE)
+
+        result = BatchRayTrace().run(simple_system, rays, out=out)
+
+        assert np.shares_memory(result.data, out)
+
+    def test_iter_run_matches_run(self, simple_system: OpticStudioSystem):
+        rays = np.zeros((11, 4))
+        rays[:, 3] = np.linspace(-1, 1, 11)
+
+        chunks = list(BatchRayTrace(max_rays=4).iter_run(simple_system, rays))
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 3]
+        np.testing.assert_array_equal(np.concatenate(chunks), BatchRayTrace().run(simple_system, rays).data)
+
+
+class TestNormPolBatchRayTrace:
+    def test_matches_unpolarized_coordinates(self, simple_system: OpticStudioSystem):
+        rays = np.zeros(3, dtype=[("Hx", float), ("Hy", float), ("Px", float), ("Py", float)])
+        rays["Py"] = [-1, 0, 1]
+
+        polarized = NormPolBatchRayTrace().run(simple_system, rays)
+        unpolarized = BatchRayTrace().run(simple_system, rays)
+
+        assert polarized.data.dtype == NORM_POL_RESULT_DTYPE
+        np.testing.assert_allclose(polarized.data["Y"], unpolarized.data["Y"])
+        assert np.all(polarized.data["intensity"] > 0)
+
+
+class TestDirectUnpolBatchRayTrace:
+    def test_trace_parallel_ray(self, simple_system: OpticStudioSystem):
+        rays = np.zeros(1, dtype=DIRECT_RAY_DTYPE)
+        rays["N"] = 1
+
+        result = DirectUnpolBatchRayTrace(start_surface=1).run(simple_system, rays)
+
+        assert result.data.dtype == DIRECT_UNPOL_RESULT_DTYPE
+        assert result.data["error_code"][0] == 0
+        assert (result.data["X"][0], result.data["Y"][0]) == pytest.approx((0, 0))
+
+    def test_matches_normalized_ray_trace(self, simple_system: OpticStudioSystem):
+        rays = np.array([[0, 1, 0, 0, 0, 1]])
+
+        direct = DirectUnpolBatchRayTrace(start_surface=1).run(simple_system, rays)
+        normalized = BatchRayTrace().run(simple_system, [[0, 0, 0, 1]])
+
+        assert direct.data["Y"][0] == pytest.approx(normalized.data["Y"][0], abs=1e-6)
+
+
+class TestDirectPolBatchRayTrace:
+    def test_returns_polarization_fields(self, simple_system: OpticStudioSystem):
+        rays = np.zeros((2, 6))
+        rays[:, 5] = 1
+
+        result = DirectPolBatchRayTrace(start_surface=1).run(simple_system, rays)
+
+        assert result.data.dtype == DIRECT_POL_RESULT_DTYPE
+        assert np.all(result.data["intensity"] > 0)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import zospy as zp
+from zospy.tools.tolerancing import (
+    MonteCarloResult,
+    QuickSensitivity,
+    SensitivityDataReader,
+    SensitivityResult,
+    ToleranceDataReader,
+    Tolerancing,
+    TolerancingProgress,
+    _column_label,
+    _fill_trials,
+    _read_sensitivity,
+    load_trials,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from zospy.zpcore import OpticStudioSystem
+
+
+@pytest.fixture
+def tolerancing_system(simple_system: OpticStudioSystem, tmp_path: Path) -> OpticStudioSystem:
+    radius_tolerance = simple_system.TDE.GetOperandAt(1)
+    radius_tolerance.ChangeType(zp.constants.Editors.TDE.ToleranceOperandType.TRAD)
+    radius_tolerance.GetOperandCell(zp.constants.Editors.TDE.ToleranceColumn.Param1).IntegerValue = 2
+    radius_tolerance.Min = -0.1
+    radius_tolerance.Max = 0.1
+
+    compensator = simple_system.TDE.AddOperand()
+    compensator.ChangeType(zp.constants.Editors.TDE.ToleranceOperandType.COMP)
+    compensator.GetOperandCell(zp.constants.Editors.TDE.ToleranceColumn.Param1).IntegerValue = 3
+
+    simple_system.save_as(tmp_path / "tolerancing_system.zmx")
+
+    return simple_system
+
+
+def test_tolerancing(tolerancing_system: OpticStudioSystem):
+    progress = []
+
+    result = Tolerancing(number_of_runs=10, poll_interval=0.1).run(tolerancing_system, callback=progress.append)
+
+    assert result.data.tol_data_file.endswith("tolerancing_system.ZTD")
+    assert progress == result.data.history
+    assert progress[-1].completed
+
+    monte_carlo = ToleranceDataReader(chunk_size=3).run(tolerancing_system, result.data.tol_data_file)
+
+    assert isinstance(monte_carlo.data, MonteCarloResult)
+    assert monte_carlo.data.trials.shape == (10, len(monte_carlo.data.columns))
+    assert list(monte_carlo.data.statistics.index) == monte_carlo.data.columns
+    assert monte_carlo.data.statistics["Sample size"].iloc[0] == 10
+
+
+def test_tolerancing_iter_run(tolerancing_system: OpticStudioSystem):
+    for progress in Tolerancing(number_of_runs=10, poll_interval=0.1).iter_run(tolerancing_system):
+        assert isinstance(progress, TolerancingProgress)
+
+    assert progress.completed
+
+
+def test_quick_sensitivity(tolerancing_system: OpticStudioSystem):
+    quick_sensitivity = QuickSensitivity().run(tolerancing_system)
+
+    assert quick_sensitivity.data.ztd_file.endswith("tolerancing_system.ZTD")
+
+    sensitivity = SensitivityDataReader().run(tolerancing_system, quick_sensitivity.data.ztd_file)
+
+    assert isinstance(sensitivity.data, SensitivityResult)
+    assert sensitivity.data.effects.shape == (1, len(sensitivity.data.criteria), 2)
+    assert sensitivity.data.operands[0].startswith("TRAD")
+    np.testing.assert_array_equal(sensitivity.data.tolerances, [[-0.1, 0.1]])
+
+
+class TestFillTrials:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4, 10])
+    def test_chunks(self, chunk_size):
+        expected = np.arange(12, dtype=float).reshape(4, 3)
+        trials = np.empty((4, 3))
+
+        chunks = list(_fill_trials(SimpleNamespace(Data=expected.ravel().tolist()), trials, chunk_size))
+
+        assert [len(chunk) for chunk in chunks][:-1] == [chunk_size] * (len(chunks) - 1)
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+        np.testing.assert_array_equal(trials, expected)
+        assert all(np.shares_memory(chunk, trials) for chunk in chunks)
+
+    def test_empty(self):
+        assert list(_fill_trials(SimpleNamespace(Data=[]), np.empty((0, 3)), 10)) == []
+
+
+class TestColumnLabel:
+    def test_column(self):
+        metadata = SimpleNamespace(IsOperand=False, Name="UserMeritFunction")
+
+        assert _column_label(metadata) == "UserMeritFunction"
+
+    def test_operand(self):
+        parameters = [
+            SimpleNamespace(IsDouble=False, IsInt=True, IntValue=2),
+            SimpleNamespace(IsDouble=True, IsInt=False, DoubleValue=0.5),
+        ]
+        metadata = SimpleNamespace(
+            IsOperand=True,
+            NumberOfParameters=2,
+            GetParameter=parameters.__getitem__,
+            GetOperandType=lambda: "TRAD",
+        )
+
+        assert _column_label(metadata) == "TRAD 2 0.5"
+
+
+def test_save_load_trials(tmp_path: Path):
+    result = MonteCarloResult(
+        trials=np.arange(6, dtype=float).reshape(3, 2),
+        columns=["Criterion", "TRAD 2"],
+        statistics=pd.DataFrame(),
+    )
+
+    result.save_trials(tmp_path / "trials.npz")
+
+    pd.testing.assert_frame_equal(load_trials(tmp_path / "trials.npz"), result.to_dataframe())
+
+
+def _operand(name: str, minimum: float, maximum: float, effects: list[tuple[float, float]]) -> SimpleNamespace:
+    return SimpleNamespace(
+        IsOperand=True,
+        NumberOfParameters=0,
+        GetOperandType=lambda: name,
+        Minimum=minimum,
+        Maximum=maximum,
+        GetEffectOnCriterion=lambda j: SimpleNamespace(
+            EstimatedChangeMinimum=effects[j][0], EstimatedChangeMaximum=effects[j][1]
+        ),
+    )
+
+
+@pytest.fixture
+def sensitivity_result() -> SensitivityResult:
+    operands = [
+        _operand("TRAD", -0.1, 0.1, [(0.01, 0.02), (-0.5, 0.1)]),
+        _operand("TTHI", -0.2, 0.2, [(-0.03, 0.01), (0.2, 0.3)]),
+    ]
+    criteria = [
+        SimpleNamespace(Name="RMSSpotRadius", NominalValue=0.005),
+        SimpleNamespace(Name="RMSWavefront", NominalValue=0.1),
+    ]
+    compensator = SimpleNamespace(
+        IsOperand=True,
+        NumberOfParameters=0,
+        GetOperandType=lambda: "COMP",
+        Minimum=-1.0,
+        Maximum=1.0,
+        Mean=0.0,
+        SampleStandardDeviation=0.5,
+        PopulationStandardDeviation=0.4,
+    )
+    data = SimpleNamespace(
+        NumberOfResultOperands=2,
+        NumberOfCriteria=2,
+        NumberOfCompensators=1,
+        GetOperand=operands.__getitem__,
+        GetCriterion=criteria.__getitem__,
+        GetCompensator=[compensator].__getitem__,
+    )
+
+    return _read_sensitivity(data)
+
+
+class TestSensitivityResult:
+    def test_read(self, sensitivity_result):
+        assert sensitivity_result.operands == ["TRAD", "TTHI"]
+        assert sensitivity_result.criteria == ["RMSSpotRadius", "RMSWavefront"]
+        np.testing.assert_array_equal(
+            sensitivity_result.effects, [[[0.01, 0.02], [-0.5, 0.1]], [[-0.03, 0.01], [0.2, 0.3]]]
+        )
+        np.testing.assert_array_equal(sensitivity_result.nominal_values, [0.005, 0.1])
+        np.testing.assert_array_equal(sensitivity_result.tolerances, [[-0.1, 0.1], [-0.2, 0.2]])
+        assert sensitivity_result.compensators.loc["COMP", "Mean"] == 0
+
+    def test_to_dataframe(self, sensitivity_result):
+        df = sensitivity_result.to_dataframe()
+
+        assert df.shape == (2, 4)
+        assert df.loc["TTHI", ("RMSWavefront", "Maximum")] == pytest.approx(0.3)
+
+    @pytest.mark.parametrize(
+        "criterion,expected_order,expected_values",
+        [
+            (0, ["TTHI", "TRAD"], [0.03, 0.02]),
+            ("RMSWavefront", ["TRAD", "TTHI"], [0.5, 0.3]),
+        ],
+    )
+    def test_rank(self, sensitivity_result, criterion, expected_order, expected_values):
+        ranking = sensitivity_result.rank(criterion)
+
+        assert list(ranking.index) == expected_order
+        assert ranking.to_numpy() == pytest.approx(expected_values)
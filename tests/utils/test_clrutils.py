@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def test_import_zospy_does_not_load_clr():
+    code = "import sys, zospy; assert 'clr' not in sys.modules and 'System' not in sys.modules"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False)
+
+    assert result.returncode == 0, result.stderr
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from importlib.metadata import version
 
-from zospy import analyses, functions, solvers, tools
+from zospy import analyses, functions, io, local, solvers, tools
 from zospy.api import config, constants
 from zospy.zpcore import ZOS
 
@@ -16,6 +16,8 @@ __all__ = (
     "analyses",
     "constants",
     "functions",
+    "io",
+    "local",
     "solvers",
     "tools",
 )
@@ -32,6 +32,7 @@ from zospy.analyses import (
     reports,
     surface,
     systemviewers,
+    tolerancing,
     wavefront,
 )
 from zospy.analyses.base import OnComplete, new_analysis
@@ -48,5 +49,6 @@ __all__ = (
     "reports",
     "surface",
     "systemviewers",
+    "tolerancing",
     "wavefront",
 )
@@ -30,6 +30,7 @@ import dataclasses
 import os
 import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass, is_dataclass
 from datetime import (
     datetime,  # ruff: ignore[typing-only-standard-library-import] Pydantic needs datetime to be present at runtime
@@ -64,6 +65,7 @@ from pydantic import (
 )
 
 from zospy.analyses.parsers import load_grammar, parse
+from zospy.analyses.parsers.pool import submit_parse
 from zospy.analyses.parsers.types import ValidatedDataFrame
 from zospy.api import constants
 from zospy.utils import zputils
@@ -236,7 +238,9 @@ class AnalysisResult(Generic[AnalysisData, AnalysisSettings]):
             if "__analysis_data__" in data:
                 data["data"] = _deserialize_analysis_data(data["data"], data.pop("__analysis_data__"))
             if "__analysis_settings__" in data:
-                data["settings"] = _deserialize_zospy_class(data["settings"], data.pop("__analysis_settings__"))
+                data["settings"] = _deserialize_zospy_class(
+                    data["settings"], data.pop("__analysis_settings__"), module="zospy.analyses"
+                )
 
         return handler(data)
 
@@ -583,6 +587,13 @@ def new_analysis(
     return Analysis(analysis)
 
 
+def _resolved_future(data: AnalysisData) -> Future[AnalysisData]:
+    future = Future()
+    future.set_result(data)
+
+    return future
+
+
 class BaseAnalysisWrapper(ABC, Generic[AnalysisData, AnalysisSettings]):
     """Base class for analysis wrappers.
 
@@ -606,6 +617,9 @@ class BaseAnalysisWrapper(ABC, Generic[AnalysisData, AnalysisSettings]):
     _needs_config_file: bool = False
     _needs_text_output_file: bool = False
 
+    # Flag to indicate if text outputs are parsed in the background while the analysis is run
+    _background: bool = False
+
     def __init__(self, *, settings_kws: dict[str, Any] | None = None):
         """Create a new analysis wrapper.
 
@@ -838,18 +852,36 @@ class BaseAnalysisWrapper(ABC, Generic[AnalysisData, AnalysisSettings]):
         else:
             raise ValueError(f"oncomplete should be a member of zospy.analyses.base.OnComplete, got {oncomplete}")
 
+    def close(self) -> None:
+        """Close the OpticStudio analysis if it is open.
+
+        Use this method to close an analysis that was kept open by running it with `oncomplete` set to
+        `OnComplete.Sustain`.
+        """
+        if self._analysis is not None:
+            self._complete(OnComplete.Close)
+
     def run(
         self,
         oss: OpticStudioSystem,
         config_file: str | Path | None = None,
         text_output_file: str | Path | None = None,
         oncomplete: OnComplete | Literal["Close", "Release", "Sustain"] = "Close",
-    ) -> AnalysisResult[AnalysisData, AnalysisSettings]:
+        *,
+        background: bool = False,
+    ) -> AnalysisResult[AnalysisData | Future[AnalysisData], AnalysisSettings]:
         """Run the analysis and return the results.
 
         This method opens the analysis in OpticStudio and creates temporary files if needed. After running the analysis,
         the temporary files are removed and the analysis is closed, released, or sustained based on `oncomplete`.
 
+        If `background` is True, the text output of the analysis is parsed in a background process pool (see
+        `zospy.analyses.parsers.pool.submit_parse`) and the data of the returned result is a
+        `concurrent.futures.Future` that resolves to the analysis data. This allows running the next analysis while the
+        output of the previous one is being parsed. For analyses that are not parsed from a text output, the future is
+        already resolved. Each worker process of the pool is spawned and imports zospy when it starts, so the pool only
+        pays off when many analyses are run.
+
         The `config_file` is ignored if self._needs_config_file is `False`.
         The `text_output_file` is ignored if self._needs_text_output_file is `False`.
 
@@ -864,11 +896,23 @@ class BaseAnalysisWrapper(ABC, Generic[AnalysisData, AnalysisSettings]):
         oncomplete : OnComplete | Literal["Close", "Release", "Sustain"]
             Action to perform after running the analysis. If "Close", the analysis will be closed. If "Release", the
             analysis will be kept open but not active. If "Sustain", the analysis will be kept open and active.
+        background : bool
+            Parse the text output in a background process and return a future as result data. Defaults to False.
 
         Returns
         -------
         AnalysisResult
             The analysis results.
+
+        Examples
+        --------
+        >>> results = [
+        ...     zp.analyses.wavefront.ZernikeStandardCoefficients(field=field).run(
+        ...         oss, background=True
+        ...     )
+        ...     for field in range(1, oss.SystemData.Fields.NumberOfFields + 1)
+        ... ]
+        >>> data = [result.data.result() for result in results]
         """
         self._oss = weakref.proxy(oss)
         self._check_mode()
@@ -880,7 +924,15 @@ class BaseAnalysisWrapper(ABC, Generic[AnalysisData, AnalysisSettings]):
         if self._needs_text_output_file:
             self._text_output_file, self._remove_text_output_file = self._create_tempfile(text_output_file, ".txt")
 
-        data = self.run_analysis()
+        self._background = background
+
+        try:
+            data = self.run_analysis()
+        finally:
+            self._background = False
+
+        if background and not isinstance(data, Future):
+            data = _resolved_future(data)
 
         result = AnalysisResult(
             data,
@@ -905,8 +957,23 @@ class BaseAnalysisWrapper(ABC, Generic[AnalysisData, AnalysisSettings]):
         grammar: str,
         transformer: type[Transformer],
         result_type: type[AnalysisData] | None = None,
-    ) -> AnalysisData:
-        """Parse the text output of the analysis."""
+        *,
+        background: bool | None = None,
+    ) -> AnalysisData | Future[AnalysisData]:
+        """Parse the text output of the analysis.
+
+        If `background` is True, the text output is read immediately and parsed in a background process pool (see
+        `zospy.analyses.parsers.pool.submit_parse`), and a future that resolves to the parse result is returned. This
+        allows OpticStudio to run the next analysis while the output is being parsed. If `background` is None, the
+        output is parsed in the background if `run` was called with `background=True`. Analyses that process the parse
+        result further should pass `background=False`.
+        """
+        if background is None:
+            background = self._background
+
+        if background:
+            return submit_parse(self.get_text_output(), grammar, transformer, result_type)
+
         parser = load_grammar(grammar)
         parse_result = parse(self.get_text_output(), parser, transformer)
 
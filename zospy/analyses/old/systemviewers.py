@@ -8,7 +8,6 @@ from typing import Any, Callable, TYPE_CHECKING
 from warnings import warn
 
 import numpy as np
-from System import Array
 
 from zospy.analyses.old.base import AnalysisResult, OnComplete, new_analysis
 from zospy.api import constants
@@ -113,6 +112,8 @@ def _get_image_data(image_data: _ZOSAPI.Tools.Layouts.IImageExportData | None) -
     if image_data is None:
         return image_data
 
+    from System import Array  # ruff: ignore[import-outside-top-level]
+
     image_size = image_data.Width * image_data.Height
 
     # In-place updating arrays works only with dotnet arrays
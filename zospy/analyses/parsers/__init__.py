@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
-from zospy.analyses.parsers import types
-from zospy.analyses.parsers.base import load_grammar, parse
+from zospy.analyses.parsers import pool, tables, types
+from zospy.analyses.parsers.base import ParseCacheInfo, clear_parse_cache, load_grammar, parse, parse_cache_info
 from zospy.analyses.parsers.transformers import ZospyTransformer
 
-__all__ = ("ZospyTransformer", "load_grammar", "parse", "types")
+__all__ = (
+    "ParseCacheInfo",
+    "ZospyTransformer",
+    "clear_parse_cache",
+    "load_grammar",
+    "parse",
+    "parse_cache_info",
+    "pool",
+    "tables",
+    "types",
+)
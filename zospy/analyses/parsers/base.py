@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from functools import lru_cache
-from typing import Any
+from typing import Any, NamedTuple
 
 from lark import Lark, Transformer
+from lark.exceptions import UnexpectedInput
 from lark.visitors import merge_transformers
 
+import zospy.api.config as _config
+from zospy.analyses.parsers.tables import extract_numeric_blocks, restore_numeric_blocks
 from zospy.analyses.parsers.transformers import ZospyTransformer
 
 
@@ -39,9 +46,102 @@ def load_grammar(name: str) -> Lark:
         raise FileNotFoundError(f"Grammar file {name}.lark not found") from e
 
 
+class _ParseCache:
+    """Least recently used cache of parse results.
+
+    Results are keyed by the parser, the transformer, the number format and a hash of the text. Copies of the results
+    are stored and returned, so that modifying a result does not affect the cache.
+    """
+
+    def __init__(self):
+        self._results: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, parser: Lark, transformer: type[Transformer]) -> tuple:
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+        return parser, transformer, _config.DECIMAL_POINT, _config.THOUSANDS_SEPARATOR, len(text), digest
+
+    def get(self, key: tuple) -> Any:
+        with self._lock:
+            if key not in self._results:
+                self.misses += 1
+
+                return None
+
+            self.hits += 1
+            self._results.move_to_end(key)
+            result = self._results[key]
+
+        return deepcopy(result)
+
+    def put(self, key: tuple, result: Any, maxsize: int) -> None:
+        result = deepcopy(result)
+
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+
+            while len(self._results) > maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+_parse_cache = _ParseCache()
+
+
+class ParseCacheInfo(NamedTuple):
+    """Statistics of the parse cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """Get the statistics of the parse cache.
+
+    See `zospy.api.config.PARSE_CACHE_SIZE` to enable the cache.
+
+    Returns
+    -------
+    ParseCacheInfo
+        The number of cache hits and misses, the maximum size and the current size of the cache.
+    """
+    return ParseCacheInfo(_parse_cache.hits, _parse_cache.misses, _config.PARSE_CACHE_SIZE, len(_parse_cache))
+
+
+def clear_parse_cache() -> None:
+    """Remove all results from the parse cache and reset its statistics.
+
+    See `zospy.api.config.PARSE_CACHE_SIZE` to enable the cache.
+    """
+    _parse_cache.clear()
+
+
 def parse(text: str, parser: Lark, transformer: type[Transformer]) -> dict[str, dict[list[int | float], Any]]:
     """Parse text using a Lark parser and a transformer.
 
+    Blocks of table rows are extracted before parsing if the grammar supports them, see
+    `zospy.analyses.parsers.tables.extract_numeric_blocks`. If the text with extracted blocks cannot be parsed, the
+    original text is parsed instead.
+
+    If `zospy.api.config.PARSE_CACHE_SIZE` is larger than 0, the results of the most recently parsed texts are cached.
+    Parsing a text that is identical to a cached one, e.g. the output of an analysis that is run again for an unchanged
+    system, then returns a copy of the cached result instead of parsing the text again.
+
     Parameters
     ----------
     text : str
@@ -56,6 +156,29 @@ def parse(text: str, parser: Lark, transformer: type[Transformer]) -> dict[str,
     dict[str, dict[list[int | float], Any]]
         The text output parsed into a dictionary.
     """
+    maxsize = _config.PARSE_CACHE_SIZE
+
+    if maxsize > 0:
+        key = _parse_cache.key(text, parser, transformer)
+
+        if (result := _parse_cache.get(key)) is not None:
+            return result
+
     merged_transformer = merge_transformers(transformer(), zospy=ZospyTransformer())
+    extracted_text, blocks = extract_numeric_blocks(text, parser)
+
+    try:
+        tree = restore_numeric_blocks(parser.parse(extracted_text), blocks)
+    except UnexpectedInput:
+        if not blocks:
+            raise
+
+        # A line outside a table may have been extracted as a block of rows, so parse the original text instead
+        tree = parser.parse(text)
+
+    result = merged_transformer.transform(tree)
+
+    if maxsize > 0:
+        _parse_cache.put(key, result, maxsize)
 
-    return merged_transformer.transform(parser.parse(text))
+    return result
@@ -0,0 +1,143 @@
+"""Parsing of text outputs in a background process pool.
+
+Parsing text outputs is CPU-bound and would otherwise block the thread that drives OpticStudio. Text outputs can be
+submitted to a pool of worker processes with `submit_parse`, which returns a `concurrent.futures.Future`. This allows
+OpticStudio to run the next analysis while the output of the previous one is still being parsed. Analyses can be run
+with `background=True` to parse their output with this pool.
+
+Worker processes are spawned rather than forked, so every worker imports zospy and loads all grammars when it starts.
+Workers do not connect to OpticStudio, but this start-up cost means the pool only pays off when many outputs are parsed.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lark.exceptions import LarkError
+
+import zospy.api.config as _config
+from zospy.analyses.parsers.base import load_grammar, parse
+
+if TYPE_CHECKING:
+    from lark import Transformer
+
+__all__ = ("shutdown_parse_pool", "submit_parse")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _available_grammars() -> list[str]:
+    return [g.stem for g in Path(__file__).parent.joinpath("grammars").glob("*.lark") if g.stem != "zospy"]
+
+
+def _initialize_worker() -> None:
+    for grammar in _available_grammars():
+        load_grammar(grammar)
+
+
+def _parse_in_worker(
+    text: str,
+    grammar: str,
+    transformer: type[Transformer],
+    result_type: type | None,
+    decimal_point: str,
+    thousands_separator: str,
+) -> Any:
+    # Use the number format of the main process, which may differ from the locale of the worker
+    _config.DECIMAL_POINT = decimal_point
+    _config.THOUSANDS_SEPARATOR = thousands_separator
+
+    # Lark and pydantic exceptions cannot always be pickled, which would break the process pool
+    try:
+        parse_result = parse(text, load_grammar(grammar), transformer)
+    except LarkError as e:
+        raise ValueError(f"Failed to parse text output with grammar {grammar}: {e}") from None
+
+    if result_type is None:
+        return parse_result
+
+    try:
+        return result_type(**parse_result)
+    except Exception as e:  # ruff: ignore[blind-except]
+        raise ValueError(f"Failed to create {result_type.__name__} from the parse result: {e}") from None
+
+
+def _get_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    global _pool  # ruff: ignore[global-statement]
+
+    with _pool_lock:
+        if _pool is None:
+            # Forking a process with a loaded .NET runtime is unsafe, so worker processes are always spawned
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+            )
+
+        return _pool
+
+
+def submit_parse(
+    text: str,
+    grammar: str,
+    transformer: type[Transformer],
+    result_type: type | None = None,
+    *,
+    max_workers: int | None = None,
+) -> Future:
+    """Parse a text output in a background process.
+
+    The process pool is created on first use and reused for subsequent calls. The number format in
+    `zospy.api.config` at the time of submission is used to parse the text.
+
+    Parameters
+    ----------
+    text : str
+        The text output to parse.
+    grammar : str
+        The name of the grammar, see `zospy.analyses.parsers.load_grammar`.
+    transformer : type[Transformer]
+        The transformer class to use. Must be importable by the worker processes, i.e. defined at module level.
+    result_type : type | None
+        If not None, the parse result is passed to this type as keyword arguments. Defaults to None.
+    max_workers : int | None
+        The number of worker processes. Only used when the pool is created. Defaults to the number of processors.
+
+    Returns
+    -------
+    Future
+        A future that resolves to the parse result. If the text cannot be parsed or the parse result is not valid for
+        `result_type`, the future raises a `ValueError`.
+    """
+    return _get_pool(max_workers).submit(
+        _parse_in_worker,
+        text,
+        grammar,
+        transformer,
+        result_type,
+        _config.DECIMAL_POINT,
+        _config.THOUSANDS_SEPARATOR,
+    )
+
+
+def shutdown_parse_pool(*, wait: bool = True) -> None:
+    """Shut down the process pool used by `submit_parse`.
+
+    A new pool is created when `submit_parse` is called again.
+
+    Parameters
+    ----------
+    wait : bool
+        If True, wait until all pending parses are completed. Defaults to True.
+    """
+    global _pool  # ruff: ignore[global-statement]
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+            _pool = None
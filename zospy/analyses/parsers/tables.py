@@ -0,0 +1,287 @@
+"""Vectorized readers for numeric tables in OpticStudio analysis output.
+
+Most of the text output of analyses such as the Single Ray Trace and the Polarization Pupil Map consists of tables of
+whitespace-separated numbers. Tokenizing every number with Lark is slow for large tables, so grammars match the body of
+such a table as a single terminal, which is decoded by the functions in this module. The numeric cells of all rows are
+delocalized at once and converted to a NumPy array in a single call.
+
+Even a single terminal is not enough for the Earley parser, which keeps alternative interpretations of every line alive
+while it scans the body of a table. Blocks of rows are therefore replaced by a short placeholder before parsing
+(`extract_numeric_blocks`), and restored in the parse tree afterwards (`restore_numeric_blocks`). This applies to every
+grammar terminal whose name ends with `_ROWS`, such as `NUMERIC_ROWS`; these terminals should also match the
+placeholder.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+from lark import Token
+
+from zospy.utils.pyutils import _delocalize
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lark import Lark, Tree
+
+__all__ = ("extract_numeric_blocks", "read_array", "read_table", "restore_numeric_blocks")
+
+BLOCK_TERMINAL_SUFFIX = "_ROWS"
+"""Suffix of the names of grammar terminals that match a block of table rows, which are extracted before parsing."""
+
+_BLOCK_PLACEHOLDER = "\ue000"
+"""Private use character that marks a placeholder for an extracted block. Followed by the index of the block."""
+
+_MISSING_CELL = "-"
+"""Cell that represents a missing value in OpticStudio tables."""
+
+_NUMERIC_CELL = re.compile(
+    r"[-+]?(?:infinity|inf|nan|(?:\d[\d.,]*|[.,]\d+)(?:e[-+]?\d+)?)\Z|-\Z",
+    flags=re.IGNORECASE,
+)
+
+
+def _split_rows(body: str) -> list[list[str]]:
+    """Split the body of a table into rows of whitespace-separated cells, ignoring empty lines."""
+    return [cells for line in body.splitlines() if (cells := line.split())]
+
+
+def _to_float(cells: list[str], decimal_point: str, thousands_separator: str | None) -> np.ndarray:
+    """Convert numeric cells to a float array. Missing cells are converted to NaN."""
+    if not cells:
+        return np.empty(0)
+
+    text = _delocalize("\n".join(cells), decimal_point=decimal_point, thousands_separator=thousands_separator)
+    values = text.split("\n")
+
+    if _MISSING_CELL in cells:
+        values = ["nan" if value == _MISSING_CELL else value for value in values]
+
+    return np.array(values, dtype=np.float64)
+
+
+def _pad(values: np.ndarray, counts: np.ndarray, n_columns: int) -> np.ndarray:
+    """Arrange the values of rows with `counts` values into an array of `n_columns` columns, padded with NaN."""
+    array = np.full((len(counts), n_columns), np.nan)
+    array[np.arange(n_columns) < counts[:, None]] = values
+
+    return array
+
+
+def read_array(
+    body: str,
+    n_columns: int | None = None,
+    *,
+    decimal_point: str = ...,
+    thousands_separator: str | None = ...,
+) -> np.ndarray:
+    """Read a table of whitespace-separated numbers into a two-dimensional array.
+
+    Parameters
+    ----------
+    body : str
+        The rows of the table, separated by newlines.
+    n_columns : int | None
+        The number of columns. Rows with fewer values are padded with NaN. If None, all rows should have the same number
+        of values. Defaults to None.
+    decimal_point : str
+        The decimal point separator used in the table. Defaults to zospy.api.config.DECIMAL_POINT.
+    thousands_separator : str | None
+        The thousands separator used in the table. Defaults to zospy.api.config.THOUSANDS_SEPARATOR.
+
+    Returns
+    -------
+    np.ndarray
+        The values of the table, with shape `(n_rows, n_columns)`.
+
+    Raises
+    ------
+    ValueError
+        If a row has more than `n_columns` values, or if `n_columns` is None and the rows have different numbers of
+        values.
+    """
+    rows = _split_rows(body)
+    counts = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+    values = _to_float([cell for row in rows for cell in row], decimal_point, thousands_separator)
+
+    if n_columns is None:
+        n_columns = int(counts[0]) if len(counts) else 0
+
+        if np.any(counts != n_columns):
+            raise ValueError("All rows of the table should have the same number of values.")
+
+    if np.any(counts > n_columns):
+        raise ValueError(f"Table rows should have at most {n_columns} values.")
+
+    if np.all(counts == n_columns):
+        return values.reshape(len(rows), n_columns)
+
+    return _pad(values, counts, n_columns)
+
+
+def _count_numeric(cells: list[str], limit: int) -> int:
+    """Count the leading numeric cells of a row, up to `limit` cells."""
+    for i, cell in enumerate(cells[:limit]):
+        if not _NUMERIC_CELL.match(cell):
+            return i
+
+    return min(len(cells), limit)
+
+
+def _label(cell: str) -> int | str:
+    """Convert a row label to an integer if possible."""
+    return int(cell) if cell.lstrip("+-").isdigit() else cell
+
+
+def read_table(
+    body: str,
+    columns: Sequence[str],
+    *,
+    label_column: bool = False,
+    text_column: bool = False,
+    decimal_point: str = ...,
+    thousands_separator: str | None = ...,
+) -> pd.DataFrame:
+    """Read a table of whitespace-separated numbers into a DataFrame.
+
+    Rows with fewer numeric values than columns are padded with NaN, and a warning is raised. Missing values may also be
+    represented by a dash.
+
+    Parameters
+    ----------
+    body : str
+        The rows of the table, separated by newlines.
+    columns : Sequence[str]
+        The column names, including the label and text column.
+    label_column : bool
+        If True, the first cell of each row is a label, such as a surface number or 'OBJ'. Labels that are integers are
+        converted to `int`. Defaults to False.
+    text_column : bool
+        If True, the non-numeric cells at the end of each row are joined with a single space into a text column, such
+        as a comment. Cells after the numeric columns are part of the text, even if they are numeric. Rows without text
+        have NaN in this column. Defaults to False.
+    decimal_point : str
+        The decimal point separator used in the table. Defaults to zospy.api.config.DECIMAL_POINT.
+    thousands_separator : str | None
+        The thousands separator used in the table. Defaults to zospy.api.config.THOUSANDS_SEPARATOR.
+
+    Returns
+    -------
+    pd.DataFrame
+        The table, with the columns in `columns`.
+
+    Raises
+    ------
+    ValueError
+        If a row has more numeric values than numeric columns and `text_column` is False.
+    """
+    rows = _split_rows(body)
+    n_numeric_columns = len(columns) - label_column - text_column
+
+    labels = [_label(row[0]) for row in rows] if label_column else None
+    cells = [row[1:] for row in rows] if label_column else rows
+    texts = None
+
+    if text_column:
+        counts = [_count_numeric(row_cells, n_numeric_columns) for row_cells in cells]
+        texts = [" ".join(row_cells[count:]) or np.nan for row_cells, count in zip(cells, counts, strict=True)]
+        cells = [row_cells[:count] for row_cells, count in zip(cells, counts, strict=True)]
+
+    counts = np.fromiter(map(len, cells), dtype=np.intp, count=len(cells))
+
+    if np.any(counts > n_numeric_columns):
+        raise ValueError(f"Table rows should have at most {n_numeric_columns} numeric values.")
+
+    values = _to_float([cell for row_cells in cells for cell in row_cells], decimal_point, thousands_separator)
+
+    if np.all(counts == n_numeric_columns):
+        values = values.reshape(len(cells), n_numeric_columns)
+    else:
+        warn("Header and row length mismatch. Empty columns will be filled with NaN.")
+        values = _pad(values, counts, n_numeric_columns)
+
+    numeric_columns = list(columns[label_column : len(columns) - text_column])
+    data = dict(zip(numeric_columns, values.T, strict=True))
+
+    if label_column:
+        data = {columns[0]: labels, **data}
+
+    if text_column:
+        data[columns[-1]] = texts
+
+    return pd.DataFrame(data, columns=list(columns))
+
+
+def extract_numeric_blocks(text: str, parser: Lark) -> tuple[str, list[str]]:
+    """Replace the blocks of table rows in a text output by placeholders.
+
+    A block consists of consecutive lines that are matched by a terminal of the grammar whose name ends with `_ROWS`,
+    such as the `NUMERIC_ROWS` terminal for lines that only contain numbers. Grammars without such terminals are not
+    affected.
+
+    Parameters
+    ----------
+    text : str
+        The text output of an analysis.
+    parser : Lark
+        The parser that will parse the text.
+
+    Returns
+    -------
+    tuple[str, list[str]]
+        The text with the blocks replaced by placeholders, and the extracted blocks.
+    """
+    terminals = [t for t in parser.terminals if t.name.endswith(BLOCK_TERMINAL_SUFFIX)]
+
+    if not terminals:
+        return text, []
+
+    blocks = []
+
+    def replace(match: re.Match) -> str:
+        indent, block = match.group(1, 2)
+        blocks.append(block)
+
+        return f"{indent}{_BLOCK_PLACEHOLDER}{len(blocks) - 1}"
+
+    pattern = _block_pattern([terminal.pattern.to_regexp() for terminal in terminals])
+
+    return pattern.sub(replace, text), blocks
+
+
+def _block_pattern(rows_regexps: list[str]) -> re.Pattern:
+    """Match blocks of rows that span complete lines, capturing the indentation and the block."""
+    rows_regexp = "|".join(f"(?:{regexp})" for regexp in rows_regexps)
+
+    return re.compile(rf"^([ \t]*)((?:{rows_regexp}))(?=[ \t]*\r?$)", flags=re.MULTILINE)
+
+
+def restore_numeric_blocks(tree: Tree, blocks: list[str]) -> Tree:
+    """Replace the placeholders in a parse tree by the blocks extracted with `extract_numeric_blocks`.
+
+    Parameters
+    ----------
+    tree : Tree
+        The parse tree of a text with placeholders.
+    blocks : list[str]
+        The extracted blocks.
+
+    Returns
+    -------
+    Tree
+        The parse tree, modified in place.
+    """
+    if not blocks:
+        return tree
+
+    for subtree in tree.iter_subtrees():
+        for i, child in enumerate(subtree.children):
+            if isinstance(child, Token) and child.startswith(_BLOCK_PLACEHOLDER):
+                subtree.children[i] = child.update(value=blocks[int(child[1:])])
+
+    return tree
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from zospy.analyses.physicaloptics import parameter_schema
 from zospy.analyses.physicaloptics.physical_optics_propagation import (
     PhysicalOpticsPropagation,
     PhysicalOpticsPropagationSettings,
@@ -14,4 +15,5 @@ __all__ = (
     "PhysicalOpticsPropagationSettings",
     "create_beam_parameter_dict",
     "create_fiber_parameter_dict",
+    "parameter_schema",
 )
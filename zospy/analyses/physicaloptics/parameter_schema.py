@@ -0,0 +1,263 @@
+"""Cached schema of the beam and fiber parameters of the Physical Optics Propagation analysis.
+
+The beam and fiber parameters of the Physical Optics Propagation analysis depend on the beam and fiber type. Instead of
+querying them from an OpticStudio analysis every time they are needed, the parameter names and default values of all
+types are discovered once in a single analysis session. The schema is kept in memory per OpticStudio version, and is
+only stored on disk if `zospy.api.config.CACHE_DIR` is set. Parameters of beam and fiber types that are defined by a
+file or DLL depend on that file, and are not part of the schema.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from zospy.analyses.base import new_analysis
+from zospy.api import config, constants
+
+if TYPE_CHECKING:
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "DYNAMIC_BEAM_TYPES",
+    "DYNAMIC_FIBER_TYPES",
+    "POPParameterSchema",
+    "clear_parameter_schema_cache",
+    "discover_parameter_schema",
+    "get_parameter_schema",
+)
+
+logger = logging.getLogger(__name__)
+
+DYNAMIC_BEAM_TYPES = frozenset({"File", "DLL", "Multimode"})
+"""Beam types whose parameters depend on a file or DLL, and are therefore not cached."""
+
+DYNAMIC_FIBER_TYPES = frozenset({"File", "DLL"})
+"""Fiber types whose parameters depend on a file or DLL, and are therefore not cached."""
+
+_SCHEMAS: dict[str, POPParameterSchema] = {}
+"""Schemas that have been loaded or discovered in this session, by OpticStudio version."""
+
+
+@dataclass(frozen=True)
+class POPParameterSchema:
+    """Beam and fiber parameters of the Physical Optics Propagation analysis for an OpticStudio version.
+
+    Attributes
+    ----------
+    version : str
+        The OpticStudio version.
+    beam : dict[str, dict[str, float]]
+        Parameter names and default values by beam type, in the order of the parameter indices.
+    fiber : dict[str, dict[str, float]]
+        Parameter names and default values by fiber type, in the order of the parameter indices.
+    """
+
+    version: str
+    beam: dict[str, dict[str, float]]
+    fiber: dict[str, dict[str, float]]
+
+    def parameters(self, which: Literal["beam", "fiber"], parameter_type: str) -> dict[str, float] | None:
+        """Get the parameter names and default values of a beam or fiber type.
+
+        Parameters
+        ----------
+        which : Literal['beam', 'fiber']
+            Whether to get the parameters of a beam type or a fiber type.
+        parameter_type : str
+            The name of the beam or fiber type.
+
+        Returns
+        -------
+        dict[str, float] | None
+            Default values by parameter name, in the order of the parameter indices, or None if the type is not part
+            of the schema.
+
+        Raises
+        ------
+        ValueError
+            If `which` is not 'beam' or 'fiber'.
+        """
+        if which == "beam":
+            return self.beam.get(parameter_type)
+
+        if which == "fiber":
+            return self.fiber.get(parameter_type)
+
+        raise ValueError("Invalid parameter type. Choose 'fiber' or 'beam'.")
+
+    def indices(self, which: Literal["beam", "fiber"], parameter_type: str) -> dict[str, int] | None:
+        """Get the parameter indices of a beam or fiber type.
+
+        Parameters
+        ----------
+        which : Literal['beam', 'fiber']
+            Whether to get the parameters of a beam type or a fiber type.
+        parameter_type : str
+            The name of the beam or fiber type.
+
+        Returns
+        -------
+        dict[str, int] | None
+            Parameter indices by parameter name, or None if the type is not part of the schema.
+        """
+        parameters = self.parameters(which, parameter_type)
+
+        return None if parameters is None else {name: i for i, name in enumerate(parameters)}
+
+    def to_json(self) -> str:
+        """Convert the schema to a JSON string.
+
+        Returns
+        -------
+        str
+            The schema as JSON string.
+        """
+        return json.dumps(asdict(self), indent=4)
+
+    @classmethod
+    def from_json(cls, data: str) -> POPParameterSchema:
+        """Create a schema from a JSON string.
+
+        Parameters
+        ----------
+        data : str
+            The schema as JSON string, see `to_json`.
+
+        Returns
+        -------
+        POPParameterSchema
+            The schema.
+        """
+        return cls(**json.loads(data))
+
+
+def _read_parameters(settings: _ZOSAPI.Analysis.Settings.PhysicalOptics.IAS_PhysicalOpticsPropagation, which: str):
+    if which == "beam":
+        return {
+            settings.GetParameterName(i): float(settings.GetParameterValue(i))
+            for i in range(settings.NumberOfParameters)
+        }
+
+    return {
+        settings.GetFiberParameterName(i): float(settings.GetFiberParameterValue(i))
+        for i in range(settings.NumberOfFiberParameters)
+    }
+
+
+def discover_parameter_schema(oss: OpticStudioSystem) -> POPParameterSchema:
+    """Discover the parameters of all beam and fiber types in a single Physical Optics Propagation analysis.
+
+    The discovered schema is not cached; use `get_parameter_schema` to get a cached schema.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance. Should be sequential.
+
+    Returns
+    -------
+    POPParameterSchema
+        The parameters of all beam and fiber types, except for the types in `DYNAMIC_BEAM_TYPES` and
+        `DYNAMIC_FIBER_TYPES`.
+    """
+    beam_types = constants.Analysis.PhysicalOptics.POPBeamTypes
+    fiber_types = constants.Analysis.PhysicalOptics.POPFiberTypes
+
+    analysis = new_analysis(oss, constants.Analysis.AnalysisIDM.PhysicalOpticsPropagation)
+
+    try:
+        beam = {}
+        for beam_type in beam_types._fields:
+            if beam_type not in DYNAMIC_BEAM_TYPES:
+                analysis.Settings.BeamType = constants.process_constant(beam_types, beam_type)
+                beam[beam_type] = _read_parameters(analysis.Settings, "beam")
+
+        fiber = {}
+        for fiber_type in fiber_types._fields:
+            if fiber_type not in DYNAMIC_FIBER_TYPES:
+                analysis.Settings.FiberType = constants.process_constant(fiber_types, fiber_type)
+                fiber[fiber_type] = _read_parameters(analysis.Settings, "fiber")
+    finally:
+        analysis.Close()
+
+    return POPParameterSchema(version=str(oss.ZOS.version), beam=beam, fiber=fiber)
+
+
+def _schema_file(version: str) -> Path | None:
+    return None if config.CACHE_DIR is None else Path(config.CACHE_DIR) / f"pop_parameters_{version}.json"
+
+
+def _load_schema(path: Path) -> POPParameterSchema | None:
+    try:
+        return POPParameterSchema.from_json(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError):
+        logger.warning(f"Ignoring invalid POP parameter schema file {path}.")
+        return None
+
+
+def _store_schema(path: Path, schema: POPParameterSchema) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(schema.to_json(), encoding="utf-8")
+    except OSError:
+        logger.warning(f"Could not store POP parameter schema file {path}.")
+
+
+def get_parameter_schema(oss: OpticStudioSystem, *, refresh: bool = False) -> POPParameterSchema:
+    """Get the parameter schema of the Physical Optics Propagation analysis for the OpticStudio version of a system.
+
+    The schema is taken from memory if it has been used before in this session, otherwise it is read from
+    `zospy.api.config.CACHE_DIR` if that is set. If it is not found, it is discovered with `discover_parameter_schema`
+    and stored in `zospy.api.config.CACHE_DIR`, if set.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance. Should be sequential.
+    refresh : bool
+        If True, the schema is discovered again and the cached schema is replaced. Defaults to False.
+
+    Returns
+    -------
+    POPParameterSchema
+        The parameter schema.
+    """
+    version = str(oss.ZOS.version)
+
+    if not refresh and version in _SCHEMAS:
+        return _SCHEMAS[version]
+
+    path = _schema_file(version)
+    schema = None if refresh or path is None else _load_schema(path)
+
+    if schema is None:
+        schema = discover_parameter_schema(oss)
+
+        if path is not None:
+            _store_schema(path, schema)
+
+    _SCHEMAS[version] = schema
+
+    return schema
+
+
+def clear_parameter_schema_cache(*, persistent: bool = False) -> None:
+    """Clear the cached parameter schemas.
+
+    Parameters
+    ----------
+    persistent : bool
+        If True, the schema files in `zospy.api.config.CACHE_DIR` are removed as well. Defaults to False.
+    """
+    _SCHEMAS.clear()
+
+    if persistent and config.CACHE_DIR is not None:
+        for path in Path(config.CACHE_DIR).glob("pop_parameters_*.json"):
+            path.unlink(missing_ok=True)
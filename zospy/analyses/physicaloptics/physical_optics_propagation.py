@@ -14,6 +14,7 @@ from zospy.analyses.parsers.types import (  # ruff: ignore[typing-only-first-par
     WavelengthNumber,
     ZOSAPIConstant,
 )
+from zospy.analyses.physicaloptics.parameter_schema import get_parameter_schema
 from zospy.api import constants
 from zospy.utils.zputils import standardize_sampling
 
@@ -434,13 +435,12 @@ class PhysicalOpticsPropagation(
     def _set_pop_parameters(self, which: Literal["beam", "fiber"], parameters: dict) -> None:
         """Set beam or fiber parameters using the provided dictionary.
 
-        Only parameters present in the dictionary are set. After setting, the function checks if all provided parameters
-        were used and raises an error if any are left unused.
+        Only parameters present in the dictionary are set. The parameter indices are looked up in the cached parameter
+        schema, see `zospy.analyses.physicaloptics.parameter_schema`. For beam and fiber types that are defined by a
+        file or DLL, they are queried from the analysis instead. All parameters are checked before any of them is set.
 
         Parameters
         ----------
-        analysis : Analysis
-            The analysis object containing settings for either beam or fiber parameters.
         which : Literal['beam', 'fiber']
             Specifies whether to set 'beam' or 'fiber' parameters. Determines which set of methods to use within the
             `analysis` object.
@@ -460,39 +460,43 @@ class PhysicalOpticsPropagation(
             specified `which` type in `analysis`.
         """
         if parameters is not None:
-            parameters = parameters.copy()  # Create copy to preserve the original dictionary
-
             if which == "beam":
+                parameter_type = str(self.settings.beam_type)
                 number_of_parameters = self.analysis.Settings.NumberOfParameters
                 get_parameter_name = self.analysis.Settings.GetParameterName
                 set_parameter_value = self.analysis.Settings.SetParameterValue
             elif which == "fiber":
+                parameter_type = str(self.settings.fiber_type)
                 number_of_parameters = self.analysis.Settings.NumberOfFiberParameters
                 get_parameter_name = self.analysis.Settings.GetFiberParameterName
                 set_parameter_value = self.analysis.Settings.SetFiberParameterValue
             else:
                 raise ValueError("Invalid parameter type. Choose 'fiber' or 'beam'.")
 
-            for i in range(number_of_parameters):
-                param_name = get_parameter_name(i)
-                param_value = parameters.pop(param_name, None)
-                if param_value is not None:  # Only set parameters that are present in the dictionary
-                    set_parameter_value(i, param_value)
+            indices = get_parameter_schema(self.oss).indices(which, parameter_type)
+
+            if indices is None:
+                indices = {get_parameter_name(i): i for i in range(number_of_parameters)}
 
-            if parameters:
+            if unaccepted := {name: value for name, value in parameters.items() if name not in indices}:
                 raise ValueError(
-                    f"The following {which} parameters are specified but not accepted: {parameters.keys()}. "
-                    f"The accepted {which} parameters for this {which}_type are: "
-                    f"{','.join([get_parameter_name(i) for i in range(number_of_parameters)])}"
+                    f"The following {which} parameters are specified but not accepted: {unaccepted.keys()}. "
+                    f"The accepted {which} parameters for this {which}_type are: {','.join(indices)}"
                 )
 
+            for name, value in parameters.items():
+                if value is not None:  # Only set parameters that have a value
+                    set_parameter_value(indices[name], value)
+
 
 def create_beam_parameter_dict(
     oss: OpticStudioSystem, beam_type: constants.Analysis.PhysicalOptics.POPBeamTypes | str = "GaussianWaist"
 ) -> dict:
     """Create a dictionary containing the parameters for a certain Physical Optics beam type and their default values.
 
-    The dictionary can be adjusted and supplied to the beam_parameters argument of physical_optics_propagation()
+    The dictionary can be adjusted and supplied to the beam_parameters argument of physical_optics_propagation(). The
+    parameters are taken from the cached parameter schema, see `zospy.analyses.physicaloptics.parameter_schema`, except
+    for beam types that are defined by a file or DLL.
 
     Parameters
     ----------
@@ -506,6 +510,9 @@ def create_beam_parameter_dict(
     dict
         A dictionary containing the parameters for a certain Physical Optics beam type and their default values.
     """
+    if (parameters := get_parameter_schema(oss).parameters("beam", str(beam_type))) is not None:
+        return dict(parameters)
+
     analysis_type = constants.Analysis.AnalysisIDM.PhysicalOpticsPropagation
 
     # Create analysis
@@ -527,7 +534,9 @@ def create_fiber_parameter_dict(
 ) -> dict:
     """Create a dictionary containing the parameters for a certain Physical Optics fiber type and their default values.
 
-     The dictionary can be adjusted and supplied to the fiber_parameters argument of physical_optics_propagation()
+     The dictionary can be adjusted and supplied to the fiber_parameters argument of physical_optics_propagation(). The
+     parameters are taken from the cached parameter schema, see `zospy.analyses.physicaloptics.parameter_schema`, except
+     for fiber types that are defined by a file or DLL.
 
     Parameters
     ----------
@@ -541,6 +550,9 @@ def create_fiber_parameter_dict(
     dict
         A dictionary containing the parameters for a certain Physical Optics fiber type and their default values.
     """
+    if (parameters := get_parameter_schema(oss).parameters("fiber", str(fiber_type))) is not None:
+        return dict(parameters)
+
     analysis_type = constants.Analysis.AnalysisIDM.PhysicalOpticsPropagation
 
     # Create analysis
@@ -10,6 +10,7 @@ from pydantic import Field
 from zospy.analyses.base import BaseAnalysisWrapper
 from zospy.analyses.decorators import analysis_result, analysis_settings
 from zospy.analyses.parsers import ZospyTransformer
+from zospy.analyses.parsers.tables import read_array
 from zospy.analyses.parsers.transformers import SimpleField
 from zospy.analyses.parsers.types import UnitField, ValidatedDataFrame  # ruff: ignore[typing-only-first-party-import]
 from zospy.api import constants
@@ -21,8 +22,8 @@ __all__ = ("PolarizationPupilMap", "PolarizationPupilMapSettings")
 
 class PolarizationPupilMapTransformer(ZospyTransformer):
     def pupil_map_table(self, args) -> SimpleField:
-        header, rows = args[0]
-        table = pd.DataFrame(columns=header, data=rows)
+        header, rows = args
+        table = pd.DataFrame(columns=header, data=read_array(rows))
 
         return SimpleField("Pupil Map", table)
 
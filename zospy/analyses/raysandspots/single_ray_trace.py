@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 from typing import Literal
-from warnings import warn
 
-import pandas as pd
 from pydantic import Field, model_validator
 
 from zospy.analyses.base import BaseAnalysisWrapper
 from zospy.analyses.decorators import analysis_result, analysis_settings
+from zospy.analyses.parsers.tables import read_table
 from zospy.analyses.parsers.transformers import ZospyTransformer
 from zospy.analyses.parsers.types import UnitField, ValidatedDataFrame  # ruff: ignore[typing-only-first-party-import]
 from zospy.api import constants
@@ -20,29 +19,14 @@ __all__ = ("SingleRayTrace", "SingleRayTraceSettings")
 class SingleRayTraceTransformer(ZospyTransformer):
     """Transformer for the output of the Single Ray Trace analysis."""
 
-    def NAN(self, args):  # ruff: ignore[unused-method-argument, invalid-function-name]
-        """Transform a NaN value."""
-        return float("nan")
-
     def ray_trace_data_table(self, args):
-        """Transform the ray trace data table to a DataFrame."""
-        header, rows = args[0]
-        header_length = len(header)
-
-        # Fill empty columns with NaN
-        for row in rows:
-            if (row_length := len(row)) < header_length:
-                # Warning is only raised once for the full loop
-                warn("Header and row length mismatch. Empty columns will be filled with NaN.")
-
-                # Check if the last row value is a comment
-                if isinstance(row[-1], str):
-                    row[-1:-1] = [float("nan")] * (header_length - row_length)
-                else:
-                    # Insert empty columns at the end of the row
-                    row.extend([float("nan")] * (header_length - row_length))
-
-        return pd.DataFrame(rows, columns=header)
+        """Transform the ray trace data table to a DataFrame.
+
+        Empty columns are filled with NaN.
+        """
+        header, rows = args
+
+        return read_table(rows, header, label_column=True, text_column=True)
 
 
 @analysis_result
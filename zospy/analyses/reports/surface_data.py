@@ -9,6 +9,7 @@ from pydantic import AliasChoices, BeforeValidator, Field
 
 from zospy.analyses.base import BaseAnalysisWrapper
 from zospy.analyses.decorators import analysis_result, analysis_settings
+from zospy.analyses.parsers.tables import read_array
 from zospy.analyses.parsers.transformers import SimpleField, ZospyTransformer
 
 __all__ = ("SurfaceData", "SurfaceDataSettings")
@@ -19,8 +20,11 @@ class SurfaceDataTransformer(ZospyTransformer):
 
     def refractive_index_table(self, args) -> SimpleField:
         """Convert the refractive index table to a list of dictionaries."""
-        header, rows = args[0]
-        table_records = [dict(zip(header, row, strict=False)) for row in rows]
+        header, rows = args
+        table_records = [
+            {header[0]: int(number), header[1]: wavelength, header[2]: index}
+            for number, wavelength, index in read_array(rows, len(header)).tolist()
+        ]
 
         return SimpleField("Refractive Indices", table_records)
 
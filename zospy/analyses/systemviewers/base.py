@@ -15,7 +15,6 @@ from warnings import warn
 
 import numpy as np
 from pydantic.fields import Field, FieldInfo
-from System import Array
 
 from zospy.analyses.base import (
     AnalysisData,
@@ -142,6 +141,8 @@ class SystemViewerWrapper(BaseAnalysisWrapper[np.ndarray | None, AnalysisSetting
         if image_data is None:
             return image_data
 
+        from System import Array  # ruff: ignore[import-outside-top-level]
+
         image_size = image_data.Width * image_data.Height
 
         # In-place updating arrays works only with dotnet arrays
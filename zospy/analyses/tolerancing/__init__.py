@@ -0,0 +1,7 @@
+"""OpticStudio analyses from the Tolerancing category."""
+
+from __future__ import annotations
+
+from zospy.analyses.tolerancing.quick_yield import QuickYield, QuickYieldSettings
+
+__all__ = ("QuickYield", "QuickYieldSettings")
@@ -0,0 +1,118 @@
+"""Quick Yield analysis."""
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pandas import DataFrame
+from pydantic import Field
+
+from zospy.analyses.base import BaseAnalysisWrapper
+from zospy.analyses.decorators import analysis_settings
+from zospy.analyses.parsers.types import ZOSAPIConstant  # ruff: ignore[typing-only-first-party-import]
+from zospy.api import constants
+
+__all__ = ("QuickYield", "QuickYieldSettings")
+
+
+@analysis_settings
+class QuickYieldSettings:
+    """Settings for the Quick Yield analysis.
+
+    For an in depth explanation of the parameters, see the OpticStudio user manual.
+
+    Attributes
+    ----------
+    field : int
+        The field number. Defaults to 1.
+    wavelength : int | str
+        The wavelength to use in the analysis. Either 'All' or an integer specifying the wavelength number. Defaults to
+        'All'.
+    configuration : int
+        The configuration number. Defaults to 1.
+    number_of_monte_carlo : int
+        The number of Monte Carlo trials. Defaults to 1000.
+    pupil_sampling : int
+        The pupil sampling. Defaults to 3.
+    statistic : zospy.constants.Tools.Tolerancing.MonteCarloStatistics | str
+        Statistical distribution of the Monte Carlo perturbations. Defaults to 'Normal'.
+    precision : zospy.constants.Analysis.Tolerancing.QYPrecisions | str
+        Precision of the yield estimate. Defaults to 'Standard'.
+    compensation : zospy.constants.Analysis.Tolerancing.QYCompensations | str
+        Accuracy of the compensator adjustment. Defaults to 'Standard'.
+    compensator_strategy : zospy.constants.Analysis.Tolerancing.QYCompensatorStrategy | str
+        How compensators are adjusted. Defaults to 'ParaxialFocus'.
+    """
+
+    field: Annotated[int, Field(gt=0)] = Field(default=1, description="Field number")
+    wavelength: Literal["All"] | Annotated[int, Field(gt=0)] = Field(
+        default="All", description="Wavelength number or 'All'"
+    )
+    configuration: int = Field(default=1, ge=1, description="Configuration number")
+    number_of_monte_carlo: int = Field(default=1000, ge=1, description="Number of Monte Carlo trials")
+    pupil_sampling: int = Field(default=3, ge=1, description="Pupil sampling")
+    statistic: ZOSAPIConstant("Tools.Tolerancing.MonteCarloStatistics") = Field(
+        default="Normal", description="Statistics"
+    )
+    precision: ZOSAPIConstant("Analysis.Tolerancing.QYPrecisions") = Field(default="Standard", description="Precision")
+    compensation: ZOSAPIConstant("Analysis.Tolerancing.QYCompensations") = Field(
+        default="Standard", description="Compensation"
+    )
+    compensator_strategy: ZOSAPIConstant("Analysis.Tolerancing.QYCompensatorStrategy") = Field(
+        default="ParaxialFocus", description="Compensator strategy"
+    )
+
+
+class QuickYield(BaseAnalysisWrapper[DataFrame | None, QuickYieldSettings], analysis_type="QuickYield"):
+    """Quick Yield analysis.
+
+    The tolerances are taken from the Tolerance Data Editor. The result contains the data series of the analysis,
+    with the criterion value as index.
+    """
+
+    def __init__(
+        self,
+        *,
+        field: int = 1,
+        wavelength: int | Literal["All"] = "All",
+        configuration: int = 1,
+        number_of_monte_carlo: int = 1000,
+        pupil_sampling: int = 3,
+        statistic: constants.Tools.Tolerancing.MonteCarloStatistics | str = "Normal",
+        precision: constants.Analysis.Tolerancing.QYPrecisions | str = "Standard",
+        compensation: constants.Analysis.Tolerancing.QYCompensations | str = "Standard",
+        compensator_strategy: constants.Analysis.Tolerancing.QYCompensatorStrategy | str = "ParaxialFocus",
+    ):
+        """Create a new Quick Yield analysis.
+
+        See Also
+        --------
+        QuickYieldSettings : Settings for the Quick Yield analysis.
+        """
+        super().__init__(settings_kws=locals())
+
+    def run_analysis(self) -> DataFrame | None:
+        """Run the Quick Yield analysis."""
+        self.analysis.Settings.QYField.SetFieldUser(self.settings.field)
+        self.analysis.set_wavelength(self.settings.wavelength)
+        self.analysis.Settings.Configuration = self.settings.configuration
+        self.analysis.Settings.NumMonteCarlo = self.settings.number_of_monte_carlo
+        self.analysis.Settings.PupilSampling = self.settings.pupil_sampling
+        self.analysis.Settings.Statistic = constants.process_constant(
+            constants.Tools.Tolerancing.MonteCarloStatistics, self.settings.statistic
+        )
+        self.analysis.Settings.Precision = constants.process_constant(
+            constants.Analysis.Tolerancing.QYPrecisions, self.settings.precision
+        )
+        self.analysis.Settings.Compensation = constants.process_constant(
+            constants.Analysis.Tolerancing.QYCompensations, self.settings.compensation
+        )
+        self.analysis.Settings.CompensatorStrategy = constants.process_constant(
+            constants.Analysis.Tolerancing.QYCompensatorStrategy, self.settings.compensator_strategy
+        )
+
+        # Run analysis
+        self.analysis.ApplyAndWaitForCompletion()
+
+        # Get results
+        return self.get_data_series()
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from typing import Annotated, Literal, get_args
 
-import numpy as np
 import pandas as pd
 from pydantic import Field
 
 from zospy.analyses.base import BaseAnalysisWrapper
 from zospy.analyses.decorators import analysis_settings
+from zospy.analyses.parsers.tables import read_array
 from zospy.analyses.parsers.transformers import ZospyTransformer
 from zospy.analyses.parsers.types import ZOSAPIConstant  # ruff: ignore[typing-only-first-party-import]
 from zospy.api import constants
@@ -27,12 +27,12 @@ class ZernikeCoefficientsVsFieldTransformer(ZospyTransformer):
 
     def zernike_vs_field_table(self, args) -> pd.DataFrame:
         """Transform the Zernike vs. Field table to a DataFrame."""
-        header, rows = args[0]
+        header, rows = args
 
         if header[0] != "Field:":
             raise ValueError("Expected 'Field' column at the start of the table header.")
 
-        values = np.array(rows, dtype=float)
+        values = read_array(rows)
         index = values[:, 0]  # First column is the index (Field coordinate)
         data = values[:, 1:]  # Remaining columns are the data
 
@@ -160,7 +160,9 @@ class ZernikeCoefficientsVsField(
         if "Insufficient Memory Available!" in text_output:
             raise RuntimeError("Zernike Coefficients vs. Field analysis failed due to insufficient memory.")
 
-        result = self.parse_output("zernike_coefficients_vs_field", transformer=ZernikeCoefficientsVsFieldTransformer)
+        result = self.parse_output(
+            "zernike_coefficients_vs_field", transformer=ZernikeCoefficientsVsFieldTransformer, background=False
+        )
 
         if self.settings.field_scan in {
             constants.Analysis.Settings.Aberrations.FieldScanDirections.Minus_X,
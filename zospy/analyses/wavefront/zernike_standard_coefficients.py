@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Annotated, TypedDict
 
 from pydantic import Field
@@ -9,6 +10,7 @@ from pydantic import Field
 from zospy.analyses.base import BaseAnalysisWrapper
 from zospy.analyses.decorators import analysis_result, analysis_settings
 from zospy.analyses.parsers import ZospyTransformer
+from zospy.analyses.parsers.tables import read_array
 from zospy.analyses.parsers.transformers import SimpleField
 from zospy.analyses.parsers.types import Coordinate, UnitField  # ruff: ignore[typing-only-first-party-import]
 from zospy.api import constants
@@ -16,6 +18,8 @@ from zospy.utils.zputils import standardize_sampling
 
 __all__ = ("ZernikeStandardCoefficients", "ZernikeStandardCoefficientsSettings")
 
+_ZERNIKE_COEFFICIENT = re.compile(r"^[ \t]*Z[ \t]*([-+]?\d+)[ \t]+([^\s:]+)[ \t]*:(.*)$", flags=re.MULTILINE)
+
 
 class ZernikeStandardCoefficientsTransformer(ZospyTransformer):
     """Transformer for the output of the Zernike Standard Coefficients analysis."""
@@ -25,14 +29,18 @@ class ZernikeStandardCoefficientsTransformer(ZospyTransformer):
         formula: str
 
     def coefficients(self, args) -> SimpleField:
-        """Convert the coefficients to a SimpleField."""
-        return SimpleField("Coefficients", dict(args))
-
-    def zernike_coefficient(self, args) -> SimpleField:
-        """Convert a Zernike coefficient to a SimpleField with the value and the formula."""
-        index, value, formula = args
-
-        return SimpleField(index, self._ZernikeStandardCoefficient(value=value, formula=formula))
+        """Convert the block of coefficients to a SimpleField with the value and the formula of every coefficient."""
+        (rows,) = args
+        indices, values, formulas = zip(*_ZERNIKE_COEFFICIENT.findall(rows), strict=True)
+        values = read_array("\n".join(values), 1)[:, 0].tolist()
+
+        return SimpleField(
+            "Coefficients",
+            {
+                int(index): self._ZernikeStandardCoefficient(value=value, formula=" ".join(formula.split()))
+                for index, value, formula in zip(indices, values, formulas, strict=True)
+            },
+        )
 
 
 @analysis_result
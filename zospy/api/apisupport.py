@@ -5,12 +5,8 @@ from __future__ import annotations
 import logging
 import os
 import sys
-import winreg
-
-import clr
 
 import zospy.api.constants
-from zospy.api.codecs import register_codecs
 from zospy.utils import clrutils
 
 logger = logging.getLogger(__name__)
@@ -30,6 +26,8 @@ def get_zos_root():
         If either OpticStudio cannot be found in the Windows registry or the OpticStudio root folder could
         not be obtained from the registry.
     """
+    import winreg  # ruff: ignore[import-outside-top-level]
+
     logger.info("Obtaining OpticStudio Location from Windows Registry")
 
     # Search for Zemax OpticStudio in the Windows Registry
@@ -75,6 +73,8 @@ def load_zosapi_nethelper(filepath=None, *, preload=False):
     else:
         znh_filepath = filepath
 
+    import clr  # ruff: ignore[import-outside-top-level]
+
     logger.debug(f"Adding reference {znh_filepath} to clr")
     sys.path.append(os.path.basename(znh_filepath))
     clr.AddReference(znh_filepath)
@@ -128,6 +128,11 @@ def load_zosapi(zosapi_nethelper=None, zemaxdirectory=None, *, preload=False):
         zos_dir = zemaxdirectory
     sys.path.append(zos_dir)
 
+    # Importing clr and the codecs loads the CLR, so this is only done when the ZOS-API is loaded
+    import clr  # ruff: ignore[import-outside-top-level]
+
+    from zospy.api.codecs import register_codecs  # ruff: ignore[import-outside-top-level]
+
     # Register custom Python.NET codecs
     register_codecs()
 
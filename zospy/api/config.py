@@ -8,12 +8,25 @@ from __future__ import annotations
 
 import locale
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 DECIMAL_POINT = locale.localeconv()["decimal_point"]
 THOUSANDS_SEPARATOR = locale.localeconv()["thousands_sep"]
 
+PARSE_CACHE_SIZE = 0
+"""Maximum number of parsed text outputs kept by `zospy.analyses.parsers.parse`. Set to 0 to disable the cache."""
+
+CACHE_DIR: Path | None = None
+"""Directory in which persistent caches are stored, such as the POP parameter schemas.
+
+Defaults to None, in which case nothing is stored on disk. Set it to a directory to keep the caches across sessions.
+"""
+
 
 def set_decimal_point_and_thousands_separator() -> None:
     """Set `DECIMAL_POINT` and `THOUSHANDS_SEPARATOR` based on the system locale.
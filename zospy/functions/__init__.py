@@ -2,13 +2,17 @@
 
 `zospy.functions` contains utility functions for zospy. These functions are available through its submodules:
 
+- **`zospy.functions.fields`** provides helper functions for the field data of a system;
 - **`zospy.functions.lde`** provides helper functions for the Lens Data Editor (LDE);
+- **`zospy.functions.mce`** provides helper functions for the Multi-Configuration Editor (MCE);
+- **`zospy.functions.mfe`** provides helper functions for the Merit Function Editor (MFE);
+- **`zospy.functions.pop`** provides helper functions for Physical Optics Propagation (POP);
 - **`zospy.functions.nce`** provides helper functions for the Non-sequential Component Editor (NCE).
 - **`zospy.functions.tools`** provides helper functions for Tools in OpticStudio.
 """
 
 from __future__ import annotations
 
-from zospy.functions import lde, nce
+from zospy.functions import fields, lde, mce, mfe, nce, pop
 
-__all__ = ("lde", "nce")
+__all__ = ("fields", "lde", "mce", "mfe", "nce", "pop")
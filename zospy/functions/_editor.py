@@ -0,0 +1,257 @@
+"""Shared helpers for reading and writing editor rows in bulk."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from zospy.api import constants
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from zospy.zpcore import OpticStudioSystem
+
+READ_ONLY_COLUMNS = ("Type",)
+"""Columns that are compared with the editor, but never written."""
+
+
+@dataclass(frozen=True)
+class EditorColumns:
+    """Description of how the columns of an editor row are accessed.
+
+    Attributes
+    ----------
+    property_columns : tuple[str, ...]
+        Columns that are available as properties of the editor row.
+    cell_getter : str
+        Name of the row method that returns a cell for a column constant, e.g. 'GetSurfaceCell'.
+    column_constant : str
+        Path of the column constant in `zospy.constants`, e.g. 'Editors.LDE.SurfaceColumn'.
+    """
+
+    property_columns: tuple[str, ...]
+    cell_getter: str
+    column_constant: str
+
+    def get_cell(self, row: Any, column: str) -> Any:
+        """Get the editor cell of `row` for a column that is not available as a property."""
+        column_constant = attrgetter(self.column_constant)(constants)
+        return getattr(row, self.cell_getter)(constants.process_constant(column_constant, column))
+
+    def read(self, row: Any, column: str) -> Any:
+        """Read the value of a column. Cells without a value are returned as None."""
+        if column == "Type":
+            return str(row.Type)
+
+        if column in self.property_columns:
+            return getattr(row, column)
+
+        cell = self.get_cell(row, column)
+        data_type = str(cell.DataType)
+
+        if data_type == "Double":
+            return cell.DoubleValue
+
+        if data_type == "Integer":
+            return cell.IntegerValue
+
+        if data_type == "String":
+            return cell.Value
+
+        return None
+
+    def write(self, row: Any, column: str, value: Any) -> None:
+        """Write the value of a column."""
+        if column in self.property_columns:
+            setattr(row, column, value)
+            return
+
+        cell = self.get_cell(row, column)
+        data_type = str(cell.DataType)
+
+        if data_type == "Double":
+            cell.DoubleValue = float(value)
+        elif data_type == "Integer":
+            cell.IntegerValue = int(value)
+        else:
+            cell.Value = str(value)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (pd.api.types.is_scalar(value) and pd.isna(value))
+
+
+def _values_equal(current: Any, new: Any) -> bool:
+    if isinstance(current, (int, float)) and isinstance(new, (int, float, np.number)):
+        return current == new or (np.isnan(current) and np.isnan(new))
+
+    return str(current) == str(new)
+
+
+@dataclass(frozen=True)
+class CellChange:
+    """A change of a single editor cell."""
+
+    row_number: int
+    column: str
+    old_value: Any
+    new_value: Any
+
+
+def find_changes(
+    dataframe: pd.DataFrame, get_row: Callable[[int], Any], row_numbers: range, columns: EditorColumns
+) -> list[CellChange]:
+    """Compare a DataFrame with the current editor values and return the cells that differ.
+
+    Missing values (None, NaN, pd.NA or pd.NaT) in the DataFrame are skipped.
+    """
+    changes = []
+
+    for row_number, values in zip(dataframe.index, dataframe.to_dict("records"), strict=True):
+        if row_number not in row_numbers:
+            raise ValueError(
+                f"Row {row_number} does not exist, row numbers should be between {row_numbers.start} and "
+                f"{row_numbers.stop - 1}."
+            )
+
+        row = get_row(int(row_number))
+
+        for column, new_value in values.items():
+            if _is_missing(new_value):
+                continue
+
+            current_value = columns.read(row, column)
+
+            if _values_equal(current_value, new_value):
+                continue
+
+            if column in READ_ONLY_COLUMNS:
+                raise ValueError(
+                    f"Cannot change column {column} of row {row_number} from {current_value} to {new_value}."
+                )
+
+            changes.append(CellChange(int(row_number), column, current_value, new_value))
+
+    return changes
+
+
+def apply_changes(
+    oss: OpticStudioSystem, changes: list[CellChange], get_row: Callable[[int], Any], columns: EditorColumns
+) -> None:
+    """Write changes to an editor while updates are suspended.
+
+    If any assignment fails, all cells that were already written are restored to their previous values and the
+    exception is raised again. Cells that had no value (see `EditorColumns.read`) cannot be restored and are skipped.
+    """
+    get_row = cache(get_row)
+    written: list[CellChange] = []
+
+    with oss.suspend_updates():
+        try:
+            for change in changes:
+                columns.write(get_row(change.row_number), change.column, change.new_value)
+                written.append(change)
+        except Exception:
+            for change in reversed(written):
+                if change.old_value is None:
+                    continue
+
+                columns.write(get_row(change.row_number), change.column, change.old_value)
+
+            raise
+        finally:
+            if any(change.column == "Comment" for change in written):
+                oss.invalidate_comment_indexes()
+
+
+class CommentIndex:
+    """Index of editor row numbers by comment.
+
+    The index is built once from the comments of all rows. Lookups are dictionary lookups, prefix and regular
+    expression queries only visit the unique comments.
+
+    Parameters
+    ----------
+    comments : Iterable[str]
+        The comments of all editor rows, in row order.
+    first_row : int
+        Row number of the first comment. Defaults to 0.
+    """
+
+    def __init__(self, comments: Iterable[str], first_row: int = 0):
+        self.comments: tuple[str, ...] = tuple(comments)
+        self.first_row = first_row
+
+        self._rows: dict[str, list[int]] = {}
+        self._casefolded_rows: dict[str, list[int]] = {}
+
+        for row_number, comment in enumerate(self.comments, start=first_row):
+            self._rows.setdefault(comment, []).append(row_number)
+            self._casefolded_rows.setdefault(comment.casefold(), []).append(row_number)
+
+    def __len__(self) -> int:
+        return len(self.comments)
+
+    def _lookup(self, *, case_sensitive: bool) -> dict[str, list[int]]:
+        return self._rows if case_sensitive else self._casefolded_rows
+
+    def find(self, comment: str, *, case_sensitive: bool = True) -> list[int]:
+        """Get the numbers of the rows whose comment equals `comment`, in ascending order."""
+        if not case_sensitive:
+            comment = comment.casefold()
+
+        return list(self._lookup(case_sensitive=case_sensitive).get(comment, []))
+
+    def startswith(self, prefix: str, *, case_sensitive: bool = True) -> list[int]:
+        """Get the numbers of the rows whose comment starts with `prefix`, in ascending order."""
+        if not case_sensitive:
+            prefix = prefix.casefold()
+
+        return sorted(
+            row_number
+            for comment, row_numbers in self._lookup(case_sensitive=case_sensitive).items()
+            if comment.startswith(prefix)
+            for row_number in row_numbers
+        )
+
+    def match(self, pattern: str | re.Pattern, *, case_sensitive: bool = True) -> list[int]:
+        """Get the numbers of the rows whose comment matches the regular expression `pattern`, in ascending order.
+
+        The pattern may match anywhere in the comment, see `re.search`.
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
+        if not case_sensitive:
+            pattern = re.compile(pattern.pattern, flags=pattern.flags | re.IGNORECASE)
+
+        return sorted(
+            row_number
+            for comment, row_numbers in self._rows.items()
+            if pattern.search(comment)
+            for row_number in row_numbers
+        )
+
+
+def get_comment_index(
+    oss: OpticStudioSystem, editor: str, number_of_rows: int, get_row: Callable[[int], Any], first_row: int
+) -> CommentIndex:
+    """Get the cached comment index of an editor, building it if the editor has no valid index.
+
+    A cached index is rebuilt when the number of rows in the editor has changed. Other edits are not detected, see
+    `OpticStudioSystem.invalidate_comment_indexes`.
+    """
+    index = oss._comment_indexes.get(editor)  # ruff: ignore[private-member-access]
+
+    if index is None or len(index) != number_of_rows:
+        index = CommentIndex((get_row(i).Comment for i in range(first_row, first_row + number_of_rows)), first_row)
+        oss._comment_indexes[editor] = index  # ruff: ignore[private-member-access]
+
+    return index
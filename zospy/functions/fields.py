@@ -0,0 +1,264 @@
+"""Utility functions for the field data of an optical system in OpticStudio."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from zospy.analyses.base import AnalysisResult, OnComplete
+from zospy.analyses.wavefront import WavefrontMap, ZernikeStandardCoefficients
+from zospy.local import zernike
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from numpy.typing import ArrayLike
+
+    from zospy.analyses.base import BaseAnalysisWrapper
+    from zospy.api import _ZOSAPI
+    from zospy.local.zernike import ZernikeConvention
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = ("FieldMapResult", "field_map", "read_fields", "write_fields")
+
+FIELD_COLUMNS = ("X", "Y", "Weight", "VDX", "VDY", "VCX", "VCY", "VAN")
+"""Columns of the field data that are read and written by `read_fields` and `write_fields`."""
+
+DEFAULT_CHUNK_SIZE = 100
+"""Default number of field points that is defined at once by `field_map`."""
+
+
+def read_fields(oss: OpticStudioSystem) -> pd.DataFrame:
+    """Read the field points of the system.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+
+    Returns
+    -------
+    pd.DataFrame
+        Field data with one row per field (index `Field`, starting at 1) and the columns in `FIELD_COLUMNS`.
+    """
+    fields = oss.SystemData.Fields
+    numbers = range(1, fields.NumberOfFields + 1)
+    rows = [fields.GetField(number) for number in numbers]
+
+    return pd.DataFrame(
+        [[getattr(row, column) for column in FIELD_COLUMNS] for row in rows],
+        index=pd.Index(numbers, name="Field"),
+        columns=list(FIELD_COLUMNS),
+        dtype=float,
+    )
+
+
+def _write_fields(fields: _ZOSAPI.SystemData.IFields, data: pd.DataFrame) -> None:
+    n_fields = fields.NumberOfFields
+
+    if n_fields > len(data):
+        fields.DeleteFieldsAt(len(data) + 1, n_fields - len(data))
+
+    for number, row in enumerate(data.to_dict("records"), start=1):
+        field = fields.GetField(number) if number <= n_fields else fields.AddField(row["X"], row["Y"], row["Weight"])
+
+        for column, value in row.items():
+            setattr(field, column, float(value))
+
+
+def write_fields(oss: OpticStudioSystem, data: pd.DataFrame) -> None:
+    """Replace the field points of the system.
+
+    Existing fields are reused, surplus fields are removed and missing fields are added. The field type and
+    normalization are not changed.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    data : pd.DataFrame
+        Field data with one row per field. Should contain the columns 'X' and 'Y', and may contain the other columns in
+        `FIELD_COLUMNS`. The weight defaults to 1 and the vignetting factors to 0.
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty, or if it contains unknown columns.
+    """
+    if data.empty:
+        raise ValueError("At least one field is required.")
+
+    if unknown_columns := set(data.columns) - set(FIELD_COLUMNS):
+        raise ValueError(f"Unknown field columns: {', '.join(sorted(unknown_columns))}.")
+
+    defaults = {"Weight": 1.0, "VDX": 0.0, "VDY": 0.0, "VCX": 0.0, "VCY": 0.0, "VAN": 0.0}
+    data = data.reindex(columns=list(FIELD_COLUMNS)).fillna(defaults)
+
+    _write_fields(oss.SystemData.Fields, data)
+    oss.invalidate_cached_results()
+
+
+@dataclass(frozen=True)
+class FieldMapResult:
+    """Results of an analysis on a two-dimensional grid of field points.
+
+    Attributes
+    ----------
+    field_x : np.ndarray
+        X field coordinates of the grid, in the units of the field type of the system.
+    field_y : np.ndarray
+        Y field coordinates of the grid, in the units of the field type of the system.
+    values : np.ndarray
+        Extracted values with shape `(len(field_x), len(field_y), ...)`. For Zernike analyses, the last axis contains
+        the Zernike terms, where element `i` corresponds to term `i + 1`.
+    executions : int
+        Number of times the analysis was executed in OpticStudio.
+    """
+
+    field_x: np.ndarray
+    field_y: np.ndarray
+    values: np.ndarray
+    executions: int
+
+
+def _zernike_standard_values(results: list[AnalysisResult]) -> np.ndarray:
+    return np.array([[c.value for _, c in sorted(r.data.coefficients.items())] for r in results])
+
+
+def _default_extract(
+    analysis: BaseAnalysisWrapper, max_term: int, convention: ZernikeConvention
+) -> Callable[[list[AnalysisResult]], ArrayLike]:
+    if isinstance(analysis, WavefrontMap):
+        return lambda results: zernike.fit([r.data for r in results], max_term, convention=convention)
+
+    if isinstance(analysis, ZernikeStandardCoefficients):
+        return _zernike_standard_values
+
+    return lambda results: np.stack([np.asarray(r.data) for r in results])
+
+
+def field_map(
+    oss: OpticStudioSystem,
+    analysis: BaseAnalysisWrapper,
+    field_x: ArrayLike,
+    field_y: ArrayLike,
+    *,
+    all_fields: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_term: int = 37,
+    convention: ZernikeConvention = "Standard",
+    extract: Callable[[list[AnalysisResult]], ArrayLike] | None = None,
+) -> FieldMapResult:
+    """Run an analysis on a two-dimensional grid of field points.
+
+    The field points of the system are temporarily replaced by chunks of at most `chunk_size` grid points. For every
+    chunk, the analysis is run once with the field set to 'All' if `all_fields` is True, and once per field otherwise.
+    The OpticStudio analysis is kept open during the whole run, and the original fields are restored afterwards, also
+    if an exception is raised.
+
+    The results of every chunk are converted to values with `extract` as soon as the chunk is finished, so that only the
+    extracted values are kept in memory. By default, wavefront maps are fitted with Zernike polynomials
+    using `zospy.local.zernike.fit`, which is usually faster than running a Zernike analysis for every field because it
+    avoids parsing a text output. For `ZernikeStandardCoefficients`, the coefficient values are extracted. For other
+    analyses, the result data are converted to a NumPy array.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    analysis : BaseAnalysisWrapper
+        The analysis. Its field setting is overwritten.
+    field_x : ArrayLike
+        X field coordinates of the grid, in the units of the field type of the system.
+    field_y : ArrayLike
+        Y field coordinates of the grid, in the units of the field type of the system.
+    all_fields : bool
+        If True, the analysis is run once per chunk with the field set to 'All'. Only use this for analyses that return
+        results for all fields at once, and specify an `extract` function that returns the values of every field.
+        Defaults to False.
+    chunk_size : int
+        Maximum number of field points that is defined at once. Defaults to `DEFAULT_CHUNK_SIZE`.
+    max_term : int
+        Number of Zernike terms that are fitted to wavefront maps. Defaults to 37.
+    convention : ZernikeConvention
+        Zernike convention that is used to fit wavefront maps. Defaults to 'Standard'.
+    extract : Callable[[list[AnalysisResult]], ArrayLike] | None
+        Function that converts the results of a chunk to an array with one row per field point of the chunk. If
+        `all_fields` is True, it receives a single result. Defaults to None, in which case the values are extracted as
+        described above.
+
+    Returns
+    -------
+    FieldMapResult
+        The extracted values for every field point.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` is smaller than 1, or if `extract` does not return one row per field point.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.load("path/to/system.zmx")
+    >>> grid = np.linspace(-10, 10, 21)
+    >>> result = zp.functions.fields.field_map(
+    ...     oss, zp.analyses.wavefront.WavefrontMap(sampling="64x64"), grid, grid
+    ... )
+    >>> result.values.shape
+    (21, 21, 37)
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size should be at least 1, got {chunk_size}.")
+
+    field_x = np.asarray(field_x, dtype=float)
+    field_y = np.asarray(field_y, dtype=float)
+    extract = extract or _default_extract(analysis, max_term, convention)
+
+    x, y = np.meshgrid(field_x, field_y, indexing="ij")
+    points = pd.DataFrame({"X": x.ravel(), "Y": y.ravel()})
+
+    original_fields = read_fields(oss)
+    chunk_values: list[np.ndarray] = []
+    executions = 0
+
+    try:
+        for start in range(0, len(points), chunk_size):
+            chunk = points.iloc[start : start + chunk_size]
+            write_fields(oss, chunk)
+
+            results: list[AnalysisResult] = []
+
+            for field in ["All"] if all_fields else range(1, len(chunk) + 1):
+                analysis.update_settings(settings_kws={"field": field})
+                results.append(analysis.run(oss, oncomplete=OnComplete.Sustain))
+
+            values = np.asarray(extract(results))
+            executions += len(results)
+
+            if len(values) != len(chunk):
+                raise ValueError(
+                    f"extract should return one row per field point of the chunk ({len(chunk)}), "
+                    f"got {len(values)} rows."
+                )
+
+            chunk_values.append(values)
+    finally:
+        analysis.close()
+
+        write_fields(oss, original_fields)
+
+    values = np.concatenate(chunk_values)
+
+    return FieldMapResult(
+        field_x=field_x,
+        field_y=field_y,
+        values=values.reshape(len(field_x), len(field_y), *values.shape[1:]),
+        executions=executions,
+    )
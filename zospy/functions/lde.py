@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from warnings import warn
 
+import numpy as np
+import pandas as pd
+
 from zospy.api import constants
+from zospy.functions._editor import CommentIndex, EditorColumns, apply_changes, find_changes, get_comment_index
+from zospy.zpcore import OpticStudioSystem, invalidate_cached_results
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from zospy.api import _ZOSAPI
-    from zospy.zpcore import OpticStudioSystem
 
-__all__ = ("find_surface_by_comment", "get_pupil", "surface_change_aperturetype", "surface_change_type")
+__all__ = (
+    "LDESnapshot",
+    "apply",
+    "comment_index",
+    "find_surface_by_comment",
+    "get_pupil",
+    "snapshot",
+    "surface_change_aperturetype",
+    "surface_change_type",
+)
 
 
 @dataclass(frozen=True)
@@ -73,7 +88,11 @@ def get_pupil(oss: OpticStudioSystem):
 
 
 def surface_change_type(
-    surface: _ZOSAPI.Editors.LDE.ILDERow, new_type: constants.Editors.LDE.SurfaceType | str, filename=None
+    surface: _ZOSAPI.Editors.LDE.ILDERow,
+    new_type: constants.Editors.LDE.SurfaceType | str,
+    filename=None,
+    *,
+    oss: OpticStudioSystem | None = None,
 ):
     """Change the type of a surface in the Lens Data Editor.
 
@@ -84,6 +103,9 @@ def surface_change_type(
     new_type : zospy.constants.Editors.LDE.SurfaceType | str
         The new surface type, either string (e.g. 'Standard') or int. The integer will be treated as if obtained from
         zp.constants.Editors.LDE.SurfaceType.
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -116,10 +138,45 @@ def surface_change_type(
         new_surface_type_settings.Filename = filename
 
     surface.ChangeType(new_surface_type_settings)
+    invalidate_cached_results(oss)
+
+
+def comment_index(oss: OpticStudioSystem) -> CommentIndex:
+    """Get an index of the Lens Data Editor surface numbers by comment.
+
+    The index is built from a single pass over the Lens Data Editor and cached on `oss`. It is rebuilt when surfaces
+    are inserted or removed, when a system is loaded or created, and when comments are changed through
+    `zospy.functions.lde.apply`. After changing comments directly through the ZOS-API, call
+    `OpticStudioSystem.invalidate_comment_indexes`.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance. Should be sequential.
+
+    Returns
+    -------
+    zospy.functions._editor.CommentIndex
+        Index of surface numbers, supporting exact (`find`), prefix (`startswith`) and regular expression (`match`)
+        queries.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.LDE.GetSurfaceAt(1).Comment = "lens 1 front"
+    >>> oss.invalidate_comment_indexes()
+    >>> zp.functions.lde.comment_index(oss).startswith("LENS 1", case_sensitive=False)
+    [1]
+    """
+    lde = oss.LDE
+
+    return get_comment_index(oss, "LDE", lde.NumberOfSurfaces, lde.GetSurfaceAt, first_row=0)
 
 
 def find_surface_by_comment(
-    lde: _ZOSAPI.Editors.LDE, comment: str, *, case_sensitive: bool = True
+    lde: _ZOSAPI.Editors.LDE | OpticStudioSystem, comment: str, *, case_sensitive: bool = True
 ) -> list[_ZOSAPI.Editors.LDE.ILDERow]:
     """Retrieve surfaces from the Lens Data Editor that have the supplied string as Comment.
 
@@ -127,8 +184,9 @@ def find_surface_by_comment(
 
     Parameters
     ----------
-    lde : ZOSAPI.Editors.LDE
-        The Lens Data Editor (LDE)
+    lde : ZOSAPI.Editors.LDE | zospy.zpcore.OpticStudioSystem
+        The Lens Data Editor (LDE). If an OpticStudioSystem is supplied, the cached comment index of its LDE is used
+        instead of reading all comments (see `comment_index`).
     comment : str
         String that is searched for in the Comment column of the LDE.
     case_sensitive : bool
@@ -152,32 +210,15 @@ def find_surface_by_comment(
     >>> lde_object_3.Comment = "aA"
     >>> zp.functions.lde.find_surface_by_comment(oss.LDE, "aa")
     """
-    # Is the search case-sensitive?
-    if not case_sensitive:
-        # If the search is NOT case-sensitive put comment argument in all small letters
-        comment = comment.lower()
-
-    # Initialize list of return indexes corresponding to LDE rows with matched Comment column
-
-    return_indices = []
-    # Loop over the objects and check the comments
-
-    for surface_index in range(lde.NumberOfSurfaces):
-        # Retrieve current object comment
-        surface = lde.GetSurfaceAt(surface_index)
-        surface_comment = surface.Comment
+    if isinstance(lde, OpticStudioSystem):
+        index = comment_index(lde)
+        lde = lde.LDE
+    else:
+        index = CommentIndex(lde.GetSurfaceAt(i).Comment for i in range(lde.NumberOfSurfaces))
 
-        # Is the search case-sensitive?
-        if not case_sensitive:
-            # If the search is NOT case-sensitive put current object comment in all small letters
-            surface_comment = surface_comment.lower()
+    get_surface = lde.GetSurfaceAt
 
-        # If the comment matches, store the corresponding object index
-        if comment == surface_comment:
-            return_indices.append(surface)
-
-    # Return list of matched inices
-    return return_indices
+    return [get_surface(surface_number) for surface_number in index.find(comment, case_sensitive=case_sensitive)]
 
 
 # Define constants for the aperture settings
@@ -221,6 +262,8 @@ def surface_change_aperturetype(
     width_of_arms: float | None = None,
     x_half_width: float | None = None,
     y_half_width: float | None = None,
+    *,
+    oss: OpticStudioSystem | None = None,
 ) -> None:
     """Change the aperturetype of a surface in the Lens Data Editor.
 
@@ -254,6 +297,9 @@ def surface_change_aperturetype(
         The x half width. Defaults to None
     y_half_width : float | None
         The y half width. Defaults to None
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -286,3 +332,184 @@ def surface_change_aperturetype(
                 setattr(new_aperturetype_settings, attr_name, param)
 
     surface.ApertureData.ChangeApertureTypeSettings(new_aperturetype_settings)
+    invalidate_cached_results(oss)
+
+
+# Columns that are available as properties of ILDERow, which is faster than retrieving the cell through GetSurfaceCell
+_ROW_PROPERTY_COLUMNS = ("Radius", "Thickness", "SemiDiameter", "ChipZone", "MechanicalSemiDiameter", "Conic", "TCE")
+
+SNAPSHOT_DEFAULT_COLUMNS = ("Radius", "Thickness", "SemiDiameter", "Conic")
+"""Numeric columns that are read by `snapshot` by default."""
+
+
+@dataclass(frozen=True)
+class LDESnapshot:
+    """Columnar snapshot of the Lens Data Editor.
+
+    Attributes
+    ----------
+    surface_type : np.ndarray
+        Surface type of each surface, e.g. 'Standard'.
+    comment : np.ndarray
+        Comment of each surface.
+    material : np.ndarray
+        Material of each surface.
+    columns : dict[str, np.ndarray]
+        Numeric column data, with one value per surface. Cells that do not contain a numeric value are NaN.
+    """
+
+    surface_type: np.ndarray
+    comment: np.ndarray
+    material: np.ndarray
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of surfaces in the snapshot."""
+        return len(self.surface_type)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Get the data of a numeric column."""
+        return self.columns[column]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the snapshot to a DataFrame with one row per surface.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with columns 'Type', 'Comment', 'Material' and the numeric columns, indexed by surface number.
+        """
+        return pd.DataFrame(
+            {"Type": self.surface_type, "Comment": self.comment, "Material": self.material, **self.columns},
+            index=pd.RangeIndex(len(self), name="Surface"),
+        )
+
+
+def _cell_value(cell: _ZOSAPI.Editors.IEditorCell) -> float:
+    data_type = str(cell.DataType)
+
+    if data_type == "Double":
+        return cell.DoubleValue
+
+    if data_type == "Integer":
+        return cell.IntegerValue
+
+    return np.nan
+
+
+def snapshot(oss: OpticStudioSystem, columns: Sequence[str] = SNAPSHOT_DEFAULT_COLUMNS) -> LDESnapshot:
+    """Read all surfaces of the Lens Data Editor into a columnar snapshot.
+
+    The Lens Data Editor is read in a single pass. Each surface row is retrieved once, after which only the requested
+    columns are read. Radius, thickness, semi-diameter, chip zone, mechanical semi-diameter, conic and TCE are read
+    through the row properties; other columns (e.g. surface parameters `Par1`, `Par2`, ...) are read through
+    `GetSurfaceCell`.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    columns : Sequence[str]
+        Names of the numeric columns to read, as defined in `zospy.constants.Editors.LDE.SurfaceColumn`. Defaults to
+        `SNAPSHOT_DEFAULT_COLUMNS`.
+
+    Returns
+    -------
+    LDESnapshot
+        The surface types, comments, materials and requested numeric columns of all surfaces.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> lens_data = zp.functions.lde.snapshot(
+    ...     oss, columns=["Radius", "Thickness", "Par1"]
+    ... )
+    >>> lens_data.to_dataframe()
+    """
+    lde = oss.LDE
+    get_surface = lde.GetSurfaceAt
+    n_surfaces = lde.NumberOfSurfaces
+
+    property_columns = [column for column in columns if column in _ROW_PROPERTY_COLUMNS]
+    cell_columns = {
+        column: constants.process_constant(constants.Editors.LDE.SurfaceColumn, column)
+        for column in columns
+        if column not in _ROW_PROPERTY_COLUMNS
+    }
+
+    surface_type, comment, material = [], [], []
+    data = {column: np.empty(n_surfaces, dtype=np.float64) for column in columns}
+
+    for i in range(n_surfaces):
+        surface = get_surface(i)
+
+        surface_type.append(str(surface.Type))
+        comment.append(surface.Comment)
+        material.append(surface.Material)
+
+        for column in property_columns:
+            data[column][i] = getattr(surface, column)
+
+        for column, surface_column in cell_columns.items():
+            data[column][i] = _cell_value(surface.GetSurfaceCell(surface_column))
+
+    return LDESnapshot(
+        surface_type=np.array(surface_type, dtype=str),
+        comment=np.array(comment, dtype=str),
+        material=np.array(material, dtype=str),
+        columns={column: data[column] for column in columns},
+    )
+
+
+_LDE_COLUMNS = EditorColumns(
+    property_columns=("Comment", "Material", *_ROW_PROPERTY_COLUMNS),
+    cell_getter="GetSurfaceCell",
+    column_constant="Editors.LDE.SurfaceColumn",
+)
+
+
+def apply(oss: OpticStudioSystem, dataframe: pd.DataFrame) -> int:
+    """Write lens data from a DataFrame to the Lens Data Editor.
+
+    The DataFrame should be indexed by surface number and have one column per editor column, named as in
+    `zospy.constants.Editors.LDE.SurfaceColumn` (e.g. 'Radius', 'Thickness', 'Material', 'Par1'). The output of
+    `LDESnapshot.to_dataframe` can be used as input. Only cells whose value differs from the current value are written.
+    Missing values (None or NaN) are skipped. A 'Type' column is only checked against the current surface types.
+
+    All changes are written while updates are suspended (see `OpticStudioSystem.suspend_updates`). If any assignment
+    fails, the cells that were already written are restored to their previous values and the exception is raised.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    dataframe : pd.DataFrame
+        The lens data to write, indexed by surface number.
+
+    Returns
+    -------
+    int
+        The number of cells that were changed.
+
+    Raises
+    ------
+    ValueError
+        If the DataFrame contains a surface number that does not exist, or a surface type that differs from the
+        current surface type.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> lens_data = zp.functions.lde.snapshot(oss).to_dataframe()
+    >>> lens_data.loc[2, "Thickness"] = 5
+    >>> zp.functions.lde.apply(oss, lens_data)
+    """
+    lde = oss.LDE
+    changes = find_changes(dataframe, lde.GetSurfaceAt, range(lde.NumberOfSurfaces), _LDE_COLUMNS)
+    apply_changes(oss, changes, lde.GetSurfaceAt, _LDE_COLUMNS)
+
+    return len(changes)
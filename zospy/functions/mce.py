@@ -0,0 +1,187 @@
+"""Utility functions for the Multi-Configuration Editor (MCE) in OpticStudio."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from zospy.analyses.base import AnalysisResult, OnComplete
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from zospy.analyses.base import BaseAnalysisWrapper
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = ("ConfigurationSweepResult", "read_configurations", "sweep")
+
+
+def _operand_value(cell: _ZOSAPI.Editors.IEditorCell) -> Any:
+    data_type = str(cell.DataType)
+
+    if data_type == "Double":
+        return cell.DoubleValue
+
+    if data_type == "Integer":
+        return cell.IntegerValue
+
+    return cell.Value
+
+
+def _read_operand_values(mce: _ZOSAPI.Editors.MCE.IMultiConfigEditor, configurations: Sequence[int]) -> list[tuple]:
+    get_operand = mce.GetOperandAt
+    operands = [get_operand(i) for i in range(1, mce.NumberOfOperands + 1)]
+
+    return [tuple(_operand_value(operand.GetOperandCell(config)) for operand in operands) for config in configurations]
+
+
+def read_configurations(oss: OpticStudioSystem) -> pd.DataFrame:
+    """Read the operand values of all configurations in the Multi-Configuration Editor.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+
+    Returns
+    -------
+    pd.DataFrame
+        Operand values with one row per configuration (index `Configuration`, starting at 1) and one column per operand
+        (`Operand`, starting at 1).
+    """
+    mce = oss.MCE
+    configurations = range(1, mce.NumberOfConfigurations + 1)
+
+    return pd.DataFrame(
+        _read_operand_values(mce, configurations),
+        index=pd.Index(configurations, name="Configuration"),
+        columns=pd.Index(range(1, mce.NumberOfOperands + 1), name="Operand"),
+    )
+
+
+@dataclass(frozen=True)
+class ConfigurationSweepResult:
+    """Results of an analysis for multiple configurations.
+
+    Attributes
+    ----------
+    results : dict[int, AnalysisResult]
+        Analysis results by configuration number. Configurations that are identical to an earlier configuration share
+        the result of that configuration.
+    duplicate_of : dict[int, int]
+        For configurations that were not computed because they are identical to an earlier configuration, the number
+        of that earlier configuration.
+    """
+
+    results: dict[int, AnalysisResult]
+    duplicate_of: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def configurations(self) -> list[int]:
+        """The configuration numbers, in the order they were swept."""
+        return list(self.results)
+
+    def stack(self) -> pd.DataFrame | np.ndarray | pd.Series | dict[str, pd.DataFrame | np.ndarray | pd.Series]:
+        """Stack the analysis data of all configurations along a `config` dimension.
+
+        Returns
+        -------
+        pd.DataFrame | np.ndarray | pd.Series | dict[str, pd.DataFrame | np.ndarray | pd.Series]
+            If the analysis data are DataFrames, they are concatenated with an additional outer index level `config`.
+            If they are arrays, they are stacked along a new first axis. If they are dataclasses, a dictionary with
+            the stacked fields of the dataclasses is returned. Other data are returned as a Series indexed by `config`.
+        """
+        return _stack([result.data for result in self.results.values()], self.configurations)
+
+
+def _stack(data: list[Any], configurations: list[int]) -> pd.DataFrame | np.ndarray | pd.Series | dict[str, Any]:
+    if all(isinstance(d, pd.DataFrame) for d in data):
+        return pd.concat(data, keys=configurations, names=["config"])
+
+    if all(isinstance(d, np.ndarray) for d in data):
+        return np.stack(data)
+
+    if all(is_dataclass(d) and type(d) is type(data[0]) for d in data):
+        return {f.name: _stack([getattr(d, f.name) for d in data], configurations) for f in fields(type(data[0]))}
+
+    return pd.Series(data, index=pd.Index(configurations, name="config"), dtype=object)
+
+
+def sweep(
+    oss: OpticStudioSystem,
+    analyses: Sequence[BaseAnalysisWrapper],
+    configurations: Iterable[int] | None = None,
+    *,
+    deduplicate: bool = True,
+) -> list[ConfigurationSweepResult]:
+    """Run analyses for multiple configurations of the Multi-Configuration Editor.
+
+    The configurations are iterated once. For every configuration, all analyses are run; the OpticStudio analysis
+    objects are kept open between configurations and closed afterwards. The current configuration is restored when the
+    sweep is finished.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    analyses : Sequence[BaseAnalysisWrapper]
+        Analysis wrappers that are run for every configuration.
+    configurations : Iterable[int] | None
+        Configuration numbers to sweep. Defaults to all configurations.
+    deduplicate : bool
+        If True, configurations whose operand values are identical to an already computed configuration are not
+        computed again, but share the results of that configuration. Defaults to True.
+
+    Returns
+    -------
+    list[ConfigurationSweepResult]
+        The results for every analysis, in the order of `analyses`.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.load("path/to/multiconfiguration_system.zmx")
+    >>> spot, mtf = zp.functions.mce.sweep(
+    ...     oss, [zp.analyses.raysandspots.StandardSpot(), zp.analyses.mtf.FFTMTF()]
+    ... )
+    >>> mtf.stack()
+    """
+    mce = oss.MCE
+    configurations = list(range(1, mce.NumberOfConfigurations + 1)) if configurations is None else list(configurations)
+    operand_values = _read_operand_values(mce, configurations) if deduplicate else [None] * len(configurations)
+
+    current_configuration = mce.CurrentConfiguration
+    computed: dict[tuple, int] = {}
+    results: list[dict[int, AnalysisResult]] = [{} for _ in analyses]
+    duplicate_of: dict[int, int] = {}
+
+    try:
+        for config, values in zip(configurations, operand_values, strict=True):
+            if deduplicate and values in computed:
+                duplicate_of[config] = computed[values]
+
+                for analysis_results in results:
+                    analysis_results[config] = analysis_results[computed[values]]
+
+                continue
+
+            mce.SetCurrentConfiguration(config)
+
+            for analysis, analysis_results in zip(analyses, results, strict=True):
+                analysis_results[config] = analysis.run(oss, oncomplete=OnComplete.Sustain)
+
+            if deduplicate:
+                computed[values] = config
+    finally:
+        for analysis in analyses:
+            analysis.close()
+
+        mce.SetCurrentConfiguration(current_configuration)
+
+    return [ConfigurationSweepResult(analysis_results, dict(duplicate_of)) for analysis_results in results]
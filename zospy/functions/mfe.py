@@ -0,0 +1,264 @@
+"""Utility functions for the Merit Function Editor (MFE) in OpticStudio."""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from numpy.typing import ArrayLike
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "MeritFunctionEvaluator",
+    "MeritFunctionResult",
+    "evaluate",
+    "find_variables",
+)
+
+
+class MeritFunctionResult(NamedTuple):
+    """Merit function value and operand data.
+
+    Attributes
+    ----------
+    total : float
+        The merit function value.
+    values : np.ndarray
+        Values of the operands.
+    targets : np.ndarray
+        Targets of the operands.
+    weights : np.ndarray
+        Weights of the operands.
+    contributions : np.ndarray
+        Contributions of the operands to the merit function, in percent.
+    """
+
+    total: float
+    values: np.ndarray
+    targets: np.ndarray
+    weights: np.ndarray
+    contributions: np.ndarray
+
+
+def _get_operands(mfe: _ZOSAPI.Editors.MFE.IMeritFunctionEditor) -> list[_ZOSAPI.Editors.MFE.IMFERow]:
+    get_operand = mfe.GetOperandAt
+
+    return [get_operand(i) for i in range(1, mfe.NumberOfOperands + 1)]
+
+
+def _read_operands(operands: Sequence[_ZOSAPI.Editors.MFE.IMFERow], attribute: str) -> np.ndarray:
+    return np.fromiter((getattr(operand, attribute) for operand in operands), dtype=float, count=len(operands))
+
+
+def evaluate(oss: OpticStudioSystem) -> MeritFunctionResult:
+    """Calculate the merit function and read the operand data as arrays.
+
+    The merit function is calculated once, after which the value, target, weight and contribution of all operands are
+    read in a single pass over the Merit Function Editor.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+
+    Returns
+    -------
+    MeritFunctionResult
+        Named tuple with the merit function value and the operand values, targets, weights and contributions.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.load("path/to/system.zmx")
+    >>> total, values, targets, weights, contributions = zp.functions.mfe.evaluate(oss)
+    """
+    total = oss.MFE.CalculateMeritFunction()
+    operands = _get_operands(oss.MFE)
+
+    values, targets, weights, contributions = np.empty((4, len(operands)))
+
+    for i, operand in enumerate(operands):
+        values[i] = operand.Value
+        targets[i] = operand.Target
+        weights[i] = operand.Weight
+        contributions[i] = operand.Contribution
+
+    return MeritFunctionResult(total, values, targets, weights, contributions)
+
+
+def find_variables(oss: OpticStudioSystem) -> list[_ZOSAPI.Editors.IEditorCell]:
+    """Find all cells with a Variable solve.
+
+    Depending on the mode of the system, the Lens Data Editor or the Non-Sequential Component Editor is searched, in
+    addition to the Multi-Configuration Editor. Cells are returned in editor order, row by row.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+
+    Returns
+    -------
+    list[ZOSAPI.Editors.IEditorCell]
+        The variable cells.
+    """
+    editors = (oss.LDE if oss.Mode == "Sequential" else oss.NCE, oss.MCE)
+    variables = []
+
+    for editor in editors:
+        get_row = editor.GetRowAt
+        columns = range(editor.MinColumn, editor.MaxColumn + 1)
+
+        for row_index in range(editor.NumberOfRows):
+            get_cell = get_row(row_index).GetCellAt
+            variables.extend(cell for cell in map(get_cell, columns) if str(cell.Solve) == "Variable")
+
+    return variables
+
+
+class MeritFunctionEvaluator:
+    """Evaluate the merit function for vectors of variable values.
+
+    The variable cells and merit function operands are retrieved once, when the evaluator is created. Each evaluation
+    writes the variables, calculates the merit function and reads the operand values, which makes the evaluator
+    suitable as an objective function for external optimizers such as `scipy.optimize.minimize`.
+
+    The evaluator assumes that the variables and operands are not changed while it is in use. Create a new evaluator
+    after changing the Merit Function Editor or the variables.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    variables : Iterable[ZOSAPI.Editors.IEditorCell] | None
+        The cells that are set by the variable vectors. Defaults to all variable cells, see `find_variables`.
+
+    Attributes
+    ----------
+    variables : list[ZOSAPI.Editors.IEditorCell]
+        The variable cells.
+    targets : np.ndarray
+        Targets of the operands.
+    weights : np.ndarray
+        Weights of the operands.
+    n_evaluations : int
+        Number of merit function evaluations performed by the evaluator.
+    elapsed : float
+        Total time spent in evaluations, in seconds.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> from scipy.optimize import minimize
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.load("path/to/system.zmx")
+    >>> evaluator = zp.functions.mfe.MeritFunctionEvaluator(oss)
+    >>> result = minimize(evaluator, evaluator.x0, method="Nelder-Mead")
+    >>> print(f"{evaluator.evaluations_per_second:.1f} evaluations per second")
+    """
+
+    def __init__(self, oss: OpticStudioSystem, variables: Iterable[_ZOSAPI.Editors.IEditorCell] | None = None):
+        self.oss = oss
+        self.variables = find_variables(oss) if variables is None else list(variables)
+
+        self._calculate_merit_function = oss.MFE.CalculateMeritFunction
+        self._operands = _get_operands(oss.MFE)
+        self.targets = _read_operands(self._operands, "Target")
+        self.weights = _read_operands(self._operands, "Weight")
+
+        self.n_evaluations = 0
+        self.elapsed = 0.0
+
+    @property
+    def x0(self) -> np.ndarray:
+        """Current values of the variables."""
+        return np.fromiter((cell.DoubleValue for cell in self.variables), dtype=float, count=len(self.variables))
+
+    @property
+    def evaluations_per_second(self) -> float:
+        """Average number of evaluations per second."""
+        return self.n_evaluations / self.elapsed if self.elapsed else float("nan")
+
+    def _set_variables(self, x: ArrayLike) -> None:
+        x = np.asarray(x, dtype=float)
+
+        if x.shape != (len(self.variables),):
+            raise ValueError(f"Expected {len(self.variables)} variable values, got an array of shape {x.shape}.")
+
+        for cell, value in zip(self.variables, x.tolist(), strict=True):
+            cell.DoubleValue = value
+
+        self.oss.invalidate_cached_results()
+
+    def _calculate(self, x: ArrayLike) -> float:
+        start = perf_counter()
+
+        self._set_variables(x)
+        total = self._calculate_merit_function()
+
+        self.elapsed += perf_counter() - start
+        self.n_evaluations += 1
+
+        return total
+
+    def __call__(self, x: ArrayLike) -> float:
+        """Set the variables to `x` and return the merit function value."""
+        return self._calculate(x)
+
+    def evaluate(self, x: ArrayLike) -> MeritFunctionResult:
+        """Set the variables to `x`, calculate the merit function and read the operand values and contributions."""
+        total = self._calculate(x)
+
+        return MeritFunctionResult(
+            total,
+            _read_operands(self._operands, "Value"),
+            self.targets.copy(),
+            self.weights.copy(),
+            _read_operands(self._operands, "Contribution"),
+        )
+
+    def evaluate_many(self, xs: ArrayLike, *, restore: bool = True) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate the merit function for multiple variable vectors.
+
+        Updates of the system are suspended during the evaluations, see `OpticStudioSystem.suspend_updates`.
+
+        Parameters
+        ----------
+        xs : ArrayLike
+            Variable vectors with shape (n, number of variables).
+        restore : bool
+            Whether the variables are restored to their original values afterwards. Defaults to True.
+
+        Returns
+        -------
+        totals : np.ndarray
+            Merit function values with shape (n,).
+        values : np.ndarray
+            Operand values with shape (n, number of operands).
+        """
+        xs = np.atleast_2d(np.asarray(xs, dtype=float))
+        totals = np.empty(len(xs))
+        values = np.empty((len(xs), len(self._operands)))
+        x0 = self.x0
+
+        with self.oss.suspend_updates():
+            try:
+                for i, x in enumerate(xs):
+                    totals[i] = self._calculate(x)
+                    values[i] = _read_operands(self._operands, "Value")
+            finally:
+                if restore:
+                    self._set_variables(x0)
+                    self._calculate_merit_function()
+
+        return totals, values
@@ -5,17 +5,28 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from zospy.api import constants
+from zospy.functions._editor import CommentIndex, EditorColumns, apply_changes, find_changes, get_comment_index
+from zospy.zpcore import OpticStudioSystem, invalidate_cached_results
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from zospy.api import _ZOSAPI
 
 __all__ = (
+    "apply",
+    "comment_index",
     "find_object_by_comment",
     "object_change_type",
 )
 
 
-def object_change_type(obj: _ZOSAPI.Editors.NCE.INCERow, new_type: constants.Editors.NCE.ObjectType | str):
+def object_change_type(
+    obj: _ZOSAPI.Editors.NCE.INCERow,
+    new_type: constants.Editors.NCE.ObjectType | str,
+    *,
+    oss: OpticStudioSystem | None = None,
+):
     """Change the object type in the Non-Sequential Component Editor.
 
     Parameters
@@ -25,6 +36,9 @@ def object_change_type(obj: _ZOSAPI.Editors.NCE.INCERow, new_type: constants.Edi
     new_type : zospy.constants.Editors.NCE.ObjectType | str
         The new object type, either string (e.g. 'StandardLens') or int. The integer will be treated as if obtained from
         zp.constants.Editors.NCE.ObjectType.
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -46,10 +60,46 @@ def object_change_type(obj: _ZOSAPI.Editors.NCE.INCERow, new_type: constants.Edi
     # Apply
     new_surface_type_settings = obj.GetObjectTypeSettings(new_type)
     obj.ChangeType(new_surface_type_settings)
+    invalidate_cached_results(oss)
+
+
+def comment_index(oss: OpticStudioSystem) -> CommentIndex:
+    """Get an index of the Non-Sequential Component Editor object numbers by comment.
+
+    The index is built from a single pass over the Non-Sequential Component Editor and cached on `oss`. It is rebuilt
+    when objects are inserted or removed, when a system is loaded or created, and when comments are changed through
+    `zospy.functions.nce.apply`. After changing comments directly through the ZOS-API, call
+    `OpticStudioSystem.invalidate_comment_indexes`.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance. Should be non-sequential.
+
+    Returns
+    -------
+    zospy.functions._editor.CommentIndex
+        Index of object numbers, supporting exact (`find`), prefix (`startswith`) and regular expression (`match`)
+        queries.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.make_nonsequential()
+    >>> oss.NCE.GetObjectAt(1).Comment = "detector 1"
+    >>> oss.invalidate_comment_indexes()
+    >>> zp.functions.nce.comment_index(oss).match("detector [0-9]+")
+    [1]
+    """
+    nce = oss.NCE
+
+    return get_comment_index(oss, "NCE", nce.NumberOfObjects, nce.GetObjectAt, first_row=1)
 
 
 def find_object_by_comment(
-    nce: _ZOSAPI.Editors.NCE, comment: str, *, case_sensitive: bool = True
+    nce: _ZOSAPI.Editors.NCE | OpticStudioSystem, comment: str, *, case_sensitive: bool = True
 ) -> list[_ZOSAPI.Editors.NCE.INCERow]:
     """Retrieve objects from the Non-Sequential Component Editor that have the supplied string as Comment.
 
@@ -57,8 +107,9 @@ def find_object_by_comment(
 
     Parameters
     ----------
-    nce : ZOSAPI.Editors.NCE
-        The Non-sequential Component Editor (NCE).
+    nce : ZOSAPI.Editors.NCE | zospy.zpcore.OpticStudioSystem
+        The Non-sequential Component Editor (NCE). If an OpticStudioSystem is supplied, the cached comment index of its
+        NCE is used instead of reading all comments (see `comment_index`).
     comment : str
         String that is searched for in the Comment column of the NCE.
     case_sensitive : bool=False
@@ -83,33 +134,77 @@ def find_object_by_comment(
     >>> nce_object_3.Comment = "aA"
     >>> find_object_by_comment(oss.NCE, "aa")
     """
-    # Number of objects in the NCE
-    number_of_objects = nce.NumberOfObjects
+    if isinstance(nce, OpticStudioSystem):
+        index = comment_index(nce)
+        nce = nce.NCE
+    else:
+        index = CommentIndex((nce.GetObjectAt(i).Comment for i in range(1, nce.NumberOfObjects + 1)), first_row=1)
+
+    get_object = nce.GetObjectAt
+
+    return [get_object(object_number) for object_number in index.find(comment, case_sensitive=case_sensitive)]
+
+
+_NCE_COLUMNS = EditorColumns(
+    property_columns=(
+        "Comment",
+        "Material",
+        "RefObject",
+        "InsideOf",
+        "XPosition",
+        "YPosition",
+        "ZPosition",
+        "TiltAboutX",
+        "TiltAboutY",
+        "TiltAboutZ",
+    ),
+    cell_getter="GetObjectCell",
+    column_constant="Editors.NCE.ObjectColumn",
+)
 
-    # Is the search case-sensitive?
-    if not case_sensitive:
-        # If the search is NOT case-sensitive put comment argument in all small letters
-        comment = comment.lower()
 
-    # Initialize list of objects with matching comment
-    matching_objects = []
+def apply(oss: OpticStudioSystem, dataframe: pd.DataFrame) -> int:
+    """Write object data from a DataFrame to the Non-Sequential Component Editor.
 
-    # Loop over the objects in the NCE and check if their comment matches
-    for object_index in range(1, number_of_objects + 1):
-        # Retrieve current object
-        current_object = nce.GetObjectAt(object_index)
+    The DataFrame should be indexed by object number and have one column per editor column, named as in
+    `zospy.constants.Editors.NCE.ObjectColumn` (e.g. 'XPosition', 'Material', 'Par1'). Only cells whose value differs
+    from the current value are written. Missing values (None or NaN) are skipped. A 'Type' column is only checked
+    against the current object types.
 
-        # Retrieve current object comment
-        object_comment = current_object.Comment
+    All changes are written while updates are suspended (see `OpticStudioSystem.suspend_updates`). If any assignment
+    fails, the cells that were already written are restored to their previous values and the exception is raised.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance.
+    dataframe : pd.DataFrame
+        The object data to write, indexed by object number.
+
+    Returns
+    -------
+    int
+        The number of cells that were changed.
 
-        # Is the search case-sensitive?
-        if not case_sensitive:
-            # If the search is NOT case-sensitive put current object comment in all small letters
-            object_comment = object_comment.lower()
+    Raises
+    ------
+    ValueError
+        If the DataFrame contains an object number that does not exist, or an object type that differs from the
+        current object type.
 
-        # If the comment matches, append the corresponding object to the return list
-        if comment == object_comment:
-            matching_objects.append(current_object)
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.make_nonsequential()
+    >>> zp.functions.nce.apply(
+    ...     oss, pd.DataFrame({"ZPosition": [10.0], "Par1": [2.0]}, index=[1])
+    ... )
+    """
+    nce = oss.NCE
+    changes = find_changes(dataframe, nce.GetObjectAt, range(1, nce.NumberOfObjects + 1), _NCE_COLUMNS)
+    apply_changes(oss, changes, nce.GetObjectAt, _NCE_COLUMNS)
 
-    # Return list of objects with matching comment
-    return matching_objects
+    return len(changes)
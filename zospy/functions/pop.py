@@ -0,0 +1,236 @@
+"""Utility functions for Physical Optics Propagation (POP) in OpticStudio."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+from uuid import uuid4
+
+import pandas as pd
+
+from zospy.analyses.base import OnComplete
+from zospy.io import zbf
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import numpy as np
+
+    from zospy.analyses.physicaloptics import PhysicalOpticsPropagation
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = ("POPChainResult", "POPStage", "propagate_chain")
+
+Surface = Literal["Ent. Pupil", "Image"] | int
+
+
+@dataclass(frozen=True)
+class POPStage:
+    """Output beam of a stage of a POP chain.
+
+    The beam is kept on disk. It is memory-mapped when it is accessed, and the irradiance is only calculated on request.
+
+    Attributes
+    ----------
+    start_surface : Surface
+        The start surface of the stage.
+    end_surface : Surface
+        The end surface of the stage.
+    path : Path
+        Path to the ZBF file of the output beam.
+    """
+
+    start_surface: Surface
+    end_surface: Surface
+    path: Path
+
+    @property
+    def beam(self) -> zbf.Beam:
+        """The output beam, with a read-only memory-mapped field."""
+        return zbf.read(self.path)
+
+    @property
+    def irradiance(self) -> np.ndarray:
+        """Irradiance of the output beam, with shape `(ny, nx)`."""
+        return self.beam.irradiance
+
+    @property
+    def parameters(self) -> dict[str, float]:
+        """Beam parameters of the output beam: the pilot beam parameters from the ZBF header and the total power."""
+        header = zbf.read_header(self.path)
+
+        return {
+            "dx": header.dx,
+            "dy": header.dy,
+            "z_position_x": header.z_position_x,
+            "rayleigh_x": header.rayleigh_x,
+            "waist_x": header.waist_x,
+            "z_position_y": header.z_position_y,
+            "rayleigh_y": header.rayleigh_y,
+            "waist_y": header.waist_y,
+            "index": header.index,
+            "receiver_efficiency": header.receiver_efficiency,
+            "system_efficiency": header.system_efficiency,
+            "power": self.beam.power,
+        }
+
+
+@dataclass(frozen=True)
+class POPChainResult:
+    """Results of a POP chain.
+
+    Attributes
+    ----------
+    stages : list[POPStage]
+        The stages of the chain, in the order they were propagated.
+    scratch_dir : Path
+        Directory that contains the output beams of the stages.
+    """
+
+    stages: list[POPStage]
+    scratch_dir: Path
+
+    @property
+    def parameters(self) -> pd.DataFrame:
+        """Beam parameters of all stages, indexed by stage number. See `POPStage.parameters`."""
+        return pd.DataFrame(
+            [stage.parameters for stage in self.stages], index=pd.RangeIndex(len(self.stages), name="Stage")
+        )
+
+    def cleanup(self) -> None:
+        """Remove the output beams of the stages from the scratch directory.
+
+        On Windows, memory-mapped beams should be deleted before their files can be removed.
+        """
+        for stage in self.stages:
+            stage.path.unlink(missing_ok=True)
+
+
+def _stage_settings(
+    stage: int, start_surface: Surface, end_surface: Surface, input_file: str, output_file: str
+) -> dict[str, object]:
+    settings = {
+        "start_surface": start_surface,
+        "end_surface": end_surface,
+        "save_output_beam": True,
+        "output_beam_file": output_file,
+        "save_beam_at_all_surfaces": False,
+    }
+
+    if stage > 0:
+        settings |= {
+            "beam_type": "File",
+            "beam_file": input_file,
+            "beam_parameters": None,
+            "auto_calculate_beam_sampling": False,
+        }
+
+    return settings
+
+
+def propagate_chain(
+    oss: OpticStudioSystem,
+    analysis: PhysicalOpticsPropagation,
+    surfaces: Sequence[tuple[Surface, Surface]],
+    *,
+    scratch_dir: str | Path | None = None,
+    transform: Callable[[int, zbf.Beam], zbf.Beam] | None = None,
+) -> POPChainResult:
+    """Propagate a beam through successive surface ranges with Physical Optics Propagation.
+
+    The first stage uses the beam definition of `analysis`. Every following stage starts from the output beam of the
+    previous stage, which is handed off as a beam file. The OpticStudio analysis is kept open for all stages and closed
+    afterwards, and the original settings of `analysis` are restored.
+
+    The output beam of every stage is moved from the OpticStudio <pop> folder to `scratch_dir`, and is only read
+    (memory-mapped) when it is accessed. Because OpticStudio only reads beam files from the <pop> folder, the input beam
+    of a stage is temporarily written there, and removed when the chain is finished.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance. Should be sequential.
+    analysis : PhysicalOpticsPropagation
+        The Physical Optics Propagation analysis that defines the beam and the propagation settings. The surface and
+        beam file settings are overwritten for every stage.
+    surfaces : Sequence[tuple[Surface, Surface]]
+        Start and end surface of every stage.
+    scratch_dir : str | Path | None
+        Directory in which the output beams of the stages are stored. Defaults to None, in which case a new temporary
+        directory is created. The beams are not removed automatically, see `POPChainResult.cleanup`.
+    transform : Callable[[int, zbf.Beam], zbf.Beam] | None
+        Function that is applied to the output beam of every stage except the last one before it is handed off to the
+        next stage, e.g. to apply an aperture. It receives the stage number and the memory-mapped output beam, and
+        returns the input beam of the next stage. Defaults to None.
+
+    Returns
+    -------
+    POPChainResult
+        The output beams of all stages.
+
+    Raises
+    ------
+    ValueError
+        If `surfaces` is empty.
+    FileNotFoundError
+        If OpticStudio did not save the output beam of a stage.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> oss.load("path/to/system.zmx")
+    >>> result = zp.functions.pop.propagate_chain(
+    ...     oss,
+    ...     zp.analyses.physicaloptics.PhysicalOpticsPropagation(
+    ...         x_sampling=256, y_sampling=256
+    ...     ),
+    ...     [(1, 4), (4, "Image")],
+    ... )
+    >>> result.parameters
+    """
+    if not surfaces:
+        raise ValueError("At least one stage is required.")
+
+    scratch_dir = Path(tempfile.mkdtemp(prefix="zospy_pop_") if scratch_dir is None else scratch_dir)
+    scratch_dir.mkdir(parents=True, exist_ok=True)
+
+    pop_dir = Path(oss.TheApplication.POPDir)
+    name = f"zospy_chain_{uuid4().hex[:8]}"
+    input_file, output_file = f"{name}_input.ZBF", f"{name}_output"
+
+    original_settings = analysis.settings
+    stages: list[POPStage] = []
+
+    try:
+        for stage, (start_surface, end_surface) in enumerate(surfaces):
+            if stage > 0:
+                beam = stages[-1].beam
+
+                if transform is not None:
+                    beam = transform(stage - 1, beam)
+
+                beam.save(pop_dir / input_file)
+
+            analysis.update_settings(
+                settings_kws=_stage_settings(stage, start_surface, end_surface, input_file, output_file)
+            )
+            analysis.run(oss, oncomplete=OnComplete.Sustain)
+
+            if not (pop_dir / f"{output_file}.ZBF").exists():
+                raise FileNotFoundError(f"OpticStudio did not save the output beam of stage {stage}.")
+
+            path = scratch_dir / f"{name}_stage{stage}.zbf"
+            shutil.move(pop_dir / f"{output_file}.ZBF", path)
+            stages.append(POPStage(start_surface, end_surface, path))
+    finally:
+        analysis.close()
+
+        analysis.update_settings(settings=original_settings)
+        (pop_dir / input_file).unlink(missing_ok=True)
+
+    return POPChainResult(stages, scratch_dir)
@@ -0,0 +1,10 @@
+"""Reading and writing of OpticStudio file formats.
+
+- `zospy.io.zbf`: Zemax Beam Files (ZBF) used by Physical Optics Propagation.
+"""
+
+from __future__ import annotations
+
+from zospy.io import zbf
+
+__all__ = ("zbf",)
@@ -0,0 +1,418 @@
+"""Reading and writing of Zemax Beam Files (ZBF).
+
+ZBF files store the complex electric field of a beam for Physical Optics Propagation (POP). They are written by POP when
+`save_output_beam` is enabled, and can be used as input beam with the 'File' beam type. A file consists of a fixed-size
+little-endian header followed by the field samples, stored as pairs of real and imaginary parts with x varying fastest.
+Polarized beams store the x component followed by the y component.
+
+The field arrays are memory-mapped by default, so large beams are not read into memory until they are accessed, and
+beams can be synthesized directly in a file with `create`. Only version 1 of the format, which is written by current
+OpticStudio versions, is supported.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+__all__ = ("ZBF_HEADER_DTYPE", "Beam", "ZBFHeader", "ZBFUnits", "create", "read", "read_header", "write")
+
+ZBFUnits = Literal["mm", "cm", "in", "m"]
+
+_UNITS: tuple[ZBFUnits, ...] = ("mm", "cm", "in", "m")
+"""Units in the order of their code in the header."""
+
+ZBF_HEADER_DTYPE = np.dtype([
+    ("version", "<i4"),
+    ("nx", "<i4"),
+    ("ny", "<i4"),
+    ("is_polarized", "<i4"),
+    ("units", "<i4"),
+    ("unused_integers", "<i4", (4,)),
+    ("dx", "<f8"),
+    ("dy", "<f8"),
+    ("z_position_x", "<f8"),
+    ("rayleigh_x", "<f8"),
+    ("waist_x", "<f8"),
+    ("z_position_y", "<f8"),
+    ("rayleigh_y", "<f8"),
+    ("waist_y", "<f8"),
+    ("wavelength", "<f8"),
+    ("index", "<f8"),
+    ("receiver_efficiency", "<f8"),
+    ("system_efficiency", "<f8"),
+    ("unused_doubles", "<f8", (8,)),
+])
+"""Binary layout of the header of a version 1 ZBF file."""
+
+_FIELD_DTYPE = np.dtype("<c16")
+"""Data type of the field samples: little-endian pairs of 64-bit real and imaginary parts."""
+
+_SUPPORTED_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ZBFHeader:
+    """Header of a ZBF file.
+
+    Attributes
+    ----------
+    nx : int
+        Number of samples in the x direction.
+    ny : int
+        Number of samples in the y direction.
+    dx : float
+        Distance between samples in the x direction, in `units`.
+    dy : float
+        Distance between samples in the y direction, in `units`.
+    wavelength : float
+        Wavelength, in `units`.
+    is_polarized : bool
+        Whether the file contains both the x and y components of the field. Defaults to False.
+    units : ZBFUnits
+        Length units of the file. Defaults to 'mm'.
+    z_position_x : float
+        Distance from the waist in the x direction. Defaults to 0.
+    rayleigh_x : float
+        Rayleigh range in the x direction. Defaults to 0.
+    waist_x : float
+        Waist radius in the x direction. Defaults to 0.
+    z_position_y : float
+        Distance from the waist in the y direction. Defaults to 0.
+    rayleigh_y : float
+        Rayleigh range in the y direction. Defaults to 0.
+    waist_y : float
+        Waist radius in the y direction. Defaults to 0.
+    index : float
+        Refractive index of the medium. Defaults to 1.
+    receiver_efficiency : float
+        Receiver efficiency. Defaults to 0.
+    system_efficiency : float
+        System efficiency. Defaults to 0.
+    """
+
+    nx: int
+    ny: int
+    dx: float
+    dy: float
+    wavelength: float
+    is_polarized: bool = False
+    units: ZBFUnits = "mm"
+    z_position_x: float = 0.0
+    rayleigh_x: float = 0.0
+    waist_x: float = 0.0
+    z_position_y: float = 0.0
+    rayleigh_y: float = 0.0
+    waist_y: float = 0.0
+    index: float = 1.0
+    receiver_efficiency: float = 0.0
+    system_efficiency: float = 0.0
+
+    def __post_init__(self):
+        """Validate the sampling and the units."""
+        if self.nx < 1 or self.ny < 1:
+            raise ValueError(f"The number of samples should be positive, got {self.nx}x{self.ny}.")
+
+        if self.units not in _UNITS:
+            raise ValueError(f"Unknown units {self.units}, should be one of {', '.join(_UNITS)}.")
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Shape of the field data: `(n_components, ny, nx)`."""
+        return 1 + self.is_polarized, self.ny, self.nx
+
+    @property
+    def file_size(self) -> int:
+        """Size of a ZBF file with this header in bytes."""
+        return ZBF_HEADER_DTYPE.itemsize + int(np.prod(self.shape)) * _FIELD_DTYPE.itemsize
+
+    def to_bytes(self) -> bytes:
+        """Encode the header in the binary ZBF format.
+
+        Returns
+        -------
+        bytes
+            The encoded header.
+        """
+        header = np.zeros((), dtype=ZBF_HEADER_DTYPE)
+
+        for name, value in asdict(self).items():
+            header[name] = _UNITS.index(value) if name == "units" else value
+
+        header["version"] = _SUPPORTED_VERSION
+
+        return header.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ZBFHeader:
+        """Decode a header in the binary ZBF format.
+
+        Parameters
+        ----------
+        data : bytes
+            The encoded header, optionally followed by other data.
+
+        Returns
+        -------
+        ZBFHeader
+            The decoded header.
+
+        Raises
+        ------
+        ValueError
+            If the data is too short, or if the format version or the units are not supported.
+        """
+        if len(data) < ZBF_HEADER_DTYPE.itemsize:
+            raise ValueError(f"A ZBF header should be {ZBF_HEADER_DTYPE.itemsize} bytes, got {len(data)} bytes.")
+
+        header = np.frombuffer(data, dtype=ZBF_HEADER_DTYPE, count=1)[0]
+
+        if header["version"] != _SUPPORTED_VERSION:
+            raise ValueError(f"Unsupported ZBF format version {header['version']}, only version 1 is supported.")
+
+        if not 0 <= header["units"] < len(_UNITS):
+            raise ValueError(f"Unknown ZBF units code {header['units']}.")
+
+        return cls(
+            nx=int(header["nx"]),
+            ny=int(header["ny"]),
+            dx=float(header["dx"]),
+            dy=float(header["dy"]),
+            wavelength=float(header["wavelength"]),
+            is_polarized=bool(header["is_polarized"]),
+            units=_UNITS[header["units"]],
+            z_position_x=float(header["z_position_x"]),
+            rayleigh_x=float(header["rayleigh_x"]),
+            waist_x=float(header["waist_x"]),
+            z_position_y=float(header["z_position_y"]),
+            rayleigh_y=float(header["rayleigh_y"]),
+            waist_y=float(header["waist_y"]),
+            index=float(header["index"]),
+            receiver_efficiency=float(header["receiver_efficiency"]),
+            system_efficiency=float(header["system_efficiency"]),
+        )
+
+
+@dataclass(frozen=True)
+class Beam:
+    """Beam stored in a ZBF file.
+
+    Attributes
+    ----------
+    header : ZBFHeader
+        The header of the file.
+    field : np.ndarray
+        Complex field with shape `(n_components, ny, nx)`, where the components are the x component and, for polarized
+        beams, the y component. This is a memory map if the file was opened with a memory map mode.
+    """
+
+    header: ZBFHeader
+    field: np.ndarray
+
+    @property
+    def ex(self) -> np.ndarray:
+        """X component of the field, with shape `(ny, nx)`."""
+        return self.field[0]
+
+    @property
+    def ey(self) -> np.ndarray | None:
+        """Y component of the field, with shape `(ny, nx)`, or None for unpolarized beams."""
+        return self.field[1] if self.header.is_polarized else None
+
+    @property
+    def x(self) -> np.ndarray:
+        """X coordinates of the samples. The center of the beam is at index `nx // 2`."""
+        return (np.arange(self.header.nx) - self.header.nx // 2) * self.header.dx
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y coordinates of the samples. The center of the beam is at index `ny // 2`."""
+        return (np.arange(self.header.ny) - self.header.ny // 2) * self.header.dy
+
+    @property
+    def irradiance(self) -> np.ndarray:
+        """Irradiance, the squared magnitude of the field summed over the components, with shape `(ny, nx)`."""
+        return np.sum(self.field.real**2 + self.field.imag**2, axis=0)
+
+    @property
+    def power(self) -> float:
+        """Total power, the irradiance integrated over the sampled area."""
+        return float(np.sum(self.irradiance) * self.header.dx * self.header.dy)
+
+    def flush(self) -> None:
+        """Write changes of a memory-mapped field to the file."""
+        if isinstance(self.field, np.memmap):
+            self.field.flush()
+
+    def save(self, path: str | Path) -> None:
+        """Write the beam to a ZBF file.
+
+        The field is written component by component, so memory-mapped fields are not read into memory at once.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the ZBF file. An existing file is overwritten.
+
+        Raises
+        ------
+        ValueError
+            If the shape of the field does not match the header.
+        """
+        if self.field.shape != self.header.shape:
+            raise ValueError(f"The field should have shape {self.header.shape}, got {self.field.shape}.")
+
+        with open(path, "wb") as f:
+            f.write(self.header.to_bytes())
+
+            for component in self.field:
+                component.astype(_FIELD_DTYPE, copy=False).tofile(f)
+
+
+def read_header(path: str | Path) -> ZBFHeader:
+    """Read the header of a ZBF file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the ZBF file.
+
+    Returns
+    -------
+    ZBFHeader
+        The header of the file.
+    """
+    with open(path, "rb") as f:
+        return ZBFHeader.from_bytes(f.read(ZBF_HEADER_DTYPE.itemsize))
+
+
+def read(path: str | Path, mmap_mode: Literal["r", "r+", "c"] | None = "r") -> Beam:
+    """Read a ZBF file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the ZBF file.
+    mmap_mode : Literal["r", "r+", "c"] | None
+        Memory map mode of the field, see `numpy.memmap`. If None, the field is read into memory. Defaults to 'r'. Note
+        that a memory-mapped file cannot be overwritten on Windows until the memory map is deleted.
+
+    Returns
+    -------
+    Beam
+        The beam.
+
+    Raises
+    ------
+    ValueError
+        If the header is invalid, or if the file size does not match the header.
+    """
+    header = read_header(path)
+    file_size = Path(path).stat().st_size
+
+    if file_size < header.file_size:
+        raise ValueError(f"ZBF file {path} should be at least {header.file_size} bytes, got {file_size} bytes.")
+
+    if mmap_mode is None:
+        with open(path, "rb") as f:
+            f.seek(ZBF_HEADER_DTYPE.itemsize)
+            field = np.fromfile(f, dtype=_FIELD_DTYPE, count=int(np.prod(header.shape))).reshape(header.shape)
+    else:
+        field = np.memmap(
+            path, dtype=_FIELD_DTYPE, mode=mmap_mode, offset=ZBF_HEADER_DTYPE.itemsize, shape=header.shape
+        )
+
+    return Beam(header=header, field=field)
+
+
+def create(path: str | Path, header: ZBFHeader) -> Beam:
+    """Create a ZBF file with a zero field that is memory-mapped for writing.
+
+    This allows to synthesize large beams directly in the file. Call `Beam.flush` to ensure all changes are written.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the ZBF file. An existing file is overwritten.
+    header : ZBFHeader
+        The header of the file.
+
+    Returns
+    -------
+    Beam
+        The beam, with a writable memory-mapped field.
+    """
+    with open(path, "wb") as f:
+        f.write(header.to_bytes())
+        f.truncate(header.file_size)
+
+    return read(path, mmap_mode="r+")
+
+
+def write(
+    path: str | Path,
+    ex: ArrayLike,
+    ey: ArrayLike | None = None,
+    *,
+    dx: float,
+    dy: float,
+    wavelength: float,
+    units: ZBFUnits = "mm",
+    **parameters: float,
+) -> ZBFHeader:
+    """Write a beam to a ZBF file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the ZBF file. An existing file is overwritten.
+    ex : ArrayLike
+        Complex x component of the field, with shape `(ny, nx)`.
+    ey : ArrayLike | None
+        Complex y component of the field, with shape `(ny, nx)`. If None, an unpolarized beam is written. Defaults to
+        None.
+    dx : float
+        Distance between samples in the x direction, in `units`.
+    dy : float
+        Distance between samples in the y direction, in `units`.
+    wavelength : float
+        Wavelength, in `units`.
+    units : ZBFUnits
+        Length units of the file. Defaults to 'mm'.
+    **parameters : float
+        Other header fields, see `ZBFHeader`.
+
+    Returns
+    -------
+    ZBFHeader
+        The header of the written file.
+
+    Raises
+    ------
+    ValueError
+        If `ex` is not two-dimensional, or if `ex` and `ey` have different shapes.
+    """
+    components = [np.asarray(ex)] if ey is None else [np.asarray(ex), np.asarray(ey)]
+
+    if components[0].ndim != 2:
+        raise ValueError(f"The field should be two-dimensional, got shape {components[0].shape}.")
+
+    if any(component.shape != components[0].shape for component in components):
+        raise ValueError("ex and ey should have the same shape.")
+
+    ny, nx = components[0].shape
+    header = ZBFHeader(
+        nx=nx, ny=ny, dx=dx, dy=dy, wavelength=wavelength, is_polarized=ey is not None, units=units, **parameters
+    )
+
+    with open(path, "wb") as f:
+        f.write(header.to_bytes())
+        f.writelines(component.astype(_FIELD_DTYPE, copy=False).tobytes() for component in components)
+
+    return header
@@ -0,0 +1,18 @@
+"""Local calculations without OpticStudio.
+
+This module provides NumPy implementations of optical calculations that operate on lens data read from OpticStudio
+once, so they can be evaluated many times without calling the ZOS-API.
+
+- `zospy.local.prescription`: the `Prescription` container and `read_prescription` to read it from OpticStudio;
+- `zospy.local.paraxial`: first-order (paraxial) ray traces, system matrices, cardinal points and pupil data;
+- `zospy.local.raytrace`: vectorized real ray traces of sequential systems;
+- `zospy.local.diffraction`: FFT-based pupil functions, PSFs and MTFs from wavefront maps;
+- `zospy.local.zernike`: Zernike Standard and Fringe polynomial fitting of wavefront maps.
+"""
+
+from __future__ import annotations
+
+from zospy.local import diffraction, paraxial, prescription, raytrace, zernike
+from zospy.local.prescription import Prescription, read_prescription
+
+__all__ = ("Prescription", "diffraction", "paraxial", "prescription", "raytrace", "read_prescription", "zernike")
@@ -0,0 +1,410 @@
+"""FFT-based diffraction calculations from wavefront maps.
+
+The pupil function, point spread function (PSF) and modulation transfer function (MTF) are calculated from the optical
+path difference (OPD) of a `WavefrontMap` analysis, so a single wavefront map replaces separate FFT PSF, FFT MTF and
+FFT Through Focus MTF analyses.
+
+The pupil is sampled on the grid of the wavefront map, where the normalized pupil coordinates run from -1 to 1. Samples
+outside the pupil are NaN in the wavefront map and are treated as opaque. The pupil is zero-padded to a larger grid
+before the Fourier transform; the padding factor determines the sampling of the PSF and MTF. Through-focus calculations
+add a defocus term to the wavefront and are evaluated for all focal shifts in one batched FFT.
+
+Image coordinates are expressed in units of the wavelength times the working F-number, and spatial frequencies in units
+of the incoherent cutoff frequency `1 / (wavelength * working F-number)`. Use `image_spacing` and `frequency_spacing` to
+convert them to physical units. FFTs are calculated with `scipy.fft` if SciPy is installed, which allows to use multiple
+worker threads, and with `numpy.fft` otherwise.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+try:
+    import scipy.fft as _fft_backend
+except ImportError:
+    _fft_backend = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from numpy.typing import ArrayLike
+
+__all__ = (
+    "MTF",
+    "PSF",
+    "PupilFunction",
+    "focal_shift_to_defocus",
+    "frequency_spacing",
+    "image_spacing",
+    "mtf",
+    "psf",
+    "pupil_function",
+    "through_focus_mtf",
+)
+
+
+def _fft2(array: np.ndarray, workers: int | None) -> np.ndarray:
+    """Two-dimensional FFT over the last two axes, using SciPy if available."""
+    if _fft_backend is not None:
+        return _fft_backend.fft2(array, workers=workers)
+
+    return np.fft.fft2(array)
+
+
+def _ifft2(array: np.ndarray, workers: int | None) -> np.ndarray:
+    """Two-dimensional inverse FFT over the last two axes, using SciPy if available."""
+    if _fft_backend is not None:
+        return _fft_backend.ifft2(array, workers=workers)
+
+    return np.fft.ifft2(array)
+
+
+@dataclass(frozen=True)
+class PupilFunction:
+    """Zero-padded complex pupil function.
+
+    Attributes
+    ----------
+    field : np.ndarray
+        Complex amplitude of the pupil with shape `(..., grid_size, grid_size)`. The leading dimensions correspond to
+        the shape of the defocus coefficients. The center of the pupil is at index `grid_size // 2`.
+    step : float
+        Distance between pupil samples in normalized pupil coordinates.
+    defocus : np.ndarray
+        Defocus coefficients in waves that were added to the wavefront.
+    """
+
+    field: np.ndarray
+    step: float
+    defocus: np.ndarray
+
+    @property
+    def grid_size(self) -> int:
+        """Number of samples along each axis of the padded grid."""
+        return self.field.shape[-1]
+
+    @property
+    def image_step(self) -> float:
+        """Distance between PSF samples in units of the wavelength times the working F-number."""
+        return 2 / (self.grid_size * self.step)
+
+    @property
+    def frequency_step(self) -> float:
+        """Distance between MTF samples in units of the cutoff frequency."""
+        return self.step / 2
+
+
+@dataclass(frozen=True)
+class PSF:
+    """Point spread function.
+
+    Attributes
+    ----------
+    intensity : np.ndarray
+        PSF with shape `(..., grid_size, grid_size)`, centered at index `grid_size // 2`. The first of the last two axes
+        corresponds to the pupil y coordinate.
+    spacing : float
+        Distance between samples in units of the wavelength times the working F-number.
+    strehl_ratio : np.ndarray
+        Ratio of the central intensity to that of an unaberrated pupil of the same shape, with the shape of the leading
+        dimensions of `intensity`.
+    """
+
+    intensity: np.ndarray
+    spacing: float
+    strehl_ratio: np.ndarray
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Image coordinates of the samples along each axis."""
+        n = self.intensity.shape[-1]
+
+        return (np.arange(n) - n // 2) * self.spacing
+
+
+@dataclass(frozen=True)
+class MTF:
+    """Optical transfer function.
+
+    Attributes
+    ----------
+    otf : np.ndarray
+        Complex optical transfer function with shape `(..., grid_size, grid_size)`, normalized to 1 at zero frequency
+        and centered at index `grid_size // 2`. The first of the last two axes corresponds to the y frequency.
+    spacing : float
+        Distance between samples in units of the cutoff frequency.
+    """
+
+    otf: np.ndarray
+    spacing: float
+
+    @property
+    def modulation(self) -> np.ndarray:
+        """Modulation transfer function, the absolute value of the OTF."""
+        return np.abs(self.otf)
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Spatial frequencies of the samples along each axis."""
+        n = self.otf.shape[-1]
+
+        return (np.arange(n) - n // 2) * self.spacing
+
+    @property
+    def frequency(self) -> np.ndarray:
+        """Spatial frequencies of `tangential` and `sagittal`, from zero up to the cutoff frequency."""
+        n = self.otf.shape[-1]
+
+        return np.arange(min(n // 2, int(np.ceil(1 / self.spacing)) + 1)) * self.spacing
+
+    @property
+    def tangential(self) -> np.ndarray:
+        """Tangential MTF, i.e. the modulation for frequencies along the y axis, with shape `(..., n_frequencies)`."""
+        n = self.otf.shape[-1]
+
+        return self.modulation[..., n // 2 : n // 2 + len(self.frequency), n // 2]
+
+    @property
+    def sagittal(self) -> np.ndarray:
+        """Sagittal MTF, i.e. the modulation for frequencies along the x axis, with shape `(..., n_frequencies)`."""
+        n = self.otf.shape[-1]
+
+        return self.modulation[..., n // 2, n // 2 : n // 2 + len(self.frequency)]
+
+
+def focal_shift_to_defocus(focal_shift: ArrayLike, wavelength: float, f_number: float) -> np.ndarray:
+    """Convert a longitudinal focal shift to a defocus coefficient.
+
+    Uses the paraxial approximation `W020 = focal_shift / (8 * f_number ** 2)`, where `W020` is the coefficient of the
+    squared normalized pupil radius.
+
+    Parameters
+    ----------
+    focal_shift : ArrayLike
+        Focal shift in lens units.
+    wavelength : float
+        Wavelength in lens units.
+    f_number : float
+        Working F-number.
+
+    Returns
+    -------
+    np.ndarray
+        Defocus coefficients in waves.
+    """
+    return np.asarray(focal_shift, dtype=float) / (8 * f_number**2 * wavelength)
+
+
+def image_spacing(pupil: PupilFunction, wavelength: float, f_number: float) -> float:
+    """Calculate the distance between PSF samples in physical units.
+
+    Parameters
+    ----------
+    pupil : PupilFunction
+        The pupil function.
+    wavelength : float
+        Wavelength. The result has the same unit.
+    f_number : float
+        Working F-number.
+
+    Returns
+    -------
+    float
+        Distance between PSF samples.
+    """
+    return pupil.image_step * wavelength * f_number
+
+
+def frequency_spacing(pupil: PupilFunction, wavelength: float, f_number: float) -> float:
+    """Calculate the distance between MTF samples in physical units.
+
+    Parameters
+    ----------
+    pupil : PupilFunction
+        The pupil function.
+    wavelength : float
+        Wavelength. The result is in cycles per unit of the wavelength.
+    f_number : float
+        Working F-number.
+
+    Returns
+    -------
+    float
+        Distance between MTF samples.
+    """
+    return pupil.frequency_step / (wavelength * f_number)
+
+
+def pupil_function(
+    wavefront: pd.DataFrame,
+    *,
+    defocus: ArrayLike = 0.0,
+    padding: float = 2.0,
+    grid_size: int | None = None,
+) -> PupilFunction:
+    """Calculate the complex pupil function from a wavefront map.
+
+    Parameters
+    ----------
+    wavefront : pd.DataFrame
+        The data of a `WavefrontMap` result: the OPD in waves, indexed by the normalized pupil y coordinate, with the
+        normalized pupil x coordinate as columns. Samples outside the pupil are NaN.
+    defocus : ArrayLike
+        Defocus coefficients in waves, added to the wavefront as `defocus * (x ** 2 + y ** 2)`. For an array of
+        coefficients, a pupil function is calculated for every coefficient. Defaults to 0.
+    padding : float
+        Ratio of the padded grid size to the size of the wavefront map. A padding of at least 2 is required to calculate
+        the MTF without aliasing. Ignored if `grid_size` is specified. Defaults to 2.
+    grid_size : int | None
+        Number of samples along each axis of the padded grid. Defaults to None, in which case it is determined by
+        `padding`.
+
+    Returns
+    -------
+    PupilFunction
+        The pupil function, with shape `(*np.shape(defocus), grid_size, grid_size)`.
+
+    Raises
+    ------
+    ValueError
+        If the wavefront map is not square, or if the padded grid is smaller than the wavefront map.
+    """
+    opd = wavefront.to_numpy(dtype=float)
+    n = opd.shape[0]
+
+    if opd.shape != (n, n):
+        raise ValueError(f"The wavefront map should be square, got shape {opd.shape}.")
+
+    grid_size = round(n * padding) if grid_size is None else grid_size
+
+    if grid_size < n:
+        raise ValueError(f"The grid size should be at least the size of the wavefront map ({n}), got {grid_size}.")
+
+    x = wavefront.columns.to_numpy(dtype=float)
+    y = wavefront.index.to_numpy(dtype=float)
+    step = float(np.mean(np.diff(x)))
+
+    defocus = np.asarray(defocus, dtype=float)
+    aperture = ~np.isnan(opd)
+    rho2 = np.add.outer(y**2, x**2)
+
+    phase = np.where(aperture, opd, 0.0) + defocus[..., None, None] * rho2
+    field = np.where(aperture, np.exp(2j * np.pi * phase), 0)
+
+    # Center the pupil on the padded grid, so that the PSF and OTF are centered as well
+    offset = grid_size // 2 - np.argmin(np.abs(y)), grid_size // 2 - np.argmin(np.abs(x))
+    padded = np.zeros((*defocus.shape, grid_size, grid_size), dtype=complex)
+    padded[..., offset[0] : offset[0] + n, offset[1] : offset[1] + n] = field
+
+    return PupilFunction(field=padded, step=step, defocus=defocus)
+
+
+def _amplitude_spread(pupil: PupilFunction, workers: int | None) -> np.ndarray:
+    """Calculate the amplitude spread function, centered at index `grid_size // 2`."""
+    axes = (-2, -1)
+
+    return np.fft.fftshift(_fft2(np.fft.ifftshift(pupil.field, axes=axes), workers), axes=axes)
+
+
+def psf(pupil: PupilFunction, *, normalize: bool = False, workers: int | None = None) -> PSF:
+    """Calculate the point spread function from a pupil function.
+
+    Parameters
+    ----------
+    pupil : PupilFunction
+        The pupil function.
+    normalize : bool
+        If True, the peak of each PSF is normalized to 1. Otherwise, the PSF is normalized such that the central
+        intensity of an unaberrated pupil is 1. Defaults to False.
+    workers : int | None
+        Number of worker threads for the FFT. Only used if SciPy is installed. Defaults to None, in which case a single
+        thread is used.
+
+    Returns
+    -------
+    PSF
+        The point spread function.
+    """
+    intensity = np.abs(_amplitude_spread(pupil, workers)) ** 2
+
+    # The central intensity of an unaberrated pupil is the squared sum of the pupil amplitudes
+    reference = np.sum(np.abs(pupil.field), axis=(-2, -1)) ** 2
+    center = pupil.grid_size // 2
+    strehl_ratio = intensity[..., center, center] / reference
+
+    if normalize:
+        intensity /= np.max(intensity, axis=(-2, -1), keepdims=True)
+    else:
+        intensity /= reference[..., None, None]
+
+    return PSF(intensity=intensity, spacing=pupil.image_step, strehl_ratio=strehl_ratio)
+
+
+def mtf(pupil: PupilFunction, *, workers: int | None = None) -> MTF:
+    """Calculate the optical transfer function from a pupil function.
+
+    The OTF is calculated as the inverse Fourier transform of the PSF, i.e. the autocorrelation of the pupil function.
+
+    Parameters
+    ----------
+    pupil : PupilFunction
+        The pupil function. Should be padded by a factor of at least 2 to avoid aliasing.
+    workers : int | None
+        Number of worker threads for the FFT. Only used if SciPy is installed. Defaults to None, in which case a single
+        thread is used.
+
+    Returns
+    -------
+    MTF
+        The optical transfer function.
+    """
+    axes = (-2, -1)
+    intensity = np.abs(_fft2(np.fft.ifftshift(pupil.field, axes=axes), workers)) ** 2
+    otf = _ifft2(intensity, workers)
+    otf /= otf[..., :1, :1]
+
+    return MTF(otf=np.fft.fftshift(otf, axes=axes), spacing=pupil.frequency_step)
+
+
+def through_focus_mtf(
+    wavefront: pd.DataFrame,
+    defocus: ArrayLike,
+    frequency: float,
+    *,
+    padding: float = 2.0,
+    workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the tangential and sagittal MTF at a single frequency for a range of defocus coefficients.
+
+    All defocus coefficients are evaluated in one batched FFT. Use `focal_shift_to_defocus` to convert focal shifts to
+    defocus coefficients.
+
+    Parameters
+    ----------
+    wavefront : pd.DataFrame
+        The data of a `WavefrontMap` result, see `pupil_function`.
+    defocus : ArrayLike
+        Defocus coefficients in waves.
+    frequency : float
+        Spatial frequency in units of the cutoff frequency. The MTF is linearly interpolated between samples.
+    padding : float
+        Padding factor of the pupil function, see `pupil_function`. Defaults to 2.
+    workers : int | None
+        Number of worker threads for the FFT. Only used if SciPy is installed. Defaults to None.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The tangential and sagittal MTF, both with the shape of `defocus`.
+    """
+    result = mtf(pupil_function(wavefront, defocus=defocus, padding=padding), workers=workers)
+    position = frequency / result.spacing
+    index = min(int(position), len(result.frequency) - 2)
+    weight = position - index
+
+    def interpolate(profile: np.ndarray) -> np.ndarray:
+        return (1 - weight) * profile[..., index] + weight * profile[..., index + 1]
+
+    return interpolate(result.tangential), interpolate(result.sagittal)
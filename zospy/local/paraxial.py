@@ -0,0 +1,419 @@
+"""First-order (paraxial) optics.
+
+Paraxial ray traces and system matrices are calculated with the y-nu method, where `y` is the ray height and `nu` is
+the reduced ray angle (refractive index times paraxial ray angle). All calculations are vectorized over wavelengths and
+over the leading dimensions of the prescription (e.g. configurations); results have shape `(..., n_wavelengths)`.
+
+Surface powers are derived from the vertex curvature of each surface. The second order term of even aspheres is
+included, paraxial surfaces act as ideal thin lenses and coordinate breaks are ignored, in line with OpticStudio's
+default 'Ignore Coordinate Breaks' paraxial ray setting.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from zospy.local.prescription import Prescription
+
+__all__ = (
+    "CardinalPoints",
+    "FirstOrderData",
+    "cardinal_points",
+    "first_order_data",
+    "surface_powers",
+    "system_matrix",
+    "trace",
+)
+
+
+def surface_powers(prescription: Prescription) -> np.ndarray:
+    """Calculate the paraxial power of each surface.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+
+    Returns
+    -------
+    np.ndarray
+        Surface powers with shape `(..., n_surfaces, n_wavelengths)`.
+    """
+    index = prescription.signed_index
+    index_before = np.concatenate([index[..., :1, :], index[..., :-1, :]], axis=-2)
+
+    curvature = prescription.curvature
+    parameters = prescription.parameters
+    surface_type = prescription.surface_type
+
+    # The second order term of an even asphere adds to the paraxial curvature
+    curvature = np.where(surface_type == "EvenAsphere", curvature + 2 * parameters[..., 0], curvature)
+    curvature = np.where(surface_type == "CoordinateBreak", 0.0, curvature)
+
+    power = (index - index_before) * curvature[..., None]
+
+    with np.errstate(divide="ignore"):
+        paraxial_power = np.where(parameters[..., 0] != 0, 1 / parameters[..., 0], 0.0)
+
+    return np.where((surface_type == "Paraxial")[:, None], paraxial_power[..., None], power)
+
+
+def _reduced_thickness(prescription: Prescription) -> np.ndarray:
+    """Reduced thickness (thickness divided by refractive index) after each surface."""
+    return prescription.thickness[..., None] / prescription.signed_index
+
+
+def _surface_range(prescription: Prescription, first_surface: int, last_surface: int | None) -> range:
+    last_surface = prescription.image_surface - 1 if last_surface is None else last_surface
+
+    if not 0 < first_surface <= last_surface < prescription.n_surfaces:
+        raise ValueError(
+            f"Invalid surface range {first_surface} to {last_surface} for a system with {prescription.n_surfaces} "
+            f"surfaces."
+        )
+
+    return range(first_surface, last_surface + 1)
+
+
+def _matrix_elements(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    return matrix[..., 0, 0], matrix[..., 0, 1], matrix[..., 1, 0], matrix[..., 1, 1]
+
+
+def system_matrix(prescription: Prescription, first_surface: int = 1, last_surface: int | None = None) -> np.ndarray:
+    """Calculate the paraxial system matrix of a range of surfaces.
+
+    The system matrix maps the ray height and reduced angle `(y, nu)` just before `first_surface` to `(y, nu)` just
+    after `last_surface`.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+    first_surface : int
+        First surface of the range. Defaults to 1.
+    last_surface : int | None
+        Last surface of the range. Defaults to the last surface before the image surface.
+
+    Returns
+    -------
+    np.ndarray
+        System matrices `[[A, B], [C, D]]` with shape `(..., n_wavelengths, 2, 2)`.
+    """
+    surfaces = _surface_range(prescription, first_surface, last_surface)
+    power = surface_powers(prescription)
+    reduced_thickness = _reduced_thickness(prescription)
+
+    a = np.ones_like(power[..., 0, :])
+    b = np.zeros_like(a)
+    c = np.zeros_like(a)
+    d = np.ones_like(a)
+
+    for surface in surfaces:
+        if surface != surfaces.start:
+            tau = reduced_thickness[..., surface - 1, :]
+            a, b = a + tau * c, b + tau * d
+
+        phi = power[..., surface, :]
+        c, d = c - phi * a, d - phi * b
+
+    return np.stack([np.stack([a, b], axis=-1), np.stack([c, d], axis=-1)], axis=-2)
+
+
+def trace(
+    prescription: Prescription,
+    y: float | np.ndarray,
+    nu: float | np.ndarray,
+    first_surface: int = 1,
+    last_surface: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace a paraxial ray through a range of surfaces.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+    y : float | np.ndarray
+        Ray height at `first_surface`. Must be broadcastable to `(..., n_wavelengths)`.
+    nu : float | np.ndarray
+        Reduced ray angle just before `first_surface`. Must be broadcastable to `(..., n_wavelengths)`.
+    first_surface : int
+        First surface of the range. Defaults to 1.
+    last_surface : int | None
+        Last surface of the range. Defaults to the image surface.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Ray heights at each surface and reduced ray angles after each surface, both with shape
+        `(..., n_traced_surfaces, n_wavelengths)`.
+    """
+    last_surface = prescription.image_surface if last_surface is None else last_surface
+    surfaces = _surface_range(prescription, first_surface, last_surface)
+    power = surface_powers(prescription)
+    reduced_thickness = _reduced_thickness(prescription)
+
+    shape = power[..., 0, :].shape
+    y = np.broadcast_to(np.asarray(y, dtype=np.float64), shape)
+    nu = np.broadcast_to(np.asarray(nu, dtype=np.float64), shape)
+
+    heights, angles = [], []
+
+    for surface in surfaces:
+        if surface != surfaces.start:
+            y = y + reduced_thickness[..., surface - 1, :] * nu
+
+        nu = nu - power[..., surface, :] * y
+
+        heights.append(y)
+        angles.append(nu)
+
+    return np.stack(heights, axis=-2), np.stack(angles, axis=-2)
+
+
+@dataclass(frozen=True)
+class CardinalPoints:
+    """Cardinal points of a range of surfaces.
+
+    Object space positions are relative to the first surface of the range, image space positions are relative to the
+    last surface of the range. All attributes have shape `(..., n_wavelengths)`.
+    """
+
+    focal_length_object: np.ndarray
+    focal_length_image: np.ndarray
+    focal_plane_object: np.ndarray
+    focal_plane_image: np.ndarray
+    principal_plane_object: np.ndarray
+    principal_plane_image: np.ndarray
+    anti_principal_plane_object: np.ndarray
+    anti_principal_plane_image: np.ndarray
+    nodal_plane_object: np.ndarray
+    nodal_plane_image: np.ndarray
+    anti_nodal_plane_object: np.ndarray
+    anti_nodal_plane_image: np.ndarray
+
+
+def cardinal_points(
+    prescription: Prescription, first_surface: int = 1, last_surface: int | None = None
+) -> CardinalPoints:
+    """Calculate the cardinal points of a range of surfaces.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+    first_surface : int
+        First surface of the range. Defaults to 1.
+    last_surface : int | None
+        Last surface of the range. Defaults to the last surface before the image surface.
+
+    Returns
+    -------
+    CardinalPoints
+        The cardinal points, equivalent to the output of the `CardinalPoints` analysis.
+    """
+    surfaces = _surface_range(prescription, first_surface, last_surface)
+    a, _, c, d = _matrix_elements(system_matrix(prescription, surfaces.start, surfaces.stop - 1))
+
+    index = prescription.signed_index
+    n_object = index[..., surfaces.start - 1, :]
+    n_image = index[..., surfaces.stop - 1, :]
+
+    with np.errstate(divide="ignore"):
+        focal_length_object = n_object / c
+        focal_length_image = -n_image / c
+        focal_plane_object = d * n_object / c
+        focal_plane_image = -a * n_image / c
+
+    return CardinalPoints(
+        focal_length_object=focal_length_object,
+        focal_length_image=focal_length_image,
+        focal_plane_object=focal_plane_object,
+        focal_plane_image=focal_plane_image,
+        principal_plane_object=focal_plane_object - focal_length_object,
+        principal_plane_image=focal_plane_image - focal_length_image,
+        anti_principal_plane_object=focal_plane_object + focal_length_object,
+        anti_principal_plane_image=focal_plane_image + focal_length_image,
+        nodal_plane_object=focal_plane_object + focal_length_image,
+        nodal_plane_image=focal_plane_image + focal_length_object,
+        anti_nodal_plane_object=focal_plane_object - focal_length_image,
+        anti_nodal_plane_image=focal_plane_image - focal_length_object,
+    )
+
+
+@dataclass(frozen=True)
+class FirstOrderData:
+    """First-order properties of a lens system.
+
+    The attributes correspond to the paraxial values reported by the `SystemData` analysis. The entrance pupil position
+    is relative to the first surface, the exit pupil position is relative to the image surface. All attributes except
+    `total_track` have shape `(..., n_wavelengths)`.
+    """
+
+    effective_focal_length_air: np.ndarray
+    effective_focal_length_image: np.ndarray
+    back_focal_length: np.ndarray
+    total_track: np.ndarray
+    image_space_f_number: np.ndarray
+    paraxial_working_f_number: np.ndarray
+    image_space_na: np.ndarray
+    object_space_na: np.ndarray
+    stop_radius: np.ndarray
+    paraxial_image_height: np.ndarray
+    paraxial_magnification: np.ndarray
+    entrance_pupil_diameter: np.ndarray
+    entrance_pupil_position: np.ndarray
+    exit_pupil_diameter: np.ndarray
+    exit_pupil_position: np.ndarray
+    angular_magnification: np.ndarray
+
+
+def _entrance_pupil_radius(
+    prescription: Prescription,
+    stop_magnification: np.ndarray,
+    effective_focal_length: np.ndarray,
+    unit_marginal_angle: np.ndarray,
+    object_distance: np.ndarray,
+    entrance_pupil_position: np.ndarray,
+) -> np.ndarray:
+    """Calculate the entrance pupil radius from the system aperture.
+
+    `stop_magnification` is the paraxial magnification from the entrance pupil to the stop, `unit_marginal_angle` is
+    the image space angle of a marginal ray through the edge of an entrance pupil with unit radius.
+    """
+    n_object = prescription.index[..., 0, :]
+    n_image = prescription.index[..., -2, :]
+    value = prescription.aperture_value
+
+    match prescription.aperture_type:
+        case "EntrancePupilDiameter":
+            return np.full(n_object.shape, value / 2)
+        case "FloatByStopSize":
+            return prescription.semi_diameter[..., prescription.stop, None] / np.abs(stop_magnification)
+        case "ImageSpaceFNum":
+            return np.abs(effective_focal_length) / (2 * value)
+        case "ParaxialWorkingFNum":
+            return 1 / (2 * n_image * np.abs(unit_marginal_angle) * value)
+        case "ObjectSpaceNA":
+            return np.tan(np.arcsin(value / n_object)) * (object_distance + entrance_pupil_position)
+        case "ObjectConeAngle":
+            return np.tan(np.deg2rad(value)) * (object_distance + entrance_pupil_position)
+        case _:
+            raise ValueError(f"Unsupported aperture type: {prescription.aperture_type}")
+
+
+def _chief_ray_angle(
+    prescription: Prescription, object_distance: np.ndarray, entrance_pupil_position: np.ndarray
+) -> np.ndarray:
+    """Calculate the object space paraxial chief ray angle for the maximum field."""
+    max_field = np.max(np.hypot(prescription.fields[:, 0], prescription.fields[:, 1]))
+
+    match prescription.field_type:
+        case "Angle":
+            return np.full(object_distance.shape, np.tan(np.deg2rad(max_field)))
+        case "ObjectHeight":
+            return -max_field / (object_distance + entrance_pupil_position)
+        case _:
+            return np.full(object_distance.shape, np.nan)
+
+
+def first_order_data(prescription: Prescription) -> FirstOrderData:
+    """Calculate the first-order properties of a lens system.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+
+    Returns
+    -------
+    FirstOrderData
+        The first-order properties, equivalent to the paraxial data reported by the `SystemData` analysis.
+
+    Raises
+    ------
+    ValueError
+        If the aperture type of the prescription is not supported.
+    """
+    last_surface = prescription.image_surface - 1
+    stop = prescription.stop
+    index = prescription.signed_index
+    n_object = index[..., 0, :]
+    n_image = index[..., last_surface, :]
+
+    object_distance = np.broadcast_to(prescription.thickness[..., 0, None], n_object.shape)
+    infinite_object = np.isinf(object_distance)
+    image_distance = prescription.thickness[..., last_surface, None]
+
+    _, _, c, _ = _matrix_elements(system_matrix(prescription))
+
+    with np.errstate(divide="ignore"):
+        efl_air = -1 / c
+        efl_image = -n_image / c
+
+    # Entrance pupil: image of the stop through the surfaces in front of it
+    if stop > 1:
+        a, b, c_front, d = _matrix_elements(system_matrix(prescription, 1, stop - 1))
+        tau = prescription.thickness[..., stop - 1, None] / index[..., stop - 1, :]
+        stop_magnification, b = a + tau * c_front, b + tau * d
+    else:
+        stop_magnification, b = np.ones_like(n_object), np.zeros_like(n_object)
+
+    entrance_pupil_position = n_object * b / stop_magnification
+
+    # Marginal ray through the edge of an entrance pupil with unit radius
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_marginal_u = np.where(infinite_object, 0.0, 1 / (object_distance + entrance_pupil_position))
+        unit_marginal_y = np.where(infinite_object, 1.0, unit_marginal_u * object_distance)
+    y, nu = trace(prescription, unit_marginal_y, n_object * unit_marginal_u, last_surface=last_surface)
+    unit_marginal_angle = nu[..., -1, :] / n_image
+    back_focal_length = -y[..., -1, :] / unit_marginal_angle
+
+    entrance_pupil_radius = _entrance_pupil_radius(
+        prescription, stop_magnification, efl_air, unit_marginal_angle, object_distance, entrance_pupil_position
+    )
+    marginal_angle = unit_marginal_angle * entrance_pupil_radius
+
+    # Exit pupil: image of the stop through the surfaces behind it
+    _, b, _, d = _matrix_elements(system_matrix(prescription, stop, last_surface))
+    stop_radius = entrance_pupil_radius * np.abs(stop_magnification)
+
+    # Chief ray through the center of the entrance pupil, with unit angle
+    y, nu = trace(prescription, -entrance_pupil_position, n_object, last_surface=last_surface)
+    angular_magnification = nu[..., -1, :] / n_image
+    chief_u = _chief_ray_angle(prescription, object_distance, entrance_pupil_position)
+
+    if prescription.field_type == "ParaxialImageHeight":
+        paraxial_image_height = np.full(n_object.shape, np.max(np.hypot(*prescription.fields.T)))
+    else:
+        paraxial_image_height = chief_u * (y[..., -1, :] + angular_magnification * back_focal_length)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        object_space_na = np.where(
+            infinite_object, 0.0, np.abs(n_object) * np.sin(np.arctan(np.abs(unit_marginal_u * entrance_pupil_radius)))
+        )
+        paraxial_magnification = np.where(
+            infinite_object, 0.0, n_object * unit_marginal_u / (n_image * unit_marginal_angle)
+        )
+
+    return FirstOrderData(
+        effective_focal_length_air=efl_air,
+        effective_focal_length_image=efl_image,
+        back_focal_length=back_focal_length,
+        total_track=np.sum(prescription.thickness[..., 1 : prescription.image_surface], axis=-1),
+        image_space_f_number=np.abs(efl_air) / (2 * entrance_pupil_radius),
+        paraxial_working_f_number=1 / (2 * np.abs(n_image * marginal_angle)),
+        image_space_na=np.abs(n_image) * np.sin(np.arctan(np.abs(marginal_angle))),
+        object_space_na=object_space_na,
+        stop_radius=stop_radius,
+        paraxial_image_height=paraxial_image_height,
+        paraxial_magnification=paraxial_magnification,
+        entrance_pupil_diameter=2 * entrance_pupil_radius,
+        entrance_pupil_position=entrance_pupil_position,
+        exit_pupil_diameter=2 * np.abs(stop_radius / d),
+        exit_pupil_position=-b * n_image / d - image_distance,
+        angular_magnification=angular_magnification,
+    )
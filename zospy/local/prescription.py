@@ -0,0 +1,298 @@
+"""Prescription data for local calculations.
+
+A `Prescription` holds the sequential lens data that is needed for calculations outside OpticStudio: surface types,
+radii, thicknesses, conics, surface parameters and refractive indices at all system wavelengths. It can be read from
+an OpticStudio system in a single pass using `read_prescription`, or constructed directly from NumPy arrays.
+
+Numeric surface data may have leading dimensions, e.g. one per configuration. All local calculations broadcast over
+these dimensions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from zospy.api import constants
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = ("Prescription", "read_prescription")
+
+N_PARAMETERS = 8
+"""Number of surface parameters (`Par1` to `Par8`) that is stored in a prescription."""
+
+_PARAMETER_SURFACE_TYPES = ("EvenAsphere", "CoordinateBreak", "Paraxial")
+
+
+@dataclass(frozen=True)
+class Prescription:
+    """Sequential lens prescription.
+
+    Surface 0 is the object surface and the last surface is the image surface. Numeric surface data has shape
+    `(..., n_surfaces)`, where the leading dimensions (e.g. configurations) are shared by all numeric fields.
+
+    Attributes
+    ----------
+    surface_type : np.ndarray
+        Surface type names, e.g. 'Standard', 'EvenAsphere', 'CoordinateBreak' or 'Paraxial'. Shape `(n_surfaces,)`.
+    radius : np.ndarray
+        Radius of curvature of each surface. Flat surfaces have an infinite radius.
+    thickness : np.ndarray
+        Thickness after each surface.
+    index : np.ndarray
+        Refractive index of the medium after each surface, at each wavelength. Shape `(..., n_surfaces, n_wavelengths)`.
+        Mirrors do not change the refractive index; the change of propagation direction is defined by `mirror`.
+    wavelengths : np.ndarray
+        System wavelengths in µm. Shape `(n_wavelengths,)`.
+    conic : np.ndarray | None
+        Conic constant of each surface. Defaults to zero for all surfaces.
+    semi_diameter : np.ndarray | None
+        Semi-diameter of each surface. Defaults to infinity for all surfaces.
+    parameters : np.ndarray | None
+        Surface parameters `Par1` to `Par8`. Shape `(..., n_surfaces, 8)`. Defaults to zero for all surfaces.
+    mirror : np.ndarray | None
+        Whether each surface is a mirror. Shape `(n_surfaces,)`. Defaults to False for all surfaces.
+    stop : int
+        Surface number of the stop surface. Defaults to 1.
+    primary_wavelength : int
+        Wavelength number (1-based) of the primary wavelength. Defaults to 1.
+    aperture_type : str
+        System aperture type, e.g. 'EntrancePupilDiameter' or 'FloatByStopSize'. Defaults to
+        'EntrancePupilDiameter'.
+    aperture_value : float
+        System aperture value. Defaults to 1.
+    field_type : str
+        Field type, e.g. 'Angle' or 'ObjectHeight'. Defaults to 'Angle'.
+    fields : np.ndarray | None
+        Field coordinates (x, y). Shape `(n_fields, 2)`. Defaults to a single on-axis field.
+    comment : Sequence[str] | None
+        Surface comments. Defaults to empty comments.
+    """
+
+    surface_type: np.ndarray
+    radius: np.ndarray
+    thickness: np.ndarray
+    index: np.ndarray
+    wavelengths: np.ndarray
+    conic: np.ndarray | None = None
+    semi_diameter: np.ndarray | None = None
+    parameters: np.ndarray | None = None
+    mirror: np.ndarray | None = None
+    stop: int = 1
+    primary_wavelength: int = 1
+    aperture_type: str = "EntrancePupilDiameter"
+    aperture_value: float = 1.0
+    field_type: str = "Angle"
+    fields: np.ndarray | None = None
+    comment: Sequence[str] | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        """Convert the prescription data to arrays and fill in the defaults."""
+        surface_type = np.asarray(self.surface_type, dtype=str)
+        radius = np.asarray(self.radius, dtype=np.float64)
+        shape = radius.shape
+
+        def _set(name, value):
+            object.__setattr__(self, name, value)
+
+        _set("surface_type", surface_type)
+        _set("radius", radius)
+        _set("thickness", np.broadcast_to(np.asarray(self.thickness, dtype=np.float64), shape))
+        _set("wavelengths", np.atleast_1d(np.asarray(self.wavelengths, dtype=np.float64)))
+        _set(
+            "index",
+            np.broadcast_to(np.asarray(self.index, dtype=np.float64), (*shape, len(self.wavelengths))),
+        )
+        _set("conic", np.zeros(shape) if self.conic is None else np.broadcast_to(np.asarray(self.conic, float), shape))
+        _set(
+            "semi_diameter",
+            np.full(shape, np.inf)
+            if self.semi_diameter is None
+            else np.broadcast_to(np.asarray(self.semi_diameter, dtype=np.float64), shape),
+        )
+        _set(
+            "parameters",
+            np.zeros((*shape, N_PARAMETERS))
+            if self.parameters is None
+            else np.broadcast_to(np.asarray(self.parameters, dtype=np.float64), (*shape, N_PARAMETERS)),
+        )
+        _set(
+            "mirror",
+            np.zeros(len(surface_type), dtype=bool) if self.mirror is None else np.asarray(self.mirror, dtype=bool),
+        )
+        _set("fields", np.zeros((1, 2)) if self.fields is None else np.asarray(self.fields, dtype=np.float64))
+        _set("comment", [""] * len(surface_type) if self.comment is None else list(self.comment))
+
+        if shape[-1] != len(surface_type):
+            raise ValueError(f"Expected {len(surface_type)} surfaces, got surface data with shape {shape}.")
+
+        if not 0 < self.stop < len(surface_type) - 1:
+            raise ValueError(f"The stop surface should be between 1 and {len(surface_type) - 2}, got {self.stop}.")
+
+    @property
+    def n_surfaces(self) -> int:
+        """Number of surfaces, including the object and image surfaces."""
+        return len(self.surface_type)
+
+    @property
+    def n_wavelengths(self) -> int:
+        """Number of wavelengths."""
+        return len(self.wavelengths)
+
+    @property
+    def image_surface(self) -> int:
+        """Surface number of the image surface."""
+        return self.n_surfaces - 1
+
+    @property
+    def curvature(self) -> np.ndarray:
+        """Curvature of each surface. Flat surfaces (infinite or zero radius) have zero curvature."""
+        with np.errstate(divide="ignore"):
+            curvature = 1 / self.radius
+
+        return np.where(np.isfinite(curvature), curvature, 0.0)
+
+    @property
+    def direction(self) -> np.ndarray:
+        """Propagation direction (+1 or -1) after each surface, taking mirrors into account."""
+        return np.where(np.cumsum(self.mirror) % 2 == 0, 1.0, -1.0)
+
+    @property
+    def signed_index(self) -> np.ndarray:
+        """Refractive index after each surface, negated after an odd number of mirrors."""
+        return self.index * self.direction[:, None]
+
+
+_NUMERIC_COLUMNS = ("radius", "thickness", "conic", "semi_diameter", "parameters", "index")
+
+
+def _read_parameters(surface: _ZOSAPI.Editors.LDE.ILDERow) -> list[float]:
+    parameters = [0.0] * N_PARAMETERS
+
+    for p in range(N_PARAMETERS):
+        cell = surface.GetSurfaceCell(getattr(constants.Editors.LDE.SurfaceColumn, f"Par{p + 1}"))
+
+        if str(cell.DataType) == "Double":
+            parameters[p] = cell.DoubleValue
+        elif str(cell.DataType) == "Integer":
+            parameters[p] = cell.IntegerValue
+
+    return parameters
+
+
+def _read_configuration(oss: OpticStudioSystem, n_wavelengths: int) -> dict[str, list | np.ndarray]:
+    """Read the surface data of the current configuration in a single pass over the Lens Data Editor."""
+    # Only import the OpticStudio editor functions when a prescription is read from OpticStudio
+    from zospy.functions.lde import snapshot  # ruff: ignore[import-outside-top-level]
+
+    lde = oss.LDE
+    lens_data = snapshot(oss, columns=("Radius", "Thickness", "Conic", "SemiDiameter"))
+    parameters = np.zeros((len(lens_data), N_PARAMETERS))
+
+    for i in np.flatnonzero(np.isin(lens_data.surface_type, _PARAMETER_SURFACE_TYPES)):
+        parameters[i] = _read_parameters(lde.GetSurfaceAt(int(i)))
+
+    return {
+        "surface_type": lens_data.surface_type.tolist(),
+        "material": lens_data.material.tolist(),
+        "comment": lens_data.comment.tolist(),
+        "radius": lens_data["Radius"],
+        "thickness": lens_data["Thickness"],
+        "conic": lens_data["Conic"],
+        "semi_diameter": lens_data["SemiDiameter"],
+        "parameters": parameters,
+        "index": [list(lde.GetIndex(i, n_wavelengths, None)[1]) for i in range(len(lens_data))],
+    }
+
+
+def read_prescription(oss: OpticStudioSystem, configurations: Sequence[int] | None = None) -> Prescription:
+    """Read the sequential prescription of an OpticStudio system.
+
+    All lens data is read in a single pass over the Lens Data Editor. If multiple configurations are requested, the
+    numeric data of all configurations is stacked along the first dimension; the surface types must be the same in all
+    configurations. The current configuration is restored afterwards.
+
+    Parameters
+    ----------
+    oss : OpticStudioSystem
+        The OpticStudio system.
+    configurations : Sequence[int] | None
+        Configuration numbers to read. If None, only the current configuration is read and the numeric data has no
+        configuration dimension. Defaults to None.
+
+    Returns
+    -------
+    Prescription
+        The prescription of the system.
+
+    Raises
+    ------
+    ValueError
+        If the surface types differ between configurations.
+    """
+    wavelengths = oss.SystemData.Wavelengths
+    n_wavelengths = wavelengths.NumberOfWavelengths
+    wavelength_values = [wavelengths.GetWavelength(w + 1).Wavelength for w in range(n_wavelengths)]
+    primary_wavelength = next(
+        (w + 1 for w in range(n_wavelengths) if wavelengths.GetWavelength(w + 1).IsPrimary),
+        1,
+    )
+
+    fields = oss.SystemData.Fields
+    field_values = [(fields.GetField(f + 1).X, fields.GetField(f + 1).Y) for f in range(fields.NumberOfFields)]
+
+    if configurations is None:
+        data = _read_configuration(oss, n_wavelengths)
+        numeric = {name: np.asarray(data[name], dtype=np.float64) for name in _NUMERIC_COLUMNS}
+    else:
+        current_configuration = oss.MCE.CurrentConfiguration
+        configuration_data = []
+
+        try:
+            for configuration in configurations:
+                oss.MCE.SetCurrentConfiguration(configuration)
+                configuration_data.append(_read_configuration(oss, n_wavelengths))
+        finally:
+            oss.MCE.SetCurrentConfiguration(current_configuration)
+
+        data = configuration_data[0]
+
+        if any(d["surface_type"] != data["surface_type"] for d in configuration_data):
+            raise ValueError("The surface types differ between configurations.")
+
+        numeric = {
+            name: np.asarray([d[name] for d in configuration_data], dtype=np.float64) for name in _NUMERIC_COLUMNS
+        }
+
+    mirror = np.array([material.upper() == "MIRROR" for material in data["material"]])
+    index = numeric["index"]
+
+    # Mirrors do not change the medium, the direction change is stored separately
+    for i in np.flatnonzero(mirror):
+        index[..., i, :] = index[..., i - 1, :]
+
+    return Prescription(
+        surface_type=data["surface_type"],
+        radius=numeric["radius"],
+        thickness=numeric["thickness"],
+        index=index,
+        wavelengths=wavelength_values,
+        conic=numeric["conic"],
+        semi_diameter=numeric["semi_diameter"],
+        parameters=numeric["parameters"],
+        mirror=mirror,
+        stop=oss.LDE.StopSurface,
+        primary_wavelength=primary_wavelength,
+        aperture_type=str(oss.SystemData.Aperture.ApertureType),
+        aperture_value=oss.SystemData.Aperture.ApertureValue,
+        field_type=str(fields.GetFieldType()),
+        fields=field_values,
+        comment=data["comment"],
+    )
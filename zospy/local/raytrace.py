@@ -0,0 +1,664 @@
+"""Real ray tracing.
+
+Rays are traced through sequential systems with NumPy, vectorized over rays, wavelengths and the leading dimensions of
+the prescription (e.g. configurations). Supported surface types are 'Standard' (including conics), 'EvenAsphere',
+'CoordinateBreak' and 'Paraxial'. Results are returned as structured arrays with the same fields as the output of the
+OpticStudio batch ray trace tools in `zospy.tools.raytrace`, with shape `(..., *ray_shape, n_wavelengths)`.
+
+Normalized rays are aimed at the paraxial entrance pupil of the primary wavelength, which corresponds to OpticStudio's
+behavior with ray aiming turned off. Surface apertures are not modelled, so the vignetting code is always zero. Lens
+units are assumed to be millimeters.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from zospy.local.paraxial import first_order_data
+from zospy.utils.raytrace_dtypes import (
+    DIRECT_RAY_DTYPE,
+    DIRECT_UNPOL_RESULT_DTYPE,
+    NORM_RAY_DTYPE,
+    NORM_UNPOL_RESULT_DTYPE,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+    from zospy.local.paraxial import FirstOrderData
+    from zospy.local.prescription import Prescription
+
+__all__ = ("SUPPORTED_SURFACE_TYPES", "model_glass_index", "trace_direct", "trace_normalized")
+
+SUPPORTED_SURFACE_TYPES = ("Standard", "EvenAsphere", "CoordinateBreak", "Paraxial")
+"""Surface types that are supported by the real ray tracer."""
+
+_WAVELENGTH_D = 0.5875618
+_WAVELENGTH_F = 0.4861327
+_WAVELENGTH_C = 0.6562725
+_WAVELENGTH_G = 0.4358343
+
+_MAX_ITERATIONS = 20
+_TOLERANCE = 1e-12
+
+
+def model_glass_index(
+    refractive_index: float | np.ndarray,
+    abbe_number: float | np.ndarray,
+    partial_dispersion: float | np.ndarray,
+    wavelengths: ArrayLike,
+) -> np.ndarray:
+    """Calculate the refractive index of a model glass.
+
+    The dispersion is approximated with a three-term Cauchy formula `n = A + B / λ² + C / λ⁴`, which reproduces the
+    refractive index at the d-line, the Abbe number and the partial dispersion `P_g,F`. The partial dispersion is
+    taken relative to the normal line `P_g,F = 0.6438 - 0.001682 * V_d`. The parameters correspond to those of
+    `zospy.solvers.material_model`; an Abbe number of zero results in a non-dispersive material.
+
+    Parameters
+    ----------
+    refractive_index : float | np.ndarray
+        Refractive index at the d-line (587.56 nm).
+    abbe_number : float | np.ndarray
+        Abbe number. Zero for a non-dispersive material.
+    partial_dispersion : float | np.ndarray
+        Deviation of the partial dispersion from the normal line.
+    wavelengths : ArrayLike
+        Wavelengths in µm.
+
+    Returns
+    -------
+    np.ndarray
+        Refractive index at each wavelength, with shape `(..., n_wavelengths)`.
+    """
+    nd = np.asarray(refractive_index, dtype=np.float64)[..., None]
+    vd = np.asarray(abbe_number, dtype=np.float64)[..., None]
+    dpgf = np.asarray(partial_dispersion, dtype=np.float64)[..., None]
+    wavelengths = np.atleast_1d(np.asarray(wavelengths, dtype=np.float64))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dispersion = np.where(vd == 0, 0.0, (nd - 1) / vd)
+
+    # Solve B and C from n_F - n_C and n_g - n_F, then A from n_d
+    p = 0.6438 - 0.001682 * vd + dpgf
+    a11, a12 = _WAVELENGTH_F**-2 - _WAVELENGTH_C**-2, _WAVELENGTH_F**-4 - _WAVELENGTH_C**-4
+    a21, a22 = _WAVELENGTH_G**-2 - _WAVELENGTH_F**-2, _WAVELENGTH_G**-4 - _WAVELENGTH_F**-4
+    determinant = a11 * a22 - a12 * a21
+    b = (a22 * dispersion - a12 * p * dispersion) / determinant
+    c = (a11 * p * dispersion - a21 * dispersion) / determinant
+    a = nd - b * _WAVELENGTH_D**-2 - c * _WAVELENGTH_D**-4
+
+    return a + b * wavelengths**-2 + c * wavelengths**-4
+
+
+def _expand(value: np.ndarray, n_ray_dims: int, n_trailing_dims: int = 0) -> np.ndarray:
+    """Expand surface data with shape `(..., *trailing)` to `(..., *[1] * n_ray_dims, 1, *trailing)`."""
+    value = np.asarray(value)
+    split = value.ndim - n_trailing_dims
+    return value.reshape(value.shape[:split] + (1,) * (n_ray_dims + 1) + value.shape[split:])
+
+
+def _expand_index(value: np.ndarray, n_ray_dims: int) -> np.ndarray:
+    """Expand wavelength data with shape `(..., n_wavelengths)` to `(..., *[1] * n_ray_dims, n_wavelengths)`."""
+    value = np.asarray(value)
+    return value.reshape(value.shape[:-1] + (1,) * n_ray_dims + value.shape[-1:])
+
+
+def _ray_columns(rays: ArrayLike, input_dtype: np.dtype) -> list[np.ndarray]:
+    """Split input rays into one array per input field."""
+    rays = np.asanyarray(rays)
+
+    if rays.dtype.names is not None:
+        missing = [name for name in input_dtype.names if name not in rays.dtype.names]
+
+        if missing:
+            raise ValueError(f"rays should contain the field '{missing[0]}'.")
+
+        return [np.asarray(rays[name], dtype=np.float64) for name in input_dtype.names]
+
+    n_fields = len(input_dtype.names)
+
+    if rays.ndim == 0 or rays.shape[-1] != n_fields:
+        raise ValueError(f"rays should have shape (..., {n_fields}), got {rays.shape}.")
+
+    return [np.asarray(rays[..., i], dtype=np.float64) for i in range(n_fields)]
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    return vector / np.linalg.norm(vector, axis=-1, keepdims=True)
+
+
+def _rotation(angle: np.ndarray, axis: int) -> np.ndarray:
+    """Rotation matrices for a rotation of the coordinate axes by `angle` (in degrees) about `axis`."""
+    angle = np.deg2rad(angle)
+    cos, sin = np.cos(angle), np.sin(angle)
+    i, j = [k for k in range(3) if k != axis]
+
+    rotation = np.zeros((*np.shape(angle), 3, 3))
+    rotation[..., axis, axis] = 1
+    rotation[..., i, i] = cos
+    rotation[..., j, j] = cos
+    rotation[..., i, j] = -sin
+    rotation[..., j, i] = sin
+
+    return rotation
+
+
+def _coordinate_break(parameters: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the decenter, rotation and order of a coordinate break from its parameters.
+
+    The columns of the rotation matrix are the axes of the new coordinate system, expressed in the old one.
+    """
+    decenter = np.stack([parameters[..., 0], parameters[..., 1], np.zeros(parameters.shape[:-1])], axis=-1)
+    rotation_x, rotation_y, rotation_z = (_rotation(parameters[..., 2 + axis], axis) for axis in range(3))
+    order = parameters[..., 5] != 0
+
+    rotation = np.where(
+        order[..., None, None],
+        rotation_z @ rotation_y @ rotation_x,
+        rotation_x @ rotation_y @ rotation_z,
+    )
+
+    return decenter, rotation, order
+
+
+def _surface_frames(prescription: Prescription, last_surface: int) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the rotation and offset of the local coordinate system of a surface, relative to surface 1."""
+    shape = prescription.radius.shape[:-1]
+    rotation = np.broadcast_to(np.eye(3), (*shape, 3, 3))
+    offset = np.zeros((*shape, 3))
+
+    for surface in range(2, last_surface + 1):
+        offset = offset + rotation[..., :, 2] * prescription.thickness[..., surface - 1, None]
+
+        if prescription.surface_type[surface] == "CoordinateBreak":
+            decenter, break_rotation, order = _coordinate_break(prescription.parameters[..., surface, :])
+            offset_before = offset + np.einsum("...ij,...j->...i", rotation, decenter)
+            rotation = rotation @ break_rotation
+            offset_after = offset + np.einsum("...ij,...j->...i", rotation, decenter)
+            offset = np.where(order[..., None], offset_after, offset_before)
+
+    return rotation, offset
+
+
+def _sag(rho: np.ndarray, curvature: np.ndarray, conic: np.ndarray, coefficients: list[np.ndarray]):
+    """Calculate the sag of a surface and its derivative with respect to `rho = x² + y²`."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        root = np.sqrt(1 - (1 + conic) * curvature**2 * rho)
+        sag = curvature * rho / (1 + root)
+        slope = curvature / (2 * root)
+
+    power = np.ones_like(rho)
+
+    for order, coefficient in enumerate(coefficients, start=1):
+        slope = slope + order * coefficient * power
+        power = power * rho
+        sag = sag + coefficient * power
+
+    return sag, slope
+
+
+def _intersect(
+    position: np.ndarray,
+    direction: np.ndarray,
+    curvature: np.ndarray,
+    conic: np.ndarray,
+    coefficients: list[np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Intersect rays with a conic or even asphere surface.
+
+    The intersection with the base conic is calculated analytically and refined with Newton's method if the surface has
+    aspheric coefficients. Returns the propagation distance to the surface and the surface normal at the intercept.
+    """
+    x, y, z = position[..., 0], position[..., 1], position[..., 2]
+    dx, dy, dz = direction[..., 0], direction[..., 1], direction[..., 2]
+
+    a = curvature * (dx * dx + dy * dy + (1 + conic) * dz * dz)
+    b = curvature * (x * dx + y * dy + (1 + conic) * z * dz) - dz
+    q = curvature * (x * x + y * y + (1 + conic) * z * z) - 2 * z
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        distance = -q / (b - np.sign(dz) * np.sqrt(b * b - a * q))
+
+    for _ in range(_MAX_ITERATIONS if coefficients else 0):
+        intercept = position + distance[..., None] * direction
+        sag, slope = _sag(intercept[..., 0] ** 2 + intercept[..., 1] ** 2, curvature, conic, coefficients)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            step = (intercept[..., 2] - sag) / (dz - 2 * slope * (intercept[..., 0] * dx + intercept[..., 1] * dy))
+
+        distance = distance - step
+
+        if not np.any(np.abs(step) > _TOLERANCE):
+            break
+
+    intercept = position + distance[..., None] * direction
+    _, slope = _sag(intercept[..., 0] ** 2 + intercept[..., 1] ** 2, curvature, conic, coefficients)
+    normal = _normalize(
+        np.stack([2 * intercept[..., 0] * slope, 2 * intercept[..., 1] * slope, -np.ones_like(slope)], -1)
+    )
+
+    return distance, normal
+
+
+def _refract(
+    direction: np.ndarray, normal: np.ndarray, index_before: np.ndarray, index_after: np.ndarray, *, mirror: bool
+) -> np.ndarray:
+    """Refract or reflect rays at a surface. Total internal reflection results in NaN directions."""
+    cos_incidence = np.sum(direction * normal, axis=-1)
+    oriented_normal = normal * np.sign(cos_incidence)[..., None]
+    cos_incidence = np.abs(cos_incidence)
+
+    if mirror:
+        return direction - 2 * cos_incidence[..., None] * oriented_normal
+
+    ratio = index_before / index_after
+
+    with np.errstate(invalid="ignore"):
+        cos_refraction = np.sqrt(1 - ratio**2 * (1 - cos_incidence**2))
+
+    return ratio[..., None] * direction + (cos_refraction - ratio * cos_incidence)[..., None] * oriented_normal
+
+
+def _trace(
+    prescription: Prescription,
+    position: np.ndarray,
+    direction: np.ndarray,
+    path_length: np.ndarray,
+    first_surface: int,
+    last_surface: int,
+    n_ray_dims: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Trace rays from the local coordinate system of surface `first_surface - 1` to `last_surface`.
+
+    The rays should already be transferred to the vertex plane of `first_surface`. Returns the position, direction,
+    surface normal (in local coordinates of `last_surface`), optical path length and error code of each ray.
+    """
+    shape = np.broadcast_shapes(
+        position.shape,
+        direction.shape,
+        (*path_length.shape, 3),
+        (*_expand_index(prescription.index[..., 0, :], n_ray_dims).shape, 3),
+    )
+    position = np.array(np.broadcast_to(position, shape))
+    direction = np.array(np.broadcast_to(direction, shape))
+    path_length = np.array(np.broadcast_to(path_length, shape[:-1]))
+    normal = np.zeros(shape)
+    normal[..., 2] = -1
+    error_code = np.zeros(shape[:-1], dtype=np.int32)
+
+    for surface in range(first_surface, last_surface + 1):
+        surface_type = prescription.surface_type[surface]
+
+        if surface_type not in SUPPORTED_SURFACE_TYPES:
+            raise ValueError(
+                f"Surface {surface} has an unsupported surface type: {surface_type}. Supported surface types are "
+                f"{', '.join(SUPPORTED_SURFACE_TYPES)}."
+            )
+
+        if surface > first_surface:
+            position[..., 2] -= _expand(prescription.thickness[..., surface - 1], n_ray_dims)
+
+        index_before = np.abs(_expand_index(prescription.index[..., surface - 1, :], n_ray_dims))
+        index_after = np.abs(_expand_index(prescription.index[..., surface, :], n_ray_dims))
+        parameters = prescription.parameters[..., surface, :]
+
+        if surface_type in {"CoordinateBreak", "Paraxial"}:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                distance = -position[..., 2] / direction[..., 2]
+
+            surface_normal = np.zeros(shape)
+            surface_normal[..., 2] = -1
+        else:
+            coefficients = (
+                [_expand(parameters[..., p], n_ray_dims) for p in range(parameters.shape[-1])]
+                if surface_type == "EvenAsphere" and np.any(parameters)
+                else []
+            )
+            distance, surface_normal = _intersect(
+                position,
+                direction,
+                _expand(prescription.curvature[..., surface], n_ray_dims),
+                _expand(prescription.conic[..., surface], n_ray_dims),
+                coefficients,
+            )
+
+        position = position + distance[..., None] * direction
+        path_length = path_length + index_before * distance
+        error_code = np.where((error_code == 0) & ~np.all(np.isfinite(position), axis=-1), surface, error_code)
+
+        if surface_type == "CoordinateBreak":
+            decenter, rotation, order = _coordinate_break(parameters)
+            decenter, rotation, order = (
+                _expand(decenter, n_ray_dims, 1),
+                _expand(rotation, n_ray_dims, 2),
+                _expand(order, n_ray_dims),
+            )
+            position = np.where(
+                order[..., None],
+                np.einsum("...j,...ji->...i", position, rotation) - decenter,
+                np.einsum("...j,...ji->...i", position - decenter, rotation),
+            )
+            direction = np.einsum("...j,...ji->...i", direction, rotation)
+            normal = np.einsum("...j,...ji->...i", normal, rotation)
+            continue
+
+        if surface_type == "Paraxial":
+            focal_length = _expand(parameters[..., 0], n_ray_dims)
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                tangent = direction[..., :2] / direction[..., 2:]
+                focus = np.concatenate(
+                    [
+                        focal_length[..., None] * tangent,
+                        np.broadcast_to(focal_length[..., None], tangent[..., :1].shape),
+                    ],
+                    axis=-1,
+                )
+                new_direction = _normalize(focus - position)
+                new_direction = new_direction * np.sign(direction[..., 2:] * focal_length[..., None])
+
+                # Optical path correction of an ideal lens, which images each plane wave onto a point
+                path_length = path_length + np.where(
+                    focal_length == 0,
+                    0.0,
+                    -index_before * np.sum(position * direction, axis=-1)
+                    - index_after
+                    * np.sign(focal_length)
+                    * (np.linalg.norm(focus - position, axis=-1) - np.linalg.norm(focus, axis=-1)),
+                )
+
+            direction = np.where((focal_length == 0)[..., None], direction, new_direction)
+        else:
+            direction = _refract(
+                direction, surface_normal, index_before, index_after, mirror=prescription.mirror[surface]
+            )
+
+        normal = surface_normal
+        error_code = np.where((error_code == 0) & ~np.all(np.isfinite(direction), axis=-1), -surface, error_code)
+
+    return position, direction, normal, path_length, error_code
+
+
+def _to_global(
+    prescription: Prescription,
+    surface: int,
+    position: np.ndarray,
+    direction: np.ndarray,
+    normal: np.ndarray,
+    n_ray_dims: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert local coordinates of `surface` to global coordinates relative to surface 1."""
+    rotation, offset = _surface_frames(prescription, surface)
+    rotation, offset = _expand(rotation, n_ray_dims, 2), _expand(offset, n_ray_dims, 1)
+
+    return (
+        offset + np.einsum("...ij,...j->...i", rotation, position),
+        np.einsum("...ij,...j->...i", rotation, direction),
+        np.einsum("...ij,...j->...i", rotation, normal),
+    )
+
+
+def _check_last_surface(prescription: Prescription, last_surface: int | None, first_surface: int) -> int:
+    last_surface = prescription.image_surface if last_surface is None else last_surface
+
+    if not first_surface <= last_surface <= prescription.image_surface:
+        raise ValueError(
+            f"last_surface should be between {first_surface} and {prescription.image_surface}, got {last_surface}."
+        )
+
+    return last_surface
+
+
+def _fill_result(
+    result: np.ndarray, position: np.ndarray, direction: np.ndarray, normal: np.ndarray, error_code: np.ndarray
+) -> np.ndarray:
+    result["error_code"] = error_code
+    result["vignette_code"] = 0
+
+    for i, (position_field, direction_field, normal_field) in enumerate(
+        zip("XYZ", "LMN", ("l2", "m2", "n2"), strict=True)
+    ):
+        result[position_field] = position[..., i]
+        result[direction_field] = direction[..., i]
+
+        if normal_field in result.dtype.names:
+            result[normal_field] = normal[..., i]
+
+    result["intensity"] = np.where(error_code == 0, 1.0, 0.0)
+
+    return result
+
+
+def _normalized_start(
+    prescription: Prescription,
+    paraxial: FirstOrderData,
+    hx: np.ndarray,
+    hy: np.ndarray,
+    px: np.ndarray,
+    py: np.ndarray,
+    n_ray_dims: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate the starting position, direction and optical path length of normalized rays in surface 1 coordinates.
+
+    Rays from an infinite object start in the vertex plane of surface 1, with their optical path length measured from
+    the plane through the entrance pupil center, perpendicular to the ray. Rays from a finite object start at the
+    object point.
+    """
+    wavelength = prescription.primary_wavelength - 1
+    pupil_radius = _expand(paraxial.entrance_pupil_diameter[..., wavelength] / 2, n_ray_dims)
+    pupil_position = _expand(paraxial.entrance_pupil_position[..., wavelength], n_ray_dims)
+    object_distance = _expand(prescription.thickness[..., 0], n_ray_dims)
+    infinite_object = np.isinf(object_distance)
+    max_field = np.max(np.hypot(prescription.fields[:, 0], prescription.fields[:, 1]))
+    zero = np.zeros(np.broadcast_shapes(hx.shape, pupil_radius.shape))
+
+    pupil_point = np.stack([px * pupil_radius + zero, py * pupil_radius + zero, pupil_position + zero], axis=-1)
+
+    with np.errstate(invalid="ignore"):
+        if prescription.field_type == "Angle":
+            tangent = np.tan(np.deg2rad(np.stack([hx, hy], axis=-1) * max_field))
+            object_point = np.concatenate(
+                [
+                    -(object_distance + pupil_position)[..., None] * tangent,
+                    -object_distance[..., None] + zero[..., None],
+                ],
+                axis=-1,
+            )
+            direction = np.where(
+                infinite_object[..., None],
+                _normalize(np.concatenate([tangent, np.ones_like(tangent[..., :1])], axis=-1)),
+                _normalize(pupil_point - object_point),
+            )
+        elif prescription.field_type == "ObjectHeight":
+            if np.any(infinite_object):
+                raise ValueError("Object height fields require a finite object distance.")
+
+            object_point = np.stack([hx * max_field + zero, hy * max_field + zero, -object_distance + zero], axis=-1)
+            direction = _normalize(pupil_point - object_point)
+        else:
+            raise ValueError(f"Unsupported field type: {prescription.field_type}")
+
+        plane_point = pupil_point - direction * (pupil_position / direction[..., 2])[..., None]
+        start = np.where(infinite_object[..., None], plane_point, object_point)
+
+        pupil_center = np.zeros_like(pupil_point)
+        pupil_center[..., 2] = pupil_point[..., 2]
+        index_object = np.abs(_expand_index(prescription.index[..., 0, :], n_ray_dims))
+        path_length = np.where(infinite_object, index_object * np.sum((start - pupil_center) * direction, axis=-1), 0.0)
+
+    return start, direction, path_length
+
+
+def _optical_path_difference(
+    prescription: Prescription,
+    paraxial: FirstOrderData,
+    position: np.ndarray,
+    direction: np.ndarray,
+    path_length: np.ndarray,
+    chief: tuple[np.ndarray, np.ndarray, np.ndarray],
+    n_ray_dims: int,
+) -> np.ndarray:
+    """Calculate the optical path difference in waves with respect to the chief ray.
+
+    The reference sphere is centered at the image intercept of the chief ray and passes through the intersection of the
+    chief ray with the paraxial exit pupil plane.
+    """
+    chief_position, chief_direction, chief_path_length = chief
+    wavelength = prescription.primary_wavelength - 1
+    exit_pupil_position = _expand(paraxial.exit_pupil_position[..., wavelength], n_ray_dims)
+    index_image = np.abs(_expand_index(prescription.index[..., -2, :], n_ray_dims))
+
+    radius = (exit_pupil_position - chief_position[..., 2]) / chief_direction[..., 2]
+    relative = position - chief_position
+    b = np.sum(relative * direction, axis=-1)
+    q = np.sum(relative * relative, axis=-1) - radius**2
+
+    with np.errstate(invalid="ignore"):
+        distance = -b + np.sign(radius) * np.sqrt(b * b - q)
+
+    reference_path_length = path_length + index_image * distance
+    chief_reference_path_length = chief_path_length + index_image * radius
+
+    return (chief_reference_path_length - reference_path_length) / (prescription.wavelengths * 1e-3)
+
+
+def trace_normalized(
+    prescription: Prescription,
+    rays: ArrayLike,
+    *,
+    last_surface: int | None = None,
+    global_coordinates: bool = False,
+) -> np.ndarray:
+    """Trace normalized rays through a sequential system.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+    rays : ArrayLike
+        Normalized field and pupil coordinates `(Hx, Hy, Px, Py)`, either as an array with shape `(..., 4)` or as a
+        structured array with dtype `NORM_RAY_DTYPE`.
+    last_surface : int | None
+        Surface to trace the rays to. If None, the rays are traced to the image surface. Defaults to None.
+    global_coordinates : bool
+        Whether to return global coordinates relative to surface 1 instead of local coordinates of `last_surface`.
+        Defaults to False.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with dtype `NORM_UNPOL_RESULT_DTYPE` and shape `(..., *ray_shape, n_wavelengths)`. The optical
+        path difference is given in waves relative to the chief ray and is only calculated when tracing to the image
+        surface; it is zero otherwise.
+
+    Raises
+    ------
+    ValueError
+        If the rays do not have the correct shape, `last_surface` is out of range, or the prescription contains an
+        unsupported surface type, aperture type or field type.
+    """
+    hx, hy, px, py = _ray_columns(rays, NORM_RAY_DTYPE)
+    hx, hy, px, py = np.broadcast_arrays(hx, hy, px, py)
+    n_ray_dims = hx.ndim
+    last_surface = _check_last_surface(prescription, last_surface, 1)
+    hx, hy, px, py = (value[..., None] for value in (hx, hy, px, py))
+
+    paraxial = first_order_data(prescription)
+    start, direction, path_length = _normalized_start(prescription, paraxial, hx, hy, px, py, n_ray_dims)
+    position, direction, normal, path_length, error_code = _trace(
+        prescription, start, direction, path_length, 1, last_surface, n_ray_dims
+    )
+
+    result = np.zeros(error_code.shape, dtype=NORM_UNPOL_RESULT_DTYPE)
+
+    if last_surface == prescription.image_surface:
+        chief_start, chief_direction, chief_path_length = _normalized_start(
+            prescription, paraxial, hx, hy, np.zeros_like(px), np.zeros_like(py), n_ray_dims
+        )
+        chief_position, chief_direction, _, chief_path_length, _ = _trace(
+            prescription, chief_start, chief_direction, chief_path_length, 1, last_surface, n_ray_dims
+        )
+        result["opd"] = _optical_path_difference(
+            prescription,
+            paraxial,
+            position,
+            direction,
+            path_length,
+            (chief_position, chief_direction, chief_path_length),
+            n_ray_dims,
+        )
+
+    if global_coordinates:
+        position, direction, normal = _to_global(prescription, last_surface, position, direction, normal, n_ray_dims)
+
+    return _fill_result(result, position, direction, normal, error_code)
+
+
+def trace_direct(
+    prescription: Prescription,
+    rays: ArrayLike,
+    *,
+    start_surface: int = 0,
+    last_surface: int | None = None,
+    global_coordinates: bool = False,
+) -> np.ndarray:
+    """Trace rays with a given starting position and direction through a sequential system.
+
+    Parameters
+    ----------
+    prescription : Prescription
+        The lens prescription.
+    rays : ArrayLike
+        Starting positions `(X, Y, Z)` and direction cosines `(L, M, N)` in local coordinates of `start_surface`, either
+        as an array with shape `(..., 6)` or as a structured array with dtype `DIRECT_RAY_DTYPE`.
+    start_surface : int
+        Surface on which the rays start. Defaults to 0.
+    last_surface : int | None
+        Surface to trace the rays to. If None, the rays are traced to the image surface. Defaults to None.
+    global_coordinates : bool
+        Whether to return global coordinates relative to surface 1 instead of local coordinates of `last_surface`.
+        Defaults to False.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with dtype `DIRECT_UNPOL_RESULT_DTYPE` and shape `(..., *ray_shape, n_wavelengths)`.
+
+    Raises
+    ------
+    ValueError
+        If the rays do not have the correct shape, the surface range is invalid, the rays start on an object surface at
+        infinity, or the prescription contains an unsupported surface type.
+    """
+    columns = np.broadcast_arrays(*_ray_columns(rays, DIRECT_RAY_DTYPE))
+    n_ray_dims = columns[0].ndim
+    last_surface = _check_last_surface(prescription, last_surface, start_surface + 1)
+
+    if np.any(np.isinf(prescription.thickness[..., start_surface])):
+        raise ValueError(f"Cannot start rays on surface {start_surface}, which has an infinite thickness.")
+
+    position = np.stack(columns[:3], axis=-1)[..., None, :]
+    direction = _normalize(np.stack(columns[3:], axis=-1))[..., None, :]
+    position = position - np.stack(
+        np.broadcast_arrays(0.0, 0.0, _expand(prescription.thickness[..., start_surface], n_ray_dims)), axis=-1
+    )
+
+    position, direction, normal, _, error_code = _trace(
+        prescription,
+        position,
+        direction,
+        np.zeros(position.shape[:-1]),
+        start_surface + 1,
+        last_surface,
+        n_ray_dims,
+    )
+
+    if global_coordinates:
+        position, direction, normal = _to_global(prescription, last_surface, position, direction, normal, n_ray_dims)
+
+    return _fill_result(
+        np.zeros(error_code.shape, dtype=DIRECT_UNPOL_RESULT_DTYPE), position, direction, normal, error_code
+    )
@@ -0,0 +1,292 @@
+"""Zernike polynomial fitting of wavefront maps.
+
+Zernike coefficients are fitted to the optical path difference (OPD) of `WavefrontMap` results with linear least
+squares, as an alternative to the Zernike Standard Coefficients and Zernike Coefficients vs. Field analyses. Two
+conventions are supported, with the same term numbering and normalization as OpticStudio:
+
+- 'Standard': Noll ordering, normalized to unit RMS over the unit circle;
+- 'Fringe': Fringe (University of Arizona) ordering, normalized to a peak value of 1 at the edge of the pupil.
+
+The basis matrix and its pseudo-inverse only depend on the sampling grid, the aperture mask, the number of terms and the
+convention. They are cached, so fitting many wavefront maps with the same sampling is a single matrix multiplication.
+Coefficient arrays have the terms along the last axis, where element `i` corresponds to term `i + 1`.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from math import factorial
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+
+__all__ = (
+    "ZernikeConvention",
+    "basis",
+    "clear_basis_cache",
+    "fit",
+    "fringe_indices",
+    "reconstruct",
+    "standard_indices",
+    "zernike",
+)
+
+ZernikeConvention = Literal["Standard", "Fringe"]
+
+_BASIS_CACHE_SIZE = 32
+"""Maximum number of cached basis matrices."""
+
+
+def standard_indices(max_term: int) -> tuple[np.ndarray, np.ndarray]:
+    """Radial and azimuthal orders of the Zernike Standard (Noll) terms.
+
+    Parameters
+    ----------
+    max_term : int
+        The number of terms.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The radial order `n` and the azimuthal order `m` of terms 1 up to and including `max_term`. Positive `m`
+        corresponds to a cosine term and negative `m` to a sine term.
+    """
+    n_orders, m_orders = [], []
+    n = 0
+
+    while len(n_orders) < max_term:
+        j = n * (n + 1) // 2 + 1
+
+        for m in range(n % 2, n + 1, 2):
+            # Noll assigns even term numbers to cosine terms and odd term numbers to sine terms
+            for sign in (1,) if m == 0 else ((1, -1) if j % 2 == 0 else (-1, 1)):
+                n_orders.append(n)
+                m_orders.append(sign * m)
+                j += 1
+
+        n += 1
+
+    return np.array(n_orders[:max_term]), np.array(m_orders[:max_term])
+
+
+def fringe_indices(max_term: int) -> tuple[np.ndarray, np.ndarray]:
+    """Radial and azimuthal orders of the Zernike Fringe terms.
+
+    Parameters
+    ----------
+    max_term : int
+        The number of terms.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The radial order `n` and the azimuthal order `m` of terms 1 up to and including `max_term`. Positive `m`
+        corresponds to a cosine term and negative `m` to a sine term.
+    """
+    n_orders, m_orders = [], []
+    group = 0
+
+    while len(n_orders) < max_term:
+        # Terms are grouped by (n + |m|) / 2, and ordered by decreasing |m| within a group
+        for m in range(group, -1, -1):
+            for sign in (1,) if m == 0 else (1, -1):
+                n_orders.append(2 * group - m)
+                m_orders.append(sign * m)
+
+        group += 1
+
+    return np.array(n_orders[:max_term]), np.array(m_orders[:max_term])
+
+
+def _indices(max_term: int, convention: ZernikeConvention) -> tuple[np.ndarray, np.ndarray]:
+    if convention == "Standard":
+        return standard_indices(max_term)
+
+    if convention == "Fringe":
+        return fringe_indices(max_term)
+
+    raise ValueError(f"Unknown Zernike convention {convention}, should be one of 'Standard' or 'Fringe'.")
+
+
+def _radial_polynomial(n: int, m: int, rho: np.ndarray) -> np.ndarray:
+    result = np.zeros_like(rho)
+
+    for s in range((n - m) // 2 + 1):
+        coefficient = (
+            (-1) ** s * factorial(n - s) / (factorial(s) * factorial((n + m) // 2 - s) * factorial((n - m) // 2 - s))
+        )
+        result += coefficient * rho ** (n - 2 * s)
+
+    return result
+
+
+def zernike(term: int, rho: ArrayLike, theta: ArrayLike, *, convention: ZernikeConvention = "Standard") -> np.ndarray:
+    """Evaluate a Zernike polynomial.
+
+    Parameters
+    ----------
+    term : int
+        The term number, starting at 1.
+    rho : ArrayLike
+        Normalized radial pupil coordinate.
+    theta : ArrayLike
+        Angle in radians, measured counterclockwise from the x axis.
+    convention : ZernikeConvention
+        The Zernike convention, 'Standard' or 'Fringe'. Defaults to 'Standard'.
+
+    Returns
+    -------
+    np.ndarray
+        The value of the polynomial.
+    """
+    n_orders, m_orders = _indices(term, convention)
+    n, m = int(n_orders[-1]), int(m_orders[-1])
+    rho, theta = np.broadcast_arrays(np.asarray(rho, dtype=float), np.asarray(theta, dtype=float))
+
+    value = _radial_polynomial(n, abs(m), rho)
+
+    if m > 0:
+        value = value * np.cos(m * theta)
+    elif m < 0:
+        value = value * np.sin(-m * theta)
+
+    if convention == "Standard":
+        value = value * np.sqrt((n + 1) * (2 if m != 0 else 1))
+
+    return value
+
+
+@lru_cache(maxsize=_BASIS_CACHE_SIZE)
+def _fit_matrices(
+    x: bytes, y: bytes, mask: bytes, shape: tuple[int, int], max_term: int, convention: ZernikeConvention
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the basis matrix and its pseudo-inverse for a sampling grid and aperture mask."""
+    x, y = np.meshgrid(np.frombuffer(x), np.frombuffer(y))
+    mask = np.frombuffer(mask, dtype=bool).reshape(shape)
+
+    rho = np.hypot(x[mask], y[mask])
+    theta = np.arctan2(y[mask], x[mask])
+
+    matrix = np.stack([zernike(term, rho, theta, convention=convention) for term in range(1, max_term + 1)], axis=-1)
+    inverse = np.linalg.pinv(matrix)
+
+    matrix.setflags(write=False)
+    inverse.setflags(write=False)
+
+    return matrix, inverse
+
+
+def _cache_key(wavefront: pd.DataFrame, mask: np.ndarray) -> tuple[bytes, bytes, bytes, tuple[int, int]]:
+    x = np.ascontiguousarray(wavefront.columns.to_numpy(dtype=float))
+    y = np.ascontiguousarray(wavefront.index.to_numpy(dtype=float))
+
+    return x.tobytes(), y.tobytes(), np.ascontiguousarray(mask).tobytes(), mask.shape
+
+
+def basis(wavefront: pd.DataFrame, max_term: int = 37, *, convention: ZernikeConvention = "Standard") -> np.ndarray:
+    """Get the Zernike basis matrix for the sampling grid and aperture of a wavefront map.
+
+    Parameters
+    ----------
+    wavefront : pd.DataFrame
+        The data of a `WavefrontMap` result: the OPD in waves, indexed by the normalized pupil y coordinate, with the
+        normalized pupil x coordinate as columns. Samples outside the pupil are NaN.
+    max_term : int
+        The number of terms. Defaults to 37.
+    convention : ZernikeConvention
+        The Zernike convention, 'Standard' or 'Fringe'. Defaults to 'Standard'.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only matrix with shape `(n_samples, max_term)`, containing the value of every term at the samples inside
+        the pupil, in row-major order.
+    """
+    mask = wavefront.notna().to_numpy()
+
+    return _fit_matrices(*_cache_key(wavefront, mask), max_term, convention)[0]
+
+
+def clear_basis_cache() -> None:
+    """Clear the cache of basis matrices and pseudo-inverses."""
+    _fit_matrices.cache_clear()
+
+
+def fit(
+    wavefront: pd.DataFrame | Sequence[pd.DataFrame],
+    max_term: int = 37,
+    *,
+    convention: ZernikeConvention = "Standard",
+) -> np.ndarray:
+    """Fit Zernike coefficients to one or more wavefront maps.
+
+    Wavefront maps with the same sampling grid and aperture share a cached pseudo-inverse, and are fitted with a single
+    matrix multiplication.
+
+    Parameters
+    ----------
+    wavefront : pd.DataFrame | Sequence[pd.DataFrame]
+        The data of one or more `WavefrontMap` results, see `basis`.
+    max_term : int
+        The number of terms. Defaults to 37.
+    convention : ZernikeConvention
+        The Zernike convention, 'Standard' or 'Fringe'. Defaults to 'Standard'.
+
+    Returns
+    -------
+    np.ndarray
+        Zernike coefficients in waves, with shape `(max_term,)` for a single wavefront map and `(n_maps, max_term)` for
+        a sequence of wavefront maps.
+    """
+    if isinstance(wavefront, pd.DataFrame):
+        return fit([wavefront], max_term, convention=convention)[0]
+
+    coefficients = np.empty((len(wavefront), max_term))
+    groups: dict[tuple, list[int]] = {}
+
+    for i, wavefront_map in enumerate(wavefront):
+        groups.setdefault(_cache_key(wavefront_map, wavefront_map.notna().to_numpy()), []).append(i)
+
+    for key, indices in groups.items():
+        _, inverse = _fit_matrices(*key, max_term, convention)
+        mask = np.frombuffer(key[2], dtype=bool).reshape(key[3])
+        values = np.stack([wavefront[i].to_numpy(dtype=float)[mask] for i in indices])
+
+        coefficients[indices] = values @ inverse.T
+
+    return coefficients
+
+
+def reconstruct(
+    coefficients: ArrayLike, like: pd.DataFrame, *, convention: ZernikeConvention = "Standard"
+) -> np.ndarray:
+    """Reconstruct wavefront maps from Zernike coefficients.
+
+    Parameters
+    ----------
+    coefficients : ArrayLike
+        Zernike coefficients in waves, with the terms along the last axis.
+    like : pd.DataFrame
+        A wavefront map that defines the sampling grid and the aperture, see `basis`.
+    convention : ZernikeConvention
+        The Zernike convention, 'Standard' or 'Fringe'. Defaults to 'Standard'.
+
+    Returns
+    -------
+    np.ndarray
+        The OPD in waves, with shape `(*coefficients.shape[:-1], n_y, n_x)`. Samples outside the aperture are NaN.
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    mask = like.notna().to_numpy()
+    matrix = _fit_matrices(*_cache_key(like, mask), coefficients.shape[-1], convention)[0]
+
+    result = np.full((*coefficients.shape[:-1], *mask.shape), np.nan)
+    result[..., mask] = coefficients @ matrix.T
+
+    return result
@@ -4,6 +4,9 @@
 Solvers have the general structure `solver_function(cell, *args)`, with `cell` the EditorCell of the solver,
 followed by the parameters for the solver.
 
+Setting a solve discards the results cached with `OpticStudioSystem.cached_result`. Because an editor cell does not refer
+to its system, the cached results of all systems are discarded unless the system is passed as `oss`.
+
 Examples
 --------
 Make the radius of a surface variable:
@@ -15,18 +18,44 @@ Change the refractive index of a medium:
 
 >>> surface = oss.InsertNewSurfaceAt(1)
 >>> zp.solvers.material_model(surface.MaterialCell, refractive_index=1.5)
+
+Apply solvers to many cells of the Lens Data Editor at once:
+
+>>> zp.solvers.apply_many(
+...     oss,
+...     [
+...         (1, "Radius", "variable"),
+...         (2, "Thickness", "position", {"from_surface": 1, "length": 10}),
+...     ],
+... )
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
 
 from zospy.api import constants
+from zospy.zpcore import invalidate_cached_results
 
 if TYPE_CHECKING:
-    from zospy.api import _ZOSAPI
+    from collections.abc import Iterable
 
-__all__ = ("element_power", "fixed", "material_model", "pickup_chief_ray", "position", "surface_pickup", "variable")
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "apply_many",
+    "element_power",
+    "fixed",
+    "material_model",
+    "pickup_chief_ray",
+    "position",
+    "surface_pickup",
+    "variable",
+)
 
 # ruff: file-ignore[private-member-access]
 
@@ -41,7 +70,9 @@ def _get_surface_index(surface: _ZOSAPI.Editors.IEditorRow | int) -> int:
     raise ValueError(f"from_surface should be an int or a Surface, got {surface}")
 
 
-def element_power(radius_cell: _ZOSAPI.Editors.IEditorCell, power: float) -> _ZOSAPI.Editors.ISolveElementPower:
+def element_power(
+    radius_cell: _ZOSAPI.Editors.IEditorCell, power: float, *, oss: OpticStudioSystem | None = None
+) -> _ZOSAPI.Editors.ISolveElementPower:
     """Solver for element power.
 
     Adjusts the value of `radius_cell` to create an element with the specified `power`. This solver should be set on
@@ -53,6 +84,9 @@ def element_power(radius_cell: _ZOSAPI.Editors.IEditorCell, power: float) -> _ZO
         Radius cell of the last element surface
     power : float
         Element power in diopters
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -65,16 +99,20 @@ def element_power(radius_cell: _ZOSAPI.Editors.IEditorCell, power: float) -> _ZO
     solve_data.Power = power
 
     radius_cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
 
 
-def fixed(cell: _ZOSAPI.Editors.IEditorCell) -> _ZOSAPI.Editors.ISolveFixed:
+def fixed(cell: _ZOSAPI.Editors.IEditorCell, *, oss: OpticStudioSystem | None = None) -> _ZOSAPI.Editors.ISolveFixed:
     """Set the cell solve type to Fixed.
 
     Parameters
     ----------
     cell : ZOSAPI.Editors.IEditorCell
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -82,6 +120,7 @@ def fixed(cell: _ZOSAPI.Editors.IEditorCell) -> _ZOSAPI.Editors.ISolveFixed:
     """
     solve_data = cell.CreateSolveType(constants.Editors.SolveType.Fixed)._S_Fixed
     cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
 
@@ -91,6 +130,8 @@ def material_model(
     refractive_index: float = 1,
     abbe_number: float = 0,
     partial_dispersion: float = 0,
+    *,
+    oss: OpticStudioSystem | None = None,
 ) -> _ZOSAPI.Editors.ISolveMaterialModel:
     """Solver for material model.
 
@@ -106,6 +147,9 @@ def material_model(
         Abbe number of the material
     partial_dispersion : float
         Partial dispersion term at d-light
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -117,12 +161,17 @@ def material_model(
     solve_data.dPgF = partial_dispersion
 
     material_cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
 
 
 def pickup_chief_ray(
-    cell: _ZOSAPI.Editors.IEditorCell, field: int = 1, wavelength: int = 0
+    cell: _ZOSAPI.Editors.IEditorCell,
+    field: int = 1,
+    wavelength: int = 0,
+    *,
+    oss: OpticStudioSystem | None = None,
 ) -> _ZOSAPI.Editors.ISolvePickupChiefRay:
     """Set the cell solve type to Chief Ray Pickup.
 
@@ -135,6 +184,9 @@ def pickup_chief_ray(
         Field index to take the chief ray from, defaults to 1.
     wavelength : int, optional
         Wavelength index of the chief ray, defaults to 0.
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -147,6 +199,7 @@ def pickup_chief_ray(
     solve_data.Wavelength = wavelength
 
     cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
 
@@ -155,6 +208,8 @@ def position(
     thickness_cell: _ZOSAPI.Editors.IEditorCell,
     from_surface: _ZOSAPI.Editors.LDE.ILDERow | _ZOSAPI.Editors.NCE.INCERow,
     length: float,
+    *,
+    oss: OpticStudioSystem | None = None,
 ) -> _ZOSAPI.Editors.ISolvePosition:
     """Set the cell solve type to Position.
 
@@ -168,6 +223,9 @@ def position(
         Index of the surface or surface from which the position is measured
     length : float
         Distance between `from_surface` and `surface`.
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -185,6 +243,7 @@ def position(
     solve_data.Length = length
 
     thickness_cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
 
@@ -195,6 +254,8 @@ def surface_pickup(
     from_column: constants.Editors.LDE.SurfaceColumn | str = None,
     scale: float = 1,
     offset: float = 0,
+    *,
+    oss: OpticStudioSystem | None = None,
 ) -> _ZOSAPI.Editors.ISolveSurfacePickup:
     """Set the cell solve type to Surface Pickup.
 
@@ -214,6 +275,9 @@ def surface_pickup(
     offset : float
         Offset which is added to the picked up value. This value is only set if the cell supports an offset.
         Defaults to 0.
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -233,16 +297,22 @@ def surface_pickup(
         solve_data.Column = constants.process_constant(constants.Editors.LDE.SurfaceColumn, from_column)
 
     cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
 
 
-def variable(cell: _ZOSAPI.Editors.IEditorCell) -> _ZOSAPI.Editors.ISolveVariable:
+def variable(
+    cell: _ZOSAPI.Editors.IEditorCell, *, oss: OpticStudioSystem | None = None
+) -> _ZOSAPI.Editors.ISolveVariable:
     """Set the cell solve type to Variable.
 
     Parameters
     ----------
     cell : ZOSAPI.Editors.IEditorCell
+    oss : zospy.zpcore.OpticStudioSystem | None
+        The system that is edited, of which the cached results are discarded. Defaults to None, in which case the
+        cached results of all systems are discarded.
 
     Returns
     -------
@@ -250,5 +320,148 @@ def variable(cell: _ZOSAPI.Editors.IEditorCell) -> _ZOSAPI.Editors.ISolveVariabl
     """
     solve_data = cell.CreateSolveType(constants.Editors.SolveType.Variable)._S_Variable
     cell.SetSolveData(solve_data)
+    invalidate_cached_results(oss)
 
     return solve_data
+
+
+_SOLVERS = {
+    "element_power": element_power,
+    "fixed": fixed,
+    "material_model": material_model,
+    "pickup_chief_ray": pickup_chief_ray,
+    "position": position,
+    "surface_pickup": surface_pickup,
+    "variable": variable,
+}
+
+
+def _is_missing(parameters: Any) -> bool:
+    return parameters is None or (pd.api.types.is_scalar(parameters) and pd.isna(parameters))
+
+
+def _parse_solve_spec(spec: pd.DataFrame | Iterable[tuple]) -> list[tuple[int, str, str, dict[str, Any]]]:
+    if isinstance(spec, pd.DataFrame):
+        parameters = spec["parameters"] if "parameters" in spec else [None] * len(spec)
+        spec = zip(spec["surface"], spec["column"], spec["solve"], parameters, strict=True)
+
+    parsed = []
+
+    for surface, column, solve, *parameters in spec:
+        if solve not in _SOLVERS:
+            raise ValueError(f"Unknown solver {solve}, should be one of {', '.join(_SOLVERS)}.")
+
+        solve_parameters = parameters[0] if parameters else None
+        solve_parameters = {} if _is_missing(solve_parameters) else dict(solve_parameters)
+
+        if "from_surface" in solve_parameters:
+            solve_parameters["from_surface"] = _get_surface_index(solve_parameters["from_surface"])
+
+        parsed.append((int(surface), column, solve, solve_parameters))
+
+    return parsed
+
+
+def _apply_solver(
+    cell: _ZOSAPI.Editors.IEditorCell,
+    column: constants.Editors.LDE.SurfaceColumn,
+    solve: str,
+    parameters: dict[str, Any],
+    solve_data_cache: dict,
+    oss: OpticStudioSystem,
+) -> bool:
+    if solve == "variable":
+        return cell.MakeSolveVariable()
+
+    if solve == "fixed":
+        return cell.MakeSolveFixed()
+
+    # Solve data depends on the column it was created for (e.g. the default pickup column), so it is only reused for
+    # cells in the same column
+    key = (solve, str(column), tuple(sorted(parameters.items())))
+
+    try:
+        solve_data = solve_data_cache.get(key)
+    except TypeError:  # Unhashable parameters, e.g. lists
+        key = solve_data = None
+
+    if solve_data is None:
+        solve_data = _SOLVERS[solve](cell, **parameters, oss=oss)
+
+        if key is not None:
+            solve_data_cache[key] = solve_data
+
+    return str(cell.SetSolveData(solve_data)) == "Success"
+
+
+def _check_solver_applied(*, success: bool, surface: int, column: str, solve: str) -> None:
+    if not success:
+        raise ValueError(f"Cannot apply solver {solve} to column {column} of surface {surface}.")
+
+
+def apply_many(oss: OpticStudioSystem, spec: pd.DataFrame | Iterable[tuple]) -> int:
+    """Apply solvers to many cells of the Lens Data Editor.
+
+    All solvers are applied while updates are suspended (see `OpticStudioSystem.suspend_updates`). Variable and fixed
+    solves are set directly on the cells. For other solvers, the solve data is created and configured once for every
+    combination of solver, column and parameters, and reused for all cells with the same combination. Solve data with
+    unhashable parameters (e.g. lists) is created for every cell. If a solver cannot be applied, the solves of the cells
+    that were already changed are restored and the exception is raised again.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        A ZOSPy OpticStudioSystem instance. Should be sequential.
+    spec : pd.DataFrame | Iterable[tuple]
+        The solvers to apply, as `(surface, column, solve)` or `(surface, column, solve, parameters)` tuples, or as a
+        DataFrame with columns `surface`, `column`, `solve` and optionally `parameters`. `column` is a column of
+        `zospy.constants.Editors.LDE.SurfaceColumn` (e.g. 'Radius'), `solve` is the name of a solver function in this
+        module (e.g. 'variable' or 'surface_pickup') and `parameters` is a mapping with the keyword arguments of that
+        solver function.
+
+    Returns
+    -------
+    int
+        The number of cells to which a solver was applied.
+
+    Raises
+    ------
+    ValueError
+        If a solver does not exist, or if OpticStudio cannot apply a solver to a cell.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> zos = zp.ZOS()
+    >>> oss = zos.connect()
+    >>> zp.solvers.apply_many(
+    ...     oss,
+    ...     [
+    ...         (1, "Radius", "variable"),
+    ...         (1, "Thickness", "variable"),
+    ...         (2, "Radius", "surface_pickup", {"from_surface": 1, "scale": -1}),
+    ...     ],
+    ... )
+    3
+    """
+    solves = _parse_solve_spec(spec)
+    get_surface = cache(oss.LDE.GetSurfaceAt)
+    solve_data_cache = {}
+    previous_solves = []
+
+    with oss.suspend_updates():
+        try:
+            for surface, column, solve, parameters in solves:
+                column_constant = constants.process_constant(constants.Editors.LDE.SurfaceColumn, column)
+                cell = get_surface(surface).GetSurfaceCell(column_constant)
+                previous_solves.append((cell, cell.GetSolveData()))
+
+                success = _apply_solver(cell, column_constant, solve, parameters, solve_data_cache, oss)
+                _check_solver_applied(success=success, surface=surface, column=column, solve=solve)
+        except Exception:
+            for cell, previous_solve in reversed(previous_solves):
+                cell.SetSolveData(previous_solve)
+
+            raise
+
+    return len(previous_solves)
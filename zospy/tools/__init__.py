@@ -8,7 +8,74 @@ to several tools.
 
 from __future__ import annotations
 
+from zospy.tools import critical_rays, nsc_raytrace, optimization, raytrace, tolerancing
 from zospy.tools.base import open_tool
+from zospy.tools.critical_rays import CriticalRaysetGenerator, CriticalRaysetGeneratorSettings, get_critical_rays
+from zospy.tools.nsc_raytrace import NSCRayTrace, NSCRayTraceSettings, ZRDReader, ZRDReaderSettings
+from zospy.tools.optimization import (
+    GlobalOptimization,
+    GlobalOptimizationSettings,
+    HammerOptimization,
+    HammerOptimizationSettings,
+    LocalOptimization,
+    LocalOptimizationSettings,
+)
 from zospy.tools.quick_focus import QuickFocus, QuickFocusSettings
+from zospy.tools.raytrace import (
+    BatchRayTrace,
+    BatchRayTraceSettings,
+    DirectPolBatchRayTrace,
+    DirectPolBatchRayTraceSettings,
+    DirectUnpolBatchRayTrace,
+    DirectUnpolBatchRayTraceSettings,
+    NormPolBatchRayTrace,
+    NormPolBatchRayTraceSettings,
+)
+from zospy.tools.tolerancing import (
+    QuickSensitivity,
+    QuickSensitivitySettings,
+    SensitivityDataReader,
+    ToleranceDataReader,
+    ToleranceDataReaderSettings,
+    Tolerancing,
+    TolerancingSettings,
+)
 
-__all__ = ("QuickFocus", "QuickFocusSettings", "open_tool")
+__all__ = (
+    "BatchRayTrace",
+    "BatchRayTraceSettings",
+    "CriticalRaysetGenerator",
+    "CriticalRaysetGeneratorSettings",
+    "DirectPolBatchRayTrace",
+    "DirectPolBatchRayTraceSettings",
+    "DirectUnpolBatchRayTrace",
+    "DirectUnpolBatchRayTraceSettings",
+    "GlobalOptimization",
+    "GlobalOptimizationSettings",
+    "HammerOptimization",
+    "HammerOptimizationSettings",
+    "LocalOptimization",
+    "LocalOptimizationSettings",
+    "NSCRayTrace",
+    "NSCRayTraceSettings",
+    "NormPolBatchRayTrace",
+    "NormPolBatchRayTraceSettings",
+    "QuickFocus",
+    "QuickFocusSettings",
+    "QuickSensitivity",
+    "QuickSensitivitySettings",
+    "SensitivityDataReader",
+    "ToleranceDataReader",
+    "ToleranceDataReaderSettings",
+    "Tolerancing",
+    "TolerancingSettings",
+    "ZRDReader",
+    "ZRDReaderSettings",
+    "critical_rays",
+    "get_critical_rays",
+    "nsc_raytrace",
+    "open_tool",
+    "optimization",
+    "raytrace",
+    "tolerancing",
+)
@@ -9,7 +9,7 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import is_dataclass
 from types import NoneType
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, get_args
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, get_args, get_origin
 
 import numpy as np
 import pandas as pd
@@ -195,16 +195,33 @@ class BaseToolWrapper(ABC, Generic[ToolOutputData, ToolSettings]):
     ):
         """Determine the settings type and class-level configuration of the tool."""
         cls.CONNECTION_MODE = connection_mode
-
-        if not hasattr(cls, "_settings_type"):
-            if hasattr(cls, "__orig_bases__"):
-                base = cls.__orig_bases__[0]
-                cls._settings_type: type[ToolSettings] = get_args(base)[1]
-            else:
-                cls._settings_type = NoneType
+        cls._settings_type: type[ToolSettings] = cls._resolve_settings_type()
 
         super().__init_subclass__(**kwargs)
 
+    @classmethod
+    def _resolve_settings_type(cls) -> type[ToolSettings] | TypeVar:
+        """Resolve the settings type from the parametrized tool wrapper base class.
+
+        Intermediate base classes that are generic in the settings type (e.g. `BaseToolWrapper[np.ndarray,
+        ToolSettings]`) keep the type variable, which is substituted by their parametrized subclasses. Subclasses
+        without a parametrized base class inherit the settings type of their parent, or have no settings.
+        """
+        for base in cls.__dict__.get("__orig_bases__", ()):
+            origin = get_origin(base)
+
+            if isinstance(origin, type) and issubclass(origin, BaseToolWrapper):
+                settings_type = origin.__dict__.get("_settings_type", ToolSettings)
+
+                if isinstance(settings_type, TypeVar):
+                    return dict(zip(origin.__parameters__, get_args(base), strict=True)).get(
+                        settings_type, settings_type
+                    )
+
+                return settings_type
+
+        return getattr(cls, "_settings_type", NoneType)
+
     @abstractmethod
     def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.ISystemTool]:
         """Callable that opens the tool in OpticStudio and returns the tool object."""
@@ -316,8 +333,9 @@ class BaseToolWrapper(ABC, Generic[ToolOutputData, ToolSettings]):
     def run(
         self,
         oss: OpticStudioSystem,
-        *,
+        *args,
         close_current: bool = False,
+        **kwargs,
     ) -> ToolResult[ToolOutputData, ToolSettings]:
         """Run the tool and return the results.
 
@@ -328,8 +346,12 @@ class BaseToolWrapper(ABC, Generic[ToolOutputData, ToolSettings]):
         ----------
         oss : OpticStudioSystem
             The OpticStudio system.
+        *args
+            Positional arguments passed to the tool, e.g. input data that is not part of the settings.
         close_current : bool
             Whether to close the current tool if one is already open.
+        **kwargs
+            Keyword arguments passed to the tool.
 
         Returns
         -------
@@ -340,7 +362,7 @@ class BaseToolWrapper(ABC, Generic[ToolOutputData, ToolSettings]):
         self._check_mode()
 
         with open_tool(oss, self._get_tool_opener(oss), close_current=close_current) as tool:
-            data = self._run_tool(tool)
+            data = self._run_tool(tool, *args, **kwargs)
 
             error_message = tool.ErrorMessage
 
@@ -0,0 +1,458 @@
+"""Critical Ray Set Generator tool and cached critical rays.
+
+`CriticalRaysetGenerator` writes a set of critical rays (e.g. the chief and marginal rays) for all fields and
+wavelengths to a critical ray set (CRS) file, which is used by the Critical Ray Tracer in non-sequential mode. The
+ZOS-API does not expose the generated rays, so ZOSPy constructs the normalized field and pupil coordinates of the same
+ray pattern and returns them as a structured array with data type `CRITICAL_RAY_DTYPE`.
+
+Several metrics need the same critical rays. `get_critical_rays` constructs the same ray pattern without running the
+tool or writing a CRS file, traces it with the Batch Ray Trace tool and caches the result for the current state of the system (see `OpticStudioSystem.cached_result`), so
+subsequent calls with the same settings reuse the traced rays instead of tracing them again. The cache is discarded
+when the system is edited through ZOSPy or when the aperture, ray aiming, field or wavelength definitions change. Call
+`OpticStudioSystem.invalidate_cached_results` after editing the lens data directly through the ZOS-API, e.g. the
+radius of a surface through `OpticStudioSystem.LDE`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Literal
+
+import numpy as np
+import pandas as pd
+from pydantic import Field
+
+from zospy.analyses.decorators import analysis_result, analysis_settings
+from zospy.analyses.parsers.types import (  # ruff: ignore[typing-only-first-party-import]
+    ValidatedNDArray,
+    ZOSAPIConstant,
+)
+from zospy.api import constants
+from zospy.api.constants import process_constant
+from zospy.tools.base import BaseToolWrapper
+from zospy.tools.raytrace import BatchRayTrace
+from zospy.utils.raytrace_dtypes import NORM_RAY_DTYPE, NORM_UNPOL_RESULT_DTYPE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "CRITICAL_RAY_DTYPE",
+    "CriticalRays",
+    "CriticalRaysetGenerator",
+    "CriticalRaysetGeneratorSettings",
+    "CriticalRaysetResult",
+    "critical_ray_pattern",
+    "get_critical_rays",
+)
+
+CRITICAL_RAY_DTYPE = np.dtype([("field", np.int32), ("wavelength", np.int32), *NORM_RAY_DTYPE.descr])
+"""Data type of critical rays: field and wavelength number, normalized field coordinates (Hx, Hy) and normalized pupil
+coordinates (Px, Py).
+
+Arrays with this data type can be traced directly with `zospy.tools.raytrace.BatchRayTrace`.
+"""
+
+
+def _pupil_pattern(ray_pattern: str, number_of_rays: int) -> np.ndarray:
+    """Get the normalized pupil coordinates (Px, Py) of a ray pattern, with shape `(n_rays, 2)`."""
+    fan = np.linspace(-1, 1, number_of_rays) if number_of_rays > 1 else np.zeros(1)
+    zeros = np.zeros_like(fan)
+
+    if ray_pattern == "ChiefAndMarginals":
+        return np.array([[0, 0], [0, 1], [0, -1], [1, 0], [-1, 0]], dtype=np.float64)
+
+    if ray_pattern == "YFan":
+        return np.column_stack([zeros, fan])
+
+    if ray_pattern == "XFan":
+        return np.column_stack([fan, zeros])
+
+    if ray_pattern == "XyFan":
+        return np.concatenate([np.column_stack([zeros, fan]), np.column_stack([fan, zeros])])
+
+    if ray_pattern == "ChiefAndRing":
+        angles = np.linspace(0, 2 * np.pi, number_of_rays, endpoint=False)
+        return np.concatenate([np.zeros((1, 2)), np.column_stack([np.sin(angles), np.cos(angles)])])
+
+    if ray_pattern == "Grid":
+        px, py = (grid.ravel() for grid in np.meshgrid(fan, fan))
+        inside = np.hypot(px, py) <= 1 + 1e-12
+        return np.column_stack([px[inside], py[inside]])
+
+    raise ValueError(f"Cannot construct the rays of ray pattern '{ray_pattern}'.")
+
+
+def critical_ray_pattern(
+    ray_pattern: constants.Tools.RayPatternOption | str, number_of_rays: int, fields: np.ndarray, n_wavelengths: int
+) -> np.ndarray:
+    """Construct the normalized coordinates of a critical ray set.
+
+    Rays are ordered by field, then by wavelength and then by pupil coordinate. 'ChiefAndMarginals' consists of the
+    chief ray and the four marginal rays at the edge of the pupil. 'YFan', 'XFan' and 'XyFan' consist of
+    `number_of_rays` rays evenly spaced along the pupil axes, 'ChiefAndRing' of the chief ray and `number_of_rays` rays
+    on the edge of the pupil and 'Grid' of the rays of a square grid of `number_of_rays` by `number_of_rays` rays that
+    lie within the pupil. 'List' rays are read from a file and cannot be constructed.
+
+    Parameters
+    ----------
+    ray_pattern : constants.Tools.RayPatternOption | str
+        The ray pattern.
+    number_of_rays : int
+        Number of rays of the pattern. Not used for 'ChiefAndMarginals'.
+    fields : np.ndarray
+        Normalized field coordinates (Hx, Hy) of all fields, with shape `(n_fields, 2)`.
+    n_wavelengths : int
+        Number of wavelengths.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with data type `CRITICAL_RAY_DTYPE`.
+
+    Raises
+    ------
+    ValueError
+        If the rays of `ray_pattern` cannot be constructed.
+    """
+    pupil = _pupil_pattern(str(ray_pattern), number_of_rays)
+    fields = np.asarray(fields, dtype=np.float64).reshape(-1, 2)
+    field_numbers, wavelength_numbers, pupil_indices = np.meshgrid(
+        np.arange(1, len(fields) + 1), np.arange(1, n_wavelengths + 1), np.arange(len(pupil)), indexing="ij"
+    )
+
+    rays = np.zeros(field_numbers.size, dtype=CRITICAL_RAY_DTYPE)
+    rays["field"] = field_numbers.ravel()
+    rays["wavelength"] = wavelength_numbers.ravel()
+    rays["Hx"], rays["Hy"] = fields[rays["field"] - 1].T
+    rays["Px"], rays["Py"] = pupil[pupil_indices.ravel()].T
+
+    return rays
+
+
+def _normalized_fields(oss: OpticStudioSystem) -> np.ndarray:
+    """Get the normalized field coordinates (Hx, Hy) of all fields, with shape `(n_fields, 2)`."""
+    fields = oss.SystemData.Fields
+    coordinates = np.array(
+        [(fields.GetField(f).X, fields.GetField(f).Y) for f in range(1, fields.NumberOfFields + 1)], dtype=np.float64
+    )
+
+    if str(fields.Normalization) == "Rectangular":
+        max_field = np.max(np.abs(coordinates), axis=0)
+    else:
+        max_field = np.max(np.hypot(coordinates[:, 0], coordinates[:, 1]))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(max_field == 0, 0.0, coordinates / max_field)
+
+
+def _ray_definitions(oss: OpticStudioSystem) -> tuple:
+    """Get the aperture, ray aiming, field and wavelength definitions of the system as a hashable tuple.
+
+    Used to cache critical rays, because these system settings are often changed directly through the ZOS-API.
+    """
+    aperture = oss.SystemData.Aperture
+    ray_aiming = oss.SystemData.RayAiming
+    fields = oss.SystemData.Fields
+    wavelengths = oss.SystemData.Wavelengths
+
+    return (
+        str(aperture.ApertureType),
+        aperture.ApertureValue,
+        str(ray_aiming.RayAiming),
+        str(fields.GetFieldType()),
+        str(fields.Normalization),
+        tuple(
+            (field.X, field.Y, field.Weight, field.VDX, field.VDY, field.VCX, field.VCY, field.VAN)
+            for field in map(fields.GetField, range(1, fields.NumberOfFields + 1))
+        ),
+        tuple(
+            (wavelength.Wavelength, wavelength.Weight)
+            for wavelength in map(wavelengths.GetWavelength, range(1, wavelengths.NumberOfWavelengths + 1))
+        ),
+    )
+
+
+@analysis_settings
+class CriticalRaysetGeneratorSettings:
+    """Settings for the Critical Ray Set Generator tool.
+
+    Attributes
+    ----------
+    ray_pattern : constants.Tools.RayPatternOption | str
+        The pattern of the rays in the pupil. Defaults to 'ChiefAndMarginals'.
+    number_of_rays : int
+        Number of rays of the pattern. Not used for the 'ChiefAndMarginals' pattern. Defaults to 5.
+    ray_scale : float | None
+        Ray scale of the critical ray set. If None, the OpticStudio default is used. Defaults to None.
+    effective_input_distance : float | None
+        Effective input distance of the rays. If None, the OpticStudio default is used. Defaults to None.
+    crs_file : str | None
+        File name of the critical ray set file. The file is saved in the directory of the lens file, or in the temporary
+        directory if the system has not been saved. If None, the name of the lens file with extension '.CRS' is used.
+        Defaults to None.
+    """
+
+    ray_pattern: ZOSAPIConstant("Tools.RayPatternOption") = Field(
+        default="ChiefAndMarginals", description="Ray pattern"
+    )
+    number_of_rays: int = Field(default=5, ge=1, description="Number of rays")
+    ray_scale: Annotated[float, Field(gt=0)] | None = Field(default=None, description="Ray scale")
+    effective_input_distance: float | None = Field(default=None, description="Effective input distance")
+    crs_file: str | None = Field(default=None, description="Critical ray set file name")
+
+
+@analysis_result
+class CriticalRaysetResult:
+    """Result of the Critical Ray Set Generator tool.
+
+    Attributes
+    ----------
+    crs_file : str
+        Full path to the critical ray set file.
+    rays : np.ndarray
+        The normalized coordinates of the critical rays of all fields and wavelengths, as a structured array with data
+        type `CRITICAL_RAY_DTYPE`.
+    """
+
+    crs_file: str
+    rays: ValidatedNDArray
+
+
+class CriticalRaysetGenerator(BaseToolWrapper[CriticalRaysetResult, CriticalRaysetGeneratorSettings]):
+    """Wrapper for the Critical Ray Set Generator tool.
+
+    The critical rays are generated for all fields and wavelengths. `ray_scale` and `effective_input_distance` only
+    affect the critical ray set file, not the normalized coordinates of the returned rays. Use `get_critical_rays` to
+    obtain the traced critical rays, cached for the current state of the system.
+
+    Examples
+    --------
+    >>> import zospy as zp
+    >>> result = zp.tools.critical_rays.CriticalRaysetGenerator(
+    ...     ray_pattern="YFan", number_of_rays=11
+    ... ).run(oss)
+    >>> result.data.crs_file
+    """
+
+    def __init__(
+        self,
+        *,
+        ray_pattern: constants.Tools.RayPatternOption | str = "ChiefAndMarginals",
+        number_of_rays: int = 5,
+        ray_scale: float | None = None,
+        effective_input_distance: float | None = None,
+        crs_file: str | None = None,
+    ):
+        """Initialize the Critical Ray Set Generator tool.
+
+        See Also
+        --------
+        CriticalRaysetGeneratorSettings : Settings for the Critical Ray Set Generator tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.ICriticalRaysetGenerator]:
+        """Get a callable that opens the Critical Ray Set Generator tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenCriticalRaysetGenerator
+
+    def _run_tool(self, tool: _ZOSAPI.Tools.ICriticalRaysetGenerator) -> CriticalRaysetResult:
+        """Run the Critical Ray Set Generator tool."""
+        system_file = Path(self.oss.SystemFile) if self.oss.SystemFile else Path(tempfile.gettempdir(), "critical_rays")
+        crs_file = str(system_file.with_name(self.settings.crs_file or f"{system_file.stem}.CRS"))
+
+        tool.RayPattern = process_constant(constants.Tools.RayPatternOption, self.settings.ray_pattern)
+        tool.NumRays = self.settings.number_of_rays
+        tool.UseAllFields = True
+        tool.UseAllWavelengths = True
+
+        if self.settings.ray_scale is not None:
+            tool.RayScale = self.settings.ray_scale
+
+        if self.settings.effective_input_distance is not None:
+            tool.EffectiveInputDistance = self.settings.effective_input_distance
+
+        tool.SaveCriticalRaysFilename = crs_file
+        tool.RunAndWaitForCompletion()
+
+        rays = critical_ray_pattern(
+            self.settings.ray_pattern,
+            self.settings.number_of_rays,
+            _normalized_fields(self.oss),
+            self.oss.SystemData.Wavelengths.NumberOfWavelengths,
+        )
+
+        return CriticalRaysetResult(crs_file=crs_file, rays=rays)
+
+
+@analysis_result
+class CriticalRays:
+    """Traced critical rays.
+
+    Attributes
+    ----------
+    rays : np.ndarray
+        The normalized coordinates of the critical rays, as a structured array with data type `CRITICAL_RAY_DTYPE`.
+    results : np.ndarray
+        The ray trace results of the critical rays, as a structured array with data type
+        `zospy.tools.raytrace.NORM_UNPOL_RESULT_DTYPE`, in the same order as `rays`.
+    """
+
+    rays: ValidatedNDArray
+    results: ValidatedNDArray
+
+    def select(self, field: int | None = None, wavelength: int | None = None) -> CriticalRays:
+        """Select the critical rays of a single field and/or wavelength.
+
+        Parameters
+        ----------
+        field : int | None
+            Field number. If None, the rays of all fields are selected. Defaults to None.
+        wavelength : int | None
+            Wavelength number. If None, the rays of all wavelengths are selected. Defaults to None.
+
+        Returns
+        -------
+        CriticalRays
+            The selected critical rays.
+        """
+        mask = np.ones(len(self.rays), dtype=bool)
+
+        if field is not None:
+            mask &= self.rays["field"] == field
+
+        if wavelength is not None:
+            mask &= self.rays["wavelength"] == wavelength
+
+        return CriticalRays(rays=self.rays[mask], results=self.results[mask])
+
+    def chief_rays(self) -> CriticalRays:
+        """Select the chief rays, i.e. the rays through the center of the pupil."""
+        mask = (self.rays["Px"] == 0) & (self.rays["Py"] == 0)
+
+        return CriticalRays(rays=self.rays[mask], results=self.results[mask])
+
+    def transverse_aberrations(self) -> np.ndarray:
+        """Calculate the transverse ray aberrations.
+
+        The transverse ray aberration is the position of a ray relative to the position of the chief ray of the same
+        field and wavelength, as in the Ray Fan analysis.
+
+        Returns
+        -------
+        np.ndarray
+            The transverse ray aberrations in x and y, with shape `(n_rays, 2)`.
+
+        Raises
+        ------
+        ValueError
+            If the ray set does not contain a chief ray for every field and wavelength.
+        """
+        chief = (self.rays["Px"] == 0) & (self.rays["Py"] == 0)
+        chief_index = np.full((self.rays["field"].max(initial=0) + 1, self.rays["wavelength"].max(initial=0) + 1), -1)
+        chief_index[self.rays["field"][chief], self.rays["wavelength"][chief]] = np.flatnonzero(chief)
+        reference = chief_index[self.rays["field"], self.rays["wavelength"]]
+
+        if np.any(reference < 0):
+            raise ValueError("The critical rays do not contain a chief ray for every field and wavelength.")
+
+        positions = np.column_stack([self.results["X"], self.results["Y"]])
+
+        return positions - positions[reference]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the critical rays and their ray trace results to a DataFrame."""
+        return pd.concat([pd.DataFrame(self.rays), pd.DataFrame(self.results)], axis=1)
+
+
+def _trace_critical_rays(
+    oss: OpticStudioSystem,
+    rays: np.ndarray,
+    ray_type: constants.Tools.RayTrace.RaysType | str,
+    to_surface: Literal["Image"] | int,
+    max_rays: int,
+) -> np.ndarray:
+    """Trace critical rays with the Batch Ray Trace tool, using a single tool run per wavelength."""
+    results = np.zeros(len(rays), dtype=NORM_UNPOL_RESULT_DTYPE)
+
+    for wavelength in np.unique(rays["wavelength"]):
+        mask = rays["wavelength"] == wavelength
+        results[mask] = (
+            BatchRayTrace(ray_type=ray_type, to_surface=to_surface, wavelength=int(wavelength), max_rays=max_rays)
+            .run(oss, rays[mask])
+            .data
+        )
+
+    return results
+
+
+def get_critical_rays(
+    oss: OpticStudioSystem,
+    *,
+    ray_pattern: constants.Tools.RayPatternOption | str = "ChiefAndMarginals",
+    number_of_rays: int = 5,
+    ray_type: constants.Tools.RayTrace.RaysType | str = "Real",
+    to_surface: Literal["Image"] | int = "Image",
+    max_rays: int = 10000,
+) -> CriticalRays:
+    """Get the traced critical rays of all fields and wavelengths, cached for the current state of the system.
+
+    On the first call for a given system state and configuration, the rays of `ray_pattern` are constructed with
+    `critical_ray_pattern`, the same rays as generated by `CriticalRaysetGenerator`, and traced with
+    `zospy.tools.raytrace.BatchRayTrace`. The Critical Ray Set Generator tool is not run, so no CRS file is written. Subsequent calls with the same
+    arguments and the same aperture, ray aiming, field and wavelength definitions return the cached result until the
+    system is edited through ZOSPy, see `OpticStudioSystem.cached_result`. Other edits made directly through the
+    ZOS-API, e.g. changing the radius of a surface through `OpticStudioSystem.LDE`, are not detected; call
+    `OpticStudioSystem.invalidate_cached_results` after such edits. The returned arrays are shared between calls and
+    should not be modified.
+
+    Parameters
+    ----------
+    oss : OpticStudioSystem
+        The OpticStudio system.
+    ray_pattern : constants.Tools.RayPatternOption | str
+        The pattern of the rays in the pupil. Defaults to 'ChiefAndMarginals'.
+    number_of_rays : int
+        Number of rays of the pattern. Not used for the 'ChiefAndMarginals' pattern. Defaults to 5.
+    ray_type : constants.Tools.RayTrace.RaysType | str
+        Trace real or paraxial rays. Defaults to 'Real'.
+    to_surface : Literal["Image"] | int
+        The surface up to which the rays are traced. Defaults to 'Image'.
+    max_rays : int
+        Maximum number of rays that is transferred to OpticStudio in a single tool run. Defaults to 10000.
+
+    Returns
+    -------
+    CriticalRays
+        The critical rays and their ray trace results.
+
+    Examples
+    --------
+    Calculate the transverse ray aberrations of the marginal rays, relative to the chief ray:
+
+    >>> import zospy as zp
+    >>> critical_rays = zp.tools.critical_rays.get_critical_rays(oss)
+    >>> critical_rays.transverse_aberrations()
+    """
+
+    def compute() -> CriticalRays:
+        rays = critical_ray_pattern(
+            ray_pattern, number_of_rays, _normalized_fields(oss), oss.SystemData.Wavelengths.NumberOfWavelengths
+        )
+
+        return CriticalRays(rays=rays, results=_trace_critical_rays(oss, rays, ray_type, to_surface, max_rays))
+
+    key = (
+        "critical_rays",
+        str(ray_pattern),
+        number_of_rays,
+        str(ray_type),
+        to_surface,
+        _ray_definitions(oss),
+    )
+
+    return oss.cached_result(key, compute)
@@ -0,0 +1,390 @@
+"""Non-sequential ray tracing and ray database (ZRD) reading.
+
+`NSCRayTrace` runs a non-sequential ray trace and optionally saves the traced rays to a ray database (ZRD) file.
+`ZRDReader` reads a ray database file into NumPy record arrays with data type `ZRD_SEGMENT_DTYPE`, one record per ray
+segment. Ray databases can be very large, so `ZRDReader.iter_run` yields the segments in chunks of a fixed size,
+without ever holding the full ray database in memory. `aggregate_detector_hits` summarizes these chunks per hit object
+while they are being read.
+"""
+
+from __future__ import annotations
+
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import numpy as np
+import pandas as pd
+from pydantic import Field
+
+from zospy.analyses.decorators import analysis_result, analysis_settings
+from zospy.analyses.parsers.types import ZOSAPIConstant  # ruff: ignore[typing-only-first-party-import]
+from zospy.api import constants
+from zospy.api.constants import process_constant
+from zospy.tools.base import BaseToolWrapper, open_tool
+from zospy.utils import clrutils
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Sequence
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "ZRD_SEGMENT_DTYPE",
+    "NSCRayTrace",
+    "NSCRayTraceResult",
+    "NSCRayTraceSettings",
+    "ZRDReader",
+    "ZRDReaderSettings",
+    "aggregate_detector_hits",
+)
+
+ZRD_SEGMENT_DTYPE = np.dtype([
+    ("ray_number", np.int32),
+    ("wave_index", np.int32),
+    ("wavelength", np.float64),
+    ("segment_level", np.int32),
+    ("segment_parent", np.int32),
+    ("hit_object", np.int32),
+    ("hit_face", np.int32),
+    ("inside_of", np.int32),
+    ("status", np.int32),
+    ("X", np.float64),
+    ("Y", np.float64),
+    ("Z", np.float64),
+    ("L", np.float64),
+    ("M", np.float64),
+    ("N", np.float64),
+    ("Exr", np.float64),
+    ("Exi", np.float64),
+    ("Eyr", np.float64),
+    ("Eyi", np.float64),
+    ("Ezr", np.float64),
+    ("Ezi", np.float64),
+    ("intensity", np.float64),
+    ("path_length", np.float64),
+    ("xy_bin", np.int32),
+    ("lm_bin", np.int32),
+    ("x_norm", np.float64),
+    ("y_norm", np.float64),
+    ("z_norm", np.float64),
+    ("index", np.float64),
+    ("starting_phase", np.float64),
+    ("phase_of", np.float64),
+    ("phase_at", np.float64),
+])
+"""Data type of a single ray segment read from a ray database.
+
+`ray_number`, `wave_index` and `wavelength` (in µm) describe the ray the segment belongs to. The remaining fields
+correspond to the output of `ZOSAPI.Tools.RayTrace.IZRDReaderResults.ReadNextSegmentFull`. `status` contains the
+integer value of the `ZOSAPI.Tools.RayTrace.RayStatus` flags of the segment.
+"""
+
+_STATUS_INDEX = 5
+
+
+def _result_read_args() -> tuple:
+    """Placeholders for the out parameters of `ReadNextResult`."""
+    return clrutils.DUMMY_INT, clrutils.DUMMY_INT, clrutils.DUMMY_DOUBLE, clrutils.DUMMY_INT
+
+
+def _segment_read_args() -> tuple:
+    """Placeholders for the out parameters of `ReadNextSegmentFull`."""
+    double, integer = clrutils.DUMMY_DOUBLE, clrutils.DUMMY_INT
+
+    return (integer,) * 5 + (clrutils.DUMMY_ENUM,) + (double,) * 14 + (integer,) * 2 + (double,) * 7
+
+
+@analysis_settings
+class NSCRayTraceSettings:
+    """Settings for the non-sequential ray trace tool.
+
+    Attributes
+    ----------
+    use_polarization : bool
+        Use polarization when tracing rays. Defaults to False.
+    split_rays : bool
+        Split rays at interfaces. Defaults to False.
+    scatter_rays : bool
+        Scatter rays. Defaults to False.
+    ignore_errors : bool
+        Ignore ray errors. Defaults to True.
+    clear_detectors : bool
+        Clear all detectors before tracing. Defaults to True.
+    save_rays : str | None
+        File name of the ray database to which the traced rays are saved. The ray database is saved in the directory
+        of the lens file. If None, no ray database is saved. Defaults to None.
+    zrd_format : constants.Tools.RayTrace.ZRDFormatType | str
+        Format of the ray database. Defaults to 'UncompressedFullData'.
+    ray_filter : str
+        Filter string that determines which rays are saved to the ray database. Defaults to an empty string.
+    number_of_cores : int | None
+        Number of CPU cores used for the ray trace. If None, the OpticStudio default is used. Defaults to None.
+    """
+
+    use_polarization: bool = Field(default=False, description="Use polarization")
+    split_rays: bool = Field(default=False, description="Split NSC rays")
+    scatter_rays: bool = Field(default=False, description="Scatter NSC rays")
+    ignore_errors: bool = Field(default=True, description="Ignore errors")
+    clear_detectors: bool = Field(default=True, description="Clear detectors before tracing")
+    save_rays: str | None = Field(default=None, description="Ray database file name")
+    zrd_format: ZOSAPIConstant("Tools.RayTrace.ZRDFormatType") = Field(
+        default="UncompressedFullData", description="Ray database format"
+    )
+    ray_filter: str = Field(default="", description="Ray database filter")
+    number_of_cores: Annotated[int, Field(ge=1)] | None = Field(default=None, description="Number of cores")
+
+
+@analysis_result
+class NSCRayTraceResult:
+    """Result of the non-sequential ray trace tool.
+
+    Attributes
+    ----------
+    total_ray_energy : float
+        Total energy of all traced rays.
+    zrd_file : str | None
+        Full path to the saved ray database, or None if no ray database was saved.
+    """
+
+    total_ray_energy: float
+    zrd_file: str | None = None
+
+
+class NSCRayTrace(BaseToolWrapper[NSCRayTraceResult, NSCRayTraceSettings]):
+    """Wrapper for the non-sequential ray trace tool.
+
+    Examples
+    --------
+    Trace rays, save them to a ray database and read the segments that hit object 3:
+
+    >>> import zospy as zp
+    >>> trace = zp.tools.nsc_raytrace.NSCRayTrace(save_rays="rays.ZRD").run(oss)
+    >>> segments = zp.tools.nsc_raytrace.ZRDReader(ray_filter="H3").run(
+    ...     oss, trace.data.zrd_file
+    ... )
+    """
+
+    def __init__(
+        self,
+        *,
+        use_polarization: bool = False,
+        split_rays: bool = False,
+        scatter_rays: bool = False,
+        ignore_errors: bool = True,
+        clear_detectors: bool = True,
+        save_rays: str | None = None,
+        zrd_format: constants.Tools.RayTrace.ZRDFormatType | str = "UncompressedFullData",
+        ray_filter: str = "",
+        number_of_cores: int | None = None,
+    ):
+        """Initialize the non-sequential ray trace tool.
+
+        See Also
+        --------
+        NSCRayTraceSettings : Settings for the non-sequential ray trace tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.RayTrace.INSCRayTrace]:
+        """Get a callable that opens the non-sequential ray trace tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenNSCRayTrace
+
+    def _run_tool(self, tool: _ZOSAPI.Tools.RayTrace.INSCRayTrace) -> NSCRayTraceResult:
+        """Run the non-sequential ray trace tool."""
+        tool.UsePolarization = self.settings.use_polarization
+        tool.SplitNSCRays = self.settings.split_rays
+        tool.ScatterNSCRays = self.settings.scatter_rays
+        tool.IgnoreErrors = self.settings.ignore_errors
+
+        if self.settings.number_of_cores is not None:
+            tool.NumberOfCores = self.settings.number_of_cores
+
+        tool.SaveRays = self.settings.save_rays is not None
+
+        if self.settings.save_rays is not None:
+            tool.SaveRaysFile = self.settings.save_rays
+            tool.ZRDFormat = process_constant(constants.Tools.RayTrace.ZRDFormatType, self.settings.zrd_format)
+            tool.Filter = self.settings.ray_filter
+
+        if self.settings.clear_detectors:
+            tool.ClearDetectors(0)
+
+        tool.RunAndWaitForCompletion()
+
+        return NSCRayTraceResult(
+            total_ray_energy=tool.GetTotalRayEnergy(),
+            zrd_file=(
+                str(Path(self.oss.SystemFile).with_name(self.settings.save_rays))
+                if self.settings.save_rays is not None
+                else None
+            ),
+        )
+
+
+def _iter_segments(
+    results: _ZOSAPI.Tools.RayTrace.IZRDReaderResults, chunk_size: int
+) -> Generator[np.ndarray, None, None]:
+    """Read all ray segments from the ray database results and yield them in chunks of `chunk_size` segments."""
+    # Bind the methods once, to avoid attribute lookups on the .NET object for every segment
+    read_next_result = results.ReadNextResult
+    read_next_segment = results.ReadNextSegmentFull
+    result_read_args, segment_read_args = _result_read_args(), _segment_read_args()
+
+    rows = []
+
+    while True:
+        success, ray_number, wave_index, wavelength, _ = read_next_result(*result_read_args)
+
+        if not success:
+            break
+
+        while True:
+            success, *segment = read_next_segment(*segment_read_args)
+
+            if not success:
+                break
+
+            segment[_STATUS_INDEX] = int(segment[_STATUS_INDEX])
+            rows.append((ray_number, wave_index, wavelength, *segment))
+
+            if len(rows) == chunk_size:
+                yield np.array(rows, dtype=ZRD_SEGMENT_DTYPE)
+                rows = []
+
+    if rows:
+        yield np.array(rows, dtype=ZRD_SEGMENT_DTYPE)
+
+
+@analysis_settings
+class ZRDReaderSettings:
+    """Settings for the ray database reader tool.
+
+    Attributes
+    ----------
+    ray_filter : str
+        Filter string that determines which rays are read, e.g. 'H3' to only read rays that hit object 3. Defaults to
+        an empty string, which reads all rays.
+    chunk_size : int
+        Number of ray segments per chunk. Defaults to 10000.
+    """
+
+    ray_filter: str = Field(default="", description="Filter string")
+    chunk_size: int = Field(default=10000, ge=1, description="Number of segments per chunk")
+
+
+class ZRDReader(BaseToolWrapper[np.ndarray, ZRDReaderSettings]):
+    """Wrapper for the ray database (ZRD) reader tool.
+
+    `run` returns all ray segments in a single record array with data type `ZRD_SEGMENT_DTYPE`. Use `iter_run` to read
+    large ray databases chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        *,
+        ray_filter: str = "",
+        chunk_size: int = 10000,
+    ):
+        """Initialize the ray database reader tool.
+
+        See Also
+        --------
+        ZRDReaderSettings : Settings for the ray database reader tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.RayTrace.IZRDReader]:
+        """Get a callable that opens the ray database reader tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenRayDatabaseReader
+
+    def _read(self, tool: _ZOSAPI.Tools.RayTrace.IZRDReader, zrd_file: str | Path) -> Generator[np.ndarray, None, None]:
+        """Read the ray database and yield the segments in chunks."""
+        tool.ZRDFile = str(zrd_file)
+        tool.Filter = self.settings.ray_filter
+
+        tool.RunAndWaitForCompletion()
+
+        yield from _iter_segments(tool.GetResults(), self.settings.chunk_size)
+
+    def _run_tool(self, tool: _ZOSAPI.Tools.RayTrace.IZRDReader, zrd_file: str | Path) -> np.ndarray:
+        """Read all segments from the ray database."""
+        chunks = list(self._read(tool, zrd_file))
+
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=ZRD_SEGMENT_DTYPE)
+
+    def iter_run(
+        self, oss: OpticStudioSystem, zrd_file: str | Path, *, close_current: bool = False
+    ) -> Generator[np.ndarray, None, None]:
+        """Read the ray database and yield the segments in chunks of `chunk_size` segments.
+
+        Only a single chunk is held in memory at a time. The tool is closed when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        oss : OpticStudioSystem
+            The OpticStudio system.
+        zrd_file : str | Path
+            Path to the ray database file.
+        close_current : bool
+            Whether to close the current tool if one is already open.
+
+        Yields
+        ------
+        np.ndarray
+            Record array with data type `ZRD_SEGMENT_DTYPE`. All chunks except the last one contain exactly
+            `chunk_size` segments.
+        """
+        self._oss = weakref.proxy(oss)
+        self._check_mode()
+
+        with open_tool(oss, self._get_tool_opener(oss), close_current=close_current) as tool:
+            yield from self._read(tool, zrd_file)
+
+
+def aggregate_detector_hits(chunks: Iterable[np.ndarray], detectors: Sequence[int] | None = None) -> pd.DataFrame:
+    """Aggregate the number of hits and the hit intensity per object from chunks of ray segments.
+
+    The chunks are processed one at a time, so this function can be applied directly to `ZRDReader.iter_run` without
+    loading the full ray database in memory.
+
+    Parameters
+    ----------
+    chunks : Iterable[np.ndarray]
+        Chunks of ray segments with data type `ZRD_SEGMENT_DTYPE`.
+    detectors : Sequence[int] | None
+        Object numbers to include in the result. If None, all hit objects are included. Defaults to None.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame indexed by object number, with the columns 'Hits' (number of segments that hit the object) and
+        'Intensity' (total intensity of these segments).
+    """
+    hits = np.zeros(0, dtype=np.int64)
+    intensity = np.zeros(0, dtype=np.float64)
+
+    for chunk in chunks:
+        hit = chunk["hit_object"] > 0
+
+        chunk_hits = np.bincount(chunk["hit_object"][hit])
+        chunk_intensities = np.bincount(chunk["hit_object"][hit], weights=chunk["intensity"][hit])
+
+        if len(chunk_hits) > len(hits):
+            hits = np.pad(hits, (0, len(chunk_hits) - len(hits)))
+            intensity = np.pad(intensity, (0, len(chunk_hits) - len(intensity)))
+
+        hits[: len(chunk_hits)] += chunk_hits
+        intensity[: len(chunk_intensities)] += chunk_intensities
+
+    objects = np.flatnonzero(hits) if detectors is None else np.asarray(detectors, dtype=np.intp)
+
+    if len(objects) and objects.max() >= len(hits):
+        hits = np.pad(hits, (0, objects.max() + 1 - len(hits)))
+        intensity = np.pad(intensity, (0, objects.max() + 1 - len(intensity)))
+
+    return pd.DataFrame(
+        {"Hits": hits[objects], "Intensity": intensity[objects]},
+        index=pd.Index(objects, name="Object"),
+    )
@@ -0,0 +1,448 @@
+"""Local, global and Hammer optimization.
+
+The optimization tools run asynchronously. While a tool runs, its merit function is polled every `poll_interval`
+seconds and reported as `OptimizationProgress`, either to a callback passed to `run` or by iterating over `iter_run`.
+An optimization is stopped when it completes, when its wall-clock budget `max_time` is exhausted, or when the merit
+function has reached a plateau: it improved less than `plateau_tolerance` (relative) during the last `plateau_time`
+seconds.
+"""
+
+from __future__ import annotations
+
+import weakref
+from abc import ABC
+from time import perf_counter
+from typing import TYPE_CHECKING, Annotated, Generic, Literal
+
+from pydantic import Field
+
+from zospy.analyses.decorators import analysis_result, analysis_settings
+from zospy.analyses.parsers.types import ZOSAPIConstant  # ruff: ignore[typing-only-first-party-import]
+from zospy.api import constants
+from zospy.api.constants import process_constant
+from zospy.tools.base import BaseToolWrapper, ToolSettings, open_tool
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "GlobalOptimization",
+    "GlobalOptimizationSettings",
+    "HammerOptimization",
+    "HammerOptimizationSettings",
+    "LocalOptimization",
+    "LocalOptimizationSettings",
+    "OptimizationProgress",
+    "OptimizationResult",
+)
+
+StopReason = Literal["Completed", "MaxTime", "Plateau"]
+
+
+@analysis_result
+class OptimizationProgress:
+    """Progress of a running optimization.
+
+    Attributes
+    ----------
+    elapsed : float
+        Time since the start of the optimization, in seconds.
+    merit_function : float
+        The current (for global optimization: the best) merit function value.
+    progress : int
+        Progress of the tool, in percent. Only meaningful for optimizations with a finite number of cycles.
+    stop_reason : {"Completed", "MaxTime", "Plateau"} | None
+        The reason the optimization was stopped, or None if it is still running.
+    """
+
+    elapsed: float
+    merit_function: float
+    progress: int
+    stop_reason: StopReason | None = None
+
+
+@analysis_result
+class OptimizationResult:
+    """Result of an optimization.
+
+    Attributes
+    ----------
+    initial_merit_function : float
+        Merit function value before the optimization.
+    final_merit_function : float
+        Merit function value after the optimization.
+    stop_reason : {"Completed", "MaxTime", "Plateau"}
+        The reason the optimization was stopped.
+    elapsed : float
+        Duration of the optimization, in seconds.
+    history : list[OptimizationProgress]
+        The polled progress of the optimization.
+    """
+
+    initial_merit_function: float
+    final_merit_function: float
+    stop_reason: StopReason
+    elapsed: float
+    history: list[OptimizationProgress] = Field(default_factory=list)
+
+
+class BaseOptimization(BaseToolWrapper[OptimizationResult, ToolSettings], ABC, Generic[ToolSettings]):
+    """Base class for the optimization tools.
+
+    Subclasses open the tool, configure the tool-specific settings and read the current merit function. This class
+    takes care of running the tool, polling its progress and stopping it.
+    """
+
+    def _configure(self, tool: _ZOSAPI.Tools.ISystemTool) -> None:
+        """Apply the tool-specific settings to `tool`."""
+
+    def _current_merit_function(self, tool: _ZOSAPI.Tools.ISystemTool) -> float:
+        """Get the current merit function value of `tool`."""
+        return tool.CurrentMeritFunction
+
+    def _is_plateau(self, samples: list[tuple[float, float]], elapsed: float, merit_function: float) -> bool:
+        """Check if the merit function improved less than `plateau_tolerance` during the last `plateau_time`."""
+        if self.settings.plateau_time is None:
+            return False
+
+        earlier = [value for time, value in samples if time <= elapsed - self.settings.plateau_time]
+
+        if not earlier:
+            return False
+
+        del samples[: len(earlier) - 1]
+
+        return earlier[-1] - merit_function <= self.settings.plateau_tolerance * abs(earlier[-1])
+
+    def _optimize(self, tool: _ZOSAPI.Tools.ISystemTool) -> Generator[OptimizationProgress, None, None]:
+        """Run the optimization and yield its progress until it is stopped."""
+        self._configure(tool)
+        tool.Algorithm = process_constant(constants.Tools.Optimization.OptimizationAlgorithm, self.settings.algorithm)
+        tool.NumberOfCores = self.settings.number_of_cores or tool.MaxCores
+
+        samples: list[tuple[float, float]] = []
+        start = perf_counter()
+        tool.Run()
+
+        try:
+            while True:
+                is_running = tool.IsRunning
+                elapsed = perf_counter() - start
+                merit_function = self._current_merit_function(tool)
+
+                if not is_running:
+                    stop_reason = "Completed"
+                elif self.settings.max_time is not None and elapsed >= self.settings.max_time:
+                    stop_reason = "MaxTime"
+                elif self._is_plateau(samples, elapsed, merit_function):
+                    stop_reason = "Plateau"
+                else:
+                    stop_reason = None
+
+                if stop_reason is not None and is_running:
+                    tool.Cancel()
+                    tool.WaitForCompletion()
+                    merit_function = self._current_merit_function(tool)
+
+                yield OptimizationProgress(
+                    elapsed=elapsed, merit_function=merit_function, progress=tool.Progress, stop_reason=stop_reason
+                )
+
+                if stop_reason is not None:
+                    return
+
+                samples.append((elapsed, merit_function))
+                tool.WaitWithTimeout(self.settings.poll_interval)
+        finally:
+            if tool.IsRunning:
+                tool.Cancel()
+                tool.WaitForCompletion()
+
+    def _run_tool(
+        self,
+        tool: _ZOSAPI.Tools.ISystemTool,
+        callback: Callable[[OptimizationProgress], None] | None = None,
+    ) -> OptimizationResult:
+        """Run the optimization, passing its progress to `callback`."""
+        history = []
+
+        try:
+            for progress in self._optimize(tool):
+                history.append(progress)
+
+                if callback is not None:
+                    callback(progress)
+        finally:
+            self.oss.invalidate_cached_results()
+
+        return OptimizationResult(
+            initial_merit_function=tool.InitialMeritFunction,
+            final_merit_function=history[-1].merit_function,
+            stop_reason=history[-1].stop_reason,
+            elapsed=history[-1].elapsed,
+            history=history,
+        )
+
+    def iter_run(
+        self, oss: OpticStudioSystem, *, close_current: bool = False
+    ) -> Generator[OptimizationProgress, None, None]:
+        """Run the optimization and yield its progress every `poll_interval` seconds.
+
+        The last item has a `stop_reason`. If the generator is closed before that, e.g. by breaking out of a loop over
+        it, the optimization is stopped. The tool is closed when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        oss : OpticStudioSystem
+            The OpticStudio system.
+        close_current : bool
+            Whether to close the current tool if one is already open.
+
+        Yields
+        ------
+        OptimizationProgress
+            The progress of the optimization.
+        """
+        self._oss = weakref.proxy(oss)
+        self._check_mode()
+
+        with open_tool(oss, self._get_tool_opener(oss), close_current=close_current) as tool:
+            try:
+                yield from self._optimize(tool)
+            finally:
+                oss.invalidate_cached_results()
+
+
+@analysis_settings
+class LocalOptimizationSettings:
+    """Settings for the local optimization tool.
+
+    Attributes
+    ----------
+    algorithm : constants.Tools.Optimization.OptimizationAlgorithm | str
+        The optimization algorithm. Defaults to 'DampedLeastSquares'.
+    cycles : constants.Tools.Optimization.OptimizationCycles | str
+        The number of optimization cycles. Defaults to 'Automatic'.
+    number_of_cores : int | None
+        Number of CPU cores used by the optimization. If None, all available cores are used. Defaults to None.
+    max_time : float | None
+        Wall-clock budget in seconds, after which the optimization is stopped. Defaults to None (no limit).
+    plateau_time : float | None
+        Time window in seconds for the plateau criterion. If None, the optimization is not stopped on a plateau.
+        Defaults to None.
+    plateau_tolerance : float
+        Minimum relative improvement of the merit function during `plateau_time`. Defaults to 1e-4.
+    poll_interval : float
+        Interval in seconds at which the progress is polled. Defaults to 1.
+    """
+
+    algorithm: ZOSAPIConstant("Tools.Optimization.OptimizationAlgorithm") = Field(
+        default="DampedLeastSquares", description="Algorithm"
+    )
+    cycles: ZOSAPIConstant("Tools.Optimization.OptimizationCycles") = Field(default="Automatic", description="Cycles")
+    number_of_cores: Annotated[int, Field(ge=1)] | None = Field(default=None, description="Number of cores")
+    max_time: Annotated[float, Field(gt=0)] | None = Field(default=None, description="Maximum run time in seconds")
+    plateau_time: Annotated[float, Field(gt=0)] | None = Field(default=None, description="Plateau window in seconds")
+    plateau_tolerance: float = Field(default=1e-4, ge=0, description="Relative plateau tolerance")
+    poll_interval: float = Field(default=1, gt=0, description="Poll interval in seconds")
+
+
+class LocalOptimization(BaseOptimization[LocalOptimizationSettings]):
+    """Wrapper for the local optimization tool.
+
+    Examples
+    --------
+    Optimize for at most 5 minutes, or until the merit function improved less than 0.1% in the last 30 seconds:
+
+    >>> import zospy as zp
+    >>> optimization = zp.tools.optimization.LocalOptimization(
+    ...     cycles="Infinite", max_time=300, plateau_time=30, plateau_tolerance=1e-3
+    ... )
+    >>> result = optimization.run(oss, callback=print)
+    >>> result.data.final_merit_function
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: constants.Tools.Optimization.OptimizationAlgorithm | str = "DampedLeastSquares",
+        cycles: constants.Tools.Optimization.OptimizationCycles | str = "Automatic",
+        number_of_cores: int | None = None,
+        max_time: float | None = None,
+        plateau_time: float | None = None,
+        plateau_tolerance: float = 1e-4,
+        poll_interval: float = 1,
+    ):
+        """Initialize the local optimization tool.
+
+        See Also
+        --------
+        LocalOptimizationSettings : Settings for the local optimization tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Optimization.ILocalOptimization]:
+        """Get a callable that opens the local optimization tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenLocalOptimization
+
+    def _configure(self, tool: _ZOSAPI.Tools.Optimization.ILocalOptimization) -> None:
+        tool.Cycles = process_constant(constants.Tools.Optimization.OptimizationCycles, self.settings.cycles)
+
+
+@analysis_settings
+class GlobalOptimizationSettings:
+    """Settings for the global optimization tool.
+
+    Attributes
+    ----------
+    algorithm : constants.Tools.Optimization.OptimizationAlgorithm | str
+        The optimization algorithm. Defaults to 'DampedLeastSquares'.
+    number_to_save : constants.Tools.Optimization.OptimizationSaveCount | str
+        The number of best systems that is saved. Defaults to 'Save_10'.
+    number_of_cores : int | None
+        Number of CPU cores used by the optimization. If None, all available cores are used. Defaults to None.
+    max_time : float | None
+        Wall-clock budget in seconds, after which the optimization is stopped. Global optimization does not stop by
+        itself, so without a budget or plateau criterion it only stops when `iter_run` is closed. Defaults to 60.
+    plateau_time : float | None
+        Time window in seconds for the plateau criterion. If None, the optimization is not stopped on a plateau.
+        Defaults to None.
+    plateau_tolerance : float
+        Minimum relative improvement of the best merit function during `plateau_time`. Defaults to 1e-4.
+    poll_interval : float
+        Interval in seconds at which the progress is polled. Defaults to 1.
+    """
+
+    algorithm: ZOSAPIConstant("Tools.Optimization.OptimizationAlgorithm") = Field(
+        default="DampedLeastSquares", description="Algorithm"
+    )
+    number_to_save: ZOSAPIConstant("Tools.Optimization.OptimizationSaveCount") = Field(
+        default="Save_10", description="Number of systems to save"
+    )
+    number_of_cores: Annotated[int, Field(ge=1)] | None = Field(default=None, description="Number of cores")
+    max_time: Annotated[float, Field(gt=0)] | None = Field(default=60, description="Maximum run time in seconds")
+    plateau_time: Annotated[float, Field(gt=0)] | None = Field(default=None, description="Plateau window in seconds")
+    plateau_tolerance: float = Field(default=1e-4, ge=0, description="Relative plateau tolerance")
+    poll_interval: float = Field(default=1, gt=0, description="Poll interval in seconds")
+
+
+class GlobalOptimization(BaseOptimization[GlobalOptimizationSettings]):
+    """Wrapper for the global optimization tool.
+
+    The reported merit function is the merit function of the best system found so far.
+
+    Examples
+    --------
+    Run a global optimization for 10 minutes and stream its progress:
+
+    >>> import zospy as zp
+    >>> optimization = zp.tools.optimization.GlobalOptimization(
+    ...     max_time=600, poll_interval=10
+    ... )
+    >>> for progress in optimization.iter_run(oss):
+    ...     print(f"{progress.elapsed:.0f} s: {progress.merit_function:.6f}")
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: constants.Tools.Optimization.OptimizationAlgorithm | str = "DampedLeastSquares",
+        number_to_save: constants.Tools.Optimization.OptimizationSaveCount | str = "Save_10",
+        number_of_cores: int | None = None,
+        max_time: float | None = 60,
+        plateau_time: float | None = None,
+        plateau_tolerance: float = 1e-4,
+        poll_interval: float = 1,
+    ):
+        """Initialize the global optimization tool.
+
+        See Also
+        --------
+        GlobalOptimizationSettings : Settings for the global optimization tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Optimization.IGlobalOptimization]:
+        """Get a callable that opens the global optimization tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenGlobalOptimization
+
+    def _configure(self, tool: _ZOSAPI.Tools.Optimization.IGlobalOptimization) -> None:
+        tool.NumberToSave = process_constant(
+            constants.Tools.Optimization.OptimizationSaveCount, self.settings.number_to_save
+        )
+
+    def _current_merit_function(self, tool: _ZOSAPI.Tools.Optimization.IGlobalOptimization) -> float:
+        return tool.CurrentMeritFunction01
+
+
+@analysis_settings
+class HammerOptimizationSettings:
+    """Settings for the Hammer optimization tool.
+
+    Attributes
+    ----------
+    algorithm : constants.Tools.Optimization.OptimizationAlgorithm | str
+        The optimization algorithm. Defaults to 'DampedLeastSquares'.
+    number_of_cores : int | None
+        Number of CPU cores used by the optimization. If None, all available cores are used. Defaults to None.
+    max_time : float | None
+        Wall-clock budget in seconds, after which the optimization is stopped. Hammer optimization does not stop by
+        itself, so without a budget or plateau criterion it only stops when `iter_run` is closed. Defaults to 60.
+    plateau_time : float | None
+        Time window in seconds for the plateau criterion. If None, the optimization is not stopped on a plateau.
+        Defaults to None.
+    plateau_tolerance : float
+        Minimum relative improvement of the merit function during `plateau_time`. Defaults to 1e-4.
+    poll_interval : float
+        Interval in seconds at which the progress is polled. Defaults to 1.
+    """
+
+    algorithm: ZOSAPIConstant("Tools.Optimization.OptimizationAlgorithm") = Field(
+        default="DampedLeastSquares", description="Algorithm"
+    )
+    number_of_cores: Annotated[int, Field(ge=1)] | None = Field(default=None, description="Number of cores")
+    max_time: Annotated[float, Field(gt=0)] | None = Field(default=60, description="Maximum run time in seconds")
+    plateau_time: Annotated[float, Field(gt=0)] | None = Field(default=None, description="Plateau window in seconds")
+    plateau_tolerance: float = Field(default=1e-4, ge=0, description="Relative plateau tolerance")
+    poll_interval: float = Field(default=1, gt=0, description="Poll interval in seconds")
+
+
+class HammerOptimization(BaseOptimization[HammerOptimizationSettings]):
+    """Wrapper for the Hammer optimization tool.
+
+    Examples
+    --------
+    Stop the Hammer optimization when the merit function improved less than 1% in the last two minutes:
+
+    >>> import zospy as zp
+    >>> optimization = zp.tools.optimization.HammerOptimization(
+    ...     max_time=3600, plateau_time=120, plateau_tolerance=0.01
+    ... )
+    >>> result = optimization.run(oss)
+    >>> result.data.stop_reason
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: constants.Tools.Optimization.OptimizationAlgorithm | str = "DampedLeastSquares",
+        number_of_cores: int | None = None,
+        max_time: float | None = 60,
+        plateau_time: float | None = None,
+        plateau_tolerance: float = 1e-4,
+        poll_interval: float = 1,
+    ):
+        """Initialize the Hammer optimization tool.
+
+        See Also
+        --------
+        HammerOptimizationSettings : Settings for the Hammer optimization tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Optimization.IHammerOptimization]:
+        """Get a callable that opens the Hammer optimization tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenHammerOptimization
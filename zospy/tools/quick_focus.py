@@ -63,3 +63,4 @@ class QuickFocus(BaseToolWrapper[None, QuickFocusSettings]):
         tool.UseCentroid = self.settings.use_centroid
 
         tool.RunAndWaitForCompletion()
+        self.oss.invalidate_cached_results()
@@ -0,0 +1,610 @@
+"""Batch Ray Trace tool.
+
+The Batch Ray Trace tool traces a large number of rays through the optical system in a single tool run. ZOSPy transfers
+the rays from and to NumPy arrays in chunks of at most `max_rays` rays, so arbitrarily large ray sets can be traced
+without holding the full ray set in OpticStudio's memory.
+
+Four ray types are supported, corresponding to the ray data types of `ZOSAPI.Tools.RayTrace.IBatchRayTrace`:
+
+- `BatchRayTrace`: normalized, unpolarized rays (`CreateNormUnpol`);
+- `NormPolBatchRayTrace`: normalized, polarized rays (`CreateNormPol`);
+- `DirectUnpolBatchRayTrace`: unpolarized rays defined by their position and direction cosines (`CreateDirectUnpol`);
+- `DirectPolBatchRayTrace`: polarized rays defined by their position and direction cosines (`CreateDirectPol`).
+
+Rays are specified either as a structured array with the field names from the corresponding `*_RAY_DTYPE`, or as a
+plain array with the required fields in the last dimension. Results are returned as structured arrays with the
+corresponding `*_RESULT_DTYPE`.
+"""
+
+from __future__ import annotations
+
+import weakref
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Generic, Literal
+
+import numpy as np
+from pydantic import Field
+
+from zospy.analyses.decorators import analysis_settings
+from zospy.analyses.parsers.types import ZOSAPIConstant  # ruff: ignore[typing-only-first-party-import]
+from zospy.api import constants
+from zospy.api.constants import process_constant
+from zospy.tools.base import BaseToolWrapper, ToolSettings, open_tool
+from zospy.utils import clrutils
+from zospy.utils.raytrace_dtypes import (
+    DIRECT_POL_RESULT_DTYPE,
+    DIRECT_RAY_DTYPE,
+    DIRECT_UNPOL_RESULT_DTYPE,
+    NORM_POL_RAY_DTYPE,
+    NORM_POL_RESULT_DTYPE,
+    NORM_RAY_DTYPE,
+    NORM_UNPOL_RESULT_DTYPE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from numpy.typing import ArrayLike
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "DIRECT_POL_RESULT_DTYPE",
+    "DIRECT_RAY_DTYPE",
+    "DIRECT_UNPOL_RESULT_DTYPE",
+    "NORM_POL_RAY_DTYPE",
+    "NORM_POL_RESULT_DTYPE",
+    "NORM_RAY_DTYPE",
+    "NORM_UNPOL_RESULT_DTYPE",
+    "BaseBatchRayTrace",
+    "BatchRayTrace",
+    "BatchRayTraceSettings",
+    "DirectPolBatchRayTrace",
+    "DirectPolBatchRayTraceSettings",
+    "DirectUnpolBatchRayTrace",
+    "DirectUnpolBatchRayTraceSettings",
+    "NormPolBatchRayTrace",
+    "NormPolBatchRayTraceSettings",
+)
+
+
+def _read_arguments(result_dtype: np.dtype) -> tuple:
+    """Placeholders for the out parameters of a `ReadNextResult` method returning `result_dtype` and a ray number."""
+    return (
+        clrutils.DUMMY_INT,
+        *tuple(
+            clrutils.DUMMY_INT if np.issubdtype(result_dtype[name], np.integer) else clrutils.DUMMY_DOUBLE
+            for name in result_dtype.names
+        ),
+    )
+
+
+def _flatten_rays(rays: ArrayLike, input_dtype: np.dtype) -> np.ndarray:
+    """Flatten input rays to a one-dimensional structured array, or a two-dimensional plain array.
+
+    Memory-mapped input arrays are not copied, so only the rays of a single chunk are loaded into memory at a time.
+    """
+    rays = np.asanyarray(rays)
+
+    if rays.dtype.names is not None:
+        return rays.reshape(-1)
+
+    n_fields = len(input_dtype.names)
+
+    if rays.ndim == 0 or rays.shape[-1] != n_fields:
+        raise ValueError(f"rays should have shape (..., {n_fields}), got {rays.shape}.")
+
+    return rays.reshape(-1, n_fields)
+
+
+def _chunk_to_list(chunk: np.ndarray, input_dtype: np.dtype, optional_fields: tuple[str, ...]) -> list[list[float]]:
+    """Convert a chunk of input rays to a list of Python floats, which are passed to OpticStudio without conversion."""
+    if chunk.dtype.names is None:
+        return chunk.astype(np.float64, copy=False).tolist()
+
+    columns = []
+
+    for name in input_dtype.names:
+        if name in chunk.dtype.names:
+            columns.append(chunk[name])
+        elif name in optional_fields:
+            columns.append(np.zeros(len(chunk)))
+        else:
+            raise ValueError(f"rays should contain the field '{name}'.")
+
+    return np.column_stack(columns).astype(np.float64, copy=False).tolist()
+
+
+def _read_results(read_next_result: Callable, read_args: tuple, n_rays: int) -> np.ndarray:
+    """Read `n_rays` results from a ray trace data object into a 2D float array.
+
+    The first column of the returned array contains the (1-based) ray number within the chunk, the remaining columns
+    contain the output values of `read_next_result`.
+    """
+    rows = []
+
+    for _ in range(n_rays):
+        success, *values = read_next_result(*read_args)
+
+        if not success:
+            break
+
+        rows.append(values)
+
+    if len(rows) != n_rays:
+        raise RuntimeError(f"Expected {n_rays} ray trace results, but only {len(rows)} could be read.")
+
+    return np.array(rows, dtype=np.float64).reshape(n_rays, -1)
+
+
+def _store_results(output: np.ndarray, results: np.ndarray) -> None:
+    """Store raw ray trace results in a structured output array, using the ray numbers to determine the positions."""
+    indices = results[:, 0].astype(np.intp) - 1
+
+    for column, name in enumerate(output.dtype.names, start=1):
+        output[name][indices] = results[:, column]
+
+
+def _get_surface_number(oss: OpticStudioSystem, surface: Literal["Image"] | int) -> int:
+    """Get the surface number for a surface specification that may refer to the image surface."""
+    if surface == "Image":
+        return oss.LDE.NumberOfSurfaces - 1
+
+    return surface
+
+
+class BaseBatchRayTrace(BaseToolWrapper[np.ndarray, ToolSettings], ABC, Generic[ToolSettings]):
+    """Base class for the Batch Ray Trace tools.
+
+    Subclasses define the input and result data types and implement the creation of the ray data object and the
+    transfer of rays to this object. This class takes care of chunking, running the tool and collecting the results.
+
+    Attributes
+    ----------
+    INPUT_DTYPE : np.dtype
+        Structured data type of the input rays.
+    OPTIONAL_INPUT_FIELDS : tuple[str, ...]
+        Fields of `INPUT_DTYPE` that are set to zero if they are missing from a structured input array.
+    RESULT_DTYPE : np.dtype
+        Structured data type of the results.
+    """
+
+    INPUT_DTYPE: ClassVar[np.dtype]
+    OPTIONAL_INPUT_FIELDS: ClassVar[tuple[str, ...]] = ()
+    RESULT_DTYPE: ClassVar[np.dtype]
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.RayTrace.IBatchRayTrace]:
+        """Get a callable that opens the Batch Ray Trace tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenBatchRayTrace
+
+    @abstractmethod
+    def _create_ray_data(self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, max_rays: int) -> Any:
+        """Create the ray data object for `max_rays` rays."""
+
+    @abstractmethod
+    def _get_ray_adder(self, ray_data: Any) -> Callable[[list[float]], Any]:
+        """Get a function that adds a single ray, specified as a list of `INPUT_DTYPE` values, to `ray_data`."""
+
+    def _get_result_reader(self, ray_data: Any) -> Callable[..., tuple]:
+        """Get the method that reads the next result from `ray_data`."""
+        return ray_data.ReadNextResult
+
+    def _trace_chunks(
+        self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, rays: np.ndarray
+    ) -> Generator[np.ndarray, None, None]:
+        """Trace flattened rays in chunks of at most `max_rays` rays and yield the results per chunk."""
+        n_rays = len(rays)
+        chunk_size = min(self.settings.max_rays, max(n_rays, 1))
+
+        ray_data = self._create_ray_data(tool, chunk_size)
+
+        # Bind the methods once, to avoid attribute lookups on the .NET object for every ray
+        add_ray = self._get_ray_adder(ray_data)
+        read_next_result = self._get_result_reader(ray_data)
+        read_args = _read_arguments(self.RESULT_DTYPE)
+
+        for offset in range(0, n_rays, chunk_size):
+            chunk = _chunk_to_list(rays[offset : offset + chunk_size], self.INPUT_DTYPE, self.OPTIONAL_INPUT_FIELDS)
+
+            ray_data.ClearData()
+
+            for ray in chunk:
+                add_ray(ray)
+
+            tool.RunAndWaitForCompletion()
+            ray_data.StartReadingResults()
+
+            result = np.zeros(len(chunk), dtype=self.RESULT_DTYPE)
+            _store_results(result, _read_results(read_next_result, read_args, len(chunk)))
+
+            yield result
+
+    def _run_tool(
+        self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, rays: ArrayLike, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Trace the rays in chunks of at most `max_rays` rays."""
+        rays = np.asanyarray(rays)
+        flat_rays = _flatten_rays(rays, self.INPUT_DTYPE)
+        shape = rays.shape if rays.dtype.names is not None else rays.shape[:-1]
+
+        if out is None:
+            out = np.zeros(len(flat_rays), dtype=self.RESULT_DTYPE)
+        elif out.dtype != self.RESULT_DTYPE or out.size != len(flat_rays):
+            raise ValueError(f"out should be an array of {len(flat_rays)} elements with dtype {self.RESULT_DTYPE}.")
+
+        flat_out = out.reshape(-1)
+        offset = 0
+
+        for result in self._trace_chunks(tool, flat_rays):
+            flat_out[offset : offset + len(result)] = result
+            offset += len(result)
+
+        return flat_out.reshape(shape)
+
+    def iter_run(
+        self, oss: OpticStudioSystem, rays: ArrayLike, *, close_current: bool = False
+    ) -> Generator[np.ndarray, None, None]:
+        """Trace rays and yield the results per chunk of at most `max_rays` rays.
+
+        Unlike `run`, this method does not collect the results, so memory use is bounded by the chunk size. If `rays` is
+        a memory-mapped array, only a single chunk of input rays is loaded into memory at a time. The tool is closed
+        when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        oss : OpticStudioSystem
+            The OpticStudio system.
+        rays : ArrayLike
+            The rays to trace. Multidimensional arrays are flattened.
+        close_current : bool
+            Whether to close the current tool if one is already open.
+
+        Yields
+        ------
+        np.ndarray
+            Structured array with `RESULT_DTYPE` containing the results for a single chunk, in input order.
+        """
+        self._oss = weakref.proxy(oss)
+        self._check_mode()
+
+        flat_rays = _flatten_rays(rays, self.INPUT_DTYPE)
+
+        with open_tool(oss, self._get_tool_opener(oss), close_current=close_current) as tool:
+            yield from self._trace_chunks(tool, flat_rays)
+
+
+@analysis_settings
+class BatchRayTraceSettings:
+    """Settings for the Batch Ray Trace tool with normalized, unpolarized rays.
+
+    Attributes
+    ----------
+    ray_type : constants.Tools.RayTrace.RaysType | str
+        Trace real or paraxial rays. Defaults to 'Real'.
+    to_surface : Literal["Image"] | int
+        The surface up to which the rays are traced. Defaults to 'Image'.
+    wavelength : int
+        The wavelength number that is used for all rays. Defaults to 1.
+    opd_mode : constants.Tools.RayTrace.OPDMode | str
+        Defines if and how the optical path difference is calculated. Defaults to 'None'.
+    max_rays : int
+        Maximum number of rays that is transferred to OpticStudio in a single tool run. Larger ray sets are traced in
+        chunks of this size. Defaults to 10000.
+    """
+
+    ray_type: ZOSAPIConstant("Tools.RayTrace.RaysType") = Field(default="Real", description="Ray type")
+    to_surface: Literal["Image"] | Annotated[int, Field(ge=1)] = Field(default="Image", description="Last surface")
+    wavelength: int = Field(default=1, ge=1, description="Wavelength number")
+    opd_mode: ZOSAPIConstant("Tools.RayTrace.OPDMode") = Field(default="None", description="OPD calculation mode")
+    max_rays: int = Field(default=10000, ge=1, description="Maximum number of rays per tool run")
+
+
+class BatchRayTrace(BaseBatchRayTrace[BatchRayTraceSettings]):
+    """Wrapper for the Batch Ray Trace tool using normalized, unpolarized rays.
+
+    The rays are specified as an array of shape (..., 4), with the columns containing the normalized field coordinates
+    Hx and Hy and the normalized pupil coordinates Px and Py, or as a structured array with data type `NORM_RAY_DTYPE`.
+    The tool returns a structured array with data type `NORM_UNPOL_RESULT_DTYPE` and the same shape as the input rays,
+    excluding the last dimension for plain arrays.
+
+    Examples
+    --------
+    Trace a fan of rays through the pupil for the on-axis field:
+
+    >>> import numpy as np
+    >>> import zospy as zp
+    >>> rays = np.zeros((101, 4))
+    >>> rays[:, 3] = np.linspace(-1, 1, 101)
+    >>> result = zp.tools.raytrace.BatchRayTrace().run(oss, rays)
+    >>> result.data["Y"]
+    """
+
+    INPUT_DTYPE = NORM_RAY_DTYPE
+    RESULT_DTYPE = NORM_UNPOL_RESULT_DTYPE
+
+    def __init__(
+        self,
+        *,
+        ray_type: constants.Tools.RayTrace.RaysType | str = "Real",
+        to_surface: Literal["Image"] | int = "Image",
+        wavelength: int = 1,
+        opd_mode: constants.Tools.RayTrace.OPDMode | str = "None",
+        max_rays: int = 10000,
+    ):
+        """Initialize the Batch Ray Trace tool.
+
+        See Also
+        --------
+        BatchRayTraceSettings : Settings for the Batch Ray Trace tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _create_ray_data(
+        self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, max_rays: int
+    ) -> _ZOSAPI.Tools.RayTrace.IRayTraceNormUnpolData:
+        return tool.CreateNormUnpol(
+            max_rays,
+            process_constant(constants.Tools.RayTrace.RaysType, self.settings.ray_type),
+            _get_surface_number(self.oss, self.settings.to_surface),
+        )
+
+    def _get_ray_adder(self, ray_data: _ZOSAPI.Tools.RayTrace.IRayTraceNormUnpolData) -> Callable[[list[float]], Any]:
+        add_ray = ray_data.AddRay
+        wavelength = self.settings.wavelength
+        opd_mode = process_constant(constants.Tools.RayTrace.OPDMode, self.settings.opd_mode)
+
+        return lambda ray: add_ray(wavelength, *ray, opd_mode)
+
+
+@analysis_settings
+class NormPolBatchRayTraceSettings:
+    """Settings for the Batch Ray Trace tool with normalized, polarized rays.
+
+    Attributes
+    ----------
+    ray_type : constants.Tools.RayTrace.RaysType | str
+        Trace real or paraxial rays. Defaults to 'Real'.
+    to_surface : Literal["Image"] | int
+        The surface up to which the rays are traced. Defaults to 'Image'.
+    wavelength : int
+        The wavelength number that is used for all rays. Defaults to 1.
+    ex : float
+        Jones vector amplitude in the x direction. Defaults to 1.
+    ey : float
+        Jones vector amplitude in the y direction. Defaults to 0.
+    phase_x : float
+        Jones vector phase in the x direction, in degrees. Defaults to 0.
+    phase_y : float
+        Jones vector phase in the y direction, in degrees. Defaults to 0.
+    max_rays : int
+        Maximum number of rays that is transferred to OpticStudio in a single tool run. Defaults to 10000.
+    """
+
+    ray_type: ZOSAPIConstant("Tools.RayTrace.RaysType") = Field(default="Real", description="Ray type")
+    to_surface: Literal["Image"] | Annotated[int, Field(ge=1)] = Field(default="Image", description="Last surface")
+    wavelength: int = Field(default=1, ge=1, description="Wavelength number")
+    ex: float = Field(default=1, description="Jones vector amplitude in x direction")
+    ey: float = Field(default=0, description="Jones vector amplitude in y direction")
+    phase_x: float = Field(default=0, description="Jones vector phase in x direction")
+    phase_y: float = Field(default=0, description="Jones vector phase in y direction")
+    max_rays: int = Field(default=10000, ge=1, description="Maximum number of rays per tool run")
+
+
+class NormPolBatchRayTrace(BaseBatchRayTrace[NormPolBatchRayTraceSettings]):
+    """Wrapper for the Batch Ray Trace tool using normalized, polarized rays.
+
+    The rays are specified as a structured array with data type `NORM_POL_RAY_DTYPE`, or as a plain array of shape
+    (..., 10). The electric field fields can be omitted from a structured array, in which case the polarization state
+    from the settings is used. The tool returns a structured array with data type `NORM_POL_RESULT_DTYPE`.
+    """
+
+    INPUT_DTYPE = NORM_POL_RAY_DTYPE
+    OPTIONAL_INPUT_FIELDS = tuple(name for name in NORM_POL_RAY_DTYPE.names if name not in NORM_RAY_DTYPE.names)
+    RESULT_DTYPE = NORM_POL_RESULT_DTYPE
+
+    def __init__(
+        self,
+        *,
+        ray_type: constants.Tools.RayTrace.RaysType | str = "Real",
+        to_surface: Literal["Image"] | int = "Image",
+        wavelength: int = 1,
+        ex: float = 1,
+        ey: float = 0,
+        phase_x: float = 0,
+        phase_y: float = 0,
+        max_rays: int = 10000,
+    ):
+        """Initialize the Batch Ray Trace tool for normalized, polarized rays.
+
+        See Also
+        --------
+        NormPolBatchRayTraceSettings : Settings for the Batch Ray Trace tool with normalized, polarized rays.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _create_ray_data(
+        self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, max_rays: int
+    ) -> _ZOSAPI.Tools.RayTrace.IRayTraceNormPolData:
+        return tool.CreateNormPol(
+            max_rays,
+            process_constant(constants.Tools.RayTrace.RaysType, self.settings.ray_type),
+            self.settings.ex,
+            self.settings.ey,
+            self.settings.phase_x,
+            self.settings.phase_y,
+            _get_surface_number(self.oss, self.settings.to_surface),
+        )
+
+    def _get_ray_adder(self, ray_data: _ZOSAPI.Tools.RayTrace.IRayTraceNormPolData) -> Callable[[list[float]], Any]:
+        add_ray = ray_data.AddRay
+        wavelength = self.settings.wavelength
+
+        return lambda ray: add_ray(wavelength, *ray)
+
+    def _get_result_reader(self, ray_data: _ZOSAPI.Tools.RayTrace.IRayTraceNormPolData) -> Callable[..., tuple]:
+        return ray_data.ReadNextResultFull
+
+
+@analysis_settings
+class DirectUnpolBatchRayTraceSettings:
+    """Settings for the Batch Ray Trace tool with unpolarized rays defined by position and direction cosines.
+
+    Attributes
+    ----------
+    ray_type : constants.Tools.RayTrace.RaysType | str
+        Trace real or paraxial rays. Defaults to 'Real'.
+    start_surface : int
+        The surface on which the rays start. Ray coordinates are specified in the local coordinate system of this
+        surface. Defaults to 0.
+    to_surface : Literal["Image"] | int
+        The surface up to which the rays are traced. Defaults to 'Image'.
+    wavelength : int
+        The wavelength number that is used for all rays. Defaults to 1.
+    max_rays : int
+        Maximum number of rays that is transferred to OpticStudio in a single tool run. Defaults to 10000.
+    """
+
+    ray_type: ZOSAPIConstant("Tools.RayTrace.RaysType") = Field(default="Real", description="Ray type")
+    start_surface: int = Field(default=0, ge=0, description="Start surface")
+    to_surface: Literal["Image"] | Annotated[int, Field(ge=1)] = Field(default="Image", description="Last surface")
+    wavelength: int = Field(default=1, ge=1, description="Wavelength number")
+    max_rays: int = Field(default=10000, ge=1, description="Maximum number of rays per tool run")
+
+
+class DirectUnpolBatchRayTrace(BaseBatchRayTrace[DirectUnpolBatchRayTraceSettings]):
+    """Wrapper for the Batch Ray Trace tool using unpolarized rays defined by position and direction cosines.
+
+    The rays are specified as a structured array with data type `DIRECT_RAY_DTYPE`, or as a plain array of shape
+    (..., 6). The tool returns a structured array with data type `DIRECT_UNPOL_RESULT_DTYPE`.
+    """
+
+    INPUT_DTYPE = DIRECT_RAY_DTYPE
+    RESULT_DTYPE = DIRECT_UNPOL_RESULT_DTYPE
+
+    def __init__(
+        self,
+        *,
+        ray_type: constants.Tools.RayTrace.RaysType | str = "Real",
+        start_surface: int = 0,
+        to_surface: Literal["Image"] | int = "Image",
+        wavelength: int = 1,
+        max_rays: int = 10000,
+    ):
+        """Initialize the Batch Ray Trace tool for direct, unpolarized rays.
+
+        See Also
+        --------
+        DirectUnpolBatchRayTraceSettings : Settings for the Batch Ray Trace tool with direct, unpolarized rays.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _create_ray_data(
+        self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, max_rays: int
+    ) -> _ZOSAPI.Tools.RayTrace.IRayTraceDirectUnpolData:
+        return tool.CreateDirectUnpol(
+            max_rays,
+            process_constant(constants.Tools.RayTrace.RaysType, self.settings.ray_type),
+            self.settings.start_surface,
+            _get_surface_number(self.oss, self.settings.to_surface),
+        )
+
+    def _get_ray_adder(self, ray_data: _ZOSAPI.Tools.RayTrace.IRayTraceDirectUnpolData) -> Callable[[list[float]], Any]:
+        add_ray = ray_data.AddRay
+        wavelength = self.settings.wavelength
+
+        return lambda ray: add_ray(wavelength, *ray)
+
+
+@analysis_settings
+class DirectPolBatchRayTraceSettings:
+    """Settings for the Batch Ray Trace tool with polarized rays defined by position and direction cosines.
+
+    Attributes
+    ----------
+    ray_type : constants.Tools.RayTrace.RaysType | str
+        Trace real or paraxial rays. Defaults to 'Real'.
+    start_surface : int
+        The surface on which the rays start. Ray coordinates are specified in the local coordinate system of this
+        surface. Defaults to 0.
+    to_surface : Literal["Image"] | int
+        The surface up to which the rays are traced. Defaults to 'Image'.
+    wavelength : int
+        The wavelength number that is used for all rays. Defaults to 1.
+    ex : float
+        Jones vector amplitude in the x direction. Defaults to 1.
+    ey : float
+        Jones vector amplitude in the y direction. Defaults to 0.
+    phase_x : float
+        Jones vector phase in the x direction, in degrees. Defaults to 0.
+    phase_y : float
+        Jones vector phase in the y direction, in degrees. Defaults to 0.
+    max_rays : int
+        Maximum number of rays that is transferred to OpticStudio in a single tool run. Defaults to 10000.
+    """
+
+    ray_type: ZOSAPIConstant("Tools.RayTrace.RaysType") = Field(default="Real", description="Ray type")
+    start_surface: int = Field(default=0, ge=0, description="Start surface")
+    to_surface: Literal["Image"] | Annotated[int, Field(ge=1)] = Field(default="Image", description="Last surface")
+    wavelength: int = Field(default=1, ge=1, description="Wavelength number")
+    ex: float = Field(default=1, description="Jones vector amplitude in x direction")
+    ey: float = Field(default=0, description="Jones vector amplitude in y direction")
+    phase_x: float = Field(default=0, description="Jones vector phase in x direction")
+    phase_y: float = Field(default=0, description="Jones vector phase in y direction")
+    max_rays: int = Field(default=10000, ge=1, description="Maximum number of rays per tool run")
+
+
+class DirectPolBatchRayTrace(BaseBatchRayTrace[DirectPolBatchRayTraceSettings]):
+    """Wrapper for the Batch Ray Trace tool using polarized rays defined by position and direction cosines.
+
+    The rays are specified as a structured array with data type `DIRECT_RAY_DTYPE`, or as a plain array of shape
+    (..., 6). The polarization state of all rays is defined by the settings. The tool returns a structured array with
+    data type `DIRECT_POL_RESULT_DTYPE`.
+    """
+
+    INPUT_DTYPE = DIRECT_RAY_DTYPE
+    RESULT_DTYPE = DIRECT_POL_RESULT_DTYPE
+
+    def __init__(
+        self,
+        *,
+        ray_type: constants.Tools.RayTrace.RaysType | str = "Real",
+        start_surface: int = 0,
+        to_surface: Literal["Image"] | int = "Image",
+        wavelength: int = 1,
+        ex: float = 1,
+        ey: float = 0,
+        phase_x: float = 0,
+        phase_y: float = 0,
+        max_rays: int = 10000,
+    ):
+        """Initialize the Batch Ray Trace tool for direct, polarized rays.
+
+        See Also
+        --------
+        DirectPolBatchRayTraceSettings : Settings for the Batch Ray Trace tool with direct, polarized rays.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _create_ray_data(
+        self, tool: _ZOSAPI.Tools.RayTrace.IBatchRayTrace, max_rays: int
+    ) -> _ZOSAPI.Tools.RayTrace.IRayTraceDirectPolData:
+        return tool.CreateDirectPol(
+            max_rays,
+            process_constant(constants.Tools.RayTrace.RaysType, self.settings.ray_type),
+            self.settings.ex,
+            self.settings.ey,
+            self.settings.phase_x,
+            self.settings.phase_y,
+            self.settings.start_surface,
+            _get_surface_number(self.oss, self.settings.to_surface),
+        )
+
+    def _get_ray_adder(self, ray_data: _ZOSAPI.Tools.RayTrace.IRayTraceDirectPolData) -> Callable[[list[float]], Any]:
+        add_ray = ray_data.AddRay
+        wavelength = self.settings.wavelength
+
+        return lambda ray: add_ray(wavelength, *ray)
+
+    def _get_result_reader(self, ray_data: _ZOSAPI.Tools.RayTrace.IRayTraceDirectPolData) -> Callable[..., tuple]:
+        return ray_data.ReadNextResultFull
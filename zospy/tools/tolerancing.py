@@ -0,0 +1,770 @@
+"""Tolerancing and tolerance data reading.
+
+`Tolerancing` runs a sensitivity and Monte Carlo tolerance analysis and `QuickSensitivity` runs a quick sensitivity
+analysis. Both save their results to a tolerance data (ZTD) file. While `Tolerancing` runs, its progress is polled every
+`poll_interval` seconds and reported as `TolerancingProgress`, either to a callback passed to `run` or by iterating over
+`iter_run`.
+
+OpticStudio only exposes the Monte Carlo trials through the tolerance data file. `ToleranceDataReader` reads this file
+and copies the trial values into a preallocated NumPy array, in chunks of `chunk_size` trials. The summary statistics
+and histograms calculated by OpticStudio are returned alongside the trials. `SensitivityDataReader` reads the estimated
+effect of every tolerance operand on every criterion into a single array.
+"""
+
+from __future__ import annotations
+
+import weakref
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Annotated, Any
+
+import numpy as np
+import pandas as pd
+from pydantic import Field
+
+from zospy.analyses.decorators import analysis_result, analysis_settings
+from zospy.analyses.parsers.types import (  # ruff: ignore[typing-only-first-party-import]
+    ValidatedDataFrame,
+    ValidatedNDArray,
+    ZOSAPIConstant,
+)
+from zospy.api import constants
+from zospy.api.constants import process_constant
+from zospy.tools.base import BaseToolWrapper, open_tool
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from zospy.api import _ZOSAPI
+    from zospy.zpcore import OpticStudioSystem
+
+__all__ = (
+    "MonteCarloResult",
+    "QuickSensitivity",
+    "QuickSensitivityResult",
+    "QuickSensitivitySettings",
+    "SensitivityDataReader",
+    "SensitivityResult",
+    "ToleranceDataReader",
+    "ToleranceDataReaderSettings",
+    "Tolerancing",
+    "TolerancingHistogram",
+    "TolerancingProgress",
+    "TolerancingResult",
+    "TolerancingSettings",
+    "load_trials",
+)
+
+_STATISTICS = {
+    "Minimum": "Minimum",
+    "Maximum": "Maximum",
+    "Mean": "Mean",
+    "SampleStandardDeviation": "Sample standard deviation",
+    "PopulationStandardDeviation": "Population standard deviation",
+    "Variance": "Variance",
+    "SampleError": "Sample error",
+    "SampleSize": "Sample size",
+}
+
+
+@analysis_settings
+class TolerancingSettings:
+    """Settings for the tolerancing tool.
+
+    Attributes
+    ----------
+    setup_mode : constants.Tools.Tolerancing.SetupModes | str
+        The sensitivity mode. Defaults to 'Sensitivity'.
+    criterion : constants.Tools.Tolerancing.Criterions | str
+        The tolerancing criterion. Defaults to 'RMSSpotRadius'.
+    criterion_sampling : int
+        Sampling used to calculate the criterion. Defaults to 3.
+    criterion_comp : constants.Tools.Tolerancing.CriterionComps | str
+        How compensators are adjusted. Defaults to 'ParaxialFocus'.
+    criterion_field : constants.Tools.Tolerancing.CriterionFields | str
+        Fields used to calculate the criterion. Defaults to 'UserDefined'.
+    number_of_runs : int
+        Number of Monte Carlo trials. Defaults to 20.
+    number_to_save : int
+        Number of Monte Carlo systems that are saved as lens files. Defaults to 0.
+    monte_carlo_statistic : constants.Tools.Tolerancing.MonteCarloStatistics | str
+        Statistical distribution of the Monte Carlo perturbations. Defaults to 'Normal'.
+    number_of_cores : int | None
+        Number of CPU cores used by the tolerancing. If None, all available cores are used. Defaults to None.
+    tol_data_file : str | None
+        File name of the tolerance data file. The file is saved in the directory of the lens file. If None, the name of
+        the lens file with extension '.ZTD' is used. Defaults to None.
+    poll_interval : float
+        Interval in seconds at which the progress is polled. Defaults to 1.
+    """
+
+    setup_mode: ZOSAPIConstant("Tools.Tolerancing.SetupModes") = Field(default="Sensitivity", description="Mode")
+    criterion: ZOSAPIConstant("Tools.Tolerancing.Criterions") = Field(default="RMSSpotRadius", description="Criterion")
+    criterion_sampling: int = Field(default=3, ge=1, description="Sampling")
+    criterion_comp: ZOSAPIConstant("Tools.Tolerancing.CriterionComps") = Field(
+        default="ParaxialFocus", description="Compensators"
+    )
+    criterion_field: ZOSAPIConstant("Tools.Tolerancing.CriterionFields") = Field(
+        default="UserDefined", description="Fields"
+    )
+    number_of_runs: int = Field(default=20, ge=0, description="Number of Monte Carlo runs")
+    number_to_save: int = Field(default=0, ge=0, description="Number of Monte Carlo files to save")
+    monte_carlo_statistic: ZOSAPIConstant("Tools.Tolerancing.MonteCarloStatistics") = Field(
+        default="Normal", description="Statistics"
+    )
+    number_of_cores: Annotated[int, Field(ge=1)] | None = Field(default=None, description="Number of cores")
+    tol_data_file: str | None = Field(default=None, description="Tolerance data file name")
+    poll_interval: float = Field(default=1, gt=0, description="Poll interval in seconds")
+
+
+@analysis_result
+class TolerancingProgress:
+    """Progress of a running tolerance analysis.
+
+    Attributes
+    ----------
+    elapsed : float
+        Time since the start of the tolerance analysis, in seconds.
+    progress : int
+        Progress of the tool, in percent.
+    completed : bool
+        Whether the tolerance analysis has finished.
+    """
+
+    elapsed: float
+    progress: int
+    completed: bool = False
+
+
+@analysis_result
+class TolerancingResult:
+    """Result of the tolerancing tool.
+
+    Attributes
+    ----------
+    tol_data_file : str
+        Full path to the tolerance data file, which can be read with `ToleranceDataReader`.
+    elapsed : float
+        Duration of the tolerance analysis, in seconds.
+    history : list[TolerancingProgress]
+        The polled progress of the tolerance analysis.
+    """
+
+    tol_data_file: str
+    elapsed: float
+    history: list[TolerancingProgress] = Field(default_factory=list)
+
+
+class Tolerancing(BaseToolWrapper[TolerancingResult, TolerancingSettings]):
+    """Wrapper for the tolerancing tool.
+
+    The tolerances are taken from the Tolerance Data Editor. The results are saved to a tolerance data file, which can
+    be read with `ToleranceDataReader`.
+
+    Examples
+    --------
+    Run 500 Monte Carlo trials and read them as a DataFrame:
+
+    >>> import zospy as zp
+    >>> tolerancing = zp.tools.tolerancing.Tolerancing(number_of_runs=500).run(
+    ...     oss, callback=print
+    ... )
+    >>> monte_carlo = zp.tools.tolerancing.ToleranceDataReader().run(
+    ...     oss, tolerancing.data.tol_data_file
+    ... )
+    >>> monte_carlo.data.to_dataframe()
+    """
+
+    def __init__(
+        self,
+        *,
+        setup_mode: constants.Tools.Tolerancing.SetupModes | str = "Sensitivity",
+        criterion: constants.Tools.Tolerancing.Criterions | str = "RMSSpotRadius",
+        criterion_sampling: int = 3,
+        criterion_comp: constants.Tools.Tolerancing.CriterionComps | str = "ParaxialFocus",
+        criterion_field: constants.Tools.Tolerancing.CriterionFields | str = "UserDefined",
+        number_of_runs: int = 20,
+        number_to_save: int = 0,
+        monte_carlo_statistic: constants.Tools.Tolerancing.MonteCarloStatistics | str = "Normal",
+        number_of_cores: int | None = None,
+        tol_data_file: str | None = None,
+        poll_interval: float = 1,
+    ):
+        """Initialize the tolerancing tool.
+
+        See Also
+        --------
+        TolerancingSettings : Settings for the tolerancing tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Tolerancing.ITolerancing]:
+        """Get a callable that opens the tolerancing tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenTolerancing
+
+    def _tol_data_file(self) -> str:
+        system_file = Path(self.oss.SystemFile)
+
+        return str(system_file.with_name(self.settings.tol_data_file or f"{system_file.stem}.ZTD"))
+
+    def _configure(self, tool: _ZOSAPI.Tools.Tolerancing.ITolerancing) -> None:
+        tool.SetupMode = process_constant(constants.Tools.Tolerancing.SetupModes, self.settings.setup_mode)
+        tool.Criterion = process_constant(constants.Tools.Tolerancing.Criterions, self.settings.criterion)
+        tool.CriterionSampling = self.settings.criterion_sampling
+        tool.CriterionComp = process_constant(constants.Tools.Tolerancing.CriterionComps, self.settings.criterion_comp)
+        tool.CriterionField = process_constant(
+            constants.Tools.Tolerancing.CriterionFields, self.settings.criterion_field
+        )
+        tool.NumberOfRuns = self.settings.number_of_runs
+        tool.NumberToSave = self.settings.number_to_save
+        tool.MonteCarloStatistic = process_constant(
+            constants.Tools.Tolerancing.MonteCarloStatistics, self.settings.monte_carlo_statistic
+        )
+        tool.SetupCore = self.settings.number_of_cores or tool.NumberOfSetupCores
+        tool.SaveTolDataFile = True
+        tool.TolDataFile = self._tol_data_file()
+
+    def _tolerance(self, tool: _ZOSAPI.Tools.Tolerancing.ITolerancing) -> Generator[TolerancingProgress, None, None]:
+        """Run the tolerance analysis and yield its progress until it has finished."""
+        self._configure(tool)
+
+        start = perf_counter()
+        tool.Run()
+
+        try:
+            while True:
+                is_running = tool.IsRunning
+
+                yield TolerancingProgress(
+                    elapsed=perf_counter() - start, progress=tool.Progress, completed=not is_running
+                )
+
+                if not is_running:
+                    return
+
+                tool.WaitWithTimeout(self.settings.poll_interval)
+        finally:
+            if tool.IsRunning:
+                tool.Cancel()
+                tool.WaitForCompletion()
+
+    def _run_tool(
+        self,
+        tool: _ZOSAPI.Tools.Tolerancing.ITolerancing,
+        callback: Callable[[TolerancingProgress], None] | None = None,
+    ) -> TolerancingResult:
+        """Run the tolerance analysis, passing its progress to `callback`."""
+        history = []
+
+        for progress in self._tolerance(tool):
+            history.append(progress)
+
+            if callback is not None:
+                callback(progress)
+
+        return TolerancingResult(tol_data_file=self._tol_data_file(), elapsed=history[-1].elapsed, history=history)
+
+    def iter_run(
+        self, oss: OpticStudioSystem, *, close_current: bool = False
+    ) -> Generator[TolerancingProgress, None, None]:
+        """Run the tolerance analysis and yield its progress every `poll_interval` seconds.
+
+        The last item has `completed` set to True. If the generator is closed before that, the tolerance analysis is
+        cancelled. The tool is closed when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        oss : OpticStudioSystem
+            The OpticStudio system.
+        close_current : bool
+            Whether to close the current tool if one is already open.
+
+        Yields
+        ------
+        TolerancingProgress
+            The progress of the tolerance analysis.
+        """
+        self._oss = weakref.proxy(oss)
+        self._check_mode()
+
+        with open_tool(oss, self._get_tool_opener(oss), close_current=close_current) as tool:
+            yield from self._tolerance(tool)
+
+
+@analysis_result
+class TolerancingHistogram:
+    """Histogram of a Monte Carlo result column.
+
+    Attributes
+    ----------
+    bin_values : np.ndarray
+        Values of the histogram bins.
+    bin_counts : np.ndarray
+        Number of trials in each bin.
+    underflow : float
+        Number of trials below the first bin.
+    overflow : float
+        Number of trials above the last bin.
+    """
+
+    bin_values: ValidatedNDArray
+    bin_counts: ValidatedNDArray
+    underflow: float
+    overflow: float
+
+
+@analysis_result
+class MonteCarloResult:
+    """Monte Carlo trials and their statistics, read from a tolerance data file.
+
+    Attributes
+    ----------
+    trials : np.ndarray
+        Trial values with shape (number of trials, number of columns).
+    columns : list[str]
+        Labels of the columns of `trials`. Tolerance operands are labelled with their type and parameters.
+    statistics : pd.DataFrame
+        Summary statistics calculated by OpticStudio, indexed by column label.
+    histograms : dict[str, TolerancingHistogram]
+        Histograms calculated by OpticStudio, by column label.
+    """
+
+    trials: ValidatedNDArray
+    columns: list[str]
+    statistics: ValidatedDataFrame
+    histograms: dict[str, TolerancingHistogram] = Field(default_factory=dict)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the trials to a DataFrame indexed by trial number, with one column per result column."""
+        return pd.DataFrame(
+            self.trials, index=pd.RangeIndex(1, len(self.trials) + 1, name="Trial"), columns=self.columns
+        )
+
+    def save_trials(self, path: str | Path) -> None:
+        """Save the trials and column labels to a compressed NumPy archive.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the archive. The extension '.npz' is appended if it is missing.
+
+        See Also
+        --------
+        load_trials : Load trials saved with this method.
+        """
+        np.savez_compressed(path, trials=self.trials, columns=np.asarray(self.columns, dtype=str))
+
+
+def load_trials(path: str | Path) -> pd.DataFrame:
+    """Load Monte Carlo trials saved with `MonteCarloResult.save_trials`.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the archive.
+
+    Returns
+    -------
+    pd.DataFrame
+        The trials, in the same format as `MonteCarloResult.to_dataframe`.
+    """
+    with np.load(path) as archive:
+        trials = archive["trials"]
+        columns = archive["columns"].tolist()
+
+    return pd.DataFrame(trials, index=pd.RangeIndex(1, len(trials) + 1, name="Trial"), columns=columns)
+
+
+def _parameter_value(parameter: _ZOSAPI.Tools.Tolerancing.ITolerancingParameter) -> float | int | str:
+    if parameter.IsDouble:
+        return parameter.DoubleValue
+
+    if parameter.IsInt:
+        return parameter.IntValue
+
+    return parameter.StringValue
+
+
+def _column_label(metadata: _ZOSAPI.Tools.Tolerancing.ITolerancingColumnMetadata) -> str:
+    """Label a result column by its name, or by its type and parameters if it is a tolerance operand."""
+    if not metadata.IsOperand:
+        return str(metadata.Name)
+
+    parameters = (_parameter_value(metadata.GetParameter(i)) for i in range(metadata.NumberOfParameters))
+
+    return " ".join([str(metadata.GetOperandType()), *map(str, parameters)])
+
+
+def _read_histogram(histogram: _ZOSAPI.Tools.Tolerancing.ITolerancingHistogram) -> TolerancingHistogram:
+    return TolerancingHistogram(
+        bin_values=np.fromiter(histogram.BinValues.Data, dtype=float, count=histogram.NumberOfBins),
+        bin_counts=np.fromiter(histogram.BinCounts.Data, dtype=float, count=histogram.NumberOfBins),
+        underflow=histogram.Underflow,
+        overflow=histogram.Overflow,
+    )
+
+
+def _fill_trials(
+    values: _ZOSAPI.Common.IMatrixData, trials: np.ndarray, chunk_size: int
+) -> Generator[np.ndarray, None, None]:
+    """Copy the trial values into `trials` and yield the filled part of every chunk of `chunk_size` trials."""
+    # The matrix is enumerated in row-major order, so consecutive elements belong to the same trial
+    elements = iter(values.Data)
+
+    for start in range(0, len(trials), chunk_size):
+        chunk = trials[start : start + chunk_size]
+        chunk.flat[:] = np.fromiter(islice(elements, chunk.size), dtype=float, count=chunk.size)
+
+        yield chunk
+
+
+def _load_tolerance_data(
+    tool: _ZOSAPI.Tools.Tolerancing.IToleranceDataViewer, tol_data_file: str | Path, data: str
+) -> Any:
+    """Load a tolerance data file in the tolerance data viewer and get one of its data sets."""
+    tool.FileName = str(tol_data_file)
+    tool.RunAndWaitForCompletion()
+
+    if getattr(tool, data) is None:
+        raise ValueError(f"The tolerance data file {tol_data_file} does not contain {data}.")
+
+    return getattr(tool, data)
+
+
+@analysis_settings
+class ToleranceDataReaderSettings:
+    """Settings for the tolerance data reader tool.
+
+    Attributes
+    ----------
+    chunk_size : int
+        Number of trials per chunk. Defaults to 1000.
+    """
+
+    chunk_size: int = Field(default=1000, ge=1, description="Number of trials per chunk")
+
+
+class ToleranceDataReader(BaseToolWrapper[MonteCarloResult, ToleranceDataReaderSettings]):
+    """Wrapper for the tolerance data viewer tool, reading the Monte Carlo results of a tolerance data file.
+
+    `run` returns all trials with their statistics and histograms. Use `iter_run` to process the trials chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = 1000,
+    ):
+        """Initialize the tolerance data reader tool.
+
+        See Also
+        --------
+        ToleranceDataReaderSettings : Settings for the tolerance data reader tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Tolerancing.IToleranceDataViewer]:
+        """Get a callable that opens the tolerance data viewer tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenToleranceDataViewer
+
+    @staticmethod
+    def _load(
+        tool: _ZOSAPI.Tools.Tolerancing.IToleranceDataViewer, tol_data_file: str | Path
+    ) -> _ZOSAPI.Tools.Tolerancing.IMonteCarloData:
+        """Load the tolerance data file and get its Monte Carlo data."""
+        return _load_tolerance_data(tool, tol_data_file, "MonteCarloData")
+
+    def _run_tool(
+        self, tool: _ZOSAPI.Tools.Tolerancing.IToleranceDataViewer, tol_data_file: str | Path
+    ) -> MonteCarloResult:
+        """Read the Monte Carlo trials, statistics and histograms from the tolerance data file."""
+        monte_carlo_data = self._load(tool, tol_data_file)
+        values = monte_carlo_data.Values
+
+        trials = np.empty((values.Rows, values.Cols))
+
+        for _ in _fill_trials(values, trials, self.settings.chunk_size):
+            pass
+
+        metadata = [monte_carlo_data.GetMetadata(i) for i in range(values.Cols)]
+        columns = [_column_label(m) for m in metadata]
+        summary_statistics = [m.SummaryStatistics for m in metadata]
+
+        statistics = pd.DataFrame(
+            [[getattr(s, attribute) for attribute in _STATISTICS] for s in summary_statistics],
+            index=pd.Index(columns, name="Column"),
+            columns=list(_STATISTICS.values()),
+        )
+        histograms = {
+            column: _read_histogram(s.Histogram) for column, s in zip(columns, summary_statistics, strict=True)
+        }
+
+        return MonteCarloResult(trials=trials, columns=columns, statistics=statistics, histograms=histograms)
+
+    def iter_run(
+        self, oss: OpticStudioSystem, tol_data_file: str | Path, *, close_current: bool = False
+    ) -> Generator[np.ndarray, None, None]:
+        """Read the Monte Carlo trials and yield them in chunks of `chunk_size` trials.
+
+        The chunks are views of a single preallocated array, which holds all trials when the generator is exhausted.
+        The tool is closed when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        oss : OpticStudioSystem
+            The OpticStudio system.
+        tol_data_file : str | Path
+            Path to the tolerance data file.
+        close_current : bool
+            Whether to close the current tool if one is already open.
+
+        Yields
+        ------
+        np.ndarray
+            Trial values with shape (number of trials in the chunk, number of columns).
+        """
+        self._oss = weakref.proxy(oss)
+        self._check_mode()
+
+        with open_tool(oss, self._get_tool_opener(oss), close_current=close_current) as tool:
+            values = self._load(tool, tol_data_file).Values
+
+            yield from _fill_trials(values, np.empty((values.Rows, values.Cols)), self.settings.chunk_size)
+
+
+@analysis_settings
+class QuickSensitivitySettings:
+    """Settings for the quick sensitivity tool.
+
+    Attributes
+    ----------
+    criterion : constants.Tools.Tolerancing.QSCriterions | str
+        The sensitivity criterion. Defaults to 'RMSSpotRadius'.
+    field : constants.Tools.Tolerancing.CriterionFields | str
+        Fields used to calculate the criterion. Defaults to 'UserDefined'.
+    sampling : int
+        Sampling used to calculate the criterion. Defaults to 3.
+    configuration : int
+        The configuration number. Defaults to 1.
+    ztd_file : str | None
+        File name of the tolerance data file. The file is saved in the directory of the lens file. If None, the name of
+        the lens file with extension '.ZTD' is used. Defaults to None.
+    """
+
+    criterion: ZOSAPIConstant("Tools.Tolerancing.QSCriterions") = Field(
+        default="RMSSpotRadius", description="Criterion"
+    )
+    field: ZOSAPIConstant("Tools.Tolerancing.CriterionFields") = Field(default="UserDefined", description="Fields")
+    sampling: int = Field(default=3, ge=1, description="Sampling")
+    configuration: int = Field(default=1, ge=1, description="Configuration number")
+    ztd_file: str | None = Field(default=None, description="Tolerance data file name")
+
+
+@analysis_result
+class QuickSensitivityResult:
+    """Result of the quick sensitivity tool.
+
+    Attributes
+    ----------
+    ztd_file : str
+        Full path to the tolerance data file, which can be read with `SensitivityDataReader`.
+    results_file : str
+        Full path to the text file with the results.
+    """
+
+    ztd_file: str
+    results_file: str
+
+
+class QuickSensitivity(BaseToolWrapper[QuickSensitivityResult, QuickSensitivitySettings]):
+    """Wrapper for the quick sensitivity tool.
+
+    The tolerances are taken from the Tolerance Data Editor. The results are saved to a tolerance data file, which can
+    be read with `SensitivityDataReader`.
+
+    Examples
+    --------
+    Rank the tolerance operands by their effect on the RMS wavefront error:
+
+    >>> import zospy as zp
+    >>> quick_sensitivity = zp.tools.tolerancing.QuickSensitivity(
+    ...     criterion="RMSWavefront"
+    ... ).run(oss)
+    >>> sensitivity = zp.tools.tolerancing.SensitivityDataReader().run(
+    ...     oss, quick_sensitivity.data.ztd_file
+    ... )
+    >>> sensitivity.data.rank()
+    """
+
+    def __init__(
+        self,
+        *,
+        criterion: constants.Tools.Tolerancing.QSCriterions | str = "RMSSpotRadius",
+        field: constants.Tools.Tolerancing.CriterionFields | str = "UserDefined",
+        sampling: int = 3,
+        configuration: int = 1,
+        ztd_file: str | None = None,
+    ):
+        """Initialize the quick sensitivity tool.
+
+        See Also
+        --------
+        QuickSensitivitySettings : Settings for the quick sensitivity tool.
+        """
+        super().__init__(settings_kws=locals())
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Tolerancing.IQuickSensitivity]:
+        """Get a callable that opens the quick sensitivity tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenQuickSensitivity
+
+    def _run_tool(self, tool: _ZOSAPI.Tools.Tolerancing.IQuickSensitivity) -> QuickSensitivityResult:
+        """Run the quick sensitivity tool."""
+        system_file = Path(self.oss.SystemFile)
+        ztd_file = str(system_file.with_name(self.settings.ztd_file or f"{system_file.stem}.ZTD"))
+
+        tool.Criterion = process_constant(constants.Tools.Tolerancing.QSCriterions, self.settings.criterion)
+        tool.Field = process_constant(constants.Tools.Tolerancing.CriterionFields, self.settings.field)
+        tool.Sampling = self.settings.sampling
+        tool.Configuration = self.settings.configuration
+        tool.ZTDFile = ztd_file
+
+        tool.RunAndWaitForCompletion()
+
+        return QuickSensitivityResult(ztd_file=ztd_file, results_file=tool.ResultsFile)
+
+
+@analysis_result
+class SensitivityResult:
+    """Estimated effects of the tolerance operands on the tolerancing criteria.
+
+    Attributes
+    ----------
+    effects : np.ndarray
+        Estimated change of the criteria with shape (number of operands, number of criteria, 2). The last axis holds
+        the change at the minimum and at the maximum tolerance of the operand.
+    operands : list[str]
+        Labels of the tolerance operands, consisting of their type and parameters.
+    criteria : list[str]
+        Names of the criteria.
+    nominal_values : np.ndarray
+        Nominal values of the criteria.
+    tolerances : np.ndarray
+        Minimum and maximum tolerances of the operands, with shape (number of operands, 2).
+    compensators : pd.DataFrame
+        Statistics of the compensators, indexed by compensator label.
+    """
+
+    effects: ValidatedNDArray
+    operands: list[str]
+    criteria: list[str]
+    nominal_values: ValidatedNDArray
+    tolerances: ValidatedNDArray
+    compensators: ValidatedDataFrame
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the effects to a DataFrame indexed by operand, with a column for every criterion and tolerance limit.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with columns (Criterion, Limit), where Limit is either 'Minimum' or 'Maximum'.
+        """
+        return pd.DataFrame(
+            self.effects.reshape(len(self.operands), -1),
+            index=pd.Index(self.operands, name="Operand"),
+            columns=pd.MultiIndex.from_product([self.criteria, ["Minimum", "Maximum"]], names=["Criterion", "Limit"]),
+        )
+
+    def rank(self, criterion: int | str = 0) -> pd.Series:
+        """Rank the operands by their worst-case effect on a criterion.
+
+        Parameters
+        ----------
+        criterion : int | str
+            Index or name of the criterion. Defaults to the first criterion.
+
+        Returns
+        -------
+        pd.Series
+            The largest absolute change of the criterion per operand, in descending order.
+        """
+        index = self.criteria.index(criterion) if isinstance(criterion, str) else criterion
+        worst_case = np.abs(self.effects[:, index]).max(axis=1, initial=0)
+
+        return pd.Series(
+            worst_case, index=pd.Index(self.operands, name="Operand"), name=self.criteria[index]
+        ).sort_values(ascending=False, kind="stable")
+
+
+_COMPENSATOR_STATISTICS = {
+    "Minimum": "Minimum",
+    "Maximum": "Maximum",
+    "Mean": "Mean",
+    "SampleStandardDeviation": "Sample standard deviation",
+    "PopulationStandardDeviation": "Population standard deviation",
+}
+
+
+def _read_sensitivity(data: _ZOSAPI.Tools.Tolerancing.ISensitivityData) -> SensitivityResult:
+    """Read the effects of all operands on all criteria in a single pass over the operands."""
+    n_operands = data.NumberOfResultOperands
+    n_criteria = data.NumberOfCriteria
+
+    effects = np.empty((n_operands, n_criteria, 2))
+    tolerances = np.empty((n_operands, 2))
+    operands = []
+
+    # Bind the methods once, to avoid attribute lookups on the .NET objects for every effect
+    get_operand = data.GetOperand
+
+    for i in range(n_operands):
+        operand = get_operand(i)
+        get_effect = operand.GetEffectOnCriterion
+
+        operands.append(_column_label(operand))
+        tolerances[i] = operand.Minimum, operand.Maximum
+
+        for j in range(n_criteria):
+            effect = get_effect(j)
+            effects[i, j] = effect.EstimatedChangeMinimum, effect.EstimatedChangeMaximum
+
+    criteria = [data.GetCriterion(j) for j in range(n_criteria)]
+    compensators = [data.GetCompensator(k) for k in range(data.NumberOfCompensators)]
+
+    return SensitivityResult(
+        effects=effects,
+        operands=operands,
+        criteria=[str(criterion.Name) for criterion in criteria],
+        nominal_values=np.array([criterion.NominalValue for criterion in criteria], dtype=float),
+        tolerances=tolerances,
+        compensators=pd.DataFrame(
+            [[getattr(c, attribute) for attribute in _COMPENSATOR_STATISTICS] for c in compensators],
+            index=pd.Index([_column_label(c) for c in compensators], name="Compensator"),
+            columns=list(_COMPENSATOR_STATISTICS.values()),
+        ),
+    )
+
+
+class SensitivityDataReader(BaseToolWrapper[SensitivityResult, None]):
+    """Wrapper for the tolerance data viewer tool, reading the sensitivity results of a tolerance data file.
+
+    Tolerance data files are created by `Tolerancing` and `QuickSensitivity`.
+    """
+
+    def __init__(self):
+        """Initialize the sensitivity data reader tool.
+
+        This tool does not require any settings.
+        """
+        super().__init__()
+
+    def _get_tool_opener(self, oss: OpticStudioSystem) -> Callable[[], _ZOSAPI.Tools.Tolerancing.IToleranceDataViewer]:
+        """Get a callable that opens the tolerance data viewer tool in OpticStudio and returns the tool object."""
+        return oss.Tools.OpenToleranceDataViewer
+
+    def _run_tool(
+        self, tool: _ZOSAPI.Tools.Tolerancing.IToleranceDataViewer, tol_data_file: str | Path
+    ) -> SensitivityResult:
+        """Read the sensitivity data from the tolerance data file."""
+        return _read_sensitivity(_load_tolerance_data(tool, tol_data_file, "SensitivityData"))
@@ -5,11 +5,12 @@ through its submodules:
 
 - **`zospy.utils.clrutils`** provides utility functions for working with the ZOS-API .NET types;
 - **`zospy.utils.pyutils`** provides utility functions for working with Python types;
+- **`zospy.utils.raytrace_dtypes`** provides the structured data types of rays and ray trace results;
 - **`zospy.utils.zputils`** provides utility functions for working with Zemax OpticStudio.
 """
 
 from __future__ import annotations
 
-from zospy.utils import clrutils, pyutils, zputils
+from zospy.utils import clrutils, pyutils, raytrace_dtypes, zputils
 
-__all__ = ("clrutils", "pyutils", "zputils")
+__all__ = ("clrutils", "pyutils", "raytrace_dtypes", "zputils")
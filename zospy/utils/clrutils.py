@@ -1,18 +1,43 @@
-"""Utilities for working with the Common Language Runtime (CLR)."""
+"""Utilities for working with the Common Language Runtime (CLR).
+
+The CLR is loaded when one of these utilities is used for the first time, not when this module is imported. This allows
+to use the parts of ZOSPy that do not communicate with OpticStudio, such as the parsers and `zospy.local`, on systems
+without a .NET runtime.
+"""
 
 from __future__ import annotations
 
 import os
 from collections import namedtuple
 from datetime import datetime as dt
+from functools import cache
 
-import clr
-from System import Double, Enum, Reflection
-
-DUMMY_DOUBLE = Double(0.0)
 DUMMY_ENUM = 0
 
 
+@cache
+def _system():
+    """Import the .NET `System` namespace, loading the CLR on first use."""
+    import clr  # ruff: ignore[import-outside-top-level, unused-import]
+    import System  # ruff: ignore[import-outside-top-level]
+
+    return System
+
+
+def __getattr__(name: str):
+    """Create the .NET placeholders `DUMMY_DOUBLE` and `DUMMY_INT` on first access."""
+    if name == "DUMMY_DOUBLE":
+        value = _system().Double(0.0)
+    elif name == "DUMMY_INT":
+        value = _system().Int32(0)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+
+    return value
+
+
 def clr_get_available_assemblies(*, with_meta=True):
     """Get all the available assemblies from the Common Language Runtime.
 
@@ -26,6 +51,8 @@ def clr_get_available_assemblies(*, with_meta=True):
     list
         A list of all available assemblies
     """
+    import clr  # ruff: ignore[import-outside-top-level]
+
     return list(clr.ListAssemblies(with_meta))
 
 
@@ -47,7 +74,7 @@ def reflect_dll_content(dllfilepath):
     if not dllfilepath.lower().endswith(".dll"):
         raise ValueError("dllfilepath should end with .dll (case is ignored)")
 
-    content = list(Reflection.Assembly.LoadFile(dllfilepath).GetTypes())
+    content = list(_system().Reflection.Assembly.LoadFile(dllfilepath).GetTypes())
 
     namespaces = sorted({item.Namespace for item in content})
     enums = sorted([item.FullName for item in content if item.IsEnum])
@@ -69,7 +96,7 @@ def system_get_enum_key_from_value(enum, value):
     Any
         The corresponding key
     """
-    return Enum.GetName(enum, value)
+    return _system().Enum.GetName(enum, value)
 
 
 def system_get_enum_names(enum):
@@ -85,7 +112,7 @@ def system_get_enum_names(enum):
     list
         A list containing the names of the Enum instance
     """
-    return list(Enum.GetNames(enum))
+    return list(_system().Enum.GetNames(enum))
 
 
 def system_get_enum_values(enum):
@@ -101,7 +128,7 @@ def system_get_enum_values(enum):
     list
         A list containing the values of the Enum instance
     """
-    return list(Enum.GetValues(enum))
+    return list(_system().Enum.GetValues(enum))
 
 
 def system_enum_to_namedtuple(enum):
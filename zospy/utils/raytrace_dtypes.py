@@ -0,0 +1,98 @@
+"""Structured data types of rays and ray trace results.
+
+The data types are shared by the OpticStudio batch ray trace tools in `zospy.tools.raytrace` and the local ray tracer in
+`zospy.local.raytrace`, and are also available from `zospy.tools.raytrace`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+__all__ = (
+    "DIRECT_POL_RESULT_DTYPE",
+    "DIRECT_RAY_DTYPE",
+    "DIRECT_UNPOL_RESULT_DTYPE",
+    "NORM_POL_RAY_DTYPE",
+    "NORM_POL_RESULT_DTYPE",
+    "NORM_RAY_DTYPE",
+    "NORM_UNPOL_RESULT_DTYPE",
+)
+
+_POSITION_FIELDS = [("X", np.float64), ("Y", np.float64), ("Z", np.float64)]
+_DIRECTION_FIELDS = [("L", np.float64), ("M", np.float64), ("N", np.float64)]
+_NORMAL_FIELDS = [("l2", np.float64), ("m2", np.float64), ("n2", np.float64)]
+_ELECTRIC_FIELD_FIELDS = [
+    ("Exr", np.float64),
+    ("Exi", np.float64),
+    ("Eyr", np.float64),
+    ("Eyi", np.float64),
+    ("Ezr", np.float64),
+    ("Ezi", np.float64),
+]
+
+NORM_RAY_DTYPE = np.dtype([("Hx", np.float64), ("Hy", np.float64), ("Px", np.float64), ("Py", np.float64)])
+"""Input data type for normalized rays: normalized field coordinates (Hx, Hy) and pupil coordinates (Px, Py)."""
+
+NORM_POL_RAY_DTYPE = np.dtype(NORM_RAY_DTYPE.descr + _ELECTRIC_FIELD_FIELDS)
+"""Input data type for normalized, polarized rays.
+
+The electric field fields are optional when using a structured array. If all electric field components of a ray are
+zero, OpticStudio uses the polarization state specified in the tool settings.
+"""
+
+DIRECT_RAY_DTYPE = np.dtype(_POSITION_FIELDS + _DIRECTION_FIELDS)
+"""Input data type for direct rays: starting position (X, Y, Z) and direction cosines (L, M, N)."""
+
+NORM_UNPOL_RESULT_DTYPE = np.dtype([
+    ("error_code", np.int32),
+    ("vignette_code", np.int32),
+    *_POSITION_FIELDS,
+    *_DIRECTION_FIELDS,
+    *_NORMAL_FIELDS,
+    ("opd", np.float64),
+    ("intensity", np.float64),
+])
+"""Result data type of `zospy.tools.raytrace.BatchRayTrace`.
+
+The fields correspond to the output of `ZOSAPI.Tools.RayTrace.IRayTraceNormUnpolData.ReadNextResult`. `l2`, `m2` and
+`n2` are the direction cosines of the surface normal at the ray intercept.
+"""
+
+DIRECT_UNPOL_RESULT_DTYPE = np.dtype([
+    ("error_code", np.int32),
+    ("vignette_code", np.int32),
+    *_POSITION_FIELDS,
+    *_DIRECTION_FIELDS,
+    *_NORMAL_FIELDS,
+    ("intensity", np.float64),
+])
+"""Result data type of `zospy.tools.raytrace.DirectUnpolBatchRayTrace`.
+
+The fields correspond to the output of `ZOSAPI.Tools.RayTrace.IRayTraceDirectUnpolData.ReadNextResult`.
+"""
+
+DIRECT_POL_RESULT_DTYPE = np.dtype([
+    ("error_code", np.int32),
+    ("vignette_code", np.int32),
+    *_POSITION_FIELDS,
+    *_DIRECTION_FIELDS,
+    *_ELECTRIC_FIELD_FIELDS,
+    ("intensity", np.float64),
+])
+"""Result data type of `zospy.tools.raytrace.DirectPolBatchRayTrace`.
+
+The fields correspond to the output of `ZOSAPI.Tools.RayTrace.IRayTraceDirectPolData.ReadNextResultFull`.
+"""
+
+NORM_POL_RESULT_DTYPE = np.dtype([
+    ("error_code", np.int32),
+    *_POSITION_FIELDS,
+    *_DIRECTION_FIELDS,
+    *_ELECTRIC_FIELD_FIELDS,
+    ("intensity", np.float64),
+])
+"""Result data type of `zospy.tools.raytrace.NormPolBatchRayTrace`.
+
+The fields correspond to the output of `ZOSAPI.Tools.RayTrace.IRayTraceNormPolData.ReadNextResultFull`. Normalized
+polarized ray traces do not report a vignetting code.
+"""
@@ -5,6 +5,8 @@ This module provides two classes:
 - `ZOS` is used to connect to OpticStudio and manage the connection.
 - `OpticStudioSystem` is used to interact with the optical system.
 
+`invalidate_cached_results` discards the results cached by `OpticStudioSystem.cached_result`.
+
 Examples
 --------
 Connect to OpticStudio and create a new optical system:
@@ -23,8 +25,9 @@ import locale
 import logging
 import warnings
 import weakref
+from contextlib import contextmanager
 from sys import version_info
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from weakref import WeakValueDictionary
 
 from semver.version import Version
@@ -34,14 +37,34 @@ from zospy.api.apisupport import load_zosapi, load_zosapi_nethelper
 from zospy.utils.pyutils import abspath
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Hashable
     from os import PathLike
 
     from zospy.api import _ZOSAPI
+    from zospy.functions._editor import CommentIndex
 
-__all__ = ("ZOS", "OpticStudioSystem")
+__all__ = ("ZOS", "OpticStudioSystem", "invalidate_cached_results")
 
 logger = logging.getLogger(__name__)
 
+_systems: weakref.WeakSet[OpticStudioSystem] = weakref.WeakSet()
+"""All OpticStudioSystem instances, used to discard cached results after edits that cannot be traced to a system."""
+
+
+def invalidate_cached_results(oss: OpticStudioSystem | None = None) -> None:
+    """Discard the results cached with `OpticStudioSystem.cached_result`.
+
+    Used by functions that edit a system through editor rows or cells, which do not refer to their system.
+
+    Parameters
+    ----------
+    oss : OpticStudioSystem | None
+        The system of which the cached results are discarded. Defaults to None, in which case the cached results of all
+        open systems are discarded.
+    """
+    for system in [oss] if oss is not None else list(_systems):
+        system.invalidate_cached_results()
+
 
 class OpticStudioSystem:
     """Wrapper for OpticStudio System instances."""
@@ -72,6 +95,10 @@ class OpticStudioSystem:
 
         self._System: _ZOSAPI.IOpticalSystem = system_instance
         self._OpenFile = None
+        self._comment_indexes: dict[str, CommentIndex] = {}
+        self._cached_results: dict[Hashable, Any] = {}
+
+        _systems.add(self)
 
     @property
     def SystemName(self) -> str:  # ruff: ignore[invalid-function-name]
@@ -206,6 +233,101 @@ class OpticStudioSystem:
     def SessionModes(self, value: constants.SessionModes | str):  # ruff: ignore[invalid-function-name]
         self._System.SessionMode = constants.process_constant(constants.SessionModes, value)
 
+    @contextmanager
+    def suspend_updates(self) -> Generator[OpticStudioSystem, None, None]:
+        """Temporarily suspend lens updates, session recording and UI updates.
+
+        Within this context, the lens update mode is set to 'None', the session mode to 'SessionOff' and changes are
+        not shown in the user interface. This speeds up many consecutive edits. The original settings are restored on
+        exit, also if an exception is raised. Because the system is assumed to be edited within this context, the cached
+        results (see `cached_result`) are discarded on exit.
+
+        Yields
+        ------
+        OpticStudioSystem
+            This optical system.
+
+        Examples
+        --------
+        >>> import zospy as zp
+        >>> zos = zp.ZOS()
+        >>> oss = zos.connect()
+        >>> with oss.suspend_updates():
+        ...     for i in range(1, oss.LDE.NumberOfSurfaces - 1):
+        ...         oss.LDE.GetSurfaceAt(i).Thickness = 1
+        """
+        application = self._System.TheApplication
+        update_mode = self._System.UpdateMode
+        session_mode = self._System.SessionMode
+        show_changes_in_ui = application.ShowChangesInUI
+
+        self._System.UpdateMode = constants.process_constant(constants.LensUpdateMode, None)
+        self._System.SessionMode = constants.process_constant(constants.SessionModes, "SessionOff")
+        application.ShowChangesInUI = False
+
+        try:
+            yield self
+        finally:
+            self._System.UpdateMode = update_mode
+            self._System.SessionMode = session_mode
+            application.ShowChangesInUI = show_changes_in_ui
+            self.invalidate_cached_results()
+
+    def cached_result(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get a result that is cached for the current state of the system, computing it if it is not cached.
+
+        Results are cached per configuration: the current configuration of the Multi-Configuration Editor is part of
+        the cache key. The cache is discarded when the system is edited through ZOSPy, i.e. when a system is loaded or
+        created, when the mode of the system is changed, when `suspend_updates` is exited (which is used by the bulk
+        editing functions in `zospy.functions` and `zospy.solvers`), when solves are set with `zospy.solvers` or surface,
+        object or aperture types are changed with `zospy.functions` (which discard the cached results of all systems
+        unless the system is passed as `oss`, see `invalidate_cached_results`), when variables are set by
+        `zospy.functions.mfe.MeritFunctionEvaluator`, and after running the Quick Focus and optimization tools. Call
+        `invalidate_cached_results` after changing the system directly through the ZOS-API, e.g. through `LDE` or
+        `SystemData`.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the result, which should include all settings that were used to compute it.
+        compute : Callable[[], Any]
+            Function that computes the result if it is not cached.
+
+        Returns
+        -------
+        Any
+            The cached or newly computed result.
+        """
+        key = (key, self._System.MCE.CurrentConfiguration)
+
+        if key not in self._cached_results:
+            self._cached_results[key] = compute()
+
+        return self._cached_results[key]
+
+    def invalidate_cached_results(self):
+        """Discard all results cached with `cached_result`."""
+        self._cached_results.clear()
+
+    def invalidate_comment_indexes(self, editor: Literal["LDE", "NCE"] | None = None):
+        """Discard the cached comment indexes of the editors.
+
+        The comment indexes used by `zospy.functions.lde.comment_index` and `zospy.functions.nce.comment_index` are
+        rebuilt automatically when the number of rows changes, when comments are changed through
+        `zospy.functions.lde.apply` or `zospy.functions.nce.apply`, and when a new system is loaded. Call this method
+        after changing comments directly through the ZOS-API, or after inserting and removing the same number of rows.
+
+        Parameters
+        ----------
+        editor : Literal['LDE', 'NCE'] | None
+            The editor of which the comment index is discarded. Defaults to None, in which case the comment indexes of
+            all editors are discarded.
+        """
+        if editor is None:
+            self._comment_indexes.clear()
+        else:
+            self._comment_indexes.pop(editor, None)
+
     def get_current_status(self) -> str:
         """Get the last status of the optical system. If null or the length is 0, then the system has no errors.
 
@@ -228,10 +350,14 @@ class OpticStudioSystem:
 
     def make_sequential(self) -> bool:
         """Set the optical system to sequential mode if it is not already."""
+        self.invalidate_comment_indexes()
+        self.invalidate_cached_results()
         return self._System.MakeSequential()
 
     def make_nonsequential(self) -> bool:
         """Set the optical system to non-sequential mode if it is not already."""
+        self.invalidate_comment_indexes()
+        self.invalidate_cached_results()
         return self._System.MakeNonSequential()
 
     def load(self, filepath: str | PathLike, *, saveifneeded: bool = False):
@@ -250,6 +376,8 @@ class OpticStudioSystem:
 
         self._System.LoadFile(filepath, saveifneeded)
         self._OpenFile = filepath
+        self.invalidate_comment_indexes()
+        self.invalidate_cached_results()
 
         logger.info(f"Opened {filepath}")
 
@@ -265,6 +393,8 @@ class OpticStudioSystem:
 
         self._System.New(saveifneeded)
         self._OpenFile = None
+        self.invalidate_comment_indexes()
+        self.invalidate_cached_results()
 
         logger.info("Opened new file")
 